@@ -0,0 +1,49 @@
+"""add_api_cost_cache_token_columns
+
+Revision ID: 7c41d2e9a3b5
+Revises: 2924c2c01a59
+Create Date: 2026-10-16 12:00:00.000000+00:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7c41d2e9a3b5"
+down_revision: Union[str, None] = "2924c2c01a59"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add prompt cache read/write token counts to api_costs."""
+    op.add_column(
+        "api_costs",
+        sa.Column(
+            "cache_read_tokens",
+            sa.Integer(),
+            nullable=False,
+            server_default="0",
+            comment="Input tokens read from the prompt cache (not in input_tokens)",
+        ),
+    )
+    op.add_column(
+        "api_costs",
+        sa.Column(
+            "cache_write_tokens",
+            sa.Integer(),
+            nullable=False,
+            server_default="0",
+            comment="Input tokens written to the prompt cache (not in input_tokens)",
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Remove prompt cache token counts from api_costs."""
+    op.drop_column("api_costs", "cache_write_tokens")
+    op.drop_column("api_costs", "cache_read_tokens")
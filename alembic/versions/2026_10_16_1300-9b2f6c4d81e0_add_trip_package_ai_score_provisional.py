@@ -0,0 +1,38 @@
+"""add_trip_package_ai_score_provisional
+
+Revision ID: 9b2f6c4d81e0
+Revises: 7c41d2e9a3b5
+Create Date: 2026-10-16 13:00:00.000000+00:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9b2f6c4d81e0"
+down_revision: Union[str, None] = "7c41d2e9a3b5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add the local pre-score flag to trip_packages."""
+    op.add_column(
+        "trip_packages",
+        sa.Column(
+            "ai_score_provisional",
+            sa.Boolean(),
+            nullable=False,
+            server_default="false",
+            comment="Whether ai_score is a local pre-score estimate rather than a Claude score",
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Remove the local pre-score flag from trip_packages."""
+    op.drop_column("trip_packages", "ai_score_provisional")
@@ -3,13 +3,29 @@ Claude API client with caching, cost tracking, and error handling.
 
 This module provides a production-grade integration with Anthropic's Claude API,
 featuring Redis-based caching, comprehensive cost tracking, and robust error handling.
+
+Prompt templates are sent in two parts: their static sections (role,
+criteria, output format) as a system prompt marked for Anthropic prompt
+caching, and their variable sections as the user message, so the shared
+instructions are billed at the cache-read rate after the first call.
+
+Bulk jobs can use analyze_batch(), which submits many requests as one
+Anthropic Message Batch (half price, no per-item round trips) and fans the
+results back out per request. analyze_stream() streams long responses and
+hands each text delta to a callback while Claude is still generating.
+
+Cost records are queued on an ApiCostBuffer and written in bulk from its own
+session, so API calls never wait on the database.
 """
 
+import asyncio
 import hashlib
 import json
 import logging
+import time
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
 
 from anthropic import AsyncAnthropic, APIError, RateLimitError, APIConnectionError
 from redis.asyncio import Redis
@@ -22,8 +38,12 @@ from tenacity import (
     retry_if_exception_type,
 )
 
-from app.models.api_cost import ApiCost
+from app.ai.cost_buffer import ApiCostBuffer, get_api_cost_buffer
+from app.ai.prompt_loader import split_prompt_template
+from app.config import settings
 from app.models.model_pricing import ModelPricing
+from app.utils.concurrency import get_session_lock
+from app.utils.redis_pool import get_redis, get_redis_registry
 from app.utils.retry import redis_retry
 
 logger = logging.getLogger(__name__)
@@ -35,17 +55,63 @@ class ClaudeAPIError(Exception):
     pass
 
 
+@dataclass
+class AnalyzeRequest:
+    """
+    One request for ClaudeClient.analyze_batch(); fields mirror analyze().
+
+    Attributes:
+        prompt: The prompt template (can use {variable} placeholders)
+        data: Dictionary of variables to format into the prompt
+        response_format: Expected format - 'json' or 'text'
+        max_tokens: Maximum tokens in response
+        operation: Operation name for cost tracking
+        temperature: Sampling temperature 0-1
+    """
+
+    prompt: str
+    data: Optional[Dict[str, Any]] = None
+    response_format: str = "json"
+    max_tokens: int = 2048
+    operation: Optional[str] = None
+    temperature: float = 1.0
+
+
+@dataclass
+class _PreparedPrompt:
+    """
+    A formatted prompt, split the way it is sent to Claude, with its cache key.
+
+    Attributes:
+        full_prompt: The formatted prompt
+        system: Cached system prompt blocks (None if the template has none)
+        user_prompt: The user message
+        cache_key: Redis cache key of the response
+        prompt_hash: SHA-256 of full_prompt, used for cost tracking
+    """
+
+    full_prompt: str
+    system: Optional[List[Dict[str, Any]]]
+    user_prompt: str
+    cache_key: str
+    prompt_hash: str
+
+
 class ClaudeClient:
     """
     Claude API client with caching, cost tracking, and error handling.
 
     Features:
     - Redis-based response caching with configurable TTL
-    - Automatic cost tracking and logging to database
+    - Automatic cost tracking, logged to the database in buffered bulk writes
     - JSON response parsing with markdown code block handling
     - Retry logic for transient failures
     - Comprehensive error handling
     - Dynamic pricing loaded from database with fallback to defaults
+    - Prompt caching of static template sections
+    - Message Batches mode for bulk jobs (analyze_batch)
+    - Streaming mode for long responses (analyze_stream)
+    - Redis health read from the shared pool's heartbeat (no ping per lookup)
 
     Example:
         >>> client = ClaudeClient(api_key="sk-...", redis_client=redis)
@@ -62,31 +128,54 @@ class ClaudeClient:
     DEFAULT_INPUT_COST_PER_MILLION = 3.0  # $3 per 1M input tokens
     DEFAULT_OUTPUT_COST_PER_MILLION = 15.0  # $15 per 1M output tokens
 
+    # Message Batches are billed at half the standard token price
+    BATCH_PRICE_MULTIPLIER = 0.5
+
+    # Prompt cache writes and reads, relative to the input token price
+    CACHE_WRITE_PRICE_MULTIPLIER = 1.25
+    CACHE_READ_PRICE_MULTIPLIER = 0.1
+
     def __init__(
         self,
         api_key: str,
-        redis_client: Redis,
+        redis_client: Optional[Redis] = None,
         model: str = "claude-sonnet-4-5-20250929",
         cache_ttl: int = 86400,  # 24 hours
         db_session: Optional[AsyncSession] = None,
+        prompt_caching: Optional[bool] = None,
+        cost_buffer: Optional[ApiCostBuffer] = None,
     ):
         """
         Initialize the Claude API client.
 
         Args:
             api_key: Anthropic API key
-            redis_client: Redis client for caching
+            redis_client: Redis client for caching (defaults to a client on the
+                shared pool)
             model: Claude model to use (default: claude-sonnet-4-5-20250929)
             cache_ttl: Cache TTL in seconds (default: 86400 = 24 hours)
-            db_session: Optional database session for cost tracking
+            db_session: Optional database session for pricing lookups; also
+                enables cost tracking (through the shared ApiCostBuffer unless
+                cost_buffer is given)
+            prompt_caching: Send static template sections as a cached system
+                prompt (defaults to settings.claude_prompt_caching)
+            cost_buffer: Buffer for ApiCost records (enables cost tracking
+                without a db_session)
         """
         self.client = AsyncAnthropic(api_key=api_key)
-        self.redis = redis_client
+        self.redis = redis_client if redis_client is not None else get_redis()
         self.model = model
         self.cache_ttl = cache_ttl
         self.db_session = db_session
+        self.prompt_caching = (
+            settings.claude_prompt_caching if prompt_caching is None else prompt_caching
+        )
         self._cache_enabled = False
 
+        if cost_buffer is None and db_session is not None:
+            cost_buffer = get_api_cost_buffer()
+        self.cost_buffer = cost_buffer
+
         # Validate Redis connection
         self._validate_redis_connection()
 
@@ -121,22 +210,13 @@ class ClaudeClient:
         """
         Check if Redis is healthy and available.
 
+        Uses the shared pool's heartbeat instead of pinging, so cache lookups
+        cost one round trip.
+
         Returns:
             True if Redis is available, False otherwise
         """
-        if not self._cache_enabled:
-            return False
-
-        try:
-            await self.redis.ping()
-            return True
-        except Exception as e:
-            if self._cache_enabled:
-                logger.warning(
-                    f"Redis connection lost: {e}. Disabling cache operations."
-                )
-                self._cache_enabled = False
-            return False
+        return self._cache_enabled and get_redis_registry().healthy
 
     async def _load_pricing(self) -> None:
         """
@@ -170,8 +250,9 @@ class ClaudeClient:
                 .order_by(ModelPricing.effective_date.desc())
                 .limit(1)
             )
-            result = await self.db_session.execute(stmt)
-            pricing = result.scalar_one_or_none()
+            async with get_session_lock(self.db_session):
+                result = await self.db_session.execute(stmt)
+                pricing = result.scalar_one_or_none()
 
             if pricing:
                 self.input_cost_per_million = pricing.input_cost_per_million
@@ -224,73 +305,145 @@ class ClaudeClient:
         Returns:
             Dict containing the parsed response. For JSON format, returns the
             parsed JSON object. For text format, returns {"text": "..."}. All
-            responses include a "_cost" field with the API call cost in USD.
+            responses include a "_cost" field with the API call cost in USD;
+            responses served from cache also have "_cache_hit": True.
 
         Raises:
             ClaudeAPIError: If the API call fails or response parsing fails
         """
-        try:
-            # Load pricing from database if not already loaded
-            await self._load_pricing()
+        async def send(user_prompt: str, system: Optional[List[Dict[str, Any]]]):
+            logger.info(
+                f"Calling Claude API (model={self.model}, "
+                f"max_tokens={max_tokens}, operation={operation})"
+            )
+            response = await self._call_api_with_retry(
+                user_prompt, max_tokens, temperature, system=system
+            )
+            return response.content[0].text, response.usage
 
-            # Format prompt with data
-            if data:
-                full_prompt = prompt.format(**data)
-            else:
-                full_prompt = prompt
+        return await self._analyze(
+            prompt, data, response_format, use_cache, max_tokens, operation, send, "analyze()"
+        )
+
+    async def analyze_stream(
+        self,
+        prompt: str,
+        data: Optional[Dict[str, Any]] = None,
+        on_text: Optional[Callable[[str], Awaitable[None]]] = None,
+        response_format: str = "json",
+        use_cache: bool = True,
+        max_tokens: int = 2048,
+        operation: Optional[str] = None,
+        temperature: float = 1.0,
+    ) -> Dict[str, Any]:
+        """
+        Like analyze(), but stream the response and report text as it arrives.
 
-            # Generate cache key
-            cache_key = self._build_cache_key(full_prompt, response_format, max_tokens)
-            prompt_hash = hashlib.sha256(full_prompt.encode()).hexdigest()
+        on_text is awaited with every text delta while Claude is still
+        generating, so callers can process long responses incrementally.
+        Cached responses are returned without calling on_text. The stream is
+        not retried: a failure after text was delivered would repeat it.
 
-            # Check cache
-            if use_cache:
-                cached = await self._get_cached_response(cache_key)
-                if cached:
-                    logger.info(f"Cache hit for prompt hash: {prompt_hash[:16]}...")
-                    # Track cache hit
-                    if self.db_session:
-                        await self._track_cache_hit(prompt_hash, operation)
-                    return cached
+        Args:
+            prompt: The prompt template (can use {variable} placeholders)
+            data: Dictionary of variables to format into the prompt
+            on_text: Async callback receiving each text delta
+            response_format: Expected format - 'json' or 'text' (default: 'json')
+            use_cache: Whether to use Redis caching (default: True)
+            max_tokens: Maximum tokens in response (default: 2048)
+            operation: Operation name for cost tracking (e.g., 'itinerary_generation')
+            temperature: Sampling temperature 0-1 (default: 1.0)
+
+        Returns:
+            The parsed complete response, in the same format as analyze()
 
-            # Call Claude API with retry logic
+        Raises:
+            ClaudeAPIError: If the API call fails or response parsing fails
+        """
+        async def send(user_prompt: str, system: Optional[List[Dict[str, Any]]]):
             logger.info(
-                f"Calling Claude API (model={self.model}, "
+                f"Streaming Claude API call (model={self.model}, "
                 f"max_tokens={max_tokens}, operation={operation})"
             )
+            params: Dict[str, Any] = {
+                "model": self.model,
+                "max_tokens": max_tokens,
+                "temperature": temperature,
+                "messages": [{"role": "user", "content": user_prompt}],
+            }
+            if system is not None:
+                params["system"] = system
 
-            response = await self._call_api_with_retry(
-                full_prompt, max_tokens, temperature
-            )
+            async with self.client.messages.stream(**params) as stream:
+                async for text in stream.text_stream:
+                    if on_text is not None:
+                        await on_text(text)
+                message = await stream.get_final_message()
 
-            # Parse response
-            response_text = response.content[0].text
-            if response_format == "json":
-                result = self.parse_json_response(response_text)
-            else:
-                result = {"text": response_text}
-
-            # Track cost
-            cost = await self.track_cost(
-                input_tokens=response.usage.input_tokens,
-                output_tokens=response.usage.output_tokens,
-                operation=operation,
-                prompt_hash=prompt_hash,
+            response_text = "".join(
+                block.text for block in message.content if getattr(block, "type", "") == "text"
             )
-            result["_cost"] = cost
-            result["_model"] = self.model
-            result["_tokens"] = {
-                "input": response.usage.input_tokens,
-                "output": response.usage.output_tokens,
-                "total": response.usage.input_tokens + response.usage.output_tokens,
-            }
+            return response_text, message.usage
+
+        return await self._analyze(
+            prompt, data, response_format, use_cache, max_tokens, operation, send,
+            "analyze_stream()",
+        )
 
-            # Cache response
+    async def _analyze(
+        self,
+        prompt: str,
+        data: Optional[Dict[str, Any]],
+        response_format: str,
+        use_cache: bool,
+        max_tokens: int,
+        operation: Optional[str],
+        send: Callable[[str, Optional[List[Dict[str, Any]]]], Awaitable[Tuple[str, Any]]],
+        method: str,
+    ) -> Dict[str, Any]:
+        """
+        Shared flow of analyze() and analyze_stream().
+
+        Formats the prompt, serves it from cache if possible, otherwise calls
+        send(user_prompt, system) and parses, cost-tracks and caches what it
+        returns. Only send differs between the two methods.
+
+        Args:
+            prompt: The prompt template
+            data: Dictionary of variables to format into the prompt
+            response_format: Expected format - 'json' or 'text'
+            use_cache: Whether to use Redis caching
+            max_tokens: Maximum tokens in response (part of the cache key)
+            operation: Operation name for cost tracking
+            send: Transport returning (response text, usage)
+            method: Public method name for error messages
+
+        Returns:
+            The parsed response, as documented in analyze()
+
+        Raises:
+            ClaudeAPIError: If the API call fails or response parsing fails
+        """
+        try:
+            # Load pricing from database if not already loaded
+            await self._load_pricing()
+
+            prepared = self._prepare_prompt(prompt, data, response_format, max_tokens)
+
+            # Check cache
             if use_cache:
-                await self._cache_response(cache_key, result)
+                cached = await self._cached_result(prepared, operation)
+                if cached:
+                    return cached
+
+            response_text, usage = await send(prepared.user_prompt, prepared.system)
+
+            result = await self._finish_response(
+                prepared, response_text, usage, response_format, operation, use_cache
+            )
 
             logger.info(
-                f"Claude API call successful (cost=${cost:.4f}, "
+                f"Claude API call successful (cost=${result['_cost']:.4f}, "
                 f"tokens={result['_tokens']['total']})"
             )
 
@@ -299,13 +452,387 @@ class ClaudeClient:
         except APIError as e:
             logger.error(f"Claude API error: {e}")
             # Track failed API call
-            if self.db_session:
-                await self._track_error(str(e), operation)
+            await self._track_error(str(e), operation)
             raise ClaudeAPIError(f"Claude API call failed: {e}") from e
         except Exception as e:
-            logger.error(f"Unexpected error in analyze(): {e}")
+            logger.error(f"Unexpected error in {method}: {e}")
             raise ClaudeAPIError(f"Unexpected error: {e}") from e
 
+    def _prepare_prompt(
+        self,
+        prompt: str,
+        data: Optional[Dict[str, Any]],
+        response_format: str,
+        max_tokens: int,
+    ) -> _PreparedPrompt:
+        """
+        Format a prompt template and derive its system/user split and cache key.
+
+        Raises:
+            KeyError, IndexError, ValueError: If data doesn't fit the template
+        """
+        # Format prompt with data
+        full_prompt = prompt.format(**data) if data else prompt
+        system, user_prompt = self._split_prompt(prompt, data, full_prompt)
+
+        return _PreparedPrompt(
+            full_prompt=full_prompt,
+            system=system,
+            user_prompt=user_prompt,
+            cache_key=self._build_cache_key(full_prompt, response_format, max_tokens),
+            prompt_hash=hashlib.sha256(full_prompt.encode()).hexdigest(),
+        )
+
+    async def _cached_result(
+        self, prepared: _PreparedPrompt, operation: Optional[str]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached response for a prompt and record the cache hit.
+
+        Returns:
+            The cached response marked with "_cache_hit", or None
+        """
+        cached = await self._get_cached_response(prepared.cache_key)
+        if not cached:
+            return None
+
+        logger.info(f"Cache hit for prompt hash: {prepared.prompt_hash[:16]}...")
+        # "_cost" is what the original call cost; this one was free
+        cached["_cache_hit"] = True
+        # Track cache hit
+        await self._track_cache_hit(prepared.prompt_hash, operation)
+        return cached
+
+    async def _finish_response(
+        self,
+        prepared: _PreparedPrompt,
+        response_text: str,
+        usage: Any,
+        response_format: str,
+        operation: Optional[str],
+        use_cache: bool,
+        batch_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Parse a response, track its cost and cache it.
+
+        Args:
+            prepared: The prompt the response answers
+            response_text: Text of the response
+            usage: Token usage reported by the API
+            response_format: Expected format - 'json' or 'text'
+            operation: Operation name for cost tracking
+            use_cache: Whether to cache the parsed response
+            batch_id: Message batch ID (batch requests are billed at the discount)
+
+        Returns:
+            The parsed response with "_cost", "_model" and "_tokens"
+
+        Raises:
+            ClaudeAPIError: If the response cannot be parsed (nothing is tracked)
+        """
+        # Parse response
+        if response_format == "json":
+            result = self.parse_json_response(response_text)
+        else:
+            result = {"text": response_text}
+
+        # Track cost
+        tokens = self._usage_tokens(usage)
+        cost = await self.track_cost(
+            input_tokens=tokens["input"],
+            output_tokens=tokens["output"],
+            operation=operation,
+            prompt_hash=prepared.prompt_hash,
+            batch_id=batch_id,
+            cache_read_tokens=tokens["cache_read"],
+            cache_write_tokens=tokens["cache_write"],
+        )
+        result["_cost"] = cost
+        result["_model"] = self.model
+        result["_tokens"] = tokens
+
+        # Cache response
+        if use_cache:
+            await self._cache_response(prepared.cache_key, result)
+
+        return result
+
+    async def analyze_batch(
+        self,
+        requests: List[AnalyzeRequest],
+        use_cache: bool = True,
+        poll_interval: Optional[float] = None,
+        timeout: Optional[float] = None,
+    ) -> List[Union[Dict[str, Any], ClaudeAPIError]]:
+        """
+        Run many analyze() requests through the Message Batches API.
+
+        Cached responses are served from Redis as in analyze(); identical
+        uncached prompts are sent once. The rest are submitted as Message
+        Batches (up to settings.claude_batch_max_requests each), polled until
+        they end, then parsed, cost-tracked (at the batch discount) and cached
+        per request. Batches usually finish within minutes but may take up to
+        24 hours, so this is meant for bulk jobs, not interactive calls.
+
+        Args:
+            requests: Requests to run
+            use_cache: Whether to use Redis caching (default: True)
+            poll_interval: Seconds between status checks
+                (defaults to settings.claude_batch_poll_seconds)
+            timeout: Seconds to wait for a batch before cancelling it
+                (defaults to settings.claude_batch_timeout_seconds)
+
+        Returns:
+            One entry per request, in order: the parsed response dict (same
+            shape as analyze()), or a ClaudeAPIError if that request failed
+
+        Raises:
+            ClaudeAPIError: If a batch cannot be submitted or does not finish in time
+
+        Example:
+            >>> results = await client.analyze_batch(
+            ...     [AnalyzeRequest(prompt=template, data=row, operation="event_scoring")
+            ...      for row in rows]
+            ... )
+        """
+        if poll_interval is None:
+            poll_interval = settings.claude_batch_poll_seconds
+        if timeout is None:
+            timeout = settings.claude_batch_timeout_seconds
+
+        await self._load_pricing()
+
+        results: List[Optional[Union[Dict[str, Any], ClaudeAPIError]]] = [None] * len(requests)
+        # cache key -> (request index list, prepared prompt, request)
+        pending: Dict[str, Dict[str, Any]] = {}
+
+        for index, request in enumerate(requests):
+            try:
+                prepared = self._prepare_prompt(
+                    request.prompt, request.data, request.response_format, request.max_tokens
+                )
+            except (KeyError, IndexError, ValueError) as e:
+                results[index] = ClaudeAPIError(f"Invalid prompt data: {e}")
+                continue
+
+            cache_key = prepared.cache_key
+            if cache_key in pending:
+                pending[cache_key]["indexes"].append(index)
+                continue
+
+            if use_cache:
+                cached = await self._cached_result(prepared, request.operation)
+                if cached:
+                    results[index] = cached
+                    continue
+
+            pending[cache_key] = {
+                "indexes": [index],
+                "prepared": prepared,
+                "request": request,
+            }
+
+        items = list(pending.items())
+        chunk_size = settings.claude_batch_max_requests
+
+        for start in range(0, len(items), chunk_size):
+            chunk = items[start : start + chunk_size]
+            responses = await self._run_message_batch(chunk, use_cache, poll_interval, timeout)
+            for (_, item), response in zip(chunk, responses, strict=True):
+                for index in item["indexes"]:
+                    # Duplicates get their own copy so callers can mutate results
+                    results[index] = dict(response) if isinstance(response, dict) else response
+
+        return results
+
+    async def _run_message_batch(
+        self,
+        items: List[Any],
+        use_cache: bool,
+        poll_interval: float,
+        timeout: float,
+    ) -> List[Union[Dict[str, Any], ClaudeAPIError]]:
+        """
+        Submit one Message Batch, wait for it to end and collect its results.
+
+        Args:
+            items: (cache_key, item) pairs built by analyze_batch()
+            use_cache: Whether to cache successful responses
+            poll_interval: Seconds between status checks
+            timeout: Seconds to wait before cancelling the batch
+
+        Returns:
+            One response dict or ClaudeAPIError per item, in order
+
+        Raises:
+            ClaudeAPIError: If the batch cannot be submitted, polled or times out
+                (the batch is cancelled if polling fails for any reason)
+        """
+        batches = self._batches_api()
+        operations = {item["request"].operation for _, item in items}
+        operation = operations.pop() if len(operations) == 1 else None
+
+        batch_requests = []
+        for position, (_, item) in enumerate(items):
+            params = {
+                "model": self.model,
+                "max_tokens": item["request"].max_tokens,
+                "temperature": item["request"].temperature,
+                "messages": [{"role": "user", "content": item["prepared"].user_prompt}],
+            }
+            if item["prepared"].system is not None:
+                params["system"] = item["prepared"].system
+            # custom_id must match ^[a-zA-Z0-9_-]{1,64}$
+            batch_requests.append({"custom_id": f"req-{position}", "params": params})
+
+        try:
+            batch = await batches.create(requests=batch_requests)
+            logger.info(
+                f"Submitted message batch {batch.id} with {len(batch_requests)} requests "
+                f"(model={self.model}, operation={operation})"
+            )
+
+            deadline = time.monotonic() + timeout
+            try:
+                while batch.processing_status != "ended":
+                    if time.monotonic() >= deadline:
+                        raise ClaudeAPIError(
+                            f"Message batch {batch.id} did not finish within {timeout:.0f}s "
+                            f"(cancelled)"
+                        )
+                    await asyncio.sleep(poll_interval)
+                    batch = await batches.retrieve(batch.id)
+            except (Exception, asyncio.CancelledError):
+                # Don't leave an abandoned batch running (and billing)
+                await self._cancel_message_batch(batches, batch.id)
+                raise
+
+            entries = {}
+            async for entry in await batches.results(batch.id):
+                entries[entry.custom_id] = entry.result
+
+        except APIError as e:
+            logger.error(f"Claude message batch error: {e}")
+            await self._track_error(str(e), operation)
+            raise ClaudeAPIError(f"Claude message batch failed: {e}") from e
+
+        counts = batch.request_counts
+        logger.info(
+            f"Message batch {batch.id} ended: {counts.succeeded} succeeded, "
+            f"{counts.errored} errored, {counts.expired} expired, {counts.canceled} canceled"
+        )
+
+        responses: List[Union[Dict[str, Any], ClaudeAPIError]] = []
+        for position, (_, item) in enumerate(items):
+            request = item["request"]
+            result = entries.get(f"req-{position}")
+
+            if result is None or result.type != "succeeded":
+                reason = "missing from results" if result is None else result.type
+                if result is not None and result.type == "errored":
+                    reason = f"errored: {result.error.error.message}"
+                responses.append(ClaudeAPIError(f"Batch request failed ({reason})"))
+                continue
+
+            message = result.message
+            try:
+                parsed = await self._finish_response(
+                    item["prepared"],
+                    message.content[0].text,
+                    message.usage,
+                    request.response_format,
+                    request.operation,
+                    use_cache,
+                    batch_id=batch.id,
+                )
+            except ClaudeAPIError as e:
+                responses.append(e)
+                continue
+
+            responses.append(parsed)
+
+        return responses
+
+    @staticmethod
+    async def _cancel_message_batch(batches: Any, batch_id: str) -> None:
+        """Cancel a message batch, logging instead of raising if that fails."""
+        try:
+            await batches.cancel(batch_id)
+            logger.warning(f"Cancelled message batch {batch_id}")
+        except Exception as e:
+            logger.error(f"Failed to cancel message batch {batch_id}: {e}")
+
+    def _split_prompt(
+        self, template: str, data: Optional[Dict[str, Any]], full_prompt: str
+    ) -> Tuple[Optional[List[Dict[str, Any]]], str]:
+        """
+        Build the system prompt and user message for a prompt template.
+
+        With prompt caching enabled, the template's static sections become a
+        system prompt with a cache breakpoint and only the formatted variable
+        sections are sent as the user message. Prompts without data, or
+        without both kinds of sections, are sent whole as the user message.
+
+        Note: Anthropic only caches prefixes above a model-specific minimum
+        length (1024 tokens for Sonnet); shorter ones are processed normally.
+
+        Args:
+            template: Prompt template
+            data: Template variables
+            full_prompt: The fully formatted prompt
+
+        Returns:
+            Tuple of (system content blocks or None, user message text)
+        """
+        if not self.prompt_caching or not data:
+            return None, full_prompt
+
+        static, variable = split_prompt_template(template)
+        if not static or not variable:
+            return None, full_prompt
+
+        system = [
+            {
+                "type": "text",
+                "text": static.format(),
+                "cache_control": {"type": "ephemeral"},
+            }
+        ]
+        return system, variable.format(**data)
+
+    @staticmethod
+    def _usage_tokens(usage: Any) -> Dict[str, int]:
+        """
+        Token counts from an API usage object.
+
+        "input" excludes prompt-cache reads and writes, which are reported
+        separately (and are absent from older SDK/usage payloads).
+        """
+
+        def count(name: str) -> int:
+            value = getattr(usage, name, None)
+            return value if isinstance(value, int) else 0
+
+        tokens = {
+            "input": usage.input_tokens,
+            "output": usage.output_tokens,
+            "cache_read": count("cache_read_input_tokens"),
+            "cache_write": count("cache_creation_input_tokens"),
+        }
+        tokens["total"] = sum(tokens.values())
+        return tokens
+
+    def _batches_api(self):
+        """
+        Message Batches resource of the Anthropic SDK.
+
+        Newer SDKs expose it as ``messages.batches``; older ones (< 0.42)
+        only under ``beta.messages.batches``.
+        """
+        batches = getattr(self.client.messages, "batches", None)
+        return batches if batches is not None else self.client.beta.messages.batches
+
     @retry(
         retry=retry_if_exception_type((RateLimitError, APIConnectionError)),
         stop=stop_after_attempt(3),
@@ -313,15 +840,20 @@ class ClaudeClient:
         reraise=True,
     )
     async def _call_api_with_retry(
-        self, prompt: str, max_tokens: int, temperature: float
+        self,
+        prompt: str,
+        max_tokens: int,
+        temperature: float,
+        system: Optional[List[Dict[str, Any]]] = None,
     ):
         """
         Call Claude API with automatic retry logic for transient failures.
 
         Args:
-            prompt: The formatted prompt to send
+            prompt: The formatted prompt (user message) to send
             max_tokens: Maximum tokens in response
             temperature: Sampling temperature
+            system: Optional system prompt content blocks
 
         Returns:
             Anthropic Message response
@@ -331,12 +863,15 @@ class ClaudeClient:
             APIConnectionError: If connection fails after retries
             APIError: For other API errors
         """
-        return await self.client.messages.create(
-            model=self.model,
-            max_tokens=max_tokens,
-            temperature=temperature,
-            messages=[{"role": "user", "content": prompt}],
-        )
+        params: Dict[str, Any] = {
+            "model": self.model,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "messages": [{"role": "user", "content": prompt}],
+        }
+        if system is not None:
+            params["system"] = system
+        return await self.client.messages.create(**params)
 
     def _build_cache_key(
         self, prompt: str, response_format: str, max_tokens: int
@@ -451,18 +986,24 @@ class ClaudeClient:
         operation: Optional[str] = None,
         prompt_hash: Optional[str] = None,
         error: Optional[str] = None,
+        batch_id: Optional[str] = None,
+        cache_read_tokens: int = 0,
+        cache_write_tokens: int = 0,
     ) -> float:
         """
-        Calculate API cost and log to database.
+        Calculate API cost and queue it for the database.
 
         Uses pricing loaded from database, or defaults if not available.
 
         Args:
-            input_tokens: Number of input tokens
+            input_tokens: Number of uncached input tokens
             output_tokens: Number of output tokens
             operation: Operation name for tracking
             prompt_hash: Hash of the prompt
             error: Error message if API call failed
+            batch_id: Message Batch the call belonged to (billed at the batch discount)
+            cache_read_tokens: Input tokens read from the prompt cache
+            cache_write_tokens: Input tokens written to the prompt cache
 
         Returns:
             Total cost in USD
@@ -471,83 +1012,92 @@ class ClaudeClient:
         await self._load_pricing()
 
         # Calculate cost using loaded pricing
-        input_cost = (input_tokens / 1_000_000) * self.input_cost_per_million
+        input_cost = (
+            (
+                input_tokens
+                + cache_write_tokens * self.CACHE_WRITE_PRICE_MULTIPLIER
+                + cache_read_tokens * self.CACHE_READ_PRICE_MULTIPLIER
+            )
+            / 1_000_000
+            * self.input_cost_per_million
+        )
         output_cost = (output_tokens / 1_000_000) * self.output_cost_per_million
         total_cost = input_cost + output_cost
+        if batch_id:
+            total_cost *= self.BATCH_PRICE_MULTIPLIER
 
         logger.info(
             f"Claude API cost: ${total_cost:.4f} "
             f"({input_tokens} input + {output_tokens} output = "
-            f"{input_tokens + output_tokens} tokens)"
+            f"{input_tokens + output_tokens} tokens"
+            + (
+                f"; cache read {cache_read_tokens}, cache write {cache_write_tokens})"
+                if cache_read_tokens or cache_write_tokens
+                else ")"
+            )
         )
 
-        # Log to database if session available
-        if self.db_session:
-            try:
-                api_cost = ApiCost(
-                    service="claude",
-                    model=self.model,
-                    input_tokens=input_tokens,
-                    output_tokens=output_tokens,
-                    cost_usd=total_cost,
-                    operation=operation,
-                    prompt_hash=prompt_hash,
-                    cache_hit=False,
-                    error=error,
-                )
-                self.db_session.add(api_cost)
-                await self.db_session.commit()
-                logger.debug(f"Logged API cost to database: {api_cost}")
-            except Exception as e:
-                logger.error(f"Failed to log API cost to database: {e}")
-                # Don't fail the request if cost logging fails
-                await self.db_session.rollback()
+        # Queue for the database (written in bulk, never awaited here)
+        self._record_cost(
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            cache_read_tokens=cache_read_tokens,
+            cache_write_tokens=cache_write_tokens,
+            cost_usd=total_cost,
+            operation=operation,
+            prompt_hash=prompt_hash,
+            error=error,
+            extra_metadata=json.dumps({"batch_id": batch_id}) if batch_id else None,
+        )
 
         return total_cost
 
     async def _track_cache_hit(
         self, prompt_hash: str, operation: Optional[str] = None
     ) -> None:
-        """Track a cache hit in the database (no tokens consumed)."""
-        if self.db_session:
-            try:
-                api_cost = ApiCost(
-                    service="claude",
-                    model=self.model,
-                    input_tokens=0,
-                    output_tokens=0,
-                    cost_usd=0.0,
-                    operation=operation,
-                    prompt_hash=prompt_hash,
-                    cache_hit=True,
-                )
-                self.db_session.add(api_cost)
-                await self.db_session.commit()
-            except Exception as e:
-                logger.warning(f"Failed to log cache hit: {e}")
-                await self.db_session.rollback()
+        """Track a cache hit (no tokens consumed)."""
+        self._record_cost(operation=operation, prompt_hash=prompt_hash, cache_hit=True)
 
     async def _track_error(
         self, error: str, operation: Optional[str] = None
     ) -> None:
-        """Track a failed API call in the database."""
-        if self.db_session:
-            try:
-                api_cost = ApiCost(
-                    service="claude",
-                    model=self.model,
-                    input_tokens=0,
-                    output_tokens=0,
-                    cost_usd=0.0,
-                    operation=operation,
-                    cache_hit=False,
-                    error=error[:1000],  # Truncate long error messages
-                )
-                self.db_session.add(api_cost)
-                await self.db_session.commit()
-            except Exception as e:
-                logger.warning(f"Failed to log API error: {e}")
-                await self.db_session.rollback()
+        """Track a failed API call."""
+        self._record_cost(operation=operation, error=error[:1000])  # Truncate long errors
+
+    def _record_cost(
+        self,
+        input_tokens: int = 0,
+        output_tokens: int = 0,
+        cache_read_tokens: int = 0,
+        cache_write_tokens: int = 0,
+        cost_usd: float = 0.0,
+        operation: Optional[str] = None,
+        prompt_hash: Optional[str] = None,
+        cache_hit: bool = False,
+        error: Optional[str] = None,
+        extra_metadata: Optional[str] = None,
+    ) -> None:
+        """Queue an ApiCost row on the cost buffer (no-op if cost tracking is off)."""
+        if self.cost_buffer is None:
+            return
+
+        # Every row has the same columns so the buffer can insert them in one batch
+        self.cost_buffer.record(
+            {
+                "service": "claude",
+                "model": self.model,
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+                "cache_read_tokens": cache_read_tokens,
+                "cache_write_tokens": cache_write_tokens,
+                "cost_usd": cost_usd,
+                "operation": operation,
+                "prompt_hash": prompt_hash,
+                "cache_hit": cache_hit,
+                "error": error,
+                "extra_metadata": extra_metadata,
+            }
+        )
 
     @redis_retry(max_attempts=3, min_wait_seconds=1, max_wait_seconds=5)
     async def clear_cache(self, pattern: str = "claude:response:*") -> int:
@@ -0,0 +1,206 @@
+"""
+Buffered, non-blocking ApiCost writes.
+
+ClaudeClient records one ApiCost row per call (paid call, cache hit or
+error). Writing each row with its own commit on the caller's session adds a
+database round trip to every AI call and commits whatever else the caller
+has pending. ApiCostBuffer instead collects the rows in memory and inserts
+them in bulk from its own session:
+
+- when max_batch_size rows are pending
+- flush_interval seconds after the first unflushed row
+- on close() (application or CLI shutdown)
+
+Recording a row never awaits the database. Rows of a failed flush are put
+back and retried, so every recorded row is written exactly once.
+
+Example:
+    >>> buffer = get_api_cost_buffer()
+    >>> buffer.record({"service": "claude", "cost_usd": 0.0042, ...})
+    >>> await close_api_cost_buffer()  # on shutdown
+"""
+
+import asyncio
+import logging
+from typing import Any, AsyncContextManager, Callable, Dict, List, Optional, Set
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models.api_cost import ApiCost
+
+logger = logging.getLogger(__name__)
+
+SessionFactory = Callable[[], AsyncContextManager[AsyncSession]]
+
+
+def _default_session_factory() -> AsyncContextManager[AsyncSession]:
+    """Open a session on the application engine (imported lazily)."""
+    from app.database import AsyncSessionLocal
+
+    return AsyncSessionLocal()
+
+
+class ApiCostBuffer:
+    """
+    In-memory buffer of ApiCost rows flushed in bulk.
+
+    Attributes:
+        pending: Column values of rows not yet written
+        recorded: Rows recorded since creation
+        written: Rows written to the database
+        recorded_cost_usd: Total cost of recorded rows
+        written_cost_usd: Total cost of written rows
+        failed_flushes: Flushes that failed (their rows were re-queued)
+    """
+
+    def __init__(
+        self,
+        session_factory: Optional[SessionFactory] = None,
+        max_batch_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+    ):
+        """
+        Initialize an empty buffer.
+
+        Args:
+            session_factory: Callable returning an async session context manager
+                (default: the application's AsyncSessionLocal)
+            max_batch_size: Pending rows that trigger a flush
+                (defaults to settings.api_cost_buffer_size)
+            flush_interval: Seconds before pending rows are flushed
+                (defaults to settings.api_cost_flush_seconds)
+        """
+        self.session_factory = session_factory or _default_session_factory
+        self.max_batch_size = max_batch_size or settings.api_cost_buffer_size
+        self.flush_interval = (
+            settings.api_cost_flush_seconds if flush_interval is None else flush_interval
+        )
+
+        self.pending: List[Dict[str, Any]] = []
+        self.recorded = 0
+        self.written = 0
+        self.recorded_cost_usd = 0.0
+        self.written_cost_usd = 0.0
+        self.failed_flushes = 0
+
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task] = set()
+        self._lock: Optional[asyncio.Lock] = None
+
+    def _get_lock(self) -> asyncio.Lock:
+        """Create the lock lazily so it binds to the running loop."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    def record(self, row: Dict[str, Any]) -> None:
+        """
+        Queue an ApiCost row without waiting for the database.
+
+        Args:
+            row: ApiCost column values
+        """
+        self.pending.append(row)
+        self.recorded += 1
+        self.recorded_cost_usd += row.get("cost_usd") or 0.0
+
+        if len(self.pending) >= self.max_batch_size:
+            self._start_flush()
+        else:
+            self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        """Arm the flush timer if it is not armed yet."""
+        if self._timer is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No loop (synchronous caller): rows wait for the next flush or close()
+            return
+        self._timer = loop.call_later(self.flush_interval, self._start_flush)
+
+    def _start_flush(self) -> None:
+        """Start a background flush."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        try:
+            task = asyncio.ensure_future(self.flush())
+        except RuntimeError:
+            return
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def flush(self) -> int:
+        """
+        Write all pending rows in one bulk insert.
+
+        Returns:
+            Number of rows written (0 if none were pending or the insert failed)
+        """
+        async with self._get_lock():
+            rows, self.pending = self.pending, []
+            if not rows:
+                return 0
+
+            try:
+                async with self.session_factory() as session:
+                    await session.execute(insert(ApiCost), rows)
+                    await session.commit()
+            except Exception as e:
+                # Keep the rows (ahead of newer ones) and retry on the next flush
+                self.pending[:0] = rows
+                self.failed_flushes += 1
+                logger.error(
+                    f"Failed to write {len(rows)} API cost records: {e}. "
+                    f"{len(self.pending)} records pending."
+                )
+                self._schedule_flush()
+                return 0
+
+            self.written += len(rows)
+            self.written_cost_usd += sum(row.get("cost_usd") or 0.0 for row in rows)
+            logger.debug(f"Wrote {len(rows)} API cost records")
+            return len(rows)
+
+    async def close(self) -> None:
+        """Stop the timer, wait for running flushes and flush what is left."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        await self.flush()
+
+        if self.pending:
+            logger.error(
+                f"{len(self.pending)} API cost records could not be written "
+                f"(${sum(row.get('cost_usd') or 0.0 for row in self.pending):.4f})"
+            )
+
+
+_buffer: Optional[ApiCostBuffer] = None
+
+
+def get_api_cost_buffer() -> ApiCostBuffer:
+    """
+    Get the process-wide ApiCostBuffer, creating it on first use.
+
+    Returns:
+        Shared buffer writing through the application's session factory
+    """
+    global _buffer
+    if _buffer is None:
+        _buffer = ApiCostBuffer()
+    return _buffer
+
+
+async def close_api_cost_buffer() -> None:
+    """Flush and drop the process-wide buffer (call on shutdown)."""
+    global _buffer
+    if _buffer is not None:
+        buffer, _buffer = _buffer, None
+        await buffer.close()
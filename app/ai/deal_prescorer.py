@@ -0,0 +1,323 @@
+"""
+Local deterministic pre-scoring of trip packages.
+
+DealPreScorer estimates a provisional 0-100 deal score for every package
+without calling Claude, so batch scoring can send only the most promising
+packages to the API. The estimate combines:
+
+- accommodation score (AccommodationScorer.score_accommodation)
+- flight price vs route history (percentile of past prices in price_history)
+- school holiday fit (share of the trip inside school holidays, family trips)
+- event relevance (EventMatcher.score_event_relevance of the matched events)
+
+Reference data is loaded with one query per kind for the whole batch and the
+weighted combination is a single vectorized pass.
+
+Example:
+    >>> prescorer = DealPreScorer(db_session)
+    >>> estimates = await prescorer.score_packages(packages)
+    >>> print(f"Provisional score: {estimates[0]['score']}/100")
+"""
+
+import logging
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+from sqlalchemy import and_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.ai.accommodation_scorer import AccommodationScorer
+from app.models.accommodation import Accommodation
+from app.models.event import Event
+from app.models.price_history import PriceHistory
+from app.models.school_holiday import SchoolHoliday
+from app.models.trip_package import TripPackage
+from app.orchestration.event_matcher import EventMatcher
+
+logger = logging.getLogger(__name__)
+
+
+class DealPreScorer:
+    """
+    Cheap local estimate of deal quality used to gate Claude calls.
+
+    Every component is on a 0-100 scale; components without data (no
+    accommodation, no price history, events not matched yet) use NEUTRAL_SCORE
+    so missing data neither promotes nor buries a package.
+
+    Scoring Components:
+        - Accommodation (35%): AccommodationScorer overall score
+        - Price (35%): 100 - percentile of the flight price in route history
+        - Holiday fit (15%): Share of trip days in school holidays (family trips)
+        - Events (15%): Mean relevance of the top matched events
+    """
+
+    # Scoring weights (sum to 1)
+    WEIGHT_ACCOMMODATION = 0.35
+    WEIGHT_PRICE = 0.35
+    WEIGHT_HOLIDAY = 0.15
+    WEIGHT_EVENTS = 0.15
+
+    COMPONENTS = ("accommodation", "price", "holiday", "events")
+
+    # Score for components without data
+    NEUTRAL_SCORE = 50.0
+
+    # Matched events averaged for the event component
+    TOP_EVENTS = 3
+
+    def __init__(
+        self,
+        db_session: AsyncSession,
+        accommodation_scorer: Optional[AccommodationScorer] = None,
+    ):
+        """
+        Initialize the pre-scorer.
+
+        Args:
+            db_session: Database session for loading reference data
+            accommodation_scorer: Accommodation scorer (default: a new AccommodationScorer)
+        """
+        self.db = db_session
+        self.accommodation_scorer = accommodation_scorer or AccommodationScorer()
+        self.event_matcher = EventMatcher(db_session)
+
+    async def score_packages(self, packages: List[TripPackage]) -> List[Dict[str, float]]:
+        """
+        Estimate scores for a batch of packages.
+
+        Args:
+            packages: Packages to score
+
+        Returns:
+            One dict per package (same order) with the provisional "score" and
+            each component ("accommodation", "price", "holiday", "events"), all 0-100
+        """
+        if not packages:
+            return []
+
+        price_history = await self._load_price_history(packages)
+        holidays = await self._load_holidays(packages)
+        accommodations = await self._load_accommodations(packages)
+        events = await self._load_events(packages)
+
+        components = np.column_stack(
+            [
+                self._accommodation_scores(packages, accommodations),
+                self._price_scores(packages, price_history),
+                self._holiday_scores(packages, holidays),
+                self._event_scores(packages, events),
+            ]
+        )
+        weights = np.array(
+            [
+                self.WEIGHT_ACCOMMODATION,
+                self.WEIGHT_PRICE,
+                self.WEIGHT_HOLIDAY,
+                self.WEIGHT_EVENTS,
+            ]
+        )
+        scores = np.clip(components, 0.0, 100.0) @ weights
+
+        return [
+            {
+                "score": round(float(score), 2),
+                **{
+                    name: round(float(value), 2)
+                    for name, value in zip(self.COMPONENTS, row, strict=True)
+                },
+            }
+            for score, row in zip(scores, components, strict=True)
+        ]
+
+    @staticmethod
+    def route_of(trip_package: TripPackage) -> Optional[Tuple[str, Optional[float]]]:
+        """
+        Route code and flight price per person of a package.
+
+        Args:
+            trip_package: The trip package
+
+        Returns:
+            Tuple of (route such as "MUC-LIS", price per person or None), or
+            None if the package has no usable flight data
+        """
+        flights = trip_package.flights_json
+        if isinstance(flights, list):
+            flights = flights[0] if flights else None
+        if not isinstance(flights, dict):
+            return None
+
+        origin = flights.get("origin_airport")
+        destination = flights.get("destination_airport")
+        if not origin or not destination:
+            return None
+
+        price = flights.get("price_per_person")
+        return f"{origin}-{destination}", float(price) if price is not None else None
+
+    async def _load_price_history(self, packages: List[TripPackage]) -> Dict[str, np.ndarray]:
+        """Load sorted historical prices for every route in the batch (one query)."""
+        routes = {route[0] for route in map(self.route_of, packages) if route}
+        if not routes:
+            return {}
+
+        try:
+            result = await self.db.execute(
+                select(PriceHistory.route, PriceHistory.price).where(
+                    PriceHistory.route.in_(routes)
+                )
+            )
+            rows = result.all()
+        except Exception as e:
+            logger.warning(f"Error loading price history for pre-scoring: {e}")
+            return {}
+
+        prices: Dict[str, List[float]] = {}
+        for route, price in rows:
+            prices.setdefault(route, []).append(float(price))
+        return {route: np.sort(np.array(values)) for route, values in prices.items()}
+
+    async def _load_holidays(self, packages: List[TripPackage]) -> np.ndarray:
+        """Load school holidays overlapping the batch as an (n, 2) array of ordinals."""
+        start = min(p.departure_date for p in packages)
+        end = max(p.return_date for p in packages)
+
+        try:
+            result = await self.db.execute(
+                select(SchoolHoliday.start_date, SchoolHoliday.end_date).where(
+                    and_(SchoolHoliday.start_date <= end, SchoolHoliday.end_date >= start)
+                )
+            )
+            rows = result.all()
+        except Exception as e:
+            logger.warning(f"Error loading school holidays for pre-scoring: {e}")
+            rows = []
+
+        return np.array(
+            [(first.toordinal(), last.toordinal()) for first, last in rows], dtype=np.int64
+        ).reshape(-1, 2)
+
+    async def _load_accommodations(self, packages: List[TripPackage]) -> Dict[int, Accommodation]:
+        """Load the accommodations of the batch by id (one query)."""
+        ids = {p.accommodation_id for p in packages if p.accommodation_id is not None}
+        if not ids:
+            return {}
+
+        try:
+            result = await self.db.execute(select(Accommodation).where(Accommodation.id.in_(ids)))
+            return {accommodation.id: accommodation for accommodation in result.scalars().all()}
+        except Exception as e:
+            logger.warning(f"Error loading accommodations for pre-scoring: {e}")
+            return {}
+
+    async def _load_events(self, packages: List[TripPackage]) -> Dict[int, Event]:
+        """Load the matched events of the batch by id (one query)."""
+        ids: Set[int] = set()
+        for package in packages:
+            for entry in self._event_entries(package):
+                event_id = entry.get("id") if isinstance(entry, dict) else entry
+                if isinstance(event_id, int):
+                    ids.add(event_id)
+        if not ids:
+            return {}
+
+        try:
+            result = await self.db.execute(select(Event).where(Event.id.in_(ids)))
+            return {event.id: event for event in result.scalars().all()}
+        except Exception as e:
+            logger.warning(f"Error loading events for pre-scoring: {e}")
+            return {}
+
+    @staticmethod
+    def _event_entries(trip_package: TripPackage) -> List[Any]:
+        events = trip_package.events_json
+        return events if isinstance(events, list) else []
+
+    def _accommodation_scores(
+        self, packages: List[TripPackage], accommodations: Dict[int, Accommodation]
+    ) -> np.ndarray:
+        """Accommodation component, scoring each accommodation once."""
+        by_id: Dict[int, float] = {}
+        for accommodation_id, accommodation in accommodations.items():
+            try:
+                result = self.accommodation_scorer.score_accommodation(accommodation)
+                by_id[accommodation_id] = result["overall_score"]
+            except Exception as e:
+                logger.warning(f"Error scoring accommodation {accommodation_id}: {e}")
+
+        return np.array(
+            [by_id.get(p.accommodation_id, self.NEUTRAL_SCORE) for p in packages], dtype=float
+        )
+
+    def _price_scores(
+        self, packages: List[TripPackage], price_history: Dict[str, np.ndarray]
+    ) -> np.ndarray:
+        """Price component: share of historical route prices above this price."""
+        scores = np.full(len(packages), self.NEUTRAL_SCORE)
+
+        # Group packages by route so each route is one searchsorted call
+        by_route: Dict[str, Tuple[List[int], List[float]]] = {}
+        for index, package in enumerate(packages):
+            route = self.route_of(package)
+            if route and route[1] is not None and route[0] in price_history:
+                positions, prices = by_route.setdefault(route[0], ([], []))
+                positions.append(index)
+                prices.append(route[1])
+
+        for route, (positions, prices) in by_route.items():
+            history = price_history[route]
+            values = np.array(prices)
+            # Mid-rank percentile, so ties with history count half
+            below = np.searchsorted(history, values, side="left")
+            at_or_below = np.searchsorted(history, values, side="right")
+            percentile = (below + at_or_below) / (2 * len(history)) * 100
+            scores[positions] = 100.0 - percentile
+
+        return scores
+
+    def _holiday_scores(self, packages: List[TripPackage], holidays: np.ndarray) -> np.ndarray:
+        """Holiday component: share of trip days within school holidays (family trips)."""
+        starts = np.array([p.departure_date.toordinal() for p in packages], dtype=np.int64)
+        ends = np.array([p.return_date.toordinal() for p in packages], dtype=np.int64)
+        family = np.array([p.package_type == "family" for p in packages])
+
+        if len(holidays):
+            # (packages, holidays) overlap in days; holiday periods do not overlap
+            overlap = (
+                np.minimum(ends[:, None], holidays[None, :, 1])
+                - np.maximum(starts[:, None], holidays[None, :, 0])
+                + 1
+            )
+            days_in_holidays = np.clip(overlap, 0, None).sum(axis=1)
+        else:
+            days_in_holidays = np.zeros(len(packages), dtype=np.int64)
+
+        trip_days = ends - starts + 1
+        fit = np.minimum(days_in_holidays / np.maximum(trip_days, 1), 1.0) * 100
+        return np.where(family, fit, self.NEUTRAL_SCORE)
+
+    def _event_scores(self, packages: List[TripPackage], events: Dict[int, Event]) -> np.ndarray:
+        """Event component: mean relevance of the top matched events."""
+        scores = np.empty(len(packages))
+
+        for index, package in enumerate(packages):
+            if package.events_json is None:
+                # Events not matched yet
+                scores[index] = self.NEUTRAL_SCORE
+                continue
+
+            relevance = []
+            for entry in self._event_entries(package):
+                event_id = entry.get("id") if isinstance(entry, dict) else entry
+                event = events.get(event_id) if isinstance(event_id, int) else None
+                if event is not None:
+                    relevance.append(self.event_matcher.score_event_relevance(event, package))
+                else:
+                    # Event details unavailable: EventMatcher's default score
+                    relevance.append(self.NEUTRAL_SCORE)
+
+            top = sorted(relevance, reverse=True)[: self.TOP_EVENTS]
+            scores[index] = min(sum(top) / len(top), 100.0) if top else 0.0
+
+        return scores
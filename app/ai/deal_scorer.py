@@ -4,27 +4,96 @@ AI-powered deal scoring system using Claude API.
 This module analyzes trip packages and scores them 0-100 based on value,
 suitability, and timing. Only analyzes packages under a configurable price
 threshold to optimize API costs.
+
+Many packages can be scored at once with score_batch(), which runs Claude
+calls concurrently, backs off on rate limits, and stops at a USD budget.
+
+Scores are looked up in three tiers: a near-duplicate cache keyed by the
+package's feature signature (DealSignatureCache), then ClaudeClient's exact
+prompt cache, then the API.
 """
 
+import asyncio
 import logging
+import math
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+from anthropic import RateLimitError
 from redis.asyncio import Redis
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.ai.claude_client import ClaudeClient
+from app.ai.claude_client import ClaudeAPIError, ClaudeClient
+from app.ai.deal_prescorer import DealPreScorer
+from app.ai.deal_signature_cache import DealSignatureCache
 from app.ai.prompt_loader import PromptLoader
+from app.config import settings
 from app.models.accommodation import Accommodation
 from app.models.event import Event
 from app.models.flight import Flight
-from app.models.price_history import PriceHistory
 from app.models.trip_package import TripPackage
 from app.models.user_preference import UserPreference
+from app.services.route_price_stats import RoutePriceStatsProvider
+from app.utils.concurrency import AdaptiveConcurrencyLimiter, get_session_lock
 
 logger = logging.getLogger(__name__)
 
+# Called with (package, status, response); status is one of "scored",
+# "estimated" (response is the local pre-score), "skipped", "failed" or "not_scored"
+ScoreCallback = Callable[[TripPackage, str, Optional[Dict[str, Any]]], None]
+
+
+@dataclass
+class BatchScoringReport:
+    """
+    Outcome of DealScorer.score_batch().
+
+    Attributes:
+        budget_usd: Spend budget the batch ran with
+        results: One dict per scored package ({"package": ..., **score fields})
+        skipped: Packages filtered out by the price threshold
+        estimated: Packages given their local pre-score instead of a Claude score
+        failed: Packages whose scoring raised an error
+        not_scored: Packages left unscored because the budget ran out
+        spent_usd: Cost of Claude calls made (cache hits are free)
+        paid_calls: Number of Claude calls that were not cache hits
+        rate_limits: Rate limits hit (each one reduced concurrency)
+        budget_exhausted: Whether the budget stopped the batch early
+    """
+
+    budget_usd: float
+    results: List[Dict[str, Any]] = field(default_factory=list)
+    skipped: int = 0
+    estimated: int = 0
+    failed: int = 0
+    not_scored: int = 0
+    spent_usd: float = 0.0
+    paid_calls: int = 0
+    rate_limits: int = 0
+    budget_exhausted: bool = False
+
+    @property
+    def scored(self) -> int:
+        """Number of packages scored."""
+        return len(self.results)
+
+    def has_budget_for(self, in_flight: int) -> bool:
+        """
+        Check whether one more call fits in the budget.
+
+        Calls still in flight are charged at the average cost so far, so the
+        budget is not overshot by a full round of concurrent calls.
+
+        Args:
+            in_flight: Calls started but not yet charged
+
+        Returns:
+            True if another call can start
+        """
+        average_cost = self.spent_usd / self.paid_calls if self.paid_calls else 0.0
+        return self.spent_usd + in_flight * average_cost < self.budget_usd
+
 
 class DealScorer:
     """
@@ -43,7 +112,10 @@ class DealScorer:
     - Optional "analyze all" mode to bypass threshold
     - Historical price context integration
     - Event matching and relevance
-    - Cost tracking and caching
+    - Cost tracking and caching, including reuse of scores for near-duplicate
+      packages (same destination, week, price band, ...)
+    - Concurrent, budget-capped batch scoring (score_batch)
+    - Local pre-scoring of large batches so only the top slice goes to Claude
 
     Example:
         >>> scorer = DealScorer(
@@ -55,12 +127,18 @@ class DealScorer:
         >>> print(f"Score: {result['score']}, Recommendation: {result['recommendation']}")
     """
 
+    # Retries per package after a rate limit (on top of ClaudeClient's own retries)
+    MAX_RATE_LIMIT_RETRIES = 2
+
     def __init__(
         self,
         claude_client: ClaudeClient,
         db_session: AsyncSession,
         price_threshold_per_person: float = 200.0,
         analyze_all: bool = False,
+        signature_cache: Optional[DealSignatureCache] = None,
+        prescorer: Optional[DealPreScorer] = None,
+        price_stats: Optional[RoutePriceStatsProvider] = None,
     ):
         """
         Initialize the deal scorer.
@@ -70,6 +148,12 @@ class DealScorer:
             db_session: Database session for querying data
             price_threshold_per_person: Max flight price per person to analyze (default: €200)
             analyze_all: If True, analyze all packages regardless of price (default: False)
+            signature_cache: Near-duplicate score cache (default: one on the Claude
+                client's Redis, configured from settings; None if disabled there)
+            prescorer: Local pre-scorer gating batch scoring (default: a DealPreScorer
+                on db_session; None if disabled in settings)
+            price_stats: Route price statistics for the prompt's price context
+                (default: a RoutePriceStatsProvider on db_session)
         """
         self.claude = claude_client
         self.db = db_session
@@ -77,6 +161,25 @@ class DealScorer:
         self.analyze_all = analyze_all
         self.prompt_loader = PromptLoader()
 
+        if signature_cache is None and settings.deal_signature_cache_enabled:
+            signature_cache = DealSignatureCache(
+                getattr(claude_client, "redis", None),
+                ttl=settings.deal_signature_cache_ttl,
+                price_band_pct=settings.deal_signature_price_band_pct,
+                date_bucket_days=settings.deal_signature_date_bucket_days,
+                namespace=str(getattr(claude_client, "model", "")),
+            )
+        self.signature_cache = signature_cache
+
+        if prescorer is None and settings.ai_prescore_enabled:
+            prescorer = DealPreScorer(db_session)
+        self.prescorer = prescorer
+        self.price_stats = price_stats or RoutePriceStatsProvider(db_session)
+
+        # Exact-cache hits and paid calls for get_cache_stats()
+        self._exact_hits = 0
+        self._api_calls = 0
+
         logger.info(
             f"Initialized DealScorer (threshold=€{price_threshold_per_person}/person, "
             f"analyze_all={analyze_all})"
@@ -112,53 +215,19 @@ class DealScorer:
         """
         try:
             # Check price threshold (unless analyze_all or force_analyze)
-            if not self.analyze_all and not force_analyze:
-                flight_price_per_person = self._get_flight_price_per_person(trip_package)
-                if flight_price_per_person > self.price_threshold:
-                    logger.info(
-                        f"Skipping trip {trip_package.id}: flight price "
-                        f"€{flight_price_per_person}/person exceeds threshold "
-                        f"€{self.price_threshold}"
-                    )
-                    return None
-
-            # Gather all required data
-            prompt_data = await self._build_prompt_data(trip_package)
+            if not self._should_analyze(trip_package, force_analyze):
+                return None
 
-            # Load prompt template
-            prompt = self.prompt_loader.load("deal_analysis")
+            # Reuse the score of a near-duplicate package if there is a fresh one
+            signature, response = await self._lookup_signature(trip_package)
 
-            # Call Claude API
-            logger.info(
-                f"Analyzing trip package {trip_package.id} "
-                f"({trip_package.destination_city}, €{trip_package.total_price})"
-            )
+            if response is None:
+                # Gather all required data
+                prompt_data = await self._build_prompt_data(trip_package)
 
-            response = await self.claude.analyze(
-                prompt=prompt,
-                data=prompt_data,
-                response_format="json",
-                use_cache=True,
-                max_tokens=2048,
-                operation="deal_scoring",
-            )
-
-            # Validate response structure
-            required_fields = [
-                "score",
-                "value_assessment",
-                "family_suitability",
-                "timing_quality",
-                "recommendation",
-                "confidence",
-                "reasoning",
-            ]
-            for field in required_fields:
-                if field not in response:
-                    logger.warning(
-                        f"Missing field '{field}' in Claude response for trip {trip_package.id}"
-                    )
-                    response[field] = None
+                # Call Claude API
+                response = await self._request_score(trip_package, prompt_data)
+                await self._remember_signature(signature, response)
 
             # Update trip package with AI results
             await self._update_trip_package(trip_package, response)
@@ -330,6 +399,9 @@ class DealScorer:
         """
         Score multiple packages and filter for good deals.
 
+        Packages are scored with score_batch() using the configured
+        concurrency and spend budget.
+
         Args:
             packages: List of TripPackage objects to analyze
             min_score: Minimum score threshold (default: 70)
@@ -343,31 +415,10 @@ class DealScorer:
             - reasoning: The reasoning text
             - All other fields from score_trip()
         """
-        results = []
+        report = await self.score_batch(packages)
 
-        for package in packages:
-            try:
-                score_result = await self.score_trip(package)
-
-                if score_result is None:
-                    # Filtered out by price threshold
-                    continue
-
-                # Check if meets minimum score
-                if score_result.get("score", 0) >= min_score:
-                    results.append(
-                        {
-                            "package": package,
-                            **score_result,
-                        }
-                    )
-
-            except Exception as e:
-                logger.error(
-                    f"Error scoring package {package.id}: {e}. Skipping.",
-                    exc_info=True,
-                )
-                continue
+        # Check if meets minimum score
+        results = [r for r in report.results if (r.get("score") or 0) >= min_score]
 
         # Sort by score descending
         results.sort(key=lambda x: x.get("score", 0), reverse=True)
@@ -379,6 +430,400 @@ class DealScorer:
 
         return results
 
+    async def score_batch(
+        self,
+        packages: List[TripPackage],
+        max_concurrency: Optional[int] = None,
+        budget_usd: Optional[float] = None,
+        commit_batch_size: Optional[int] = None,
+        on_result: Optional[ScoreCallback] = None,
+    ) -> BatchScoringReport:
+        """
+        Score many packages concurrently within a spend budget.
+
+        Packages over the price threshold are skipped up front. If more packages
+        remain than the Claude slice allows (see _claude_slice_size), all of them
+        are pre-scored locally, the best slice is sent to Claude and the rest keep
+        their local estimate (ai_score_provisional=True). Packages sent to Claude
+        are scored cheapest first (total price per night, then most events).
+        Claude calls run through an adaptive concurrency limiter that halves
+        concurrency and pauses on rate limits and recovers on success. No new
+        call starts once the spend (from ClaudeClient.track_cost, cache hits
+        excluded) reaches the budget. Scores are committed in groups.
+
+        Args:
+            packages: Packages to score
+            max_concurrency: Maximum concurrent Claude calls
+                (defaults to settings.ai_scoring_max_concurrency)
+            budget_usd: Spend budget in USD (defaults to settings.ai_scoring_budget_usd)
+            commit_batch_size: Scored packages per commit
+                (defaults to settings.ai_scoring_commit_batch_size)
+            on_result: Optional callback invoked once per package with
+                (package, status, response) for progress reporting
+
+        Returns:
+            BatchScoringReport with the scored results and counters
+
+        Example:
+            >>> report = await scorer.score_batch(packages, budget_usd=2.0)
+            >>> print(f"Scored {report.scored} for ${report.spent_usd:.2f}")
+        """
+        max_concurrency = max_concurrency or settings.ai_scoring_max_concurrency
+        budget_usd = settings.ai_scoring_budget_usd if budget_usd is None else budget_usd
+        commit_batch_size = commit_batch_size or settings.ai_scoring_commit_batch_size
+
+        report = BatchScoringReport(budget_usd=budget_usd)
+        limiter = AdaptiveConcurrencyLimiter(
+            max_concurrency, cooldown_seconds=settings.ai_scoring_rate_limit_cooldown
+        )
+        # The session is shared by all tasks (and the Claude client's cost tracking)
+        db_lock = get_session_lock(self.db)
+        in_flight = 0
+        uncommitted = 0
+
+        def notify(package: TripPackage, status: str, response=None) -> None:
+            if on_result:
+                on_result(package, status, response)
+
+        # Price threshold check is free, so filter before scheduling anything
+        candidates = []
+        for package in packages:
+            try:
+                if self._should_analyze(package):
+                    candidates.append(package)
+                else:
+                    report.skipped += 1
+                    notify(package, "skipped")
+            except Exception as e:
+                logger.error(f"Error checking package {package.id}: {e}. Skipping.")
+                report.failed += 1
+                notify(package, "failed")
+
+        candidates = await self._select_for_claude(candidates, report, notify)
+        uncommitted = report.estimated
+        candidates.sort(key=self._scoring_priority)
+
+        logger.info(
+            f"Batch scoring {len(candidates)} packages "
+            f"(concurrency={max_concurrency}, budget=${budget_usd:.2f}, "
+            f"{report.skipped} over threshold, {report.estimated} pre-scored only)"
+        )
+
+        async def flush() -> None:
+            nonlocal uncommitted
+            if not uncommitted:
+                return
+            uncommitted = 0
+            async with db_lock:
+                try:
+                    await self.db.commit()
+                except Exception as e:
+                    logger.error(f"Error committing scored packages: {e}")
+                    await self.db.rollback()
+
+        async def score_one(package: TripPackage) -> None:
+            nonlocal in_flight, uncommitted
+
+            # Near-duplicate hits are free: no slot, no budget
+            signature, response = await self._lookup_signature(package)
+            attempts = 0 if response is not None else self.MAX_RATE_LIMIT_RETRIES + 1
+
+            for attempt in range(attempts):
+                async with limiter:
+                    if not report.has_budget_for(in_flight):
+                        report.budget_exhausted = True
+                        report.not_scored += 1
+                        notify(package, "not_scored")
+                        return
+
+                    in_flight += 1
+                    try:
+                        async with db_lock:
+                            prompt_data = await self._build_prompt_data(package)
+                        response = await self._request_score(package, prompt_data)
+                        if not response.get("_cache_hit"):
+                            report.spent_usd += response.get("_cost") or 0.0
+                            report.paid_calls += 1
+                    except ClaudeAPIError as e:
+                        if (
+                            isinstance(e.__cause__, RateLimitError)
+                            and attempt < self.MAX_RATE_LIMIT_RETRIES
+                        ):
+                            report.rate_limits += 1
+                            limiter.record_rate_limit()
+                            continue
+                        raise
+                    finally:
+                        in_flight -= 1
+
+                limiter.record_success()
+                await self._remember_signature(signature, response)
+                break
+
+            package.ai_score = response.get("score")
+            package.ai_reasoning = response.get("reasoning")
+            package.ai_score_provisional = False
+            report.results.append({"package": package, **response})
+            notify(package, "scored", response)
+
+            uncommitted += 1
+            if uncommitted >= commit_batch_size:
+                await flush()
+
+        async def score_guarded(package: TripPackage) -> None:
+            try:
+                await score_one(package)
+            except Exception as e:
+                logger.error(f"Error scoring package {package.id}: {e}. Skipping.")
+                report.failed += 1
+                notify(package, "failed")
+
+        await asyncio.gather(*(score_guarded(package) for package in candidates))
+        await flush()
+
+        logger.info(
+            f"Batch scoring done: {report.scored} scored, {report.estimated} estimated, "
+            f"{report.skipped} skipped, {report.failed} failed, {report.not_scored} over budget "
+            f"(spent ${report.spent_usd:.4f} of ${budget_usd:.2f}, "
+            f"{report.rate_limits} rate limits)"
+        )
+
+        return report
+
+    async def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Hit rates of the scoring caches since this scorer was created.
+
+        Returns:
+            Dictionary with:
+            - signature_cache_enabled: Whether the near-duplicate cache is in use
+            - signature_hits / signature_misses / signature_hit_rate
+            - exact_hits / api_calls: Outcomes of lookups that missed the
+              signature cache (exact prompt cache hit or paid API call)
+            - exact_hit_rate: exact_hits / (exact_hits + api_calls)
+            - overall_hit_rate: Share of scored packages that needed no API call
+            - exact_cache: ClaudeClient.get_cache_stats() output
+        """
+        cache = self.signature_cache
+        signature_hits = cache.hits if cache else 0
+        signature_misses = cache.misses if cache else 0
+        lookups = signature_hits + self._exact_hits + self._api_calls
+
+        def rate(hits: int, total: int) -> float:
+            return round(hits / total, 4) if total else 0.0
+
+        return {
+            "signature_cache_enabled": bool(cache and cache.enabled),
+            "signature_hits": signature_hits,
+            "signature_misses": signature_misses,
+            "signature_hit_rate": rate(signature_hits, signature_hits + signature_misses),
+            "exact_hits": self._exact_hits,
+            "api_calls": self._api_calls,
+            "exact_hit_rate": rate(self._exact_hits, self._exact_hits + self._api_calls),
+            "overall_hit_rate": rate(signature_hits + self._exact_hits, lookups),
+            "exact_cache": await self.claude.get_cache_stats(),
+        }
+
+    async def _lookup_signature(
+        self, trip_package: TripPackage
+    ) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """
+        Look up a fresh score for a near-duplicate of the package.
+
+        Args:
+            trip_package: The trip package
+
+        Returns:
+            Tuple of (signature or None, cached response or None). Cached
+            responses are marked "_cache_hit" with a "_cost" of 0.
+        """
+        if self.signature_cache is None:
+            return None, None
+
+        signature = self.signature_cache.signature(trip_package)
+        response = await self.signature_cache.get(signature)
+        if response is not None:
+            response["_cache_hit"] = True
+            response["_cost"] = 0.0
+            logger.info(
+                f"Reusing near-duplicate score for trip {trip_package.id} "
+                f"({trip_package.destination_city}): {response.get('score')}/100"
+            )
+        return signature, response
+
+    async def _remember_signature(
+        self, signature: Optional[str], response: Dict[str, Any]
+    ) -> None:
+        """Store a fresh Claude score under the package signature."""
+        if self.signature_cache is not None:
+            await self.signature_cache.set(signature, response)
+
+    def _claude_slice_size(self, candidates: int) -> int:
+        """
+        Number of packages of a batch that may go to Claude.
+
+        A fraction of the batch (settings.ai_prescore_claude_fraction), at least
+        settings.ai_prescore_min_claude and at most settings.ai_prescore_max_claude.
+
+        Args:
+            candidates: Packages left after the price threshold
+
+        Returns:
+            Maximum packages to score with Claude
+        """
+        share = math.ceil(candidates * settings.ai_prescore_claude_fraction)
+        return min(settings.ai_prescore_max_claude, max(settings.ai_prescore_min_claude, share))
+
+    async def _select_for_claude(
+        self,
+        packages: List[TripPackage],
+        report: BatchScoringReport,
+        notify: Callable[..., None],
+    ) -> List[TripPackage]:
+        """
+        Pre-score a batch locally and keep only the best slice for Claude.
+
+        Packages outside the slice get their local score as a provisional
+        ai_score. Nothing is pre-scored if the whole batch fits in the slice.
+
+        Args:
+            packages: Packages that passed the price threshold
+            report: Batch report (estimated is incremented)
+            notify: Progress callback, called with status "estimated"
+
+        Returns:
+            Packages to score with Claude
+        """
+        limit = self._claude_slice_size(len(packages))
+        if self.prescorer is None or len(packages) <= limit:
+            return packages
+
+        try:
+            async with get_session_lock(self.db):
+                estimates = await self.prescorer.score_packages(packages)
+        except Exception as e:
+            logger.error(f"Error pre-scoring packages: {e}. Sending all to Claude.")
+            return packages
+
+        ranked = sorted(
+            zip(packages, estimates, strict=True), key=lambda pair: pair[1]["score"], reverse=True
+        )
+        for package, estimate in ranked[limit:]:
+            package.ai_score = estimate["score"]
+            package.ai_reasoning = (
+                f"Local estimate (not analyzed by AI): accommodation "
+                f"{estimate['accommodation']:.0f}, price {estimate['price']:.0f}, "
+                f"holiday fit {estimate['holiday']:.0f}, events {estimate['events']:.0f}"
+            )
+            package.ai_score_provisional = True
+            report.estimated += 1
+            notify(package, "estimated", estimate)
+
+        logger.info(
+            f"Pre-scored {len(packages)} packages locally, sending top {limit} to Claude "
+            f"(cut-off score {ranked[limit - 1][1]['score']:.1f})"
+        )
+        return [package for package, _ in ranked[:limit]]
+
+    def _should_analyze(self, trip_package: TripPackage, force_analyze: bool = False) -> bool:
+        """
+        Check the flight price threshold (unless analyze_all or force_analyze).
+
+        Args:
+            trip_package: The trip package
+            force_analyze: If True, bypass price threshold check
+
+        Returns:
+            True if the package should be sent to Claude
+
+        Raises:
+            ValueError: If flight data is missing or invalid
+        """
+        if self.analyze_all or force_analyze:
+            return True
+
+        flight_price_per_person = self._get_flight_price_per_person(trip_package)
+        if flight_price_per_person > self.price_threshold:
+            logger.info(
+                f"Skipping trip {trip_package.id}: flight price "
+                f"€{flight_price_per_person}/person exceeds threshold "
+                f"€{self.price_threshold}"
+            )
+            return False
+
+        return True
+
+    def _scoring_priority(self, trip_package: TripPackage) -> Tuple[float, int]:
+        """
+        Sort key for batch scoring: cheapest per night first, then most events.
+
+        Args:
+            trip_package: The trip package
+
+        Returns:
+            Tuple usable as a sort key (lower sorts first)
+        """
+        nights = max(trip_package.num_nights or 1, 1)
+        events = trip_package.events_json
+        event_count = len(events) if isinstance(events, list) else 0
+        return float(trip_package.total_price) / nights, -event_count
+
+    async def _request_score(
+        self, trip_package: TripPackage, prompt_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Call Claude with the deal analysis prompt and validate the response.
+
+        Args:
+            trip_package: The trip package being analyzed
+            prompt_data: Prompt variables from _build_prompt_data()
+
+        Returns:
+            Claude response with all required fields present (missing ones set to None)
+
+        Raises:
+            ClaudeAPIError: If the API call fails
+        """
+        # Load prompt template
+        prompt = self.prompt_loader.load("deal_analysis")
+
+        logger.info(
+            f"Analyzing trip package {trip_package.id} "
+            f"({trip_package.destination_city}, €{trip_package.total_price})"
+        )
+
+        response = await self.claude.analyze(
+            prompt=prompt,
+            data=prompt_data,
+            response_format="json",
+            use_cache=True,
+            max_tokens=2048,
+            operation="deal_scoring",
+        )
+        if response.get("_cache_hit"):
+            self._exact_hits += 1
+        else:
+            self._api_calls += 1
+
+        # Validate response structure
+        required_fields = [
+            "score",
+            "value_assessment",
+            "family_suitability",
+            "timing_quality",
+            "recommendation",
+            "confidence",
+            "reasoning",
+        ]
+        for field_name in required_fields:
+            if field_name not in response:
+                logger.warning(
+                    f"Missing field '{field_name}' in Claude response for trip {trip_package.id}"
+                )
+                response[field_name] = None
+
+        return response
+
     def _get_flight_price_per_person(self, trip_package: TripPackage) -> float:
         """
         Extract flight price per person from trip package.
@@ -574,29 +1019,27 @@ class DealScorer:
             # Build route string (e.g., "MUC-LIS")
             route = f"{origin}-{destination}"
 
-            # Query price history
-            query = select(PriceHistory).where(PriceHistory.route == route)
-            result = await self.db.execute(query)
-            price_records = result.scalars().all()
-
-            if not price_records:
+            # Aggregates for all routes are loaded once and memoized
+            stats = await self.price_stats.get(route)
+            if stats is None:
                 return f"No historical price data available for route {route}."
 
-            # Calculate statistics
-            prices = [float(record.price) for record in price_records]
-            avg_price = sum(prices) / len(prices)
-            min_price = min(prices)
-            max_price = max(prices)
-
             current_price = self._get_flight_price_per_person(trip_package)
-            percent_diff = ((current_price - avg_price) / avg_price) * 100
+            percent_diff = ((current_price - stats.avg_price) / stats.avg_price) * 100
             comparison = "above" if percent_diff > 0 else "below"
 
-            return (
-                f"Average price for {route}: €{avg_price:.2f}\n"
-                f"Lowest seen: €{min_price:.2f}, Highest: €{max_price:.2f}\n"
+            context = (
+                f"Average price for {route}: €{stats.avg_price:.2f}\n"
+                f"Lowest seen: €{stats.min_price:.2f}, Highest: €{stats.max_price:.2f}\n"
+            )
+            if stats.median_price is not None:
+                context += (
+                    f"Typical range: €{stats.p25_price:.2f}-€{stats.p75_price:.2f} "
+                    f"(median €{stats.median_price:.2f})\n"
+                )
+            return context + (
                 f"This price is {abs(percent_diff):.1f}% {comparison} average "
-                f"(based on {len(price_records)} historical records)"
+                f"(based on {stats.count} historical records)"
             )
 
         except Exception as e:
@@ -658,6 +1101,7 @@ class DealScorer:
         try:
             trip_package.ai_score = score_result.get("score")
             trip_package.ai_reasoning = score_result.get("reasoning")
+            trip_package.ai_score_provisional = False
 
             # Save to database
             await self.db.commit()
@@ -0,0 +1,227 @@
+"""
+Near-duplicate response cache for deal scoring.
+
+ClaudeClient's response cache is keyed by the exact formatted prompt, so two
+packages that differ only in package id, a few euros of price or the order of
+their events never share a cached score. DealSignatureCache is a second tier
+in front of it, keyed by a normalized feature signature of the package:
+
+- destination city and origin airport
+- package type and number of nights
+- departure date bucket (default: 7-day buckets)
+- total price band (logarithmic, default: 5% wide)
+- accommodation rating band (whole rating points)
+- set of event categories
+
+Packages with the same signature get the same score and reasoning while the
+entry is fresh (within its TTL).
+
+Example:
+    >>> cache = DealSignatureCache(redis_client, namespace=client.model)
+    >>> signature = cache.signature(package)
+    >>> cached = await cache.get(signature)
+    >>> if cached is None:
+    ...     result = await score_with_claude(package)
+    ...     await cache.set(signature, result)
+"""
+
+import hashlib
+import json
+import logging
+import math
+from typing import Any, Dict, Optional
+
+from redis.asyncio import Redis
+
+from app.models.trip_package import TripPackage
+
+logger = logging.getLogger(__name__)
+
+
+class DealSignatureCache:
+    """
+    Redis cache of deal scores keyed by package feature signature.
+
+    Redis errors never fail scoring: they are logged and the cache disables
+    itself for the rest of the run (lookups miss, stores are skipped).
+
+    Attributes:
+        hits: Lookups answered from the cache
+        misses: Lookups that found no fresh entry
+        stores: Responses stored
+    """
+
+    KEY_PREFIX = "claude:deal_signature:"
+
+    # Bump when the signature features or stored fields change
+    SIGNATURE_VERSION = 1
+
+    # Response fields reused on a signature hit
+    STORED_FIELDS = (
+        "score",
+        "value_assessment",
+        "family_suitability",
+        "timing_quality",
+        "recommendation",
+        "confidence",
+        "reasoning",
+        "highlights",
+        "concerns",
+    )
+
+    def __init__(
+        self,
+        redis_client: Optional[Redis],
+        ttl: int = 259200,
+        price_band_pct: float = 5.0,
+        date_bucket_days: int = 7,
+        namespace: str = "",
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            redis_client: Redis client (None disables the cache)
+            ttl: Seconds an entry stays fresh (default: 3 days)
+            price_band_pct: Width of a total price band in percent
+            date_bucket_days: Width of a departure date bucket in days
+            namespace: Extra signature input, e.g. the Claude model name, so
+                scores from different models never mix
+        """
+        self.redis = redis_client
+        self.ttl = ttl
+        self.price_band_pct = price_band_pct
+        self.date_bucket_days = date_bucket_days
+        self.namespace = namespace
+        self.enabled = redis_client is not None
+
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+
+    def features(self, trip_package: TripPackage) -> Optional[Dict[str, Any]]:
+        """
+        Normalized features of a package.
+
+        Args:
+            trip_package: The trip package
+
+        Returns:
+            Feature dict, or None if the package lacks the data to build one
+        """
+        if not trip_package.destination_city or not trip_package.departure_date:
+            return None
+        if trip_package.total_price is None:
+            return None
+
+        flights = trip_package.flights_json
+        if isinstance(flights, list):
+            flights = flights[0] if flights else {}
+        origin = flights.get("origin_airport") if isinstance(flights, dict) else None
+
+        total_price = float(trip_package.total_price)
+        price_band = (
+            math.floor(math.log(total_price) / math.log1p(self.price_band_pct / 100))
+            if total_price > 0
+            else 0
+        )
+
+        rating = None
+        accommodation = trip_package.accommodation
+        if accommodation is not None and accommodation.rating is not None:
+            rating = math.floor(float(accommodation.rating))
+
+        events = trip_package.events_json if isinstance(trip_package.events_json, list) else []
+        categories = sorted(
+            {
+                str(event["category"]).strip().lower()
+                for event in events
+                if isinstance(event, dict) and event.get("category")
+            }
+        )
+
+        return {
+            "v": self.SIGNATURE_VERSION,
+            "namespace": self.namespace,
+            "destination": trip_package.destination_city.strip().lower(),
+            "origin": (origin or "").upper(),
+            "package_type": trip_package.package_type,
+            "nights": trip_package.num_nights,
+            "date_bucket": trip_package.departure_date.toordinal() // self.date_bucket_days,
+            "price_band": price_band,
+            "rating_band": rating,
+            "event_categories": categories,
+        }
+
+    def signature(self, trip_package: TripPackage) -> Optional[str]:
+        """
+        Signature hash of a package.
+
+        Args:
+            trip_package: The trip package
+
+        Returns:
+            Hex digest, or None if the package cannot be signed
+        """
+        features = self.features(trip_package)
+        if features is None:
+            return None
+        encoded = json.dumps(features, sort_keys=True, default=str)
+        return hashlib.sha256(encoded.encode()).hexdigest()
+
+    async def get(self, signature: Optional[str]) -> Optional[Dict[str, Any]]:
+        """
+        Look up a fresh score for a signature.
+
+        Args:
+            signature: Signature from signature()
+
+        Returns:
+            Stored response fields plus "_signature_hit": True, or None on a miss
+        """
+        if not self.enabled or signature is None:
+            return None
+
+        try:
+            cached = await self.redis.get(f"{self.KEY_PREFIX}{signature}")
+        except Exception as e:
+            self._disable(e)
+            cached = None
+
+        try:
+            response = json.loads(cached) if cached else None
+        except (TypeError, ValueError):
+            logger.warning(f"Ignoring unreadable deal signature cache entry {signature[:16]}")
+            response = None
+
+        if not isinstance(response, dict):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        response["_signature_hit"] = True
+        return response
+
+    async def set(self, signature: Optional[str], response: Dict[str, Any]) -> None:
+        """
+        Store the reusable fields of a scoring response.
+
+        Args:
+            signature: Signature from signature()
+            response: Validated scoring response
+        """
+        if not self.enabled or signature is None or response.get("score") is None:
+            return
+
+        entry = {field: response.get(field) for field in self.STORED_FIELDS}
+        try:
+            await self.redis.setex(
+                f"{self.KEY_PREFIX}{signature}", self.ttl, json.dumps(entry, default=str)
+            )
+            self.stores += 1
+        except Exception as e:
+            self._disable(e)
+
+    def _disable(self, error: Exception) -> None:
+        logger.warning(f"Deal signature cache unavailable: {error}. Disabling it.")
+        self.enabled = False
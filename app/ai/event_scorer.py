@@ -6,14 +6,16 @@ Events are scored 0-10 based on age appropriateness, engagement level,
 practical considerations, and alignment with user interests.
 """
 
+import json
 import logging
-from typing import Dict, List, Optional, Any
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.ai.claude_client import ClaudeClient
+from app.ai.claude_client import AnalyzeRequest, ClaudeAPIError, ClaudeClient
 from app.ai.prompt_loader import PromptLoader
+from app.config import settings
 from app.models.event import Event
 from app.models.user_preference import UserPreference
 
@@ -35,8 +37,14 @@ class EventScorer:
         >>>
         >>> # Batch scoring
         >>> results = await scorer.score_events_batch(events, user_prefs)
+        >>>
+        >>> # Packed scoring: 10 events per Claude prompt
+        >>> results = await scorer.score_events_batch(events, user_prefs, pack_size=10)
     """
 
+    # Response tokens budgeted per event in a packed prompt
+    PACKED_TOKENS_PER_EVENT = 400
+
     def __init__(
         self,
         claude_client: ClaudeClient,
@@ -93,15 +101,7 @@ class EventScorer:
             prompt = self.prompt_loader.load("event_scoring")
 
             # Prepare event details
-            event_data = {
-                "title": event.title,
-                "category": event.category,
-                "description": event.description or "No description provided",
-                "event_date": str(event.event_date),
-                "price_range": event.price_range or "Not specified",
-                "destination_city": event.destination_city,
-                "user_interests": self._format_interests(user_interests),
-            }
+            event_data = self._build_event_data(event, user_interests)
 
             # Call Claude API
             logger.info(
@@ -148,6 +148,8 @@ class EventScorer:
         user_preferences: Optional[UserPreference] = None,
         update_db: bool = True,
         min_score_threshold: float = 0.0,
+        use_batch_api: bool = False,
+        pack_size: int = 1,
     ) -> Dict[str, Any]:
         """
         Score multiple events in batch with progress tracking.
@@ -157,6 +159,11 @@ class EventScorer:
             user_preferences: Optional UserPreference instance (fetches default if None)
             update_db: Whether to update events in database
             min_score_threshold: Only return events scoring above this threshold
+            use_batch_api: Submit all events as one Claude Message Batch (half
+                price, but results may take minutes to hours) instead of
+                scoring them one call at a time
+            pack_size: Events sent per Claude prompt (see score_events_packed);
+                1 scores each event on its own. Ignored with use_batch_api.
 
         Returns:
             Dict containing:
@@ -192,14 +199,19 @@ class EventScorer:
                 f"Starting batch scoring of {len(events)} events with interests: {user_interests}"
             )
 
-            for idx, event in enumerate(events, 1):
+            if use_batch_api:
+                outcomes = await self._score_with_batch_api(events, user_interests, update_db)
+            elif pack_size > 1:
+                outcomes = await self.score_events_packed(
+                    events, user_interests, pack_size, update_db
+                )
+            else:
+                outcomes = await self._score_sequentially(events, user_interests, update_db)
+
+            for event, result in outcomes:
                 try:
-                    # Score the event
-                    result = await self.score_event(
-                        event=event,
-                        user_interests=user_interests,
-                        update_db=update_db,
-                    )
+                    if isinstance(result, Exception):
+                        raise result
 
                     score = result.get("relevance_score", 0.0)
 
@@ -219,10 +231,6 @@ class EventScorer:
                     scores.append(score)
                     total_cost += result.get("_cost", 0.0)
 
-                    # Log progress every 10 events
-                    if idx % 10 == 0:
-                        logger.info(f"Progress: {idx}/{len(events)} events scored")
-
                 except Exception as e:
                     logger.error(f"Failed to score event {event.id}: {e}")
                     failed_count += 1
@@ -254,6 +262,235 @@ class EventScorer:
             logger.error(f"Batch scoring failed: {e}")
             raise
 
+    async def _score_sequentially(
+        self,
+        events: List[Event],
+        user_interests: List[str],
+        update_db: bool,
+    ) -> List[Tuple[Event, Union[Dict[str, Any], Exception]]]:
+        """
+        Score events one API call at a time.
+
+        Returns:
+            (event, result or the exception raised while scoring it) per event
+        """
+        outcomes = []
+        for idx, event in enumerate(events, 1):
+            try:
+                result = await self.score_event(
+                    event=event,
+                    user_interests=user_interests,
+                    update_db=update_db,
+                )
+            except Exception as e:
+                result = e
+            outcomes.append((event, result))
+
+            # Log progress every 10 events
+            if idx % 10 == 0:
+                logger.info(f"Progress: {idx}/{len(events)} events scored")
+
+        return outcomes
+
+    async def score_events_packed(
+        self,
+        events: List[Event],
+        user_interests: Optional[List[str]] = None,
+        pack_size: int = 10,
+        update_db: bool = True,
+    ) -> List[Tuple[Event, Union[Dict[str, Any], Exception]]]:
+        """
+        Score events several at a time, one Claude prompt per pack.
+
+        Each pack is sent as a JSON array with the scoring instructions once,
+        which cuts input tokens and round trips by roughly pack_size. Results
+        are mapped back to events by event_id and validated; events whose
+        result is missing or malformed (or the whole pack, if the response
+        cannot be parsed) are re-scored with score_event().
+
+        Args:
+            events: Events to score
+            user_interests: Optional list of user interests
+            pack_size: Maximum events per prompt
+            update_db: Whether to update the events' ai_relevance_score
+
+        Returns:
+            (event, result or the exception raised while scoring it) per event,
+            in input order. Packed results carry an even share of the pack's
+            "_cost".
+        """
+        prompt = self.prompt_loader.load("event_scoring_packed")
+        outcomes = []
+
+        for start in range(0, len(events), pack_size):
+            pack = events[start : start + pack_size]
+            keys = self._pack_keys(pack)
+
+            packed_items = [
+                {"event_id": key, **self._event_details(event)}
+                for key, event in zip(keys, pack, strict=True)
+            ]
+
+            results: Dict[Any, Dict[str, Any]] = {}
+            cost_share = 0.0
+            try:
+                response = await self.claude.analyze(
+                    prompt=prompt,
+                    data={
+                        "events_json": json.dumps(packed_items, ensure_ascii=False, indent=2),
+                        "user_interests": self._format_interests(user_interests),
+                    },
+                    response_format="json",
+                    use_cache=True,
+                    max_tokens=self.PACKED_TOKENS_PER_EVENT * len(pack) + 256,
+                    operation="event_scoring",
+                    temperature=0.7,
+                )
+                cost_share = response.get("_cost", 0.0) / len(pack)
+                results = self._parse_packed_results(response, keys)
+            except ClaudeAPIError as e:
+                logger.warning(f"Packed scoring of {len(pack)} events failed: {e}")
+
+            if len(results) < len(pack):
+                logger.warning(
+                    f"Packed response covered {len(results)}/{len(pack)} events, "
+                    f"scoring the rest individually"
+                )
+
+            for key, event in zip(keys, pack, strict=True):
+                result = results.get(key)
+                if result is not None:
+                    result["_cost"] = cost_share
+                    if update_db:
+                        event.ai_relevance_score = float(result["relevance_score"])
+                    outcomes.append((event, result))
+                    continue
+
+                try:
+                    result = await self.score_event(
+                        event=event,
+                        user_interests=user_interests,
+                        update_db=update_db,
+                    )
+                    result["_cost"] = result.get("_cost", 0.0) + cost_share
+                except Exception as e:
+                    result = e
+                outcomes.append((event, result))
+
+            if update_db and results:
+                try:
+                    await self.db.commit()
+                except Exception as e:
+                    logger.error(f"Failed to save packed event scores: {e}")
+                    await self.db.rollback()
+                    raise
+
+            logger.info(f"Progress: {start + len(pack)}/{len(events)} events scored")
+
+        return outcomes
+
+    @staticmethod
+    def _pack_keys(pack: List[Event]) -> List[Any]:
+        """Event ids for a pack, or 1-based positions if ids are missing or repeated."""
+        ids = [event.id for event in pack]
+        if None in ids or len(set(ids)) != len(ids):
+            return list(range(1, len(pack) + 1))
+        return ids
+
+    @staticmethod
+    def _parse_packed_results(
+        response: Dict[str, Any], keys: List[Any]
+    ) -> Dict[Any, Dict[str, Any]]:
+        """
+        Validate a packed scoring response and index its results by event key.
+
+        Items with an unknown or repeated event_id, or without a numeric
+        relevance_score in 0-10, are dropped.
+
+        Args:
+            response: Parsed response from ClaudeClient.analyze()
+            keys: Event keys sent in the pack
+
+        Returns:
+            Dict mapping event key to its result
+
+        Raises:
+            ClaudeAPIError: If the response has no "results" array
+        """
+        items = response.get("results")
+        if not isinstance(items, list):
+            raise ClaudeAPIError("Packed scoring response has no 'results' array")
+
+        # The model may echo ids as strings
+        by_text = {str(key): key for key in keys}
+        results: Dict[Any, Dict[str, Any]] = {}
+        duplicates = set()
+
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            key = by_text.get(str(item.get("event_id")))
+            score = item.get("relevance_score")
+            if key is None or isinstance(score, bool) or not isinstance(score, (int, float)):
+                continue
+            if not 0 <= score <= 10:
+                continue
+            if key in results:
+                duplicates.add(key)
+                continue
+            result = dict(item)
+            del result["event_id"]
+            results[key] = result
+
+        for key in duplicates:
+            # Conflicting answers for one event: trust neither
+            del results[key]
+
+        return results
+
+    async def _score_with_batch_api(
+        self,
+        events: List[Event],
+        user_interests: List[str],
+        update_db: bool,
+    ) -> List[Tuple[Event, Union[Dict[str, Any], Exception]]]:
+        """
+        Score all events in one Claude Message Batch.
+
+        Scores are written to the events and committed once, after the batch
+        has ended.
+
+        Returns:
+            (event, result or the error for that request) per event
+        """
+        prompt = self.prompt_loader.load("event_scoring")
+        requests = [
+            AnalyzeRequest(
+                prompt=prompt,
+                data=self._build_event_data(event, user_interests),
+                response_format="json",
+                max_tokens=1024,
+                operation="event_scoring",
+                temperature=0.7,
+            )
+            for event in events
+        ]
+
+        logger.info(f"Submitting {len(requests)} events to the Claude Message Batches API")
+        results = await self.claude.analyze_batch(requests)
+
+        if update_db:
+            for event, result in zip(events, results, strict=True):
+                if not isinstance(result, Exception):
+                    event.ai_relevance_score = float(result.get("relevance_score", 0.0))
+            try:
+                await self.db.commit()
+            except Exception:
+                await self.db.rollback()
+                raise
+
+        return list(zip(events, results, strict=True))
+
     async def get_top_events(
         self,
         destination_city: str,
@@ -332,6 +569,26 @@ class EventScorer:
             logger.error(f"Failed to get unscored events: {e}")
             raise
 
+    def _build_event_data(
+        self, event: Event, user_interests: Optional[List[str]]
+    ) -> Dict[str, str]:
+        """Build the event_scoring prompt variables for an event."""
+        return {
+            **self._event_details(event),
+            "user_interests": self._format_interests(user_interests),
+        }
+
+    def _event_details(self, event: Event) -> Dict[str, str]:
+        """Event fields shown to Claude for scoring."""
+        return {
+            "title": event.title,
+            "category": event.category,
+            "description": event.description or "No description provided",
+            "event_date": str(event.event_date),
+            "price_range": event.price_range or "Not specified",
+            "destination_city": event.destination_city,
+        }
+
     def _format_interests(self, interests: Optional[List[str]]) -> str:
         """
         Format user interests for the prompt.
@@ -388,6 +645,8 @@ async def score_events_for_destination(
     claude_client: ClaudeClient,
     db_session: AsyncSession,
     min_score_threshold: float = 5.0,
+    use_batch_api: bool = False,
+    pack_size: Optional[int] = None,
 ) -> Dict[str, Any]:
     """
     Convenience function to score all unscored events for a destination.
@@ -397,6 +656,8 @@ async def score_events_for_destination(
         claude_client: ClaudeClient instance
         db_session: Database session
         min_score_threshold: Minimum score to include in results
+        use_batch_api: Score via the Claude Message Batches API
+        pack_size: Events per Claude prompt (defaults to settings.event_scoring_pack_size)
 
     Returns:
         Batch scoring results dictionary
@@ -424,4 +685,6 @@ async def score_events_for_destination(
     return await scorer.score_events_batch(
         events=events,
         min_score_threshold=min_score_threshold,
+        use_batch_api=use_batch_api,
+        pack_size=pack_size or settings.event_scoring_pack_size,
     )
@@ -3,21 +3,36 @@ AI-powered itinerary generator for high-scoring family trips.
 
 This module generates detailed 3-day family itineraries using Claude API,
 optimized for families with young children (ages 3 & 6).
+
+In streaming mode the response is parsed while it arrives and every finished
+section (day_1, day_2, ...) is saved to itinerary_json right away, marked
+with "_status": "generating" until the itinerary is complete, so pages can
+show partial itineraries early. Batches run concurrently under an adaptive
+concurrency limit.
 """
 
+import asyncio
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+from anthropic import RateLimitError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.ai.claude_client import ClaudeClient
+from app.ai.json_stream import JsonMemberStream
 from app.ai.prompt_loader import load_prompt
+from app.config import settings
 from app.models.accommodation import Accommodation
 from app.models.event import Event
 from app.models.trip_package import TripPackage
+from app.utils.concurrency import AdaptiveConcurrencyLimiter, get_session_lock
 
 logger = logging.getLogger(__name__)
 
+# Key marking an itinerary that is still being generated
+STATUS_KEY = "_status"
+STATUS_GENERATING = "generating"
+
 
 class ItineraryGenerationError(Exception):
     """Custom exception for itinerary generation errors."""
@@ -44,6 +59,9 @@ class ItineraryGenerator:
         ...     save_to_db=True
         ... )
         >>> print(itinerary["day_1"]["morning"])
+
+        >>> # Stream: days are saved as soon as Claude has written them
+        >>> itinerary = await generator.generate_itinerary_streaming(trip_package=trip)
     """
 
     def __init__(
@@ -103,57 +121,12 @@ class ItineraryGenerator:
         Raises:
             ItineraryGenerationError: If generation fails or trip doesn't meet criteria
         """
-        # Validate trip package
-        if not force and (
-            trip_package.ai_score is None
-            or float(trip_package.ai_score) < self.min_score_threshold
-        ):
-            raise ItineraryGenerationError(
-                f"Trip score ({trip_package.ai_score}) is below threshold "
-                f"({self.min_score_threshold}). Use force=True to override."
-            )
-
-        # Check if itinerary already exists
-        if trip_package.itinerary_json and not force:
-            logger.info(
-                f"Trip package {trip_package.id} already has itinerary. "
-                f"Returning cached version."
-            )
-            return trip_package.itinerary_json
-
-        logger.info(
-            f"Generating itinerary for trip {trip_package.id} "
-            f"(destination: {trip_package.destination_city}, "
-            f"dates: {trip_package.departure_date} to {trip_package.return_date}, "
-            f"score: {trip_package.ai_score})"
-        )
+        cached = self._check_trip(trip_package, force)
+        if cached is not None:
+            return cached
 
         try:
-            # Load accommodation details
-            accommodation_info = await self._get_accommodation_info(trip_package)
-
-            # Load events info
-            events_info = await self._get_events_info(trip_package)
-
-            # Format dates
-            dates = self._format_dates(trip_package)
-
-            # Load and format prompt
-            prompt = load_prompt("itinerary_generation")
-
-            prompt_data = {
-                "city": trip_package.destination_city,
-                "dates": dates,
-                "accommodation_name": accommodation_info["name"],
-                "accommodation_address": accommodation_info["address"],
-                "accommodation_type": accommodation_info["type"],
-                "events_list": events_info,
-            }
-
-            # Call Claude API
-            logger.info(
-                f"Calling Claude API to generate itinerary for {trip_package.destination_city}"
-            )
+            prompt, prompt_data = await self._build_prompt(trip_package)
 
             response = await self.claude.analyze(
                 prompt=prompt,
@@ -192,42 +165,153 @@ class ItineraryGenerator:
                 f"Itinerary generation failed: {e}"
             ) from e
 
+    async def generate_itinerary_streaming(
+        self,
+        trip_package: TripPackage,
+        save_to_db: bool = True,
+        force: bool = False,
+        on_section: Optional[Callable[[TripPackage, str, Any], None]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Generate an itinerary from a streamed response, saving it section by section.
+
+        Each top-level section (day_1, day_2, day_3, tips, ...) is parsed as
+        soon as Claude finishes it. With save_to_db, the sections received so
+        far are committed to itinerary_json together with
+        "_status": "generating"; the complete, validated itinerary replaces
+        them at the end. If generation fails, the previous itinerary_json is
+        restored.
+
+        Args:
+            trip_package: TripPackage instance with trip details
+            save_to_db: Whether to save the itinerary to database (default: True)
+            force: Generate even if score is below threshold (default: False)
+            on_section: Optional callback called with (trip_package, key, value)
+                for every section as it completes
+
+        Returns:
+            The complete itinerary, as returned by generate_itinerary()
+
+        Raises:
+            ItineraryGenerationError: If generation fails or trip doesn't meet criteria
+        """
+        cached = self._check_trip(trip_package, force)
+        if cached is not None:
+            return cached
+
+        persist = save_to_db and self.db_session is not None
+        previous = trip_package.itinerary_json
+        parser = JsonMemberStream()
+        partial: Dict[str, Any] = {}
+
+        async def on_text(text: str) -> None:
+            for key, value in parser.feed(text):
+                partial[key] = value
+                if on_section is not None:
+                    on_section(trip_package, key, value)
+                if persist:
+                    await self._save_partial(
+                        trip_package, {**partial, STATUS_KEY: STATUS_GENERATING}
+                    )
+
+        try:
+            prompt, prompt_data = await self._build_prompt(trip_package)
+
+            response = await self.claude.analyze_stream(
+                prompt=prompt,
+                data=prompt_data,
+                on_text=on_text,
+                response_format="json",
+                use_cache=True,
+                max_tokens=4096,
+                operation="itinerary_generation",
+                temperature=0.7,
+            )
+
+            itinerary = {
+                k: v for k, v in response.items() if not k.startswith("_")
+            }
+            self._validate_itinerary(itinerary)
+
+            logger.info(
+                f"Itinerary streamed successfully ({len(partial)} sections saved early). "
+                f"Cost: ${response['_cost']:.4f}, "
+                f"Tokens: {response['_tokens']['total']}"
+            )
+
+            if persist:
+                await self._save_to_database(trip_package, itinerary)
+
+            return itinerary
+
+        except Exception as e:
+            logger.error(f"Failed to generate itinerary for trip {trip_package.id}: {e}")
+            if persist and partial:
+                await self._save_partial(trip_package, previous)
+            raise ItineraryGenerationError(
+                f"Itinerary generation failed: {e}"
+            ) from e
+
     async def generate_batch(
         self,
         trip_packages: List[TripPackage],
         save_to_db: bool = True,
         skip_errors: bool = True,
+        stream: bool = False,
+        max_concurrency: Optional[int] = None,
     ) -> Dict[int, Dict[str, Any]]:
         """
-        Generate itineraries for multiple trip packages.
+        Generate itineraries for multiple trip packages concurrently.
+
+        Up to max_concurrency itineraries are generated at once; the limit is
+        lowered temporarily when Claude reports rate limiting. Database
+        writes take turns on the shared session.
 
         Args:
             trip_packages: List of TripPackage instances
             save_to_db: Whether to save itineraries to database
             skip_errors: Continue on errors (default: True)
+            stream: Use generate_itinerary_streaming, saving days as they
+                arrive (default: False)
+            max_concurrency: Itineraries generated at once
+                (defaults to settings.itinerary_max_concurrency)
 
         Returns:
             Dictionary mapping trip package IDs to itineraries
         """
         results = {}
         errors = {}
-
-        for trip in trip_packages:
-            try:
-                itinerary = await self.generate_itinerary(
-                    trip_package=trip,
-                    save_to_db=save_to_db,
-                )
-                results[trip.id] = itinerary
-                logger.info(f"Generated itinerary for trip {trip.id}")
-            except Exception as e:
-                errors[trip.id] = str(e)
-                if skip_errors:
-                    logger.warning(
-                        f"Skipping trip {trip.id} due to error: {e}"
-                    )
-                else:
+        limiter = AdaptiveConcurrencyLimiter(
+            max_concurrency or settings.itinerary_max_concurrency,
+            cooldown_seconds=settings.ai_scoring_rate_limit_cooldown,
+        )
+        generate = self.generate_itinerary_streaming if stream else self.generate_itinerary
+
+        async def generate_one(trip: TripPackage) -> None:
+            async with limiter:
+                try:
+                    itinerary = await generate(trip_package=trip, save_to_db=save_to_db)
+                except Exception as e:
+                    if self._is_rate_limit(e):
+                        limiter.record_rate_limit()
+                    errors[trip.id] = str(e)
+                    if skip_errors:
+                        logger.warning(
+                            f"Skipping trip {trip.id} due to error: {e}"
+                        )
+                        return
                     raise
+                limiter.record_success()
+
+            results[trip.id] = itinerary
+            logger.info(f"Generated itinerary for trip {trip.id}")
+
+        tasks = [asyncio.create_task(generate_one(trip)) for trip in trip_packages]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
 
         logger.info(
             f"Batch generation complete. "
@@ -237,7 +321,122 @@ class ItineraryGenerator:
         if errors:
             logger.warning(f"Failed trips: {errors}")
 
-        return results
+        # Keep the input order
+        return {trip.id: results[trip.id] for trip in trip_packages if trip.id in results}
+
+    def _check_trip(
+        self, trip_package: TripPackage, force: bool
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Check that a trip qualifies for generation.
+
+        Args:
+            trip_package: TripPackage instance
+            force: Skip the score threshold and regenerate existing itineraries
+
+        Returns:
+            The existing complete itinerary to reuse, or None to generate one
+
+        Raises:
+            ItineraryGenerationError: If the trip's score is below threshold
+                or only a provisional local estimate
+        """
+        # Validate trip package
+        if not force and trip_package.ai_score_provisional:
+            # Local pre-score estimates don't justify a paid itinerary call
+            raise ItineraryGenerationError(
+                f"Trip score ({trip_package.ai_score}) is a provisional local "
+                f"estimate, not an AI score. Use force=True to override."
+            )
+
+        if not force and (
+            trip_package.ai_score is None
+            or float(trip_package.ai_score) < self.min_score_threshold
+        ):
+            raise ItineraryGenerationError(
+                f"Trip score ({trip_package.ai_score}) is below threshold "
+                f"({self.min_score_threshold}). Use force=True to override."
+            )
+
+        # Check if itinerary already exists (partial ones are regenerated)
+        if (
+            trip_package.itinerary_json
+            and not force
+            and not self.is_partial(trip_package.itinerary_json)
+        ):
+            logger.info(
+                f"Trip package {trip_package.id} already has itinerary. "
+                f"Returning cached version."
+            )
+            return trip_package.itinerary_json
+
+        logger.info(
+            f"Generating itinerary for trip {trip_package.id} "
+            f"(destination: {trip_package.destination_city}, "
+            f"dates: {trip_package.departure_date} to {trip_package.return_date}, "
+            f"score: {trip_package.ai_score})"
+        )
+        return None
+
+    @staticmethod
+    def is_partial(itinerary: Any) -> bool:
+        """
+        Whether a stored itinerary is still being generated.
+
+        Args:
+            itinerary: Value of TripPackage.itinerary_json
+
+        Returns:
+            True for itineraries saved mid-stream
+        """
+        return isinstance(itinerary, dict) and itinerary.get(STATUS_KEY) == STATUS_GENERATING
+
+    @staticmethod
+    def _is_rate_limit(error: BaseException) -> bool:
+        """Whether an error was caused by a Claude rate limit."""
+        while error is not None:
+            if isinstance(error, RateLimitError):
+                return True
+            error = error.__cause__
+        return False
+
+    async def _build_prompt(
+        self, trip_package: TripPackage
+    ) -> Tuple[str, Dict[str, Any]]:
+        """
+        Load the itinerary prompt and its data for a trip.
+
+        Args:
+            trip_package: TripPackage instance
+
+        Returns:
+            Tuple of (prompt template, prompt data)
+        """
+        # Load accommodation details
+        accommodation_info = await self._get_accommodation_info(trip_package)
+
+        # Load events info
+        events_info = await self._get_events_info(trip_package)
+
+        # Format dates
+        dates = self._format_dates(trip_package)
+
+        # Load and format prompt
+        prompt = load_prompt("itinerary_generation")
+
+        prompt_data = {
+            "city": trip_package.destination_city,
+            "dates": dates,
+            "accommodation_name": accommodation_info["name"],
+            "accommodation_address": accommodation_info["address"],
+            "accommodation_type": accommodation_info["type"],
+            "events_list": events_info,
+        }
+
+        logger.info(
+            f"Calling Claude API to generate itinerary for {trip_package.destination_city}"
+        )
+        return prompt, prompt_data
 
     async def _get_accommodation_info(
         self, trip_package: TripPackage
@@ -369,22 +568,45 @@ class ItineraryGenerator:
             logger.warning("No database session available. Skipping save.")
             return
 
-        try:
-            trip_package.itinerary_json = itinerary
+        async with get_session_lock(self.db_session):
+            try:
+                trip_package.itinerary_json = itinerary
 
-            self.db_session.add(trip_package)
-            await self.db_session.commit()
-            await self.db_session.refresh(trip_package)
+                self.db_session.add(trip_package)
+                await self.db_session.commit()
+                await self.db_session.refresh(trip_package)
 
-            logger.info(
-                f"Saved itinerary to database for trip package {trip_package.id}"
-            )
-        except Exception as e:
-            logger.error(f"Failed to save itinerary to database: {e}")
-            await self.db_session.rollback()
-            raise ItineraryGenerationError(
-                f"Failed to save itinerary: {e}"
-            ) from e
+                logger.info(
+                    f"Saved itinerary to database for trip package {trip_package.id}"
+                )
+            except Exception as e:
+                logger.error(f"Failed to save itinerary to database: {e}")
+                await self.db_session.rollback()
+                raise ItineraryGenerationError(
+                    f"Failed to save itinerary: {e}"
+                ) from e
+
+    async def _save_partial(
+        self, trip_package: TripPackage, itinerary: Optional[Dict[str, Any]]
+    ) -> None:
+        """
+        Commit an in-progress (or restored) itinerary without failing generation.
+
+        Args:
+            trip_package: TripPackage instance to update
+            itinerary: Value to store in itinerary_json
+        """
+        async with get_session_lock(self.db_session):
+            try:
+                trip_package.itinerary_json = itinerary
+                self.db_session.add(trip_package)
+                await self.db_session.commit()
+            except Exception as e:
+                logger.warning(
+                    f"Failed to save partial itinerary for trip package "
+                    f"{trip_package.id}: {e}"
+                )
+                await self.db_session.rollback()
 
     async def get_itinerary_summary(self, trip_package: TripPackage) -> str:
         """
@@ -398,6 +620,8 @@ class ItineraryGenerator:
         """
         if not trip_package.itinerary_json:
             return "No itinerary generated yet."
+        if self.is_partial(trip_package.itinerary_json):
+            return "Itinerary is still being generated."
 
         itinerary = trip_package.itinerary_json
 
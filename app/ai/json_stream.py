@@ -0,0 +1,132 @@
+"""
+Incremental parsing of a streamed JSON object.
+
+Claude returns itineraries as one JSON object ("day_1", "day_2", ...). When
+the response is streamed, JsonMemberStream picks out each top-level member
+as soon as its value is complete, so callers can use finished sections
+before the rest of the object has arrived. Text before the opening brace
+(e.g. a markdown code fence) and after the closing brace is ignored.
+
+Example:
+    >>> parser = JsonMemberStream()
+    >>> parser.feed('```json\\n{"day_1": {"morning": "Zoo"}, "da')
+    [('day_1', {'morning': 'Zoo'})]
+    >>> parser.feed('y_2": {}}')
+    [('day_2', {})]
+"""
+
+import json
+import logging
+from typing import Any, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class JsonMemberStream:
+    """
+    Parser that yields the top-level members of a JSON object as they complete.
+
+    Only nesting, strings and escapes are tracked while scanning; each
+    completed member value is decoded with json.loads. Members whose value
+    does not decode are logged and skipped (the complete response is still
+    parsed and validated separately).
+
+    Attributes:
+        done: Whether the closing brace of the object has been seen
+    """
+
+    def __init__(self):
+        """Initialize a parser waiting for the opening brace."""
+        self.done = False
+        self._text = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._expect = "key"  # at depth 1: "key", "value" or "separator"
+        self._key: Optional[str] = None
+        self._start: Optional[int] = None
+
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        """
+        Add streamed text and return the members it completed.
+
+        Args:
+            chunk: Next piece of the response text
+
+        Returns:
+            List of (key, value) tuples in document order
+        """
+        members: List[Tuple[str, Any]] = []
+        if self.done:
+            return members
+
+        self._text += chunk
+        text = self._text
+
+        for index in range(self._pos, len(text)):
+            char = text[index]
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    if self._depth == 1:
+                        if self._expect == "key":
+                            self._key = json.loads(text[self._start : index + 1])
+                        else:
+                            self._emit(members, text[self._start : index + 1])
+                continue
+
+            if self._depth == 0:
+                if char == "{":
+                    self._depth = 1
+                    self._expect = "key"
+                continue
+
+            if char == '"':
+                self._in_string = True
+                if self._depth == 1:
+                    self._start = index
+            elif char in "{[":
+                if self._depth == 1:
+                    self._start = index
+                self._depth += 1
+            elif char in "}]":
+                self._depth -= 1
+                if self._depth == 1:
+                    self._emit(members, text[self._start : index + 1])
+                elif self._depth == 0:
+                    self._end_scalar(members, index)
+                    self.done = True
+                    break
+            elif self._depth == 1:
+                if char == ":":
+                    self._expect = "value"
+                    self._start = None
+                elif char == ",":
+                    self._end_scalar(members, index)
+                    self._expect = "key"
+                elif not char.isspace() and self._expect == "value" and self._start is None:
+                    # Start of a number, true, false or null
+                    self._start = index
+
+        self._pos = len(text)
+        return members
+
+    def _end_scalar(self, members: List[Tuple[str, Any]], end: int) -> None:
+        """Emit a pending number/literal value ending before position end."""
+        if self._expect == "value" and self._start is not None:
+            self._emit(members, self._text[self._start : end].strip())
+
+    def _emit(self, members: List[Tuple[str, Any]], raw: str) -> None:
+        """Decode a completed member value and add it to members."""
+        self._expect = "separator"
+        self._start = None
+        try:
+            members.append((self._key, json.loads(raw)))
+        except ValueError as e:
+            logger.warning(f"Skipping undecodable streamed member '{self._key}': {e}")
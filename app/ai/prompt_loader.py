@@ -6,14 +6,19 @@ prompt templates used with Claude API.
 """
 
 import logging
+import re
+import string
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
 # Default prompts directory
 PROMPTS_DIR = Path(__file__).parent / "prompts"
 
+# Templates are split into sections at blank lines
+_SECTION_BREAK = re.compile(r"\n[ \t]*\n")
+
 
 class PromptLoader:
     """
@@ -217,3 +222,40 @@ def load_prompt(prompt_name: str) -> str:
         The prompt template string
     """
     return get_prompt_loader().load(prompt_name)
+
+
+def _has_placeholders(section: str) -> bool:
+    """Whether a template section contains {variable} placeholders."""
+    try:
+        return any(field is not None for _, field, _, _ in string.Formatter().parse(section))
+    except ValueError:
+        # Unbalanced braces: leave it to format() to report
+        return True
+
+
+def split_prompt_template(template: str) -> Tuple[str, str]:
+    """
+    Split a prompt template into its static and variable sections.
+
+    Sections are separated by blank lines. Sections without {variable}
+    placeholders (role, scoring criteria, output format) form the static part,
+    which is identical for every call and can be sent as a cached system
+    prompt; sections with placeholders form the variable part. Both keep
+    their original order.
+
+    Args:
+        template: Prompt template
+
+    Returns:
+        Tuple of (static template, variable template); either may be empty.
+        Both are still templates: format them before use.
+
+    Example:
+        >>> static, variable = split_prompt_template(load_prompt("event_scoring"))
+        >>> system = static.format()
+        >>> user = variable.format(**event_data)
+    """
+    static, variable = [], []
+    for section in _SECTION_BREAK.split(template.strip()):
+        (variable if _has_placeholders(section) else static).append(section)
+    return "\n\n".join(static), "\n\n".join(variable)
@@ -11,7 +11,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
-import redis.asyncio as aioredis
+from redis.asyncio import Redis
 from tenacity import (
     retry,
     stop_after_attempt,
@@ -21,12 +21,14 @@ from tenacity import (
 )
 
 from app import __version__, __app_name__
+from app.ai.cost_buffer import close_api_cost_buffer
 from app.config import settings
 from app.database import check_db_connection, close_db_connections
+from app.utils.redis_pool import close_redis_registry, get_redis
 
 logger = logging.getLogger(__name__)
 
-# Store Redis client globally
+# Client on the shared Redis pool, set at startup
 redis_client = None
 
 
@@ -37,10 +39,13 @@ redis_client = None
     before_sleep=before_sleep_log(logger, logging.WARNING),
     reraise=True,
 )
-async def connect_to_redis() -> aioredis.Redis:
+async def connect_to_redis() -> Redis:
     """
     Connect to Redis with retry logic.
 
+    The client borrows connections from the application-wide pool, whose
+    heartbeat keeps tracking Redis health after startup.
+
     Retries up to 5 times with exponential backoff (2-10 seconds).
     This helps handle race conditions during container startup when
     Redis might not be ready yet.
@@ -52,11 +57,7 @@ async def connect_to_redis() -> aioredis.Redis:
         Exception: If all retry attempts fail
     """
     try:
-        client = await aioredis.from_url(
-            str(settings.redis_url),
-            encoding="utf-8",
-            decode_responses=True,
-        )
+        client = get_redis(decode_responses=True)
         await client.ping()
         logger.info("Redis connection established")
         return client
@@ -153,10 +154,11 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down application")
 
-    # Close Redis connection
-    if redis_client:
-        await redis_client.close()
-        logger.info("Redis connection closed")
+    # Close the shared Redis pools
+    await close_redis_registry()
+
+    # Write buffered API cost records before the database goes away
+    await close_api_cost_buffer()
 
     # Close database connections
     await close_db_connections()
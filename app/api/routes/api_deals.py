@@ -42,7 +42,11 @@ async def get_deals(
 
         # Apply filters
         if min_score is not None:
-            query = query.where(TripPackage.ai_score >= min_score)
+            # Local pre-score estimates don't count as AI scores
+            query = query.where(
+                TripPackage.ai_score >= min_score,
+                TripPackage.ai_score_provisional.is_(False),
+            )
 
         if destination:
             query = query.where(TripPackage.destination_city == destination)
@@ -61,8 +65,8 @@ async def get_deals(
         total_result = await db.execute(count_query)
         total = total_result.scalar() or 0
 
-        # Order by AI score descending
-        query = query.order_by(desc(TripPackage.ai_score))
+        # Order by AI score descending, local estimates last
+        query = query.order_by(TripPackage.ai_score_provisional, desc(TripPackage.ai_score))
 
         # Apply pagination
         query = query.limit(limit).offset(offset)
@@ -84,6 +88,7 @@ async def get_deals(
                 "num_nights": pkg.num_nights,
                 "total_price": float(pkg.total_price),
                 "ai_score": float(pkg.ai_score) if pkg.ai_score is not None else None,
+                "ai_score_provisional": bool(pkg.ai_score_provisional),
                 "ai_reasoning": pkg.ai_reasoning,
                 "flights_json": pkg.flights_json,
                 "events_json": pkg.events_json,
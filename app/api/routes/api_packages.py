@@ -55,6 +55,7 @@ async def get_package(
             "num_nights": package.num_nights,
             "total_price": float(package.total_price),
             "ai_score": float(package.ai_score) if package.ai_score is not None else None,
+            "ai_score_provisional": bool(package.ai_score_provisional),
             "ai_reasoning": package.ai_reasoning,
             "flights_json": package.flights_json,
             "events_json": package.events_json,
@@ -34,14 +34,18 @@ async def get_stats(
             select(func.count()).select_from(TripPackage)
         ) or 0
 
-        # Count high score packages (>= 70)
+        # Count high score packages (>= 70), leaving out local estimates
         high_score_packages = await db.scalar(
-            select(func.count()).select_from(TripPackage).where(TripPackage.ai_score >= 70)
+            select(func.count())
+            .select_from(TripPackage)
+            .where(TripPackage.ai_score >= 70, TripPackage.ai_score_provisional.is_(False))
         ) or 0
 
-        # Average score
+        # Average AI score
         avg_score = await db.scalar(
-            select(func.avg(TripPackage.ai_score))
+            select(func.avg(TripPackage.ai_score)).where(
+                TripPackage.ai_score_provisional.is_(False)
+            )
         ) or 0.0
 
         # Average price
@@ -74,7 +78,9 @@ async def get_stats(
             select(
                 TripPackage.destination_city,
                 func.count().label("count"),
-                func.avg(TripPackage.ai_score).label("avg_score"),
+                func.avg(TripPackage.ai_score)
+                .filter(TripPackage.ai_score_provisional.is_(False))
+                .label("avg_score"),
                 func.avg(TripPackage.total_price).label("avg_price"),
             )
             .group_by(TripPackage.destination_city)
@@ -30,6 +30,7 @@ class DealResponse(BaseModel):
     return_date: Optional[str] = None
     total_price: Optional[float] = None
     ai_score: Optional[int] = None
+    ai_score_provisional: bool = False
     ai_reasoning: Optional[str] = None
     package_type: Optional[str] = None
     created_at: datetime
@@ -52,6 +53,7 @@ class DealDetailResponse(BaseModel):
     return_date: Optional[str] = None
     total_price: Optional[float] = None
     ai_score: Optional[int] = None
+    ai_score_provisional: bool = False
     ai_reasoning: Optional[str] = None
     package_type: Optional[str] = None
     flights_json: Optional[Dict[str, Any]] = None
@@ -93,7 +95,11 @@ async def get_deals(
 
             # Apply filters
             if min_score is not None:
-                query = query.where(TripPackage.ai_score >= min_score)
+                # Local pre-score estimates don't count as AI scores
+                query = query.where(
+                    TripPackage.ai_score >= min_score,
+                    TripPackage.ai_score_provisional.is_(False),
+                )
 
             if destination:
                 query = query.where(TripPackage.destination_city == destination)
@@ -107,13 +113,18 @@ async def get_deals(
             if package_type:
                 query = query.where(TripPackage.package_type == package_type)
 
-            # Order by AI score descending
-            query = query.order_by(desc(TripPackage.ai_score))
+            # Order by AI score descending, local estimates last
+            query = query.order_by(
+                TripPackage.ai_score_provisional, desc(TripPackage.ai_score)
+            )
 
             # Get total count before pagination
             count_query = select(TripPackage.id)
             if min_score is not None:
-                count_query = count_query.where(TripPackage.ai_score >= min_score)
+                count_query = count_query.where(
+                    TripPackage.ai_score >= min_score,
+                    TripPackage.ai_score_provisional.is_(False),
+                )
             if destination:
                 count_query = count_query.where(TripPackage.destination_city == destination)
             if min_price is not None:
@@ -142,6 +153,7 @@ async def get_deals(
                     return_date=deal.return_date.isoformat() if deal.return_date else None,
                     total_price=deal.total_price,
                     ai_score=deal.ai_score,
+                    ai_score_provisional=bool(deal.ai_score_provisional),
                     ai_reasoning=deal.ai_reasoning,
                     package_type=deal.package_type,
                     created_at=deal.created_at,
@@ -220,6 +232,7 @@ async def get_deal(deal_id: int) -> DealDetailResponse:
                 return_date=deal.return_date.isoformat() if deal.return_date else None,
                 total_price=deal.total_price,
                 ai_score=deal.ai_score,
+                ai_score_provisional=bool(deal.ai_score_provisional),
                 ai_reasoning=deal.ai_reasoning,
                 package_type=deal.package_type,
                 flights_json=deal.flights_json,
@@ -256,6 +269,7 @@ async def get_top_deals(
         try:
             result = await db.execute(
                 select(TripPackage)
+                .where(TripPackage.ai_score_provisional.is_(False))
                 .order_by(desc(TripPackage.ai_score))
                 .limit(limit)
             )
@@ -269,6 +283,7 @@ async def get_top_deals(
                     return_date=deal.return_date.isoformat() if deal.return_date else None,
                     total_price=deal.total_price,
                     ai_score=deal.ai_score,
+                    ai_score_provisional=bool(deal.ai_score_provisional),
                     ai_reasoning=deal.ai_reasoning,
                     package_type=deal.package_type,
                     created_at=deal.created_at,
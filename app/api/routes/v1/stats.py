@@ -56,15 +56,20 @@ async def get_stats() -> StatsResponse:
                 select(func.count()).select_from(TripPackage)
             )
 
-            # Count high score packages (>= 70)
+            # Count high score packages (>= 70), leaving out local estimates
             high_score_packages = await db.scalar(
                 select(func.count())
                 .select_from(TripPackage)
                 .where(TripPackage.ai_score >= 70)
+                .where(TripPackage.ai_score_provisional.is_(False))
             )
 
-            # Average score
-            avg_score = await db.scalar(select(func.avg(TripPackage.ai_score)))
+            # Average AI score
+            avg_score = await db.scalar(
+                select(func.avg(TripPackage.ai_score)).where(
+                    TripPackage.ai_score_provisional.is_(False)
+                )
+            )
 
             # Average price
             avg_price = await db.scalar(select(func.avg(TripPackage.total_price)))
@@ -110,7 +115,9 @@ async def get_destination_stats(
                 select(
                     TripPackage.destination_city,
                     func.count().label("count"),
-                    func.avg(TripPackage.ai_score).label("avg_score"),
+                    func.avg(TripPackage.ai_score)
+                    .filter(TripPackage.ai_score_provisional.is_(False))
+                    .label("avg_score"),
                 )
                 .group_by(TripPackage.destination_city)
                 .order_by(desc("count"))
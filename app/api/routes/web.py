@@ -29,13 +29,19 @@ async def get_stats(db: AsyncSession) -> dict:
         # Count packages
         total_packages = await db.scalar(select(func.count()).select_from(TripPackage))
 
-        # Count high score packages (>= 70)
+        # Count high score packages (>= 70), leaving out local estimates
         high_score_packages = await db.scalar(
-            select(func.count()).select_from(TripPackage).where(TripPackage.ai_score >= 70)
+            select(func.count())
+            .select_from(TripPackage)
+            .where(TripPackage.ai_score >= 70, TripPackage.ai_score_provisional.is_(False))
         )
 
-        # Average score
-        avg_score = await db.scalar(select(func.avg(TripPackage.ai_score)))
+        # Average AI score
+        avg_score = await db.scalar(
+            select(func.avg(TripPackage.ai_score)).where(
+                TripPackage.ai_score_provisional.is_(False)
+            )
+        )
 
         # Average price
         avg_price = await db.scalar(select(func.avg(TripPackage.total_price)))
@@ -67,10 +73,10 @@ async def get_stats(db: AsyncSession) -> dict:
 async def dashboard(request: Request, db: AsyncSession = Depends(get_async_session)):
     """Main dashboard with recent deals."""
     try:
-        # Get recent deals ordered by AI score
+        # Get recent deals ordered by AI score, local estimates last
         result = await db.execute(
             select(TripPackage)
-            .order_by(desc(TripPackage.ai_score))
+            .order_by(TripPackage.ai_score_provisional, desc(TripPackage.ai_score))
             .limit(12)
         )
         recent_deals = result.scalars().all()
@@ -118,7 +124,11 @@ async def deals_page(
 
         # Apply filters
         if min_score and min_score > 0:
-            query = query.where(TripPackage.ai_score >= min_score)
+            # Local pre-score estimates don't count as AI scores
+            query = query.where(
+                TripPackage.ai_score >= min_score,
+                TripPackage.ai_score_provisional.is_(False),
+            )
 
         if destination:
             query = query.where(TripPackage.destination_city == destination)
@@ -132,8 +142,8 @@ async def deals_page(
         if package_type:
             query = query.where(TripPackage.package_type == package_type)
 
-        # Order by AI score descending
-        query = query.order_by(desc(TripPackage.ai_score))
+        # Order by AI score descending, local estimates last
+        query = query.order_by(TripPackage.ai_score_provisional, desc(TripPackage.ai_score))
 
         # Execute query
         result = await db.execute(query)
@@ -342,6 +352,7 @@ async def stats_page(request: Request, db: AsyncSession = Depends(get_async_sess
         # Get score distribution
         score_result = await db.execute(
             select(TripPackage.ai_score, TripPackage.destination_city)
+            .where(TripPackage.ai_score_provisional.is_(False))
             .order_by(desc(TripPackage.ai_score))
         )
         score_data = score_result.all()
@@ -351,7 +362,9 @@ async def stats_page(request: Request, db: AsyncSession = Depends(get_async_sess
             select(
                 TripPackage.destination_city,
                 func.count().label("count"),
-                func.avg(TripPackage.ai_score).label("avg_score"),
+                func.avg(TripPackage.ai_score)
+                .filter(TripPackage.ai_score_provisional.is_(False))
+                .label("avg_score"),
             )
             .group_by(TripPackage.destination_city)
             .order_by(desc("count"))
@@ -35,6 +35,9 @@ class PackageResponse(BaseModel):
     num_nights: int
     total_price: float = Field(description="Total package price in EUR")
     ai_score: Optional[float] = Field(None, description="AI-generated score from 0 to 100")
+    ai_score_provisional: bool = Field(
+        False, description="Whether ai_score is a local estimate rather than a Claude score"
+    )
     ai_reasoning: Optional[str] = Field(None, description="AI explanation for the score")
 
     # JSONB fields
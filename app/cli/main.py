@@ -12,7 +12,6 @@ from pathlib import Path
 from typing import List, Optional
 
 import typer
-from redis.asyncio import Redis
 from rich.console import Console
 from rich.panel import Panel
 from rich.progress import (
@@ -26,11 +25,13 @@ from rich.progress import (
 from rich.table import Table
 from rich.tree import Tree
 from rich import print as rprint
-from sqlalchemy import select, func, and_, desc
+from sqlalchemy import select, func, and_, or_, desc
 
 from app import __version__, __app_name__
 from app.config import settings
 from app.database import check_db_connection, get_async_session_context, get_sync_session
+from app.scrapers.browser_pool import run_with_browser_pools
+from app.utils.redis_pool import close_redis_registry, get_redis, get_redis_registry
 from app.cli.validators import (
     airport_code_callback,
     date_callback,
@@ -189,10 +190,10 @@ def scrape(
     ))
 
     try:
-        asyncio.run(_run_scrape(
+        asyncio.run(run_with_browser_pools(_run_scrape(
             origin, destination, departure_date, return_date,
             scraper, region, save, disable_scraper, enable_scraper
-        ))
+        )))
     except Exception as e:
         handle_error(e, "Scraping failed")
 
@@ -432,6 +433,11 @@ def pipeline(
         None,
         help="Enable specific scrapers (overrides config, e.g., --enable-scraper kiwi)",
     ),
+    stream: bool = typer.Option(
+        True,
+        help="Stream flights to the database as each scraper finishes "
+        "(--no-stream collects all flights first)",
+    ),
 ):
     """
     Run the complete travel search pipeline (end-to-end automation).
@@ -452,6 +458,7 @@ def pipeline(
         scout pipeline --destinations LIS,BCN,PRG         # Specific destinations
         scout pipeline --max-price 150 --no-analyze      # Budget filter, skip AI
         scout pipeline --region Berlin                   # Use Berlin school holidays
+        scout pipeline --no-stream                       # Collect all flights, then save
     """
     console.print(Panel(
         "[bold]Starting Complete Travel Search Pipeline[/bold]",
@@ -459,10 +466,10 @@ def pipeline(
     ))
 
     try:
-        asyncio.run(_run_pipeline(
-            destinations, dates, analyze, max_price,
-            disable_scraper, enable_scraper
-        ))
+        asyncio.run(run_with_browser_pools(_run_pipeline(
+            destinations, dates, region, analyze, max_price,
+            disable_scraper, enable_scraper, stream
+        )))
     except Exception as e:
         handle_error(e, "Pipeline execution failed")
 
@@ -475,6 +482,7 @@ async def _run_pipeline(
     max_price: Optional[float],
     disable_scraper: Optional[List[str]] = None,
     enable_scraper: Optional[List[str]] = None,
+    stream: bool = True,
 ):
     """Execute the main pipeline."""
     from app.orchestration.flight_orchestrator import FlightOrchestrator
@@ -515,234 +523,240 @@ async def _run_pipeline(
         "analyzed": 0,
     }
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        TimeElapsedColumn(),
-        console=console,
-    ) as progress:
-
-        # Step 1: Determine destinations
-        task1 = progress.add_task("[cyan]Loading destinations...", total=1)
-
-        async with get_async_session_context() as db:
-            if destinations == "all":
-                result = await db.execute(select(Airport).where(Airport.is_destination == True))
-                dest_airports = result.scalars().all()
-                dest_codes = [a.iata_code for a in dest_airports]
-            else:
-                dest_codes = [d.strip().upper() for d in destinations.split(",")]
+    try:
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TimeElapsedColumn(),
+            console=console,
+        ) as progress:
+
+            # Step 1: Determine destinations
+            task1 = progress.add_task("[cyan]Loading destinations...", total=1)
+
+            async with get_async_session_context() as db:
+                if destinations == "all":
+                    result = await db.execute(select(Airport).where(Airport.is_destination == True))
+                    dest_airports = result.scalars().all()
+                    dest_codes = [a.iata_code for a in dest_airports]
+                else:
+                    dest_codes = [d.strip().upper() for d in destinations.split(",")]
 
-            # Get origin airports
-            origin_result = await db.execute(
-                select(Airport).where(Airport.is_origin == True)
-            )
-            origin_airports = origin_result.scalars().all()
-            origin_codes = [a.iata_code for a in origin_airports]
+                # Get origin airports
+                origin_result = await db.execute(
+                    select(Airport).where(Airport.is_origin == True)
+                )
+                origin_airports = origin_result.scalars().all()
+                origin_codes = [a.iata_code for a in origin_airports]
 
-        progress.update(task1, completed=1)
-        info(f"Origins: {', '.join(origin_codes)}")
-        info(f"Destinations: {', '.join(dest_codes)}")
-        info(f"Region: {region}")
+            progress.update(task1, completed=1)
+            info(f"Origins: {', '.join(origin_codes)}")
+            info(f"Destinations: {', '.join(dest_codes)}")
+            info(f"Region: {region}")
 
-        # Step 2: Determine date ranges
-        task2 = progress.add_task("[cyan]Calculating date ranges...", total=1)
+            # Step 2: Determine date ranges
+            task2 = progress.add_task("[cyan]Calculating date ranges...", total=1)
 
-        if dates == "next-3-months":
-            end_date = date.today() + timedelta(days=90)
-        elif dates == "next-6-months":
-            end_date = date.today() + timedelta(days=180)
-        else:
-            end_date = date.today() + timedelta(days=90)
+            if dates == "next-3-months":
+                end_date = date.today() + timedelta(days=90)
+            elif dates == "next-6-months":
+                end_date = date.today() + timedelta(days=180)
+            else:
+                end_date = date.today() + timedelta(days=90)
 
-        date_ranges = get_school_holiday_periods(
-            start_date=date.today(),
-            end_date=end_date,
-            region=region,
-        )
+            date_ranges = get_school_holiday_periods(
+                start_date=date.today(),
+                end_date=end_date,
+                region=region,
+            )
 
-        progress.update(task2, completed=1)
-        info(f"Date ranges: {len(date_ranges)} school holiday periods")
+            progress.update(task2, completed=1)
+            info(f"Date ranges: {len(date_ranges)} school holiday periods")
 
-        # Step 3: Scrape flights
-        task3 = progress.add_task("[yellow]Scraping flights...", total=None)
+            # Step 3: Scrape flights
+            task3 = progress.add_task("[yellow]Scraping flights...", total=None)
 
-        # Initialize Redis client for caching
-        redis_client = None
-        try:
-            redis_client = await Redis.from_url(str(settings.redis_url))
-            await redis_client.ping()
-            logger.info("Redis connection established for flight caching")
-        except Exception as e:
-            logger.warning(f"Redis connection failed, caching will be disabled: {e}")
+            # Borrow a client from the shared Redis pool for caching
             redis_client = None
+            if await get_redis_registry().check():
+                redis_client = get_redis()
+                logger.info("Redis connection established for flight caching")
+            else:
+                logger.warning("Redis connection failed, caching will be disabled")
 
-        orchestrator = FlightOrchestrator(redis_client=redis_client)
-        flights = await orchestrator.scrape_all(
-            origins=origin_codes,
-            destinations=dest_codes,
-            date_ranges=date_ranges,
-        )
-
-        # Close Redis connection
-        if redis_client:
-            await redis_client.close()
-
-        stats["flights"] = len(flights)
-        progress.update(task3, completed=1)
-        success(f"Found {stats['flights']} flights")
-
-        # Step 4: Scrape accommodations
-        task4 = progress.add_task("[yellow]Scraping accommodations...", total=len(dest_codes))
-
-        from app.orchestration.accommodation_orchestrator import AccommodationOrchestrator
-
-        acc_orchestrator = AccommodationOrchestrator()
-        all_accommodations = []
-
-        for dest_code in dest_codes:
+            orchestrator = FlightOrchestrator(redis_client=redis_client)
             try:
-                # Get city name for destination
-                async with get_async_session_context() as db:
-                    result = await db.execute(
-                        select(Airport).where(Airport.iata_code == dest_code)
+                if stream:
+                    # Flights are deduplicated and saved while scrapers are still running
+                    flight_stats = await orchestrator.stream_to_database(
+                        origins=origin_codes,
+                        destinations=dest_codes,
+                        date_ranges=date_ranges,
                     )
-                    dest_airport = result.scalar_one_or_none()
-                    city_name = dest_airport.city if dest_airport else dest_code
-
-                # Use first date range for accommodation search
-                if date_ranges:
-                    check_in, check_out = date_ranges[0]
-
-                    accommodations = await acc_orchestrator.search_all_sources(
-                        city=city_name,
-                        check_in=check_in,
-                        check_out=check_out,
-                        adults=2,
-                        children=2,
+                    stats["flights"] = flight_stats["unique"]
+                else:
+                    flights = await orchestrator.scrape_all(
+                        origins=origin_codes,
+                        destinations=dest_codes,
+                        date_ranges=date_ranges,
                     )
+                    await orchestrator.save_to_database(flights)
+                    stats["flights"] = len(flights)
+            finally:
+                await orchestrator.close()
 
-                    if accommodations:
-                        save_stats = await acc_orchestrator.save_to_database(accommodations)
-                        all_accommodations.extend(accommodations)
-                        stats["accommodations"] += save_stats["inserted"] + save_stats["updated"]
-
-                progress.update(task4, advance=1)
-
-            except Exception as e:
-                logger.error(f"Error scraping accommodations for {dest_code}: {e}")
-                progress.update(task4, advance=1)
-                continue
-
-        info(f"Found {stats['accommodations']} accommodations")
-
-        # Step 5: Match packages
-        task5 = progress.add_task("[cyan]Generating trip packages...", total=None)
-
-        async with get_async_session_context() as db:
-            matcher = AccommodationMatcher()
-            packages = await matcher.generate_trip_packages(
-                db=db,
-                max_budget=max_price or settings.max_flight_price_per_person,
-            )
-
-            stats["packages"] = len(packages)
-            progress.update(task5, completed=1)
-            success(f"Generated {stats['packages']} trip packages")
-
-        # Step 6: Match events
-        task6 = progress.add_task("[cyan]Matching events to packages...", total=None)
-
-        async with get_async_session_context() as db:
-            event_matcher = EventMatcher(db_session=db)
-            packages = await event_matcher.match_events_to_packages(packages)
+            progress.update(task3, completed=1)
+            success(f"Found {stats['flights']} flights")
 
-        progress.update(task6, completed=1)
+            # Step 4: Scrape accommodations
+            task4 = progress.add_task("[yellow]Scraping accommodations...", total=None)
 
-        # Step 7: AI analysis
-        if analyze and stats["packages"] > 0:
-            from app.ai.claude_client import ClaudeClient
-            from app.ai.deal_scorer import DealScorer
-            from app.models.trip_package import TripPackage
-            from redis.asyncio import Redis
+            from app.orchestration.accommodation_orchestrator import AccommodationOrchestrator
 
-            # Initialize Redis client for caching
-            redis_client = await Redis.from_url(str(settings.redis_url))
+            acc_orchestrator = AccommodationOrchestrator()
 
             try:
+                # Get city names for all destinations at once
                 async with get_async_session_context() as db:
                     result = await db.execute(
-                        select(TripPackage).where(TripPackage.ai_score.is_(None))
+                        select(Airport.iata_code, Airport.city).where(
+                            Airport.iata_code.in_(dest_codes)
+                        )
                     )
-                    unscored = result.scalars().all()
+                    city_by_code = dict(result.all())
+                cities = list(dict.fromkeys(city_by_code.get(code, code) for code in dest_codes))
 
-                    # Limit to 50 for cost control
-                    packages_to_score = unscored[:50]
+                # Search all cities and holiday windows concurrently, then save once
+                accommodations = await acc_orchestrator.search_cities(
+                    cities=cities,
+                    date_ranges=date_ranges,
+                    adults=2,
+                    children=2,
+                )
 
-                    task7 = progress.add_task(
-                        "[magenta]Running AI analysis...",
-                        total=len(packages_to_score)
-                    )
+                if accommodations:
+                    save_stats = await acc_orchestrator.save_to_database(accommodations)
+                    stats["accommodations"] += save_stats["inserted"] + save_stats["updated"]
 
-                    # Create Claude client and deal scorer with proper dependencies
-                    claude_client = ClaudeClient(
-                        api_key=settings.anthropic_api_key,
-                        redis_client=redis_client,
-                        db_session=db,
-                    )
-                    scorer = DealScorer(
-                        claude_client=claude_client,
-                        db_session=db,
-                    )
+            except Exception as e:
+                logger.error(f"Error scraping accommodations: {e}")
 
-                    for idx, package in enumerate(packages_to_score):
-                        try:
-                            # Update progress with current package being analyzed
-                            progress.update(
-                                task7,
-                                description=f"[magenta]Analyzing {package.destination_city} "
-                                f"({idx+1}/{len(packages_to_score)})...",
-                            )
+            progress.update(task4, completed=1)
+            info(f"Found {stats['accommodations']} accommodations")
+
+            # Step 5: Match packages
+            task5 = progress.add_task("[cyan]Generating trip packages...", total=None)
 
-                            # Log start of analysis
-                            console.print(
-                                f"[dim magenta]⟳ Scoring package {package.id}: "
-                                f"{package.destination_city}, €{package.total_price}[/dim magenta]"
+            async with get_async_session_context() as db:
+                matcher = AccommodationMatcher()
+                packages = await matcher.generate_trip_packages(
+                    db=db,
+                    max_budget=max_price or settings.max_flight_price_per_person,
+                )
+
+                stats["packages"] = len(packages)
+                progress.update(task5, completed=1)
+                success(f"Generated {stats['packages']} trip packages")
+
+            # Step 6: Match events
+            task6 = progress.add_task("[cyan]Matching events to packages...", total=None)
+
+            async with get_async_session_context() as db:
+                event_matcher = EventMatcher(db_session=db)
+                packages = await event_matcher.match_events_to_packages(packages)
+
+            progress.update(task6, completed=1)
+
+            # Step 7: AI analysis
+            if analyze and stats["packages"] > 0:
+                from app.ai.claude_client import ClaudeClient
+                from app.ai.cost_buffer import close_api_cost_buffer
+                from app.ai.deal_scorer import DealScorer
+                from app.models.trip_package import TripPackage
+
+                # Client on the shared Redis pool for caching
+                redis_client = get_redis()
+
+                try:
+                    async with get_async_session_context() as db:
+                        result = await db.execute(
+                            # Unscored packages and local estimates compete for Claude again
+                            select(TripPackage).where(
+                                or_(
+                                    TripPackage.ai_score.is_(None),
+                                    TripPackage.ai_score_provisional.is_(True),
+                                )
                             )
+                        )
+                        unscored = result.scalars().all()
 
-                            score_data = await scorer.score_trip(package)
+                        task7 = progress.add_task(
+                            "[magenta]Running AI analysis...",
+                            total=len(unscored)
+                        )
 
-                            if score_data:
-                                package.ai_score = score_data["score"]
-                                package.ai_reasoning = score_data["reasoning"]
-                                await db.commit()
-                                stats["analyzed"] += 1
+                        # Create Claude client and deal scorer with proper dependencies
+                        claude_client = ClaudeClient(
+                            api_key=settings.anthropic_api_key,
+                            redis_client=redis_client,
+                            db_session=db,
+                        )
+                        scorer = DealScorer(
+                            claude_client=claude_client,
+                            db_session=db,
+                        )
 
-                                # Log completion with score
+                        def on_scored(package, status, score_data):
+                            if status == "scored":
                                 console.print(
                                     f"[dim green]✓ Package {package.id}: "
                                     f"Score {score_data['score']}/100 "
                                     f"({score_data.get('recommendation', 'N/A')})[/dim green]"
                                 )
-                            else:
+                            elif status == "estimated":
+                                console.print(
+                                    f"[dim]~ Package {package.id}: "
+                                    f"Local estimate {score_data['score']}/100[/dim]"
+                                )
+                            elif status == "skipped":
                                 console.print(
                                     f"[dim yellow]⚠ Package {package.id}: Skipped (over price threshold)[/dim yellow]"
                                 )
-
+                            elif status == "failed":
+                                console.print(f"[dim red]✗ Package {package.id}: Failed[/dim red]")
                             progress.update(task7, advance=1)
 
-                        except Exception as e:
-                            logger.error(f"Failed to score package {package.id}: {e}")
-                            console.print(
-                                f"[dim red]✗ Package {package.id}: Failed - {str(e)}[/dim red]"
+                        # Concurrent scoring, cheapest first, until the spend budget is used up
+                        report = await scorer.score_batch(unscored, on_result=on_scored)
+                        stats["analyzed"] = report.scored
+
+                        if report.budget_exhausted:
+                            warning(
+                                f"AI budget of ${report.budget_usd:.2f} reached, "
+                                f"{report.not_scored} packages left unscored"
                             )
-                            progress.update(task7, advance=1)
-                            continue
+                        if report.estimated:
+                            info(
+                                f"{report.estimated} packages kept their local pre-score "
+                                f"(not in the top slice sent to Claude)"
+                            )
+                        info(f"AI scoring cost: ${report.spent_usd:.4f}")
+
+                        cache_stats = await scorer.get_cache_stats()
+                        info(
+                            f"AI cache: {cache_stats['signature_hits']} near-duplicate hits, "
+                            f"{cache_stats['exact_hits']} exact hits, "
+                            f"{cache_stats['api_calls']} API calls "
+                            f"({cache_stats['overall_hit_rate']:.0%} served from cache)"
+                        )
 
-                success(f"Analyzed {stats['analyzed']} packages")
-            finally:
-                await redis_client.close()
+                    success(f"Analyzed {stats['analyzed']} packages")
+                finally:
+                    await close_api_cost_buffer()
+    finally:
+        # Close the shared Redis pools and their heartbeat
+        await close_redis_registry()
 
     # Display final statistics
     console.print("\n")
@@ -904,9 +918,10 @@ async def _show_deals(
             if user_prefs:
                 info(f"Using preferences from database for user {user_id}")
 
-        # Build query
+        # Build query (local pre-score estimates don't count as AI scores)
         query = select(TripPackage).where(
-            TripPackage.ai_score >= min_score
+            TripPackage.ai_score >= min_score,
+            TripPackage.ai_score_provisional.is_(False),
         )
 
         if destination:
@@ -1165,7 +1180,9 @@ def scrape_accommodations(
     ))
 
     try:
-        asyncio.run(_run_accommodation_scrape(city, check_in, check_out, adults, children, save))
+        asyncio.run(run_with_browser_pools(
+            _run_accommodation_scrape(city, check_in, check_out, adults, children, save)
+        ))
     except Exception as e:
         handle_error(e, "Accommodation scraping failed")
 
@@ -1306,7 +1323,7 @@ def test_scraper(
     ))
 
     try:
-        asyncio.run(_test_scraper(scraper, origin, dest, save))
+        asyncio.run(run_with_browser_pools(_test_scraper(scraper, origin, dest, save)))
     except Exception as e:
         handle_error(e, f"Scraper test failed")
 
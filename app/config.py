@@ -6,7 +6,7 @@ Loads environment variables with validation and type checking.
 import tempfile
 from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from pydantic import Field, PostgresDsn, RedisDsn, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -54,6 +54,12 @@ class Settings(BaseSettings):
         ...,
         description="Redis connection URL",
     )
+    redis_max_connections: int = Field(
+        default=50, ge=1, description="Connections per shared Redis pool"
+    )
+    redis_heartbeat_seconds: float = Field(
+        default=5.0, ge=0, description="Seconds between Redis health pings (0 disables)"
+    )
 
     # Celery
     celery_broker_url: Optional[str] = Field(
@@ -99,6 +105,81 @@ class Settings(BaseSettings):
         ge=0.0,
         le=1.0,
     )
+    scraper_max_concurrency: int = Field(
+        default=10,
+        description="Maximum number of scraper tasks running at once across all sources",
+        ge=1,
+    )
+    scraper_concurrency_kiwi: int = Field(
+        default=8, description="Maximum concurrent Kiwi API calls", ge=1
+    )
+    scraper_concurrency_skyscanner: int = Field(
+        default=2, description="Maximum concurrent Skyscanner browser sessions", ge=1
+    )
+    scraper_concurrency_ryanair: int = Field(
+        default=2, description="Maximum concurrent Ryanair browser sessions", ge=1
+    )
+    scraper_concurrency_wizzair: int = Field(
+        default=4, description="Maximum concurrent WizzAir API calls", ge=1
+    )
+    scraper_concurrency_booking: int = Field(
+        default=2, description="Maximum concurrent Booking.com browser sessions", ge=1
+    )
+    scraper_concurrency_airbnb: int = Field(
+        default=3, description="Maximum concurrent Airbnb searches", ge=1
+    )
+    scraper_rate_per_second_kiwi: float = Field(
+        default=1.0, description="Token bucket rate for Kiwi API requests per second", gt=0
+    )
+    scraper_rate_per_second_ryanair: float = Field(
+        default=0.2, description="Token bucket rate for Ryanair searches per second", gt=0
+    )
+    rate_limit_acquire_timeout: float = Field(
+        default=30.0,
+        description="Seconds a scraper waits for rate limit capacity before failing",
+        ge=0,
+    )
+    browser_pool_size: int = Field(
+        default=2, description="Number of warm Chromium browsers kept per launch configuration", ge=1
+    )
+    browser_pool_max_uses: int = Field(
+        default=50, description="Browser contexts served by one browser before it is recycled", ge=1
+    )
+    http_pool_max_connections: int = Field(
+        default=100, description="Total keep-alive connections of the shared HTTP client pool", ge=1
+    )
+    http_pool_max_per_host: int = Field(
+        default=10, description="Keep-alive connections per host in the shared HTTP client pool", ge=1
+    )
+    http_pool_keepalive_seconds: float = Field(
+        default=30.0, description="Seconds an idle pooled HTTP connection is kept open", gt=0
+    )
+    http_pool_dns_cache_seconds: int = Field(
+        default=300, description="TTL of cached DNS lookups in the shared HTTP client pool", ge=1
+    )
+    http_pool_http2: bool = Field(
+        default=True, description="Negotiate HTTP/2 for pooled httpx clients (needs h2)"
+    )
+
+    # Flight bulk save
+    flight_bulk_save: bool = Field(
+        default=True,
+        description="Save flights through the set-based bulk upsert path instead of row by row",
+    )
+    flight_bulk_batch_size: int = Field(
+        default=5000, description="Flights staged per bulk upsert transaction", ge=1
+    )
+
+    # Streaming flight pipeline (scrape -> dedup -> DB)
+    flight_stream_queue_size: int = Field(
+        default=32, description="Scraper results buffered before scrapers block", ge=1
+    )
+    flight_stream_batch_size: int = Field(
+        default=500, description="Unique flights per streaming database write", ge=1
+    )
+    flight_stream_flush_seconds: float = Field(
+        default=2.0, description="Max seconds a streamed flight waits before being written", ge=0
+    )
 
     # Price Thresholds (in EUR)
     max_flight_price_per_person: float = Field(
@@ -108,6 +189,11 @@ class Settings(BaseSettings):
         default=150.0, description="Maximum accommodation price per night in EUR"
     )
     min_deal_score: float = Field(default=7.0, description="Minimum deal score (0-10)")
+    package_top_k_per_city: int = Field(
+        default=0,
+        ge=0,
+        description="Keep only the K cheapest trip packages per city (0 = keep all)",
+    )
 
     # Geographic Settings
     default_departure_airports: str = Field(
@@ -215,6 +301,101 @@ class Settings(BaseSettings):
 
         return v
 
+    # AI Deal Scoring (batch)
+    ai_scoring_max_concurrency: int = Field(
+        default=8, ge=1, description="Maximum concurrent Claude calls when batch scoring"
+    )
+    ai_scoring_budget_usd: float = Field(
+        default=5.0,
+        ge=0.0,
+        description="Stop batch scoring once this much (USD) has been spent on Claude calls",
+    )
+    ai_scoring_commit_batch_size: int = Field(
+        default=25, ge=1, description="Scored packages per database commit"
+    )
+    ai_scoring_rate_limit_cooldown: float = Field(
+        default=10.0,
+        ge=0.0,
+        description="Seconds to pause new Claude calls after a rate limit",
+    )
+    event_scoring_pack_size: int = Field(
+        default=10,
+        ge=1,
+        le=50,
+        description="Events per Claude prompt when scoring a destination (1 = one per call)",
+    )
+
+    # Local pre-scoring (DealPreScorer): only the top slice goes to Claude
+    ai_prescore_enabled: bool = Field(
+        default=True,
+        description="Pre-score batches locally and send only the most promising to Claude",
+    )
+    ai_prescore_claude_fraction: float = Field(
+        default=0.25,
+        gt=0.0,
+        le=1.0,
+        description="Share of pre-scored packages sent to Claude (the rest keep the estimate)",
+    )
+    ai_prescore_min_claude: int = Field(
+        default=20, ge=0, description="Always send at least this many packages to Claude"
+    )
+    ai_prescore_max_claude: int = Field(
+        default=200, ge=1, description="Never send more than this many packages to Claude per run"
+    )
+
+    # Route price statistics for deal prompts (RoutePriceStatsProvider)
+    route_price_stats_ttl: float = Field(
+        default=900.0,
+        ge=0.0,
+        description="Seconds per-route price statistics are reused when building prompts",
+    )
+
+    # Itinerary generation (ItineraryGenerator.generate_batch)
+    itinerary_max_concurrency: int = Field(
+        default=4, ge=1, description="Maximum itineraries generated concurrently in a batch"
+    )
+
+    # Near-duplicate deal score cache (DealSignatureCache)
+    deal_signature_cache_enabled: bool = Field(
+        default=True, description="Reuse scores of packages with the same feature signature"
+    )
+    deal_signature_cache_ttl: int = Field(
+        default=259200, ge=60, description="Seconds a near-duplicate score stays fresh"
+    )
+    deal_signature_price_band_pct: float = Field(
+        default=5.0, gt=0.0, le=100.0, description="Width of a signature price band (%)"
+    )
+    deal_signature_date_bucket_days: int = Field(
+        default=7, ge=1, le=90, description="Width of a signature departure date bucket (days)"
+    )
+
+    # Buffered API cost tracking (ApiCostBuffer)
+    api_cost_buffer_size: int = Field(
+        default=100, ge=1, description="Pending API cost records that trigger a bulk write"
+    )
+    api_cost_flush_seconds: float = Field(
+        default=5.0, gt=0.0, description="Seconds before pending API cost records are written"
+    )
+
+    # Claude prompt caching
+    claude_prompt_caching: bool = Field(
+        default=True,
+        description="Send static prompt template sections as a cached system prompt",
+    )
+
+    # Claude Message Batches (bulk jobs)
+    claude_batch_poll_seconds: float = Field(
+        default=30.0, gt=0.0, description="Seconds between Message Batch status checks"
+    )
+    claude_batch_timeout_seconds: float = Field(
+        default=86400.0,
+        gt=0.0,
+        description="Cancel a Message Batch that has not ended after this many seconds",
+    )
+    claude_batch_max_requests: int = Field(
+        default=10000, ge=1, le=100000, description="Maximum requests per Message Batch"
+    )
+
     # Feature Flags
     enable_scraping: bool = Field(default=True, description="Enable web scraping")
     enable_ai_scoring: bool = Field(default=True, description="Enable AI scoring")
@@ -310,6 +491,32 @@ class Settings(BaseSettings):
 
         return available
 
+    def get_scraper_concurrency_limits(self) -> Dict[str, int]:
+        """
+        Get per-source concurrency limits for flight scrapers.
+
+        Returns:
+            Dict mapping scraper name to maximum concurrent tasks
+        """
+        return {
+            "kiwi": self.scraper_concurrency_kiwi,
+            "skyscanner": self.scraper_concurrency_skyscanner,
+            "ryanair": self.scraper_concurrency_ryanair,
+            "wizzair": self.scraper_concurrency_wizzair,
+        }
+
+    def get_accommodation_concurrency_limits(self) -> Dict[str, int]:
+        """
+        Get per-source concurrency limits for accommodation scrapers.
+
+        Returns:
+            Dict mapping scraper name to maximum concurrent tasks
+        """
+        return {
+            "booking": self.scraper_concurrency_booking,
+            "airbnb": self.scraper_concurrency_airbnb,
+        }
+
     def has_default_scraper(self) -> bool:
         """
         Check if at least one default (no API key) scraper is enabled.
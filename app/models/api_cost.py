@@ -52,6 +52,22 @@ class ApiCost(Base, TimestampMixin):
         comment="Number of output tokens generated",
     )
 
+    cache_read_tokens: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+        comment="Input tokens read from the prompt cache (not in input_tokens)",
+    )
+
+    cache_write_tokens: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+        comment="Input tokens written to the prompt cache (not in input_tokens)",
+    )
+
     # Cost tracking
     cost_usd: Mapped[float] = mapped_column(
         Float,
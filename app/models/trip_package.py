@@ -72,6 +72,13 @@ class TripPackage(Base, TimestampMixin):
         nullable=True,
         comment="AI explanation for the score and package recommendation",
     )
+    ai_score_provisional: Mapped[bool] = mapped_column(
+        Boolean,
+        nullable=False,
+        default=False,
+        server_default="false",
+        comment="Whether ai_score is a local pre-score estimate rather than a Claude score",
+    )
     itinerary_json: Mapped[Optional[dict[str, Any]]] = mapped_column(
         JSONB,
         nullable=True,
@@ -103,8 +110,8 @@ class TripPackage(Base, TimestampMixin):
 
     @property
     def is_high_score(self) -> bool:
-        """Check if package has high AI score (>= 80)."""
-        if self.ai_score:
+        """Check if package has high AI score (>= 80); local estimates don't count."""
+        if self.ai_score and not self.ai_score_provisional:
             return float(self.ai_score) >= 80.0
         return False
 
@@ -198,6 +198,7 @@ class NotificationService:
                 .where(TripPackage.ai_score >= threshold)
                 .where(TripPackage.created_at >= yesterday)
                 .where(TripPackage.notified == False)
+                .where(TripPackage.ai_score_provisional == False)
                 .order_by(TripPackage.ai_score.desc())
                 .limit(10)
             )
@@ -292,6 +293,7 @@ class NotificationService:
                 .filter(TripPackage.ai_score >= threshold)
                 .filter(TripPackage.created_at >= yesterday)
                 .filter(TripPackage.notified == False)
+                .filter(TripPackage.ai_score_provisional == False)
                 .order_by(TripPackage.ai_score.desc())
                 .limit(10)
                 .all()
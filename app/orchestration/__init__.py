@@ -9,5 +9,6 @@ accommodations and events to trip packages.
 from app.orchestration.accommodation_matcher import AccommodationMatcher
 from app.orchestration.event_matcher import EventMatcher
 from app.orchestration.flight_orchestrator import FlightOrchestrator
+from app.orchestration.scrape_scheduler import ScrapeScheduler
 
-__all__ = ["FlightOrchestrator", "AccommodationMatcher", "EventMatcher"]
+__all__ = ["FlightOrchestrator", "AccommodationMatcher", "EventMatcher", "ScrapeScheduler"]
@@ -17,14 +17,16 @@ import logging
 from datetime import date
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
 from rich.table import Table
-from sqlalchemy import select
+from sqlalchemy import exists, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.ai.accommodation_scorer import AccommodationScorer
+from app.config import settings
 from app.models.accommodation import Accommodation
 from app.models.flight import Flight
 from app.models.school_holiday import SchoolHoliday
@@ -44,9 +46,9 @@ class AccommodationMatcher:
 
     Features:
         - Smart matching by destination city
-        - Trip duration filtering (min/max nights)
-        - Budget filtering
-        - School holiday filtering
+        - Trip duration and budget filtering as one NumPy broadcast per city
+        - School holiday filtering in the flight query
+        - Optional top-K cheapest packages per city
         - Accommodation scoring and ranking
         - Comprehensive cost breakdown
         - Batch database operations
@@ -73,13 +75,16 @@ class AccommodationMatcher:
         min_nights: int = 3,
         max_nights: int = 10,
         filter_holidays: bool = True,
+        top_k_per_city: Optional[int] = None,
     ) -> List[TripPackage]:
         """
         Generate all valid trip package combinations.
 
-        Queries flights with calculated true costs, matches them with accommodations
-        in the same destination city, filters by budget and trip duration, and
-        creates TripPackage objects.
+        Queries flights with calculated true costs (restricted to school holiday
+        departures in the query), then per destination city computes the cost of
+        every flight × accommodation pair as one NumPy broadcast and keeps the
+        pairs within the night range and budget. TripPackage objects are only
+        created for those survivors.
 
         Args:
             db: Async database session
@@ -87,9 +92,12 @@ class AccommodationMatcher:
             min_nights: Minimum trip duration in nights (default: 3)
             max_nights: Maximum trip duration in nights (default: 10)
             filter_holidays: Only include trips during school holidays (default: True)
+            top_k_per_city: Keep only the K cheapest packages per city
+                (defaults to settings.package_top_k_per_city; 0 or None keeps all)
 
         Returns:
-            List of TripPackage objects ready for database insertion
+            List of TripPackage objects ready for database insertion, grouped by
+            city (cheapest first when top_k_per_city is set)
 
         Example:
             >>> async with get_async_session_context() as db:
@@ -98,27 +106,63 @@ class AccommodationMatcher:
             ...     )
             ...     print(f"Generated {len(packages)} packages")
         """
+        if top_k_per_city is None:
+            top_k_per_city = settings.package_top_k_per_city
+
         logger.info(
             f"Generating trip packages: budget ≤ €{max_budget}, "
-            f"nights {min_nights}-{max_nights}, filter_holidays={filter_holidays}"
+            f"nights {min_nights}-{max_nights}, filter_holidays={filter_holidays}, "
+            f"top_k_per_city={top_k_per_city or 'all'}"
         )
 
-        packages = []
-
-        # Get all unique destination cities with flights
-        stmt = (
-            select(Flight.destination_airport_id)
-            .where(Flight.true_cost.isnot(None))
-            .distinct()
+        # Round-trip flights with true costs, with holiday windows applied in SQL
+        flight_stmt = (
+            select(Flight)
+            .where(
+                Flight.true_cost.isnot(None),
+                Flight.return_date.isnot(None),  # Only round-trip flights
+            )
+            .options(
+                selectinload(Flight.origin_airport),
+                selectinload(Flight.destination_airport),
+            )
         )
-        result = await db.execute(stmt)
-        destination_airport_ids = [row[0] for row in result.all()]
+        if filter_holidays:
+            holiday_count = await db.scalar(select(func.count()).select_from(SchoolHoliday))
+            if holiday_count:
+                flight_stmt = flight_stmt.where(
+                    exists().where(
+                        SchoolHoliday.start_date <= Flight.departure_date,
+                        SchoolHoliday.end_date >= Flight.departure_date,
+                    )
+                )
+            else:
+                logger.warning("No school holidays found in database, returning all packages")
+
+        flight_result = await db.execute(flight_stmt)
+        flights_by_city: Dict[str, List[Flight]] = {}
+        for flight in flight_result.scalars().all():
+            flights_by_city.setdefault(flight.destination_airport.city, []).append(flight)
+
+        # All accommodations for those cities in one query
+        accommodations_by_city: Dict[str, List[Accommodation]] = {}
+        if flights_by_city:
+            accom_stmt = select(Accommodation).where(
+                Accommodation.destination_city.in_(list(flights_by_city))
+            )
+            accom_result = await db.execute(accom_stmt)
+            for accommodation in accom_result.scalars().all():
+                accommodations_by_city.setdefault(accommodation.destination_city, []).append(
+                    accommodation
+                )
 
         console.print(
             f"\n[bold cyan]Finding trip packages across "
-            f"{len(destination_airport_ids)} destinations...[/bold cyan]\n"
+            f"{len(flights_by_city)} destinations...[/bold cyan]\n"
         )
 
+        packages = []
+
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
@@ -129,46 +173,17 @@ class AccommodationMatcher:
         ) as progress:
             task_id = progress.add_task(
                 "[cyan]Matching flights with accommodations...",
-                total=len(destination_airport_ids),
+                total=len(flights_by_city),
             )
 
-            for airport_id in destination_airport_ids:
-                # Get flights to this destination with relationships loaded
-                flight_stmt = (
-                    select(Flight)
-                    .where(
-                        Flight.destination_airport_id == airport_id,
-                        Flight.true_cost.isnot(None),
-                        Flight.return_date.isnot(None),  # Only round-trip flights
-                    )
-                    .options(
-                        selectinload(Flight.origin_airport),
-                        selectinload(Flight.destination_airport),
-                    )
-                )
-                flight_result = await db.execute(flight_stmt)
-                flights = flight_result.scalars().all()
-
-                if not flights:
-                    progress.update(task_id, advance=1)
-                    continue
-
-                # Get destination city from first flight
-                destination_city = flights[0].destination_airport.city
-
+            for destination_city, flights in flights_by_city.items():
                 # Update progress with current city
                 progress.update(
                     task_id,
                     description=f"[cyan]Processing {destination_city}... ({len(flights)} flights)",
                 )
 
-                # Get accommodations in this city
-                accom_stmt = select(Accommodation).where(
-                    Accommodation.destination_city == destination_city
-                )
-                accom_result = await db.execute(accom_stmt)
-                accommodations = list(accom_result.scalars().all())
-
+                accommodations = accommodations_by_city.get(destination_city)
                 if not accommodations:
                     logger.debug(f"No accommodations found for {destination_city}")
                     console.print(
@@ -188,31 +203,27 @@ class AccommodationMatcher:
                     f"accommodations in {destination_city}"
                 )
 
-                # Create all valid combinations
-                packages_for_city = 0
-                for flight in flights:
-                    num_nights = (flight.return_date - flight.departure_date).days
-
-                    # Skip if outside night range
-                    if not (min_nights <= num_nights <= max_nights):
-                        continue
-
-                    for accommodation in accommodations:
-                        cost = self.calculate_trip_cost(flight, accommodation, num_nights)
-
-                        # Skip if over budget
-                        if cost["total"] > max_budget:
-                            continue
+                flight_idx, accommodation_idx = self.find_affordable_pairs(
+                    flights,
+                    accommodations,
+                    max_budget=max_budget,
+                    min_nights=min_nights,
+                    max_nights=max_nights,
+                    top_k=top_k_per_city,
+                )
 
-                        # Create package
-                        package = self.create_trip_package(flight, accommodation, cost)
-                        packages.append(package)
-                        packages_for_city += 1
+                # Build ORM objects only for the surviving pairs
+                pairs = zip(flight_idx.tolist(), accommodation_idx.tolist(), strict=True)
+                for i, j in pairs:
+                    flight, accommodation = flights[i], accommodations[j]
+                    num_nights = (flight.return_date - flight.departure_date).days
+                    cost = self.calculate_trip_cost(flight, accommodation, num_nights)
+                    packages.append(self.create_trip_package(flight, accommodation, cost))
 
                 # Log completion for this city
-                logger.info(f"✓ {destination_city}: Created {packages_for_city} packages")
+                logger.info(f"✓ {destination_city}: Created {len(flight_idx)} packages")
                 console.print(
-                    f"[dim green]✓ {destination_city}: {packages_for_city} packages created[/dim green]"
+                    f"[dim green]✓ {destination_city}: {len(flight_idx)} packages created[/dim green]"
                 )
 
                 progress.update(task_id, advance=1)
@@ -221,16 +232,80 @@ class AccommodationMatcher:
             f"[bold green]✓ Generated {len(packages)} trip packages[/bold green]\n"
         )
 
-        # Filter by school holidays if requested
-        if filter_holidays:
-            packages = await self.filter_by_school_holidays(db, packages)
-            console.print(
-                f"[bold yellow]Filtered to {len(packages)} packages "
-                f"during school holidays[/bold yellow]\n"
-            )
-
         return packages
 
+    def find_affordable_pairs(
+        self,
+        flights: List[Flight],
+        accommodations: List[Accommodation],
+        max_budget: float,
+        min_nights: int,
+        max_nights: int,
+        top_k: Optional[int] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find flight × accommodation pairs within the night range and budget.
+
+        Broadcasts flight costs (num_flights × 1) against nightly prices
+        (1 × num_accommodations) using the same cost model as
+        calculate_trip_cost(), so no per-pair Python objects are created.
+
+        Args:
+            flights: Round-trip flights to one city (true_cost set)
+            accommodations: Accommodations in that city, in ranked order
+            max_budget: Maximum total trip cost in EUR
+            min_nights: Minimum trip duration in nights
+            max_nights: Maximum trip duration in nights
+            top_k: Keep only the K cheapest pairs (None or 0 keeps all)
+
+        Returns:
+            Tuple of (flight indices, accommodation indices). Without top_k,
+            pairs are ordered by flight then accommodation rank; with top_k,
+            by total cost ascending.
+
+        Example:
+            >>> flight_idx, accom_idx = matcher.find_affordable_pairs(
+            ...     flights, accommodations, max_budget=2000.0, min_nights=3, max_nights=10
+            ... )
+            >>> print(f"{len(flight_idx)} pairs within budget")
+        """
+        empty = np.empty(0, dtype=np.intp)
+        if not flights or not accommodations:
+            return empty, empty
+
+        nights = np.array(
+            [(f.return_date - f.departure_date).days for f in flights], dtype=np.float64
+        )
+        flight_costs = np.array(
+            [float(f.true_cost) if f.true_cost else 0.0 for f in flights], dtype=np.float64
+        )
+        nightly_prices = np.array(
+            [float(a.price_per_night) for a in accommodations], dtype=np.float64
+        )
+
+        in_range = (nights >= min_nights) & (nights <= max_nights)
+        if not in_range.any():
+            return empty, empty
+
+        # total = flight + nights × (nightly price + food + activities), per pair
+        daily_costs = self.DAILY_FOOD_COST + self.DAILY_ACTIVITIES_COST
+        totals = (
+            flight_costs[:, None]
+            + nights[:, None] * nightly_prices[None, :]
+            + (nights * daily_costs)[:, None]
+        )
+        # calculate_trip_cost() compares the total rounded to cents
+        mask = (np.round(totals, 2) <= max_budget) & in_range[:, None]
+
+        flight_idx, accommodation_idx = np.nonzero(mask)
+
+        if top_k:
+            # Stable sort so ties keep flight/accommodation rank order
+            keep = np.argsort(totals[flight_idx, accommodation_idx], kind="stable")[:top_k]
+            flight_idx, accommodation_idx = flight_idx[keep], accommodation_idx[keep]
+
+        return flight_idx, accommodation_idx
+
     def match_flights_to_accommodations(
         self, flights: List[Flight], accommodations: List[Accommodation]
     ) -> List[Tuple[Flight, Accommodation]]:
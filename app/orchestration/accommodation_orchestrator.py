@@ -12,13 +12,20 @@ Example:
     ...     check_out=date(2025, 7, 7)
     ... )
     >>> print(f"Found {len(accommodations)} unique accommodations")
+
+    >>> # Several cities and holiday windows, within per-source limits
+    >>> accommodations = await orchestrator.search_cities(
+    ...     cities=["Barcelona", "Lisbon"],
+    ...     date_ranges=[(date(2025, 7, 1), date(2025, 7, 7))],
+    ... )
 """
 
 import asyncio
+import functools
 import logging
 from collections import defaultdict
 from datetime import date, datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
@@ -30,6 +37,7 @@ from app.config import settings
 from app.database import get_async_session_context
 from app.models.accommodation import Accommodation
 from app.models.scraping_job import ScrapingJob
+from app.orchestration.scrape_scheduler import ScrapeScheduler
 from app.scrapers.booking_scraper import BookingClient
 from app.scrapers.airbnb_scraper import AirbnbClient
 
@@ -47,6 +55,7 @@ class AccommodationOrchestrator:
 
     Features:
         - Parallel execution of all scrapers using asyncio.gather()
+        - Multi-city, multi-window searches with per-source concurrency limits
         - Graceful error handling - continues if individual scrapers fail
         - Deduplication based on name, city, and price range
         - Batch database operations for efficiency
@@ -219,6 +228,97 @@ class AccommodationOrchestrator:
 
         return unique_accommodations
 
+    async def search_cities(
+        self,
+        cities: List[str],
+        date_ranges: List[Tuple[date, date]],
+        adults: int = 2,
+        children: int = 2,
+    ) -> List[Dict]:
+        """
+        Search every city and date range on all sources, deduplicate, and return unique accommodations.
+
+        One job per date range, city and scraper is run through a ScrapeScheduler,
+        so searches for different cities overlap within the per-source limits
+        (settings.get_accommodation_concurrency_limits()) and the global
+        settings.scraper_max_concurrency. Earlier date ranges are started first.
+
+        Args:
+            cities: Destination city names (e.g., ['Barcelona', 'Lisbon'])
+            date_ranges: (check_in, check_out) tuples
+            adults: Number of adults (default: 2)
+            children: Number of children (default: 2)
+
+        Returns:
+            List of unique accommodation dictionaries ready for database insertion
+        """
+        scheduler = ScrapeScheduler(
+            source_limits=settings.get_accommodation_concurrency_limits(),
+            max_concurrency=settings.scraper_max_concurrency,
+        )
+        scrapers = [
+            (self.booking, "booking", "Booking.com"),
+            (self.airbnb, "airbnb", "Airbnb"),
+        ]
+        display_names = {source: display_name for _, source, display_name in scrapers}
+
+        # Earlier holiday windows get higher priority (lower value)
+        for priority, (check_in, check_out) in enumerate(date_ranges):
+            for city in cities:
+                for scraper, scraper_name, display_name in scrapers:
+                    if not scraper:
+                        continue
+                    scheduler.submit(
+                        scraper_name,
+                        functools.partial(
+                            self._scrape_source,
+                            scraper,
+                            scraper_name,
+                            city,
+                            check_in,
+                            check_out,
+                            adults,
+                            children,
+                        ),
+                        priority=priority,
+                        label=f"{display_name}: {city} {check_in}→{check_out}",
+                    )
+
+        if not len(scheduler):
+            logger.warning("No accommodation searches to run")
+            return []
+
+        logger.info(
+            f"Starting {len(scheduler)} accommodation searches for {len(cities)} cities "
+            f"and {len(date_ranges)} date ranges (max {scheduler.max_concurrency} concurrent)"
+        )
+        start_time = datetime.now()
+
+        results = await scheduler.run()
+
+        all_accommodations = []
+        scraper_stats = defaultdict(lambda: {"success": 0, "failed": 0, "accommodations": 0})
+
+        for job, result in zip(scheduler.jobs, results, strict=True):
+            scraper_name = display_names[job.source]
+
+            if isinstance(result, Exception):
+                logger.error(f"Scraper failed ({job.label}): {result}")
+                scraper_stats[scraper_name]["failed"] += 1
+            else:
+                scraper_stats[scraper_name]["success"] += 1
+                scraper_stats[scraper_name]["accommodations"] += len(result)
+                all_accommodations.extend(result)
+
+        elapsed_time = (datetime.now() - start_time).total_seconds()
+        logger.info(
+            f"Accommodation searches completed: {len(all_accommodations)} total "
+            f"accommodations, {elapsed_time:.2f}s elapsed"
+        )
+        self._print_stats_table(scraper_stats, elapsed_time)
+
+        return self.deduplicate(all_accommodations)
+
     def _print_stats_table(self, scraper_stats: Dict, elapsed_time: float):
         """Print a Rich table with scraper statistics."""
         table = Table(title="Scraping Statistics")
@@ -282,23 +382,22 @@ class AccommodationOrchestrator:
 
         try:
             if scraper_name == "booking":
-                # Booking.com scraper
-                async with scraper:
-                    accommodations = await scraper.search(
-                        city=city,
-                        check_in=check_in,
-                        check_out=check_out,
-                        adults=adults,
-                        children_ages=[3, 6] if children >= 2 else [3],
-                        limit=20,
-                    )
-                    # Apply family-friendly filter
-                    accommodations = scraper.filter_family_friendly(
-                        accommodations,
-                        min_bedrooms=2,
-                        max_price=settings.max_accommodation_price_per_night,
-                        min_rating=7.5,
-                    )
+                # Booking.com scraper (leases its own browser context per search)
+                accommodations = await scraper.search(
+                    city=city,
+                    check_in=check_in,
+                    check_out=check_out,
+                    adults=adults,
+                    children_ages=[3, 6] if children >= 2 else [3],
+                    limit=20,
+                )
+                # Apply family-friendly filter
+                accommodations = scraper.filter_family_friendly(
+                    accommodations,
+                    min_bedrooms=2,
+                    max_price=settings.max_accommodation_price_per_night,
+                    min_rating=7.5,
+                )
 
                 # Normalize Booking.com data
                 for acc in accommodations:
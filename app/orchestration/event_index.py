@@ -0,0 +1,126 @@
+"""
+In-memory interval index over event dates.
+
+EventMatcher loads the events of every destination in a batch with one query
+and uses EventIntervalIndex to answer each package's "which events overlap
+these trip dates" question without going back to the database.
+
+Per city, events are kept sorted by start date. A query binary-searches the
+window of start dates that can still overlap the trip (the trip's start minus
+the longest event span up to the trip's end) and checks only those end
+dates, so it costs O(log n + k) for the k matches. Long-running events
+(exhibitions, season-long festivals) would widen that window for everyone,
+so they are kept in a short separate list that is scanned directly.
+
+Example:
+    >>> index = EventIntervalIndex(events)
+    >>> index.overlapping("Lisbon", date(2025, 12, 20), date(2025, 12, 27))
+    [<Event ...>, ...]
+"""
+
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from datetime import date
+from typing import Dict, Iterable, List, Tuple
+
+from app.models.event import Event
+
+# Events spanning more days than this are scanned instead of indexed
+LONG_EVENT_DAYS = 14
+
+
+class _CityIntervals:
+    """Sorted event intervals (as date ordinals) for one city."""
+
+    __slots__ = ("starts", "ends", "events", "max_span", "long_events")
+
+    def __init__(self, intervals: List[Tuple[int, int, Event]], long_event_days: int):
+        """
+        Build the sorted arrays.
+
+        Args:
+            intervals: (start ordinal, end ordinal, event) tuples
+            long_event_days: Span above which events go to the scanned list
+        """
+        short = []
+        self.long_events: List[Tuple[int, int, Event]] = []
+        for interval in intervals:
+            if interval[1] - interval[0] > long_event_days:
+                self.long_events.append(interval)
+            else:
+                short.append(interval)
+
+        # Stable sort keeps the input order for events starting the same day
+        short.sort(key=lambda interval: interval[0])
+        self.starts = [interval[0] for interval in short]
+        self.ends = [interval[1] for interval in short]
+        self.events = [interval[2] for interval in short]
+        self.max_span = max((end - start for start, end, _ in short), default=0)
+
+    def overlapping(self, start: int, end: int) -> List[Event]:
+        """Events whose interval intersects [start, end] (ordinals)."""
+        lo = bisect_left(self.starts, start - self.max_span)
+        hi = bisect_right(self.starts, end)
+        ends = self.ends
+        matches = [self.events[i] for i in range(lo, hi) if ends[i] >= start]
+
+        for event_start, event_end, event in self.long_events:
+            if event_start <= end and event_end >= start:
+                matches.append(event)
+        return matches
+
+
+class EventIntervalIndex:
+    """
+    Per-city interval index answering date-overlap queries for events.
+
+    An event without end_date lasts one day. Overlap matches
+    EventMatcher.find_events_for_trip: the event starts on or before the
+    trip's last day and ends on or after its first day.
+
+    Attributes:
+        size: Number of indexed events
+    """
+
+    def __init__(self, events: Iterable[Event], long_event_days: int = LONG_EVENT_DAYS):
+        """
+        Index events by city and date range.
+
+        Args:
+            events: Events to index
+            long_event_days: Events spanning more days are kept in a scanned
+                list instead of widening the search window (default: 14)
+        """
+        by_city: Dict[str, List[Tuple[int, int, Event]]] = defaultdict(list)
+        self.size = 0
+        for event in events:
+            start = event.event_date.toordinal()
+            end = (event.end_date or event.event_date).toordinal()
+            by_city[event.destination_city].append((start, end, event))
+            self.size += 1
+
+        self._cities = {
+            city: _CityIntervals(intervals, long_event_days)
+            for city, intervals in by_city.items()
+        }
+
+    def overlapping(self, city: str, start_date: date, end_date: date) -> List[Event]:
+        """
+        Find events in a city that overlap a date range.
+
+        Args:
+            city: Destination city name
+            start_date: First day of the range
+            end_date: Last day of the range (inclusive)
+
+        Returns:
+            Matching events, ordered by start date (long-running events last)
+        """
+        intervals = self._cities.get(city)
+        if intervals is None:
+            return []
+        return intervals.overlapping(start_date.toordinal(), end_date.toordinal())
+
+    def __len__(self) -> int:
+        """Number of indexed events."""
+        return self.size
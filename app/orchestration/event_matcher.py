@@ -3,16 +3,58 @@ EventMatcher - Associates events with trip packages.
 
 This module provides functionality to match events from EventBrite and tourism boards
 with trip packages based on destination, dates, and package type (family vs parent_escape).
+
+Batches are matched in memory: the events of all destinations are loaded with
+one query, indexed by city and date range (EventIntervalIndex), and their
+age/category flags and package-independent relevance scores are computed once
+per event rather than once per package.
 """
 
+import heapq
 from datetime import date
-from typing import List, Optional
+from typing import Dict, List, Optional, Set, Tuple
 
 from sqlalchemy import and_, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.event import Event
 from app.models.trip_package import TripPackage
+from app.orchestration.event_index import EventIntervalIndex
+
+# Keywords indicating adult-only content
+ADULT_KEYWORDS = [
+    "18+",
+    "21+",
+    "adults only",
+    "nightclub",
+    "night club",
+    "bar crawl",
+    "pub crawl",
+    "wine tasting",
+    "beer tasting",
+    "cocktail",
+]
+
+# Keywords indicating family-friendly content
+FAMILY_KEYWORDS = [
+    "kids",
+    "children",
+    "family",
+    "playground",
+    "child",
+    "toddler",
+    "baby",
+    "puppet",
+    "animation",
+    "storytelling",
+    "story time",
+]
+
+FAMILY_CATEGORIES = ["family", "cultural"]
+PARENT_ESCAPE_CATEGORIES = ["parent_escape", "cultural"]
+
+# Events kept per package
+MAX_EVENTS_PER_PACKAGE = 10
 
 
 class EventMatcher:
@@ -43,12 +85,13 @@ class EventMatcher:
         """
         Add matching events to each package.
 
-        For each package:
-        1. Find events in destination during trip dates
-        2. Filter by package type (family/parent_escape)
-        3. Apply age appropriateness filters if needed
-        4. Rank by relevance
-        5. Store event IDs in package
+        Events for all packages are loaded with one query and indexed by
+        city and dates. For each package:
+        1. Look up events in destination during trip dates in the index
+        2. Filter by package type (family/parent_escape), using flags
+           computed once per event (age appropriateness for families)
+        3. Rank by relevance
+        4. Store event IDs in package
 
         Args:
             packages: List of TripPackage objects to enrich with events
@@ -56,35 +99,82 @@ class EventMatcher:
         Returns:
             List of TripPackage objects with events_json populated
         """
+        if not packages:
+            return packages
+
+        events = await self.find_events_for_packages(packages)
+        index = EventIntervalIndex(events)
+
+        # Per event: (fits family packages, fits parent escapes, base score)
+        profiles: Dict[int, Tuple[bool, bool, float]] = {
+            id(event): (
+                self.is_age_appropriate(event) and event.category in FAMILY_CATEGORIES,
+                event.category in PARENT_ESCAPE_CATEGORIES,
+                self._base_relevance(event),
+            )
+            for event in events
+        }
+
         for package in packages:
             # Find events in destination during trip dates
-            events = await self.find_events_for_trip(
+            candidates = index.overlapping(
                 package.destination_city,
                 package.departure_date,
                 package.return_date,
             )
 
             # Filter by package type
-            if package.package_type == "family":
-                # Apply age appropriateness filter for families with young kids
-                events = self.filter_by_age_appropriateness(events)
-                # Keep only family and cultural events
-                events = self.categorize_for_package_type(events, "family")
-            else:  # parent_escape
-                # Keep only parent escape and cultural events
-                events = self.categorize_for_package_type(events, "parent_escape")
+            flag = 0 if package.package_type == "family" else 1
+            candidates = [event for event in candidates if profiles[id(event)][flag]]
 
             # Rank events by relevance and keep top 10
-            events = self.rank_events_by_relevance(events, package)
+            trip_weekdays = self._trip_weekdays(package)
+            ranked = heapq.nlargest(
+                MAX_EVENTS_PER_PACKAGE,
+                candidates,
+                key=lambda event: profiles[id(event)][2]
+                + self._weekend_bonus(event, trip_weekdays),
+            )
 
             # Store event IDs in package
-            if events:
-                package.events_json = [event.id for event in events]
-            else:
-                package.events_json = []
+            package.events_json = [event.id for event in ranked]
 
         return packages
 
+    async def find_events_for_packages(self, packages: List[TripPackage]) -> List[Event]:
+        """
+        Load the events that can overlap any of the packages, in one query.
+
+        Selects events in the packages' destinations that overlap the span
+        from the earliest departure to the latest return.
+
+        Args:
+            packages: Trip packages to load events for
+
+        Returns:
+            List of Event objects (a superset of each package's matches)
+        """
+        if not packages:
+            return []
+
+        cities = {package.destination_city for package in packages}
+        span_start = min(package.departure_date for package in packages)
+        span_end = max(package.return_date for package in packages)
+
+        stmt = select(Event).where(
+            and_(
+                Event.destination_city.in_(cities),
+                Event.event_date <= span_end,
+                or_(
+                    Event.end_date >= span_start,
+                    and_(Event.end_date.is_(None), Event.event_date >= span_start),
+                ),
+            )
+        )
+
+        result = await self.db.execute(stmt)
+        return list(result.scalars().all())
+
     async def find_events_for_trip(
         self,
         destination: str,
@@ -153,56 +243,33 @@ class EventMatcher:
         if kids_ages is None:
             kids_ages = [3, 6]
 
-        appropriate = []
-
-        # Keywords indicating adult-only content
-        adult_keywords = [
-            "18+",
-            "21+",
-            "adults only",
-            "nightclub",
-            "night club",
-            "bar crawl",
-            "pub crawl",
-            "wine tasting",
-            "beer tasting",
-            "cocktail",
-        ]
-
-        # Keywords indicating family-friendly content
-        family_keywords = [
-            "kids",
-            "children",
-            "family",
-            "playground",
-            "child",
-            "toddler",
-            "baby",
-            "puppet",
-            "animation",
-            "storytelling",
-            "story time",
-        ]
-
-        for event in events:
-            title_lower = event.title.lower()
-            desc_lower = event.description.lower() if event.description else ""
-            combined_text = title_lower + " " + desc_lower
-
-            # Exclude adult-only events
-            if any(word in combined_text for word in adult_keywords):
-                continue
-
-            # For young kids (3-6), prefer specific types
-            is_family_friendly = any(
-                word in combined_text for word in family_keywords
-            )
-            is_appropriate_category = event.category in ["family", "cultural"]
+        return [event for event in events if self.is_age_appropriate(event)]
+
+    @staticmethod
+    def is_age_appropriate(event: Event) -> bool:
+        """
+        Check whether an event suits young children (ages 3-6).
+
+        Args:
+            event: Event to check
+
+        Returns:
+            False for adult-only events; otherwise True if the event mentions
+            kids/family content or is in a family or cultural category
+        """
+        title_lower = event.title.lower()
+        desc_lower = event.description.lower() if event.description else ""
+        combined_text = title_lower + " " + desc_lower
+
+        # Exclude adult-only events
+        if any(word in combined_text for word in ADULT_KEYWORDS):
+            return False
 
-            if is_family_friendly or is_appropriate_category:
-                appropriate.append(event)
+        # For young kids (3-6), prefer specific types
+        is_family_friendly = any(word in combined_text for word in FAMILY_KEYWORDS)
+        is_appropriate_category = event.category in FAMILY_CATEGORIES
 
-        return appropriate
+        return is_family_friendly or is_appropriate_category
 
     def categorize_for_package_type(
         self,
@@ -224,10 +291,10 @@ class EventMatcher:
         """
         if package_type == "family":
             # Keep family and cultural events
-            return [e for e in events if e.category in ["family", "cultural"]]
+            return [e for e in events if e.category in FAMILY_CATEGORIES]
         elif package_type == "parent_escape":
             # Keep parent escape and cultural events
-            return [e for e in events if e.category in ["parent_escape", "cultural"]]
+            return [e for e in events if e.category in PARENT_ESCAPE_CATEGORIES]
         else:
             # Unknown package type, return all events
             return events
@@ -255,39 +322,82 @@ class EventMatcher:
         if not events:
             return []
 
-        def score_event(event: Event) -> float:
-            """Calculate relevance score for an event."""
-            score = 0.0
-
-            # AI relevance score (0-10) - primary ranking factor
-            if event.ai_relevance_score is not None:
-                score += float(event.ai_relevance_score) * 10  # Weight: 0-100
-            else:
-                score += 50  # Default middle score if no AI score
-
-            # Free events get bonus points
-            if event.price_range and "free" in event.price_range.lower():
-                score += 20
-
-            # Weekend events get bonus if trip includes weekend
-            if hasattr(package, "departure_date") and hasattr(package, "return_date"):
-                # Check if event is on weekend (Saturday=5, Sunday=6)
-                event_weekday = event.event_date.weekday()
-                if event_weekday in [5, 6]:
-                    # Check if trip includes this weekend
-                    trip_weekdays = [
-                        (package.departure_date.toordinal() + i) % 7
-                        for i in range((package.return_date - package.departure_date).days + 1)
-                    ]
-                    if event_weekday in trip_weekdays:
-                        score += 10
-
-            # Multi-day events get slight penalty (less flexible scheduling)
-            if event.end_date and event.end_date > event.event_date:
-                score -= 5
-
-            return score
-
         # Sort events by score (highest first) and return top 10
-        scored_events = sorted(events, key=score_event, reverse=True)
-        return scored_events[:10]
+        scored_events = sorted(
+            events, key=lambda event: self.score_event_relevance(event, package), reverse=True
+        )
+        return scored_events[:MAX_EVENTS_PER_PACKAGE]
+
+    def score_event_relevance(self, event: Event, package: TripPackage) -> float:
+        """
+        Calculate the relevance score of an event for a trip.
+
+        Args:
+            event: The event to score
+            package: The trip package for context
+
+        Returns:
+            Relevance score (roughly 0-130, higher is more relevant)
+        """
+        score = self._base_relevance(event)
+
+        # Weekend events get bonus if trip includes weekend
+        if hasattr(package, "departure_date") and hasattr(package, "return_date"):
+            score += self._weekend_bonus(event, self._trip_weekdays(package))
+
+        return score
+
+    @staticmethod
+    def _base_relevance(event: Event) -> float:
+        """
+        Relevance score parts that don't depend on the trip.
+
+        Args:
+            event: The event to score
+
+        Returns:
+            AI score, free-event bonus and multi-day penalty combined
+        """
+        score = 0.0
+
+        # AI relevance score (0-10) - primary ranking factor
+        if event.ai_relevance_score is not None:
+            score += float(event.ai_relevance_score) * 10  # Weight: 0-100
+        else:
+            score += 50  # Default middle score if no AI score
+
+        # Free events get bonus points
+        if event.price_range and "free" in event.price_range.lower():
+            score += 20
+
+        # Multi-day events get slight penalty (less flexible scheduling)
+        if event.end_date and event.end_date > event.event_date:
+            score -= 5
+
+        return score
+
+    @staticmethod
+    def _trip_weekdays(package: TripPackage) -> Set[int]:
+        """Weekday numbers covered by a trip, as compared in _weekend_bonus."""
+        return {
+            (package.departure_date.toordinal() + i) % 7
+            for i in range((package.return_date - package.departure_date).days + 1)
+        }
+
+    @staticmethod
+    def _weekend_bonus(event: Event, trip_weekdays: Set[int]) -> float:
+        """
+        Bonus for weekend events when the trip includes that weekend day.
+
+        Args:
+            event: The event to score
+            trip_weekdays: Result of _trip_weekdays() for the trip
+
+        Returns:
+            10 for a matching weekend event, otherwise 0
+        """
+        # Check if event is on weekend (Saturday=5, Sunday=6)
+        event_weekday = event.event_date.weekday()
+        if event_weekday in [5, 6] and event_weekday in trip_weekdays:
+            return 10.0
+        return 0.0
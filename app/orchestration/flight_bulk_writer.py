@@ -0,0 +1,426 @@
+"""
+Set-based bulk upsert of scraped flights into PostgreSQL.
+
+The row-by-row save path flushes after every new flight, writes one
+price_history row per flight and finds duplicates with a large OR of AND
+clauses. This writer handles a whole batch with a fixed number of statements:
+
+1. Missing airports are created with INSERT ... ON CONFLICT DO NOTHING
+2. The batch is staged in a temporary table (dropped on commit)
+3. Each staged row is matched to an existing flight (same route, airline and
+   date, departure within ±2 hours) in SQL
+4. Cheaper matches are applied with UPDATE ... FROM, new flights are added
+   with INSERT ... SELECT
+5. All price_history rows are written with one INSERT ... SELECT
+
+Matching follows the row-by-row path: rows are matched against flights that
+existed before the batch, rows without a departure time match any flight on
+that day, and an existing flight is only updated when the new price is lower.
+When several rows of one batch match the same flight, the cheapest one wins.
+
+Example:
+    >>> async with get_async_session_context() as db:
+    ...     stats = await FlightBulkWriter(db).write(flights)
+    ...     await db.commit()
+    >>> print(f"Inserted {stats['inserted']}, Updated {stats['updated']}")
+"""
+
+import logging
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import (
+    Boolean,
+    Column,
+    Date,
+    DateTime,
+    Integer,
+    MetaData,
+    Numeric,
+    String,
+    Table,
+    Text,
+    Time,
+    and_,
+    case,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.airport import Airport
+from app.models.flight import Flight
+from app.models.price_history import PriceHistory
+from app.utils.date_utils import parse_time
+
+logger = logging.getLogger(__name__)
+
+# Staged row outcomes
+ACTION_INSERT = "insert"
+ACTION_UPDATE = "update"
+ACTION_SKIP = "skip"
+
+_staging = Table(
+    "flight_staging",
+    MetaData(),
+    Column("idx", Integer, primary_key=True, autoincrement=False),
+    Column("origin_airport_id", Integer, nullable=False),
+    Column("destination_airport_id", Integer, nullable=False),
+    Column("route", String(10), nullable=False),
+    Column("airline", String(50), nullable=False),
+    Column("departure_date", Date, nullable=False),
+    Column("departure_time", Time),
+    Column("time_lower", Time),
+    Column("time_upper", Time),
+    Column("return_date", Date),
+    Column("return_time", Time),
+    Column("price_per_person", Numeric(10, 2), nullable=False),
+    Column("total_price", Numeric(10, 2), nullable=False),
+    Column("booking_class", String(20)),
+    Column("direct_flight", Boolean, nullable=False),
+    Column("source", String(50), nullable=False),
+    Column("booking_url", Text),
+    Column("has_booking_url", Boolean, nullable=False),
+    Column("match_id", Integer),
+    Column("action", String(10), nullable=False, server_default=ACTION_SKIP),
+    prefixes=["TEMPORARY"],
+    postgresql_on_commit="DROP",
+)
+
+
+def _parse_date(value: Any) -> Optional[date]:
+    """Parse a YYYY-MM-DD string, returning None if invalid."""
+    if not value or value == "None":
+        return None
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except (ValueError, TypeError):
+        return None
+
+
+def _resolve_prices(flight_data: Dict) -> Tuple[float, float]:
+    """Derive (price_per_person, total_price) the same way as the row-by-row path."""
+    price_per_person = flight_data.get("price_per_person")
+    if price_per_person is None:
+        total_price = flight_data.get("total_price", 0)
+        price_per_person = total_price / 4 if total_price else 0
+
+    total_price = flight_data.get("total_price")
+    if total_price is None:
+        total_price = price_per_person * 4
+
+    return float(price_per_person), float(total_price)
+
+
+def prepare_staging_rows(
+    flights: Sequence[Dict], airport_ids: Dict[str, int]
+) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Convert flight dictionaries to staging rows.
+
+    Each distinct time string is parsed once. Flights with unknown airports,
+    an invalid departure date or unusable prices are skipped.
+
+    Args:
+        flights: Flight dictionaries to save
+        airport_ids: Airport id by upper-case IATA code
+
+    Returns:
+        Tuple of (staging rows, number of skipped flights)
+    """
+    rows = []
+    skipped = 0
+    parsed_times: Dict[Any, Any] = {}
+
+    def cached_time(value):
+        try:
+            return parsed_times[value]
+        except KeyError:
+            parsed_times[value] = parse_time(value, context="flight bulk save")
+            return parsed_times[value]
+        except TypeError:
+            # Unhashable value, parse without caching
+            return parse_time(value, context="flight bulk save")
+
+    for idx, flight_data in enumerate(flights):
+        origin_code = (flight_data.get("origin_airport") or "").upper()
+        dest_code = (flight_data.get("destination_airport") or "").upper()
+
+        if origin_code not in airport_ids or dest_code not in airport_ids:
+            logger.warning(
+                f"Skipping flight: airports not found "
+                f"({flight_data.get('origin_airport')} or "
+                f"{flight_data.get('destination_airport')})"
+            )
+            skipped += 1
+            continue
+
+        departure_date = _parse_date(flight_data.get("departure_date"))
+        if departure_date is None:
+            logger.warning(f"Invalid departure_date: {flight_data.get('departure_date')}")
+            skipped += 1
+            continue
+
+        try:
+            price_per_person, total_price = _resolve_prices(flight_data)
+        except (ValueError, TypeError) as e:
+            logger.warning(f"Invalid price for flight {origin_code}->{dest_code}: {e}")
+            skipped += 1
+            continue
+
+        departure_time = cached_time(flight_data.get("departure_time"))
+        if departure_time is not None:
+            departure = datetime.combine(departure_date, departure_time)
+            time_lower = (departure - timedelta(hours=2)).time()
+            time_upper = (departure + timedelta(hours=2)).time()
+        else:
+            time_lower = time_upper = None
+
+        rows.append(
+            {
+                "idx": idx,
+                "origin_airport_id": airport_ids[origin_code],
+                "destination_airport_id": airport_ids[dest_code],
+                "route": f"{origin_code}-{dest_code}",
+                "airline": flight_data.get("airline", "Unknown"),
+                "departure_date": departure_date,
+                "departure_time": departure_time,
+                "time_lower": time_lower,
+                "time_upper": time_upper,
+                "return_date": _parse_date(flight_data.get("return_date")),
+                "return_time": cached_time(flight_data.get("return_time")),
+                "price_per_person": price_per_person,
+                "total_price": total_price,
+                "booking_class": flight_data.get("booking_class", "Economy"),
+                "direct_flight": flight_data.get("direct_flight", True),
+                "source": flight_data.get("source", "unknown"),
+                "booking_url": flight_data.get("booking_url"),
+                "has_booking_url": "booking_url" in flight_data,
+            }
+        )
+
+    return rows, skipped
+
+
+class FlightBulkWriter:
+    """
+    Writes a batch of flights with set-based SQL statements.
+
+    The caller owns the transaction: commit after write() to persist the
+    batch (this also drops the staging table).
+
+    Attributes:
+        db: Async database session (PostgreSQL)
+    """
+
+    def __init__(self, db: AsyncSession):
+        """
+        Initialize the writer.
+
+        Args:
+            db: Async database session
+        """
+        self.db = db
+
+    async def resolve_airports(self, flights: Sequence[Dict]) -> Dict[str, int]:
+        """
+        Get airport ids for all codes in the batch, creating missing airports.
+
+        Args:
+            flights: Flight dictionaries
+
+        Returns:
+            Airport id by upper-case IATA code
+        """
+        cities: Dict[str, str] = {}
+        for flight_data in flights:
+            for code_key, city_key in (
+                ("origin_airport", "origin_city"),
+                ("destination_airport", "destination_city"),
+            ):
+                code = (flight_data.get(code_key) or "").upper()
+                if code and not cities.get(code):
+                    cities[code] = flight_data.get(city_key) or ""
+
+        if not cities:
+            return {}
+
+        result = await self.db.execute(
+            select(Airport.iata_code, Airport.id).where(Airport.iata_code.in_(cities))
+        )
+        airport_ids = dict(result.all())
+
+        missing = [code for code in cities if code not in airport_ids]
+        if missing:
+            logger.info(f"Creating {len(missing)} new airports: {', '.join(sorted(missing))}")
+            stmt = (
+                pg_insert(Airport)
+                .values(
+                    [
+                        {
+                            "iata_code": code,
+                            "name": f"{cities[code]} Airport" if cities[code] else f"{code} Airport",
+                            "city": cities[code] or code,
+                            "distance_from_home": 0,
+                            "driving_time": 0,
+                        }
+                        for code in missing
+                    ]
+                )
+                .on_conflict_do_nothing(index_elements=[Airport.iata_code])
+            )
+            await self.db.execute(stmt)
+
+            result = await self.db.execute(
+                select(Airport.iata_code, Airport.id).where(Airport.iata_code.in_(missing))
+            )
+            airport_ids.update(result.all())
+
+        return airport_ids
+
+    async def write(self, flights: Sequence[Dict]) -> Dict[str, int]:
+        """
+        Upsert a batch of flights and record their prices.
+
+        Args:
+            flights: Flight dictionaries to save
+
+        Returns:
+            Dict with 'inserted', 'updated' and 'skipped' counts for the batch
+        """
+        stats = {"inserted": 0, "updated": 0, "skipped": 0}
+        if not flights:
+            return stats
+
+        airport_ids = await self.resolve_airports(flights)
+        rows, stats["skipped"] = prepare_staging_rows(flights, airport_ids)
+        if not rows:
+            return stats
+
+        s = _staging.c
+        now = datetime.now()
+
+        await self.db.run_sync(lambda session: _staging.create(session.connection()))
+        await self.db.execute(insert(_staging), rows)
+
+        # Match each staged row to the first existing flight in its ±2h window
+        candidates = (
+            select(
+                s.idx,
+                Flight.id.label("flight_id"),
+                func.row_number().over(partition_by=s.idx, order_by=Flight.id).label("rank"),
+            )
+            .join(
+                Flight,
+                and_(
+                    Flight.origin_airport_id == s.origin_airport_id,
+                    Flight.destination_airport_id == s.destination_airport_id,
+                    Flight.airline == s.airline,
+                    Flight.departure_date == s.departure_date,
+                    or_(
+                        s.departure_time.is_(None),
+                        Flight.departure_time.between(s.time_lower, s.time_upper),
+                    ),
+                ),
+            )
+            .subquery()
+        )
+        await self.db.execute(
+            update(_staging)
+            .where(s.idx == candidates.c.idx, candidates.c.rank == 1)
+            .values(match_id=candidates.c.flight_id)
+        )
+
+        # Cheapest cheaper row per matched flight becomes its update
+        cheaper = (
+            select(
+                s.idx,
+                func.row_number()
+                .over(partition_by=s.match_id, order_by=(s.price_per_person, s.idx))
+                .label("rank"),
+            )
+            .join(Flight, Flight.id == s.match_id)
+            .where(s.price_per_person < Flight.price_per_person)
+            .subquery()
+        )
+        await self.db.execute(
+            update(_staging)
+            .where(s.idx == cheaper.c.idx, cheaper.c.rank == 1)
+            .values(action=ACTION_UPDATE)
+        )
+        await self.db.execute(
+            update(_staging).where(s.match_id.is_(None)).values(action=ACTION_INSERT)
+        )
+
+        await self.db.execute(
+            update(Flight)
+            .where(Flight.id == s.match_id, s.action == ACTION_UPDATE)
+            .values(
+                price_per_person=s.price_per_person,
+                total_price=s.total_price,
+                booking_url=case((s.has_booking_url, s.booking_url), else_=Flight.booking_url),
+                scraped_at=now,
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+        flight_columns = [
+            "origin_airport_id",
+            "destination_airport_id",
+            "airline",
+            "departure_date",
+            "departure_time",
+            "return_date",
+            "return_time",
+            "price_per_person",
+            "total_price",
+            "booking_class",
+            "direct_flight",
+            "source",
+            "booking_url",
+        ]
+        await self.db.execute(
+            insert(Flight).from_select(
+                flight_columns + ["scraped_at"],
+                select(*[s[name] for name in flight_columns], literal(now, DateTime(timezone=True)))
+                .where(s.action == ACTION_INSERT)
+                .order_by(s.idx),
+            )
+        )
+
+        # One price_history row per staged flight: the new price for inserts and
+        # updates, the existing flight's current price for skipped duplicates
+        is_skip = s.action == ACTION_SKIP
+        await self.db.execute(
+            insert(PriceHistory).from_select(
+                ["route", "price", "source", "scraped_at"],
+                select(
+                    s.route,
+                    case((is_skip, Flight.price_per_person), else_=s.price_per_person),
+                    func.coalesce(Flight.source, s.source),
+                    case(
+                        (is_skip, Flight.scraped_at),
+                        else_=literal(now, DateTime(timezone=True)),
+                    ),
+                )
+                .select_from(_staging.outerjoin(Flight, Flight.id == s.match_id))
+                .order_by(s.idx),
+            )
+        )
+
+        result = await self.db.execute(select(s.action, func.count()).group_by(s.action))
+        counts = dict(result.all())
+        stats["inserted"] = counts.get(ACTION_INSERT, 0)
+        stats["updated"] = counts.get(ACTION_UPDATE, 0)
+        stats["skipped"] += counts.get(ACTION_SKIP, 0)
+
+        logger.info(
+            f"Bulk saved {len(rows)} flights: {stats['inserted']} inserted, "
+            f"{stats['updated']} updated, {stats['skipped']} skipped"
+        )
+        return stats
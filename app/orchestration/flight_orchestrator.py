@@ -15,10 +15,11 @@ Example:
 """
 
 import asyncio
+import functools
 import logging
 from collections import defaultdict
 from datetime import date, datetime, time, timedelta
-from typing import Dict, List, Optional, Tuple
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple, Union
 
 from redis.asyncio import Redis
 from rich.console import Console
@@ -34,17 +35,24 @@ from app.exceptions import ScraperFailureThresholdExceeded
 from app.models.airport import Airport
 from app.models.flight import Flight
 from app.models.scraping_job import ScrapingJob
+from app.orchestration.flight_bulk_writer import FlightBulkWriter
+from app.orchestration.scrape_scheduler import ScrapeJob, ScrapeScheduler
+from app.scrapers.http_pool import HttpClientPool
 from app.scrapers.kiwi_scraper import KiwiClient
 from app.scrapers.ryanair_scraper import RyanairScraper
 from app.scrapers.skyscanner_scraper import SkyscannerScraper
 from app.scrapers.wizzair_scraper import WizzAirScraper
 from app.services.price_history_service import PriceHistoryService
 from app.utils.date_utils import parse_time
-from app.utils.flight_cache import FlightDeduplicationCache
+from app.utils.flight_cache import FlightGroupIndex
+from app.utils.flight_deduplication import IncrementalFlightDeduplicator, deduplicate_flights
 
 logger = logging.getLogger(__name__)
 console = Console()
 
+# Marks the end of a streaming queue
+_END_OF_STREAM = object()
+
 
 class FlightOrchestrator:
     """
@@ -55,18 +63,21 @@ class FlightOrchestrator:
     airline, and timing, and saves unique flights to the database.
 
     Features:
-        - Parallel execution of all scrapers using asyncio.gather()
+        - Parallel execution of all scrapers with per-source and global concurrency limits
         - Graceful error handling - continues if individual scrapers fail
         - Deduplication based on route + airline + time window
         - Batch database operations for efficiency
         - Progress tracking with Rich console output
         - Comprehensive logging and statistics
+        - Keep-alive HTTP connections shared by the API scrapers; call close()
+          (or use ``async with``) when done to release them
 
     Attributes:
         kiwi: Kiwi.com API client
         skyscanner: Skyscanner web scraper
         ryanair: Ryanair web scraper
         wizzair: WizzAir API scraper
+        http_pool: HTTP client pool owned by the orchestrator
     """
 
     def __init__(self, enabled_scrapers: Optional[List[str]] = None, redis_client: Optional[Redis] = None):
@@ -85,18 +96,25 @@ class FlightOrchestrator:
         else:
             self.enabled_scrapers = settings.get_available_scrapers()
 
+        # API scrapers borrow keep-alive clients from a pool owned by the orchestrator
+        self.http_pool = HttpClientPool()
+
         # Initialize only enabled scrapers
-        self.kiwi = KiwiClient() if "kiwi" in self.enabled_scrapers else None
+        self.kiwi = (
+            KiwiClient(http_pool=self.http_pool) if "kiwi" in self.enabled_scrapers else None
+        )
         self.skyscanner = (
             SkyscannerScraper(headless=True) if "skyscanner" in self.enabled_scrapers else None
         )
         self.ryanair = RyanairScraper() if "ryanair" in self.enabled_scrapers else None
-        self.wizzair = WizzAirScraper() if "wizzair" in self.enabled_scrapers else None
+        self.wizzair = (
+            WizzAirScraper(http_pool=self.http_pool) if "wizzair" in self.enabled_scrapers else None
+        )
 
         # Initialize flight cache if Redis is available
         self.cache = None
         if redis_client:
-            self.cache = FlightDeduplicationCache(
+            self.cache = FlightGroupIndex(
                 redis_client=redis_client,
                 ttl=settings.cache_ttl_flights,  # Use configured TTL (default: 3600s)
             )
@@ -113,6 +131,18 @@ class FlightOrchestrator:
             f"{', '.join(self.enabled_scrapers)}"
         )
 
+    async def __aenter__(self) -> "FlightOrchestrator":
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Async context manager exit."""
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the pooled HTTP connections used by the API scrapers."""
+        await self.http_pool.close()
+
     async def scrape_all(
         self,
         origins: List[str],
@@ -122,9 +152,11 @@ class FlightOrchestrator:
         """
         Run all scrapers in parallel, deduplicate, and return unique flights.
 
-        This is the main entry point for flight scraping. It creates tasks for all
+        This is the main entry point for flight scraping. It creates jobs for all
         combinations of origins, destinations, date ranges, and scrapers, then runs
-        them concurrently using asyncio.gather().
+        them concurrently through a ScrapeScheduler, which caps in-flight jobs per
+        source (settings.scraper_concurrency_*) and globally
+        (settings.scraper_max_concurrency). Earlier date ranges are scheduled first.
 
         Args:
             origins: List of origin airport IATA codes (e.g., ['MUC', 'FMM', 'NUE', 'SZG'])
@@ -149,55 +181,291 @@ class FlightOrchestrator:
 
         start_time = datetime.now()
 
-        # Create tasks for all combinations
-        tasks = []
+        # Queue one job per combination; the scheduler bounds how many run at once
+        scheduler, task_metadata = self._schedule_scrapes(
+            origins,
+            destinations,
+            date_ranges,
+            lambda *args: functools.partial(self.scrape_source, *args),
+        )
+
+        results = await self._run_scheduled_scrapes(scheduler, task_metadata)
+
+        # Process results and collect statistics (raises if too many scrapers failed)
+        self._summarize_results(results, task_metadata, start_time)
+
+        all_flights = [
+            flight for result in results if isinstance(result, list) for flight in result
+        ]
+
+        # Deduplicate flights (with caching if available)
+        console.print(f"\n[bold yellow]Deduplicating {len(all_flights)} flights...[/bold yellow]")
+        unique_flights = await self.deduplicate(all_flights)
+
+        console.print(
+            f"[bold green]✓ Found {len(unique_flights)} unique flights "
+            f"(removed {len(all_flights) - len(unique_flights)} duplicates)[/bold green]\n"
+        )
+
+        return unique_flights
+
+    async def stream_to_database(
+        self,
+        origins: List[str],
+        destinations: List[str],
+        date_ranges: List[Tuple[date, date]],
+        queue_size: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+    ) -> Dict[str, int]:
+        """
+        Scrape, deduplicate and save flights as a streaming pipeline.
+
+        Unlike scrape_all + save_to_database, nothing waits for the whole scrape:
+        - Each finished scraper job pushes its normalized flights into a bounded
+          queue; when the queue is full the job holds its scheduler slot, so
+          scraping slows down to the pace of the consumers (backpressure)
+        - An incremental deduplicator drops flights that are not cheaper than
+          their group's best so far; with Redis configured the groups live in
+          the FlightGroupIndex, so this also covers earlier runs
+        - A batched writer saves unique flights once ``batch_size`` are pending
+          or ``flush_interval`` seconds have passed, so first results reach the
+          database shortly after the first scraper returns
+
+        Scraper statistics and the failure threshold check match scrape_all.
+        The threshold is checked after all received flights have been saved.
+
+        Args:
+            origins: List of origin airport IATA codes
+            destinations: List of destination airport IATA codes
+            date_ranges: List of (departure_date, return_date) tuples
+            queue_size: Scraper results buffered before producers block
+                (defaults to settings.flight_stream_queue_size)
+            batch_size: Flights per database write
+                (defaults to settings.flight_stream_batch_size)
+            flush_interval: Max seconds a pending flight waits before being written
+                (defaults to settings.flight_stream_flush_seconds)
+
+        Returns:
+            Dict with 'scraped', 'unique', 'inserted', 'updated' and 'skipped' counts
+
+        Example:
+            >>> stats = await orchestrator.stream_to_database(
+            ...     origins=['MUC'], destinations=['LIS'],
+            ...     date_ranges=[(date(2025, 12, 20), date(2025, 12, 27))],
+            ... )
+            >>> print(f"Saved {stats['inserted']} new flights")
+        """
+        queue_size = queue_size or settings.flight_stream_queue_size
+        batch_size = batch_size or settings.flight_stream_batch_size
+        if flush_interval is None:
+            flush_interval = settings.flight_stream_flush_seconds
+
+        start_time = datetime.now()
+        scraped_queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        unique_queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        if self.cache:
+            # Fresh index object so stats cover this run; groups persist in Redis
+            deduplicator = FlightGroupIndex(
+                self.cache.redis, ttl=self.cache.ttl, key_prefix=self.cache.key_prefix
+            )
+        else:
+            deduplicator = IncrementalFlightDeduplicator()
+        totals = {"inserted": 0, "updated": 0, "skipped": 0}
+
+        scheduler, task_metadata = self._schedule_scrapes(
+            origins,
+            destinations,
+            date_ranges,
+            lambda *args: functools.partial(self._scrape_into_queue, scraped_queue, *args),
+        )
+
+        consumers = [
+            asyncio.ensure_future(
+                self._deduplicate_stream(scraped_queue, unique_queue, deduplicator)
+            ),
+            asyncio.ensure_future(
+                self._write_stream(unique_queue, totals, batch_size, flush_interval)
+            ),
+        ]
+        producers = asyncio.ensure_future(
+            self._run_scheduled_scrapes(scheduler, task_metadata)
+        )
+
+        try:
+            done, _ = await asyncio.wait(
+                [producers, *consumers], return_when=asyncio.FIRST_COMPLETED
+            )
+            for consumer in consumers:
+                if consumer in done:
+                    # Consumers only finish early on error; surface it (stops scraping)
+                    consumer.result()
+
+            results = await producers
+            await scraped_queue.put(_END_OF_STREAM)
+            await asyncio.gather(*consumers)
+        finally:
+            unfinished = [f for f in (producers, *consumers) if not f.done()]
+            for future in unfinished:
+                future.cancel()
+            # Let cancelled scrapers and consumers unwind before returning
+            await asyncio.gather(*unfinished, return_exceptions=True)
+
+        self._summarize_results(results, task_metadata, start_time)
+
+        dedup_stats = deduplicator.get_stats()
+        stats = {
+            "scraped": dedup_stats["received"],
+            "unique": dedup_stats["unique"],
+            **totals,
+        }
+        console.print(
+            f"[bold green]✓ Streamed {stats['unique']} unique flights to the database "
+            f"({stats['inserted']} inserted, {stats['updated']} updated, "
+            f"{stats['skipped']} skipped)[/bold green]\n"
+        )
+        return stats
+
+    async def _scrape_into_queue(self, queue: asyncio.Queue, *args) -> int:
+        """
+        Run scrape_source and push its flights into the streaming queue.
+
+        Returns the flight count instead of the flights so scheduler results
+        don't keep every flight in memory.
+        """
+        flights = await self.scrape_source(*args)
+        if flights:
+            await queue.put(flights)
+        return len(flights)
+
+    async def _deduplicate_stream(
+        self,
+        scraped_queue: asyncio.Queue,
+        unique_queue: asyncio.Queue,
+        deduplicator: Union[IncrementalFlightDeduplicator, FlightGroupIndex],
+    ) -> None:
+        """Consume scraped batches and forward new or cheaper flights."""
+        while True:
+            flights = await scraped_queue.get()
+            if flights is _END_OF_STREAM:
+                await unique_queue.put(_END_OF_STREAM)
+                return
+
+            if isinstance(deduplicator, FlightGroupIndex):
+                unique_flights = await deduplicator.merge(flights)
+            else:
+                unique_flights = deduplicator.add(flights)
+            if not unique_flights:
+                continue
+
+            await unique_queue.put(unique_flights)
+
+    async def _write_stream(
+        self,
+        unique_queue: asyncio.Queue,
+        totals: Dict[str, int],
+        batch_size: int,
+        flush_interval: float,
+    ) -> None:
+        """Save unique flights in batches, flushing at least every flush_interval."""
+        loop = asyncio.get_running_loop()
+        pending: List[Dict] = []
+        deadline = None
+
+        async def flush():
+            nonlocal pending, deadline
+            batch, pending, deadline = pending, [], None
+            batch_stats = await self.save_to_database(batch, create_job=False)
+            for key in totals:
+                totals[key] += batch_stats[key]
+
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - loop.time())
+            try:
+                flights = await asyncio.wait_for(unique_queue.get(), timeout)
+            except asyncio.TimeoutError:
+                await flush()
+                continue
+
+            if flights is _END_OF_STREAM:
+                if pending:
+                    await flush()
+                return
+
+            pending.extend(flights)
+            if deadline is None:
+                deadline = loop.time() + flush_interval
+            if len(pending) >= batch_size:
+                await flush()
+
+    def _schedule_scrapes(
+        self,
+        origins: List[str],
+        destinations: List[str],
+        date_ranges: List[Tuple[date, date]],
+        make_job: Callable[..., Callable[[], Awaitable]],
+    ) -> Tuple[ScrapeScheduler, List[str]]:
+        """
+        Create a scheduler with one job per route, date range and enabled scraper.
+
+        Args:
+            origins: Origin airport IATA codes
+            destinations: Destination airport IATA codes
+            date_ranges: (departure_date, return_date) tuples
+            make_job: Called with (scraper, scraper_name, origin, destination, dates),
+                returns the job's coroutine factory
+
+        Returns:
+            Tuple of (scheduler, job labels in submission order)
+        """
+        scheduler = ScrapeScheduler(
+            source_limits=settings.get_scraper_concurrency_limits(),
+            max_concurrency=settings.scraper_max_concurrency,
+        )
         task_metadata = []  # Track which scraper/route each task represents
 
-        for origin in origins:
-            for destination in destinations:
-                for departure_date, return_date in date_ranges:
-                    # Create task for each ENABLED scraper
-                    if self.kiwi:
-                        tasks.append(
-                            self.scrape_source(
-                                self.kiwi, "kiwi", origin, destination, (departure_date, return_date)
-                            )
-                        )
-                        task_metadata.append(f"Kiwi: {origin}→{destination}")
+        scrapers = [
+            (self.kiwi, "kiwi", "Kiwi"),
+            (self.skyscanner, "skyscanner", "Skyscanner"),
+            (self.ryanair, "ryanair", "Ryanair"),
+            (self.wizzair, "wizzair", "WizzAir"),
+        ]
 
-                    if self.skyscanner:
-                        tasks.append(
-                            self.scrape_source(
-                                self.skyscanner,
-                                "skyscanner",
+        # Earlier holiday windows get higher priority (lower value)
+        for priority, (departure_date, return_date) in enumerate(date_ranges):
+            for origin in origins:
+                for destination in destinations:
+                    # Create job for each ENABLED scraper
+                    for scraper, scraper_name, display_name in scrapers:
+                        if not scraper:
+                            continue
+                        label = f"{display_name}: {origin}→{destination}"
+                        scheduler.submit(
+                            scraper_name,
+                            make_job(
+                                scraper,
+                                scraper_name,
                                 origin,
                                 destination,
                                 (departure_date, return_date),
-                            )
+                            ),
+                            priority=priority,
+                            label=label,
                         )
-                        task_metadata.append(f"Skyscanner: {origin}→{destination}")
+                        task_metadata.append(label)
 
-                    if self.ryanair:
-                        tasks.append(
-                            self.scrape_source(
-                                self.ryanair, "ryanair", origin, destination, (departure_date, return_date)
-                            )
-                        )
-                        task_metadata.append(f"Ryanair: {origin}→{destination}")
-
-                    if self.wizzair:
-                        tasks.append(
-                            self.scrape_source(
-                                self.wizzair, "wizzair", origin, destination, (departure_date, return_date)
-                            )
-                        )
-                        task_metadata.append(f"WizzAir: {origin}→{destination}")
+        return scheduler, task_metadata
 
+    async def _run_scheduled_scrapes(
+        self, scheduler: ScrapeScheduler, task_metadata: List[str]
+    ) -> List:
+        """Run scheduled scrape jobs behind per-scraper progress bars."""
         console.print(
-            f"\n[bold cyan]Starting {len(tasks)} scraping tasks in parallel...[/bold cyan]\n"
+            f"\n[bold cyan]Starting {len(scheduler)} scraping tasks "
+            f"(max {scheduler.max_concurrency} concurrent)...[/bold cyan]\n"
         )
 
-        # Run all tasks concurrently with real-time progress tracking
+        # Run tasks within concurrency limits with real-time progress tracking
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
@@ -215,16 +483,27 @@ class FlightOrchestrator:
                         f"[yellow]{scraper}: Starting...", total=scraper_count
                     )
 
-            # Gather results with return_exceptions=True to handle failures gracefully
-            # We'll track completion in real-time using task callbacks
-            results = await self._gather_with_progress(
-                tasks, task_metadata, progress, scraper_tasks
-            )
+            # Failures are returned in place of results so they can be counted;
+            # progress is updated in real time as each job completes
+            return await self._gather_with_progress(scheduler, progress, scraper_tasks)
+
+    def _summarize_results(
+        self, results: List, task_metadata: List[str], start_time: datetime
+    ) -> None:
+        """
+        Log scraper statistics, enforce the failure threshold and print the stats table.
 
-        # Process results and collect statistics
-        all_flights = []
+        Args:
+            results: Job results (flight lists or counts, exceptions for failures)
+            task_metadata: Job labels in submission order
+            start_time: When scraping started
+
+        Raises:
+            ScraperFailureThresholdExceeded: If too many scrapers failed
+        """
         successful_scrapers = 0
         failed_scrapers = 0
+        total_flights = 0
         scraper_stats = defaultdict(lambda: {"success": 0, "failed": 0, "flights": 0})
 
         for idx, result in enumerate(results):
@@ -235,16 +514,17 @@ class FlightOrchestrator:
                 failed_scrapers += 1
                 scraper_stats[scraper_name]["failed"] += 1
             else:
+                flight_count = result if isinstance(result, int) else len(result)
                 successful_scrapers += 1
                 scraper_stats[scraper_name]["success"] += 1
-                scraper_stats[scraper_name]["flights"] += len(result)
-                all_flights.extend(result)
+                scraper_stats[scraper_name]["flights"] += flight_count
+                total_flights += flight_count
 
         # Log statistics
         elapsed_time = (datetime.now() - start_time).total_seconds()
         logger.info(
             f"Scraping completed: {successful_scrapers} successful, {failed_scrapers} failed, "
-            f"{len(all_flights)} total flights, {elapsed_time:.2f}s elapsed"
+            f"{total_flights} total flights, {elapsed_time:.2f}s elapsed"
         )
 
         # Check failure threshold
@@ -269,17 +549,6 @@ class FlightOrchestrator:
         # Print statistics table
         self._print_stats_table(scraper_stats, elapsed_time)
 
-        # Deduplicate flights (with caching if available)
-        console.print(f"\n[bold yellow]Deduplicating {len(all_flights)} flights...[/bold yellow]")
-        unique_flights = await self.deduplicate(all_flights)
-
-        console.print(
-            f"[bold green]✓ Found {len(unique_flights)} unique flights "
-            f"(removed {len(all_flights) - len(unique_flights)} duplicates)[/bold green]\n"
-        )
-
-        return unique_flights
-
     def _print_stats_table(self, scraper_stats: Dict, elapsed_time: float):
         """Print a Rich table with scraper statistics."""
         table = Table(title="Scraping Statistics")
@@ -310,74 +579,61 @@ class FlightOrchestrator:
 
     async def _gather_with_progress(
         self,
-        tasks: List,
-        task_metadata: List[str],
+        scheduler: ScrapeScheduler,
         progress: Progress,
         scraper_tasks: Dict,
     ) -> List:
         """
-        Execute tasks with real-time progress updates.
+        Execute scheduled jobs with real-time progress updates.
 
-        This method wraps asyncio.gather to provide real-time feedback as each
-        scraper completes, updating the progress bars and showing immediate results.
+        Runs the scheduler (which enforces per-source and global concurrency
+        limits) and provides real-time feedback as each scraper completes,
+        updating the progress bars and showing immediate results.
 
         Args:
-            tasks: List of coroutines to execute
-            task_metadata: List of task descriptions matching tasks
+            scheduler: ScrapeScheduler with all scraping jobs submitted
             progress: Rich Progress instance
             scraper_tasks: Dict mapping scraper names to progress task IDs
 
         Returns:
-            List of results from all tasks (with exceptions for failures)
+            List of results from all jobs in submission order (with exceptions for failures)
         """
-        results = [None] * len(tasks)
-        pending_tasks = {
-            asyncio.create_task(task): (idx, task_metadata[idx])
-            for idx, task in enumerate(tasks)
-        }
-
-        # Process tasks as they complete
-        while pending_tasks:
-            done, pending = await asyncio.wait(
-                pending_tasks.keys(), return_when=asyncio.FIRST_COMPLETED
-            )
-
-            for task in done:
-                idx, metadata = pending_tasks.pop(task)
-                scraper_name = metadata.split(":")[0].strip()
-                route = metadata.split(":")[1].strip() if ":" in metadata else ""
 
-                try:
-                    result = task.result()
-                    results[idx] = result
-                    flight_count = len(result) if isinstance(result, list) else 0
-
-                    # Update progress for this scraper
-                    if scraper_name in scraper_tasks:
-                        progress.update(
-                            scraper_tasks[scraper_name],
-                            advance=1,
-                            description=f"[green]{scraper_name}: {route} ({flight_count} flights)",
-                        )
+        def on_complete(job: ScrapeJob, result) -> None:
+            metadata = job.label
+            scraper_name = metadata.split(":")[0].strip()
+            route = metadata.split(":")[1].strip() if ":" in metadata else ""
 
-                    # Log completion
-                    logger.info(f"✓ {scraper_name} completed {route}: {flight_count} flights found")
+            if isinstance(result, Exception):
+                # Update progress to show failure
+                if scraper_name in scraper_tasks:
+                    progress.update(
+                        scraper_tasks[scraper_name],
+                        advance=1,
+                        description=f"[red]{scraper_name}: {route} (failed)",
+                    )
 
-                except Exception as e:
-                    results[idx] = e
+                # Log error
+                logger.error(f"✗ {scraper_name} failed {route}: {str(result)}")
+                return
 
-                    # Update progress to show failure
-                    if scraper_name in scraper_tasks:
-                        progress.update(
-                            scraper_tasks[scraper_name],
-                            advance=1,
-                            description=f"[red]{scraper_name}: {route} (failed)",
-                        )
+            if isinstance(result, list):
+                flight_count = len(result)
+            else:
+                flight_count = result if isinstance(result, int) else 0
+
+            # Update progress for this scraper
+            if scraper_name in scraper_tasks:
+                progress.update(
+                    scraper_tasks[scraper_name],
+                    advance=1,
+                    description=f"[green]{scraper_name}: {route} ({flight_count} flights)",
+                )
 
-                    # Log error
-                    logger.error(f"✗ {scraper_name} failed {route}: {str(e)}")
+            # Log completion
+            logger.info(f"✓ {scraper_name} completed {route}: {flight_count} flights found")
 
-        return results
+        return await scheduler.run(on_complete=on_complete)
 
     async def scrape_source(
         self,
@@ -526,7 +782,7 @@ class FlightOrchestrator:
             logger.error(error_msg, exc_info=True)
             console.print(f"[dim red]✗ {error_msg}[/dim red]")
 
-            # Re-raise exception to let scrape_all handle it via return_exceptions=True
+            # Re-raise exception to let scrape_all handle it (the scheduler returns it as the result)
             # This allows proper failure tracking and threshold checking
             raise
 
@@ -545,9 +801,11 @@ class FlightOrchestrator:
         - Merge booking_url fields (keep all sources for user choice)
 
         Redis Caching:
-        - Before deduplication, filters out flights already in cache
-        - After deduplication, caches unique flights
-        - Dramatically reduces CPU usage for repeated queries
+        - Groups are merged into the FlightGroupIndex in one round trip
+        - Flights whose group already has an equal or cheaper stored price
+          (e.g. from an earlier run) are dropped
+        - Returned flights carry booking URLs, sources and duplicate counts
+          merged across runs
 
         Args:
             flights: List of flight dictionaries from all sources
@@ -565,187 +823,52 @@ class FlightOrchestrator:
 
         logger.info(f"Deduplicating {len(flights)} flights...")
 
-        # Filter out cached flights if cache is available
-        flights_to_process = flights
-        cached_count = 0
-
         if self.cache:
-            logger.info("Checking flight cache to skip already-processed flights...")
-            flights_to_process = await self.cache.filter_uncached_flights(flights)
-            cached_count = len(flights) - len(flights_to_process)
-
-            if cached_count > 0:
-                logger.info(
-                    f"Cache hit: {cached_count} flights already processed, "
-                    f"{len(flights_to_process)} need deduplication"
-                )
+            unique_flights = await self.cache.merge(flights)
+            logger.info(
+                f"Deduplication complete: {len(unique_flights)} new or cheaper flights "
+                f"from {len(flights)} (checked against Redis flight groups)"
+            )
+            known = len(flights) - len(unique_flights)
+            if known > 0:
                 console.print(
-                    f"[dim]  → Cache hit: {cached_count} flights already seen, "
-                    f"processing {len(flights_to_process)} new flights[/dim]"
-                )
-
-        # If all flights are cached, return empty list (they've all been processed before)
-        if not flights_to_process:
-            logger.info("All flights found in cache - no deduplication needed")
-            return []
-
-        # Group flights by route + airline + approximate time
-        grouped = defaultdict(list)
-
-        for flight in flights:
-            try:
-                # Parse departure date and time
-                dep_date_str = flight.get("departure_date", "")
-                dep_time_str = flight.get("departure_time", "00:00")
-
-                if not dep_date_str:
-                    logger.warning(f"Skipping flight with no departure_date: {flight}")
-                    continue
-
-                # Parse date
-                try:
-                    dep_date = datetime.strptime(dep_date_str, "%Y-%m-%d").date()
-                except ValueError:
-                    logger.warning(f"Invalid departure_date format: {dep_date_str}")
-                    continue
-
-                # Parse time using robust parser
-                dep_time = parse_time(
-                    dep_time_str,
-                    context=f"departure_time for {flight.get('origin_airport')}->{flight.get('destination_airport')}"
+                    f"[dim]  → {known} flights merged into known or cheaper groups, "
+                    f"{len(unique_flights)} new or cheaper[/dim]"
                 )
+            return unique_flights
 
-                # Use parsed time or default to noon if parsing failed
-                if dep_time is not None:
-                    dep_datetime = datetime.combine(dep_date, dep_time)
-                else:
-                    # Default to noon for grouping purposes when time is unavailable
-                    dep_datetime = datetime.combine(dep_date, time(12, 0))
-                    if dep_time_str:  # Only log if there was a value that failed to parse
-                        logger.debug(
-                            f"Using default noon for grouping (departure time unavailable): "
-                            f"{flight.get('origin_airport')}->{flight.get('destination_airport')} on {dep_date}"
-                        )
-
-                # Round departure time to 2-hour blocks for grouping
-                hour_block = (dep_datetime.hour // 2) * 2
-                rounded_time = dep_datetime.replace(hour=hour_block, minute=0, second=0)
-
-                # Parse return date/time similarly
-                ret_date_str = flight.get("return_date", "")
-                ret_time_str = flight.get("return_time", "00:00")
+        # Group by route + airline + 2-hour time blocks and keep the cheapest
+        # of each group, in a single vectorized pass
+        unique_flights = deduplicate_flights(flights)
 
-                if ret_date_str and ret_date_str != "None":
-                    try:
-                        ret_date = datetime.strptime(ret_date_str, "%Y-%m-%d").date()
-
-                        # Parse return time using robust parser
-                        ret_time = parse_time(
-                            ret_time_str,
-                            context=f"return_time for {flight.get('origin_airport')}->{flight.get('destination_airport')}"
-                        )
-
-                        # Use parsed time or default to noon if parsing failed
-                        if ret_time is not None:
-                            ret_datetime = datetime.combine(ret_date, ret_time)
-                        else:
-                            # Default to noon for grouping purposes when time is unavailable
-                            ret_datetime = datetime.combine(ret_date, time(12, 0))
-                            if ret_time_str:  # Only log if there was a value that failed to parse
-                                logger.debug(
-                                    f"Using default noon for grouping (return time unavailable): "
-                                    f"{flight.get('origin_airport')}->{flight.get('destination_airport')} on {ret_date}"
-                                )
-
-                        ret_hour_block = (ret_datetime.hour // 2) * 2
-                        rounded_ret_time = ret_datetime.replace(
-                            hour=ret_hour_block, minute=0, second=0
-                        )
-                    except ValueError:
-                        rounded_ret_time = None
-                else:
-                    rounded_ret_time = None
-
-                # Create grouping key
-                key = (
-                    flight.get("origin_airport", "").upper(),
-                    flight.get("destination_airport", "").upper(),
-                    flight.get("airline", "Unknown").upper(),
-                    rounded_time,
-                    rounded_ret_time,
-                )
-
-                grouped[key].append(flight)
-
-            except Exception as e:
-                logger.warning(f"Error processing flight for deduplication: {e}", exc_info=True)
-                continue
-
-        # Keep cheapest from each group and merge URLs
-        unique_flights = []
-
-        for key, flight_group in grouped.items():
-            try:
-                # Find cheapest flight
-                best = min(
-                    flight_group,
-                    key=lambda f: f.get("price_per_person") or f.get("total_price", float("inf")),
-                )
-
-                # Merge booking URLs from all sources
-                booking_urls = []
-                sources = []
-
-                for f in flight_group:
-                    url = f.get("booking_url")
-                    if url and url not in booking_urls:
-                        booking_urls.append(url)
-
-                    source = f.get("source")
-                    if source and source not in sources:
-                        sources.append(source)
-
-                # Update best flight with merged data
-                best["booking_urls"] = booking_urls
-                best["sources"] = sources
-                best["duplicate_count"] = len(flight_group)  # Track how many were merged
-
-                unique_flights.append(best)
-
-            except Exception as e:
-                logger.warning(f"Error selecting best flight from group: {e}", exc_info=True)
-                continue
-
-        duplicates_removed = len(flights_to_process) - len(unique_flights)
+        duplicates_removed = len(flights) - len(unique_flights)
         logger.info(
             f"Deduplication complete: {len(unique_flights)} unique flights "
-            f"({duplicates_removed} duplicates removed from {len(flights_to_process)} processed)"
+            f"({duplicates_removed} duplicates removed)"
         )
 
-        # Cache the unique flights for future queries
-        if self.cache and unique_flights:
-            logger.info(f"Caching {len(unique_flights)} unique flights...")
-            cached_count = await self.cache.cache_multiple_flights(unique_flights)
-            logger.info(f"Successfully cached {cached_count} flights (TTL: {self.cache.ttl}s)")
-
         return unique_flights
 
     async def save_to_database(
-        self, flights: List[Dict], create_job: bool = True
+        self, flights: List[Dict], create_job: bool = True, bulk: Optional[bool] = None
     ) -> Dict[str, int]:
         """
         Batch save flights to database with duplicate checking.
 
-        Uses SQLAlchemy bulk operations for efficiency. Updates existing flights
-        if price is cheaper, otherwise skips duplicates.
+        Updates existing flights if price is cheaper, otherwise skips duplicates.
+        Every saved or skipped flight records a price_history entry.
 
-        Optimized to avoid N+1 queries by:
-        - Batch loading all required airports upfront
-        - Batch loading potential duplicate flights upfront
+        Two save paths:
+        - Bulk (default): stages each batch in a temporary table and resolves
+          the ±2h duplicate match, inserts, updates and price history with a
+          fixed number of set-based statements (see FlightBulkWriter)
+        - Row by row: batches of 50 with airports and potential duplicates
+          loaded upfront, one ORM object per flight
 
         Args:
             flights: List of flight dictionaries to save
             create_job: Whether to create a ScrapingJob record (default: True)
+            bulk: Use the bulk path (defaults to settings.flight_bulk_save)
 
         Returns:
             Dict with statistics:
@@ -790,269 +913,21 @@ class FlightOrchestrator:
                     db.add(job)
                     await db.flush()
 
-                # Process flights in batches for efficiency
-                batch_size = 50
+                # Process flights in batches; the bulk path stages whole batches
+                # in SQL, the row-by-row path handles small batches per flight
+                if bulk is None:
+                    bulk = settings.flight_bulk_save
+                batch_size = settings.flight_bulk_batch_size if bulk else 50
 
                 for i in range(0, len(flights), batch_size):
                     batch = flights[i : i + batch_size]
 
-                    # FIX N+1: Collect all unique airport IATA codes in this batch
-                    airport_codes = set()
-                    for flight_data in batch:
-                        origin = flight_data.get("origin_airport", "")
-                        destination = flight_data.get("destination_airport", "")
-                        if origin:
-                            airport_codes.add(origin.upper())
-                        if destination:
-                            airport_codes.add(destination.upper())
-
-                    # FIX N+1: Batch load all airports at once
-                    airport_stmt = select(Airport).where(Airport.iata_code.in_(airport_codes))
-                    airport_result = await db.execute(airport_stmt)
-                    airports_list = airport_result.scalars().all()
-
-                    # Build airport cache by IATA code
-                    airport_cache: Dict[str, Airport] = {
-                        airport.iata_code: airport for airport in airports_list
-                    }
-
-                    # FIX N+1: Create missing airports in batch
-                    missing_codes = airport_codes - set(airport_cache.keys())
-                    for iata_code in missing_codes:
-                        # Find the city name from flight data
-                        city = ""
-                        for flight_data in batch:
-                            if flight_data.get("origin_airport", "").upper() == iata_code:
-                                city = flight_data.get("origin_city", "")
-                                break
-                            elif flight_data.get("destination_airport", "").upper() == iata_code:
-                                city = flight_data.get("destination_city", "")
-                                break
-
-                        logger.info(f"Creating new airport: {iata_code} ({city})")
-                        new_airport = Airport(
-                            iata_code=iata_code,
-                            name=f"{city} Airport" if city else f"{iata_code} Airport",
-                            city=city or iata_code,
-                            distance_from_home=0,
-                            driving_time=0,
-                        )
-                        db.add(new_airport)
-                        airport_cache[iata_code] = new_airport
-
-                    # Flush to get IDs for new airports
-                    await db.flush()
-
-                    # FIX N+1: Collect all flight parameters for duplicate checking
-                    flight_params = []
-                    for flight_data in batch:
-                        dep_date_str = flight_data.get("departure_date", "")
-                        if not dep_date_str:
-                            continue
-
-                        try:
-                            departure_date_obj = datetime.strptime(dep_date_str, "%Y-%m-%d").date()
-                            origin_code = flight_data.get("origin_airport", "").upper()
-                            dest_code = flight_data.get("destination_airport", "").upper()
-
-                            if origin_code in airport_cache and dest_code in airport_cache:
-                                flight_params.append({
-                                    "origin_airport_id": airport_cache[origin_code].id,
-                                    "destination_airport_id": airport_cache[dest_code].id,
-                                    "airline": flight_data.get("airline", "Unknown"),
-                                    "departure_date": departure_date_obj,
-                                })
-                        except (ValueError, TypeError):
-                            continue
-
-                    # FIX N+1: Batch load all potential duplicate flights
-                    existing_flights_map = {}
-                    if flight_params:
-                        # Build query to find all potential duplicates
-                        duplicate_conditions = []
-                        for params in flight_params:
-                            duplicate_conditions.append(
-                                and_(
-                                    Flight.origin_airport_id == params["origin_airport_id"],
-                                    Flight.destination_airport_id == params["destination_airport_id"],
-                                    Flight.airline == params["airline"],
-                                    Flight.departure_date == params["departure_date"],
-                                )
-                            )
-
-                        if duplicate_conditions:
-                            from sqlalchemy import or_
-                            existing_stmt = select(Flight).where(or_(*duplicate_conditions))
-                            existing_result = await db.execute(existing_stmt)
-                            existing_flights = existing_result.scalars().all()
-
-                            # Build index for O(1) lookup
-                            for flight in existing_flights:
-                                key = (
-                                    flight.origin_airport_id,
-                                    flight.destination_airport_id,
-                                    flight.airline,
-                                    flight.departure_date,
-                                )
-                                if key not in existing_flights_map:
-                                    existing_flights_map[key] = []
-                                existing_flights_map[key].append(flight)
-
-                    # Now process each flight with cached data
-                    for flight_data in batch:
-                        try:
-                            # Get airports from cache
-                            origin_code = flight_data.get("origin_airport", "").upper()
-                            dest_code = flight_data.get("destination_airport", "").upper()
-
-                            origin_airport = airport_cache.get(origin_code)
-                            destination_airport = airport_cache.get(dest_code)
-
-                            if not origin_airport or not destination_airport:
-                                logger.warning(
-                                    f"Skipping flight: airports not found "
-                                    f"({flight_data.get('origin_airport')} or "
-                                    f"{flight_data.get('destination_airport')})"
-                                )
-                                stats["skipped"] += 1
-                                continue
-
-                            # Parse dates and times
-                            dep_date_str = flight_data.get("departure_date", "")
-                            dep_time_str = flight_data.get("departure_time")
-
-                            try:
-                                departure_date_obj = datetime.strptime(dep_date_str, "%Y-%m-%d").date()
-                            except (ValueError, TypeError):
-                                logger.warning(f"Invalid departure_date: {dep_date_str}")
-                                stats["skipped"] += 1
-                                continue
-
-                            # Parse departure time using robust parser
-                            departure_time_obj = parse_time(
-                                dep_time_str,
-                                context=f"departure_time for DB save {origin_airport.iata_code}->{destination_airport.iata_code}"
-                            )
-
-                            # Parse return date and time
-                            ret_date_str = flight_data.get("return_date")
-                            ret_time_str = flight_data.get("return_time")
-
-                            # Parse return date
-                            if ret_date_str and ret_date_str != "None":
-                                try:
-                                    return_date_obj = datetime.strptime(ret_date_str, "%Y-%m-%d").date()
-                                except (ValueError, TypeError):
-                                    return_date_obj = None
-                            else:
-                                return_date_obj = None
-
-                            # Parse return time using robust parser
-                            return_time_obj = parse_time(
-                                ret_time_str,
-                                context=f"return_time for DB save {origin_airport.iata_code}->{destination_airport.iata_code}"
-                            )
-
-                            # Check for existing flight using cached data
-                            airline = flight_data.get("airline", "Unknown")
-                            lookup_key = (
-                                origin_airport.id,
-                                destination_airport.id,
-                                airline,
-                                departure_date_obj,
-                            )
-
-                            existing_flight = None
-                            candidates = existing_flights_map.get(lookup_key, [])
-
-                            # Check time window for candidates
-                            if departure_time_obj:
-                                time_lower = (
-                                    datetime.combine(departure_date_obj, departure_time_obj) - timedelta(hours=2)
-                                ).time()
-                                time_upper = (
-                                    datetime.combine(departure_date_obj, departure_time_obj) + timedelta(hours=2)
-                                ).time()
-
-                                for candidate in candidates:
-                                    if candidate.departure_time:
-                                        if time_lower <= candidate.departure_time <= time_upper:
-                                            existing_flight = candidate
-                                            break
-                            elif candidates:
-                                # No time specified, take first candidate
-                                existing_flight = candidates[0]
-
-                            # Get price (handle both price_per_person and total_price)
-                            price_per_person = flight_data.get("price_per_person")
-                            if price_per_person is None:
-                                # Fallback to total_price / 4
-                                total_price = flight_data.get("total_price", 0)
-                                price_per_person = total_price / 4 if total_price else 0
-
-                            total_price = flight_data.get("total_price")
-                            if total_price is None:
-                                total_price = price_per_person * 4
-
-                            if existing_flight:
-                                # Update if new price is cheaper
-                                if price_per_person < existing_flight.price_per_person:
-                                    old_price = existing_flight.price_per_person
-                                    logger.info(
-                                        f"Updating flight {existing_flight.id}: "
-                                        f"€{existing_flight.price_per_person} → €{price_per_person}"
-                                    )
-                                    existing_flight.price_per_person = price_per_person
-                                    existing_flight.total_price = total_price
-                                    existing_flight.booking_url = flight_data.get(
-                                        "booking_url", existing_flight.booking_url
-                                    )
-                                    existing_flight.scraped_at = datetime.now()
-
-                                    # Track price change
-                                    await PriceHistoryService.track_price_change(
-                                        db, existing_flight, old_price
-                                    )
-
-                                    stats["updated"] += 1
-                                else:
-                                    # Track price even if not updating (for history)
-                                    await PriceHistoryService.track_price_change(
-                                        db, existing_flight, None
-                                    )
-                                    stats["skipped"] += 1
-                            else:
-                                # Insert new flight
-                                new_flight = Flight(
-                                    origin_airport_id=origin_airport.id,
-                                    destination_airport_id=destination_airport.id,
-                                    airline=airline,
-                                    departure_date=departure_date_obj,
-                                    departure_time=departure_time_obj,
-                                    return_date=return_date_obj,
-                                    return_time=return_time_obj,
-                                    price_per_person=price_per_person,
-                                    total_price=total_price,
-                                    booking_class=flight_data.get("booking_class", "Economy"),
-                                    direct_flight=flight_data.get("direct_flight", True),
-                                    source=flight_data.get("source", "unknown"),
-                                    booking_url=flight_data.get("booking_url"),
-                                    scraped_at=datetime.now(),
-                                )
-                                db.add(new_flight)
-                                await db.flush()  # Get the flight ID and load relationships
-
-                                # Track initial price
-                                await PriceHistoryService.track_price_change(
-                                    db, new_flight, None
-                                )
-
-                                stats["inserted"] += 1
-
-                        except Exception as e:
-                            logger.error(f"Error saving flight: {e}", exc_info=True)
-                            stats["skipped"] += 1
-                            continue
+                    if bulk:
+                        batch_stats = await FlightBulkWriter(db).write(batch)
+                        for key in ("inserted", "updated", "skipped"):
+                            stats[key] += batch_stats[key]
+                    else:
+                        await self._save_batch_row_by_row(db, batch, stats)
 
                     # Commit batch
                     await db.commit()
@@ -1084,6 +959,277 @@ class FlightOrchestrator:
 
         return stats
 
+    async def _save_batch_row_by_row(
+        self, db: AsyncSession, batch: List[Dict], stats: Dict[str, int]
+    ) -> None:
+        """
+        Save one batch of flights row by row, updating stats in place.
+
+        Used when bulk saving is disabled (settings.flight_bulk_save=False).
+
+        Args:
+            db: Database session (caller commits)
+            batch: Flight dictionaries to save
+            stats: Statistics dict from save_to_database to update
+        """
+        # FIX N+1: Collect all unique airport IATA codes in this batch
+        airport_codes = set()
+        for flight_data in batch:
+            origin = flight_data.get("origin_airport", "")
+            destination = flight_data.get("destination_airport", "")
+            if origin:
+                airport_codes.add(origin.upper())
+            if destination:
+                airport_codes.add(destination.upper())
+
+        # FIX N+1: Batch load all airports at once
+        airport_stmt = select(Airport).where(Airport.iata_code.in_(airport_codes))
+        airport_result = await db.execute(airport_stmt)
+        airports_list = airport_result.scalars().all()
+
+        # Build airport cache by IATA code
+        airport_cache: Dict[str, Airport] = {
+            airport.iata_code: airport for airport in airports_list
+        }
+
+        # FIX N+1: Create missing airports in batch
+        missing_codes = airport_codes - set(airport_cache.keys())
+        for iata_code in missing_codes:
+            # Find the city name from flight data
+            city = ""
+            for flight_data in batch:
+                if flight_data.get("origin_airport", "").upper() == iata_code:
+                    city = flight_data.get("origin_city", "")
+                    break
+                elif flight_data.get("destination_airport", "").upper() == iata_code:
+                    city = flight_data.get("destination_city", "")
+                    break
+
+            logger.info(f"Creating new airport: {iata_code} ({city})")
+            new_airport = Airport(
+                iata_code=iata_code,
+                name=f"{city} Airport" if city else f"{iata_code} Airport",
+                city=city or iata_code,
+                distance_from_home=0,
+                driving_time=0,
+            )
+            db.add(new_airport)
+            airport_cache[iata_code] = new_airport
+
+        # Flush to get IDs for new airports
+        await db.flush()
+
+        # FIX N+1: Collect all flight parameters for duplicate checking
+        flight_params = []
+        for flight_data in batch:
+            dep_date_str = flight_data.get("departure_date", "")
+            if not dep_date_str:
+                continue
+
+            try:
+                departure_date_obj = datetime.strptime(dep_date_str, "%Y-%m-%d").date()
+                origin_code = flight_data.get("origin_airport", "").upper()
+                dest_code = flight_data.get("destination_airport", "").upper()
+
+                if origin_code in airport_cache and dest_code in airport_cache:
+                    flight_params.append({
+                        "origin_airport_id": airport_cache[origin_code].id,
+                        "destination_airport_id": airport_cache[dest_code].id,
+                        "airline": flight_data.get("airline", "Unknown"),
+                        "departure_date": departure_date_obj,
+                    })
+            except (ValueError, TypeError):
+                continue
+
+        # FIX N+1: Batch load all potential duplicate flights
+        existing_flights_map = {}
+        if flight_params:
+            # Build query to find all potential duplicates
+            duplicate_conditions = []
+            for params in flight_params:
+                duplicate_conditions.append(
+                    and_(
+                        Flight.origin_airport_id == params["origin_airport_id"],
+                        Flight.destination_airport_id == params["destination_airport_id"],
+                        Flight.airline == params["airline"],
+                        Flight.departure_date == params["departure_date"],
+                    )
+                )
+
+            if duplicate_conditions:
+                from sqlalchemy import or_
+                existing_stmt = select(Flight).where(or_(*duplicate_conditions))
+                existing_result = await db.execute(existing_stmt)
+                existing_flights = existing_result.scalars().all()
+
+                # Build index for O(1) lookup
+                for flight in existing_flights:
+                    key = (
+                        flight.origin_airport_id,
+                        flight.destination_airport_id,
+                        flight.airline,
+                        flight.departure_date,
+                    )
+                    if key not in existing_flights_map:
+                        existing_flights_map[key] = []
+                    existing_flights_map[key].append(flight)
+
+        # Now process each flight with cached data
+        for flight_data in batch:
+            try:
+                # Get airports from cache
+                origin_code = flight_data.get("origin_airport", "").upper()
+                dest_code = flight_data.get("destination_airport", "").upper()
+
+                origin_airport = airport_cache.get(origin_code)
+                destination_airport = airport_cache.get(dest_code)
+
+                if not origin_airport or not destination_airport:
+                    logger.warning(
+                        f"Skipping flight: airports not found "
+                        f"({flight_data.get('origin_airport')} or "
+                        f"{flight_data.get('destination_airport')})"
+                    )
+                    stats["skipped"] += 1
+                    continue
+
+                # Parse dates and times
+                dep_date_str = flight_data.get("departure_date", "")
+                dep_time_str = flight_data.get("departure_time")
+
+                try:
+                    departure_date_obj = datetime.strptime(dep_date_str, "%Y-%m-%d").date()
+                except (ValueError, TypeError):
+                    logger.warning(f"Invalid departure_date: {dep_date_str}")
+                    stats["skipped"] += 1
+                    continue
+
+                # Parse departure time using robust parser
+                departure_time_obj = parse_time(
+                    dep_time_str,
+                    context=f"departure_time for DB save {origin_airport.iata_code}->{destination_airport.iata_code}"
+                )
+
+                # Parse return date and time
+                ret_date_str = flight_data.get("return_date")
+                ret_time_str = flight_data.get("return_time")
+
+                # Parse return date
+                if ret_date_str and ret_date_str != "None":
+                    try:
+                        return_date_obj = datetime.strptime(ret_date_str, "%Y-%m-%d").date()
+                    except (ValueError, TypeError):
+                        return_date_obj = None
+                else:
+                    return_date_obj = None
+
+                # Parse return time using robust parser
+                return_time_obj = parse_time(
+                    ret_time_str,
+                    context=f"return_time for DB save {origin_airport.iata_code}->{destination_airport.iata_code}"
+                )
+
+                # Check for existing flight using cached data
+                airline = flight_data.get("airline", "Unknown")
+                lookup_key = (
+                    origin_airport.id,
+                    destination_airport.id,
+                    airline,
+                    departure_date_obj,
+                )
+
+                existing_flight = None
+                candidates = existing_flights_map.get(lookup_key, [])
+
+                # Check time window for candidates
+                if departure_time_obj:
+                    time_lower = (
+                        datetime.combine(departure_date_obj, departure_time_obj) - timedelta(hours=2)
+                    ).time()
+                    time_upper = (
+                        datetime.combine(departure_date_obj, departure_time_obj) + timedelta(hours=2)
+                    ).time()
+
+                    for candidate in candidates:
+                        if candidate.departure_time:
+                            if time_lower <= candidate.departure_time <= time_upper:
+                                existing_flight = candidate
+                                break
+                elif candidates:
+                    # No time specified, take first candidate
+                    existing_flight = candidates[0]
+
+                # Get price (handle both price_per_person and total_price)
+                price_per_person = flight_data.get("price_per_person")
+                if price_per_person is None:
+                    # Fallback to total_price / 4
+                    total_price = flight_data.get("total_price", 0)
+                    price_per_person = total_price / 4 if total_price else 0
+
+                total_price = flight_data.get("total_price")
+                if total_price is None:
+                    total_price = price_per_person * 4
+
+                if existing_flight:
+                    # Update if new price is cheaper
+                    if price_per_person < existing_flight.price_per_person:
+                        old_price = existing_flight.price_per_person
+                        logger.info(
+                            f"Updating flight {existing_flight.id}: "
+                            f"€{existing_flight.price_per_person} → €{price_per_person}"
+                        )
+                        existing_flight.price_per_person = price_per_person
+                        existing_flight.total_price = total_price
+                        existing_flight.booking_url = flight_data.get(
+                            "booking_url", existing_flight.booking_url
+                        )
+                        existing_flight.scraped_at = datetime.now()
+
+                        # Track price change
+                        await PriceHistoryService.track_price_change(
+                            db, existing_flight, old_price
+                        )
+
+                        stats["updated"] += 1
+                    else:
+                        # Track price even if not updating (for history)
+                        await PriceHistoryService.track_price_change(
+                            db, existing_flight, None
+                        )
+                        stats["skipped"] += 1
+                else:
+                    # Insert new flight
+                    new_flight = Flight(
+                        origin_airport_id=origin_airport.id,
+                        destination_airport_id=destination_airport.id,
+                        airline=airline,
+                        departure_date=departure_date_obj,
+                        departure_time=departure_time_obj,
+                        return_date=return_date_obj,
+                        return_time=return_time_obj,
+                        price_per_person=price_per_person,
+                        total_price=total_price,
+                        booking_class=flight_data.get("booking_class", "Economy"),
+                        direct_flight=flight_data.get("direct_flight", True),
+                        source=flight_data.get("source", "unknown"),
+                        booking_url=flight_data.get("booking_url"),
+                        scraped_at=datetime.now(),
+                    )
+                    db.add(new_flight)
+                    await db.flush()  # Get the flight ID and load relationships
+
+                    # Track initial price
+                    await PriceHistoryService.track_price_change(
+                        db, new_flight, None
+                    )
+
+                    stats["inserted"] += 1
+
+            except Exception as e:
+                logger.error(f"Error saving flight: {e}", exc_info=True)
+                stats["skipped"] += 1
+                continue
+
     async def _get_or_create_airport(
         self, db: AsyncSession, iata_code: str, city: str = ""
     ) -> Optional[Airport]:
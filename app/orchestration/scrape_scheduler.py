@@ -0,0 +1,233 @@
+"""
+Bounded-concurrency scheduler for scraper tasks.
+
+Launching every origin × destination × date range × scraper combination at once
+starts hundreds of Playwright browsers and API calls simultaneously. This module
+provides a scheduler that runs scraper jobs with:
+
+- A separate concurrency limit per source (e.g. 2 Skyscanner browsers, 8 Kiwi calls)
+- A global cap on the total number of jobs in flight
+- Priority ordering (lower value runs first, ties keep submission order)
+
+Jobs are submitted as coroutine factories, so no coroutine is created until a
+slot is available for it.
+
+Example:
+    >>> scheduler = ScrapeScheduler(
+    ...     source_limits={"skyscanner": 2, "kiwi": 8},
+    ...     max_concurrency=10,
+    ... )
+    >>> scheduler.submit("kiwi", lambda: client.search_flights(...), priority=0)
+    >>> results = await scheduler.run()
+"""
+
+import asyncio
+import heapq
+import logging
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ScrapeJob:
+    """
+    A single unit of scraper work waiting to be scheduled.
+
+    Attributes:
+        index: Submission index (position of the result in ``run()`` output)
+        source: Scraper source name used for per-source limits (e.g. 'kiwi')
+        factory: Zero-argument callable returning the coroutine to run
+        priority: Scheduling priority (lower runs first)
+        label: Human-readable description used for logging/progress
+    """
+
+    index: int
+    source: str
+    factory: Callable[[], Awaitable[Any]] = field(repr=False)
+    priority: int = 0
+    label: str = ""
+
+
+class ScrapeScheduler:
+    """
+    Runs scraper jobs with per-source and global concurrency limits.
+
+    Results are returned in submission order. Exceptions raised by a job are
+    captured and returned in place of its result (like ``asyncio.gather`` with
+    ``return_exceptions=True``) so failure accounting can be done by the caller.
+
+    Attributes:
+        source_limits: Maximum concurrent jobs per source
+        max_concurrency: Maximum concurrent jobs across all sources
+        default_source_limit: Limit used for sources missing from source_limits
+    """
+
+    def __init__(
+        self,
+        source_limits: Optional[Dict[str, int]] = None,
+        max_concurrency: int = 8,
+        default_source_limit: int = 4,
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            source_limits: Mapping of source name to concurrency limit
+            max_concurrency: Global cap on concurrently running jobs
+            default_source_limit: Limit for sources not in source_limits
+
+        Raises:
+            ValueError: If any limit is lower than 1
+        """
+        self.source_limits = dict(source_limits or {})
+        self.max_concurrency = max_concurrency
+        self.default_source_limit = default_source_limit
+
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+        if default_source_limit < 1:
+            raise ValueError(
+                f"default_source_limit must be at least 1, got {default_source_limit}"
+            )
+        for source, limit in self.source_limits.items():
+            if limit < 1:
+                raise ValueError(f"Concurrency limit for '{source}' must be at least 1, got {limit}")
+
+        self._jobs: List[ScrapeJob] = []
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    @property
+    def jobs(self) -> List[ScrapeJob]:
+        """Submitted jobs in submission order."""
+        return list(self._jobs)
+
+    def limit_for(self, source: str) -> int:
+        """Get the concurrency limit for a source."""
+        return self.source_limits.get(source, self.default_source_limit)
+
+    def submit(
+        self,
+        source: str,
+        factory: Callable[[], Awaitable[Any]],
+        priority: int = 0,
+        label: str = "",
+    ) -> ScrapeJob:
+        """
+        Queue a job for execution.
+
+        Args:
+            source: Source name used for the per-source limit
+            factory: Zero-argument callable returning a coroutine
+            priority: Lower values are started first
+            label: Description used in logs and progress callbacks
+
+        Returns:
+            The queued ScrapeJob
+        """
+        job = ScrapeJob(
+            index=len(self._jobs),
+            source=source,
+            factory=factory,
+            priority=priority,
+            label=label or source,
+        )
+        self._jobs.append(job)
+        return job
+
+    async def run(
+        self,
+        on_complete: Optional[Callable[[ScrapeJob, Any], None]] = None,
+    ) -> List[Any]:
+        """
+        Execute all submitted jobs within the configured limits.
+
+        Args:
+            on_complete: Optional callback invoked as ``on_complete(job, result)``
+                when each job finishes; ``result`` is the exception on failure
+
+        Returns:
+            List of results in submission order (exceptions for failed jobs)
+        """
+        results: List[Any] = [None] * len(self._jobs)
+
+        # One heap per source so a saturated source never blocks the others
+        pending: Dict[str, List[Tuple[int, int, ScrapeJob]]] = defaultdict(list)
+        for job in self._jobs:
+            heapq.heappush(pending[job.source], (job.priority, job.index, job))
+
+        running: Dict[asyncio.Task, ScrapeJob] = {}
+        active: Dict[str, int] = defaultdict(int)
+
+        logger.info(
+            f"Scheduling {len(self._jobs)} jobs (global cap: {self.max_concurrency}, "
+            f"per-source: {self._describe_limits(pending.keys())})"
+        )
+
+        try:
+            while pending or running:
+                self._launch_ready(pending, running, active)
+
+                if not running:
+                    break
+
+                done, _ = await asyncio.wait(running.keys(), return_when=asyncio.FIRST_COMPLETED)
+
+                for task in done:
+                    job = running.pop(task)
+                    active[job.source] -= 1
+
+                    try:
+                        result = task.result()
+                    except Exception as e:
+                        result = e
+
+                    results[job.index] = result
+
+                    if on_complete:
+                        on_complete(job, result)
+        finally:
+            # Don't leave orphaned scraper tasks behind if run() itself is cancelled
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running.keys(), return_exceptions=True)
+
+        return results
+
+    def _launch_ready(
+        self,
+        pending: Dict[str, List[Tuple[int, int, ScrapeJob]]],
+        running: Dict[asyncio.Task, ScrapeJob],
+        active: Dict[str, int],
+    ) -> None:
+        """Start the highest-priority jobs whose source has a free slot."""
+        while len(running) < self.max_concurrency:
+            best_source = None
+            best_key = None
+
+            for source, heap in pending.items():
+                if active[source] >= self.limit_for(source):
+                    continue
+                key = heap[0][:2]
+                if best_key is None or key < best_key:
+                    best_key = key
+                    best_source = source
+
+            if best_source is None:
+                return
+
+            _, _, job = heapq.heappop(pending[best_source])
+            if not pending[best_source]:
+                del pending[best_source]
+
+            active[job.source] += 1
+            running[asyncio.create_task(job.factory())] = job
+
+    def _describe_limits(self, sources) -> str:
+        """Format per-source limits for logging."""
+        return ", ".join(f"{source}={self.limit_for(source)}" for source in sorted(sources)) or "none"
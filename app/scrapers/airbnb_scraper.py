@@ -3,8 +3,11 @@ Airbnb scraper using Apify (primary) or Playwright (fallback).
 
 This module provides functionality to search for family-friendly Airbnb listings
 using Apify's pre-built Airbnb Scraper actor or direct scraping with Playwright.
+Actor runs go through the async ApifyApiClient, so a search never blocks the
+event loop while Apify is scraping.
 """
 
+import asyncio
 import logging
 from datetime import date, datetime
 from typing import Any, Dict, List, Optional
@@ -16,6 +19,8 @@ from app.config import settings
 from app.database import get_async_session_context
 from app.exceptions import PlaywrightNotInstalledError
 from app.models.accommodation import Accommodation
+from app.scrapers.apify_api import APIFY_API_URL, ApifyApiClient
+from app.scrapers.http_pool import HttpClientPool
 
 logger = logging.getLogger(__name__)
 
@@ -31,35 +36,41 @@ class AirbnbClient:
     # Apify actor ID for Airbnb scraper
     AIRBNB_ACTOR_ID = "dtrungtin/airbnb-scraper"
 
+    # Seconds to wait for an actor run before giving up
+    APIFY_RUN_TIMEOUT = 900
+
     # Family-friendly criteria
     MIN_BEDROOMS = 2
     MAX_PRICE_PER_NIGHT = 150.0  # EUR
     REQUIRED_AMENITIES = ["Kitchen"]
     PROPERTY_TYPE = "Entire place"
 
-    def __init__(self, apify_api_key: Optional[str] = None):
+    def __init__(
+        self,
+        apify_api_key: Optional[str] = None,
+        http_pool: Optional[HttpClientPool] = None,
+        apify_base_url: str = APIFY_API_URL,
+    ):
         """
         Initialize Airbnb client.
 
         Args:
             apify_api_key: Apify API key. If not provided, uses settings.
+            http_pool: Shared HTTP client pool for Apify API calls (optional)
+            apify_base_url: Apify API base URL (default: APIFY_API_URL)
         """
         self.apify_api_key = apify_api_key or settings.apify_api_key
-        self.apify_client = None
+        self.apify_client: Optional[ApifyApiClient] = None
         self.credits_used = 0.0
 
         # Initialize Apify client if API key is available
         if self.apify_api_key:
-            try:
-                from apify_client import ApifyClient
-                self.apify_client = ApifyClient(self.apify_api_key)
-                logger.info("Apify client initialized successfully")
-            except ImportError:
-                logger.warning(
-                    "apify-client not installed. Install with: pip install apify-client"
-                )
-            except Exception as e:
-                logger.error(f"Failed to initialize Apify client: {e}")
+            self.apify_client = ApifyApiClient(
+                token=self.apify_api_key,
+                base_url=apify_base_url,
+                http_pool=http_pool,
+            )
+            logger.info("Apify client initialized successfully")
 
     async def search(
         self,
@@ -115,6 +126,9 @@ class AirbnbClient:
         """
         Search Airbnb using Apify actor.
 
+        The actor run is started and polled asynchronously, so searches for
+        other cities (and other sources) keep running while it scrapes.
+
         Args:
             city: Destination city
             check_in: Check-in date
@@ -131,27 +145,55 @@ class AirbnbClient:
             city, check_in, check_out, adults, children, max_listings
         )
 
-        logger.info(f"Running Apify actor with input: {actor_input}")
+        logger.info(f"Starting Apify actor with input: {actor_input}")
+
+        # Start the actor and poll until it finishes, without blocking the loop
+        run = await self.apify_client.start_actor(self.AIRBNB_ACTOR_ID, actor_input)
+        try:
+            run = await self.apify_client.wait_for_run(
+                run["id"], timeout=self.APIFY_RUN_TIMEOUT
+            )
+        except (asyncio.TimeoutError, asyncio.CancelledError):
+            # Don't leave the actor running (and billing) after giving up on it
+            await self._abort_apify_run(run["id"])
+            raise
 
-        # Run the actor and wait for it to finish
-        run = self.apify_client.actor(self.AIRBNB_ACTOR_ID).call(run_input=actor_input)
+        self._track_apify_credits(run)
 
-        # Track credits used
+        # Parse results page by page as they are fetched from the dataset
+        accommodations = []
+        item_count = 0
+        async for items in self.apify_client.iterate_dataset_pages(
+            run["defaultDatasetId"], limit=max_listings
+        ):
+            item_count += len(items)
+            accommodations.extend(self.parse_apify_results(items))
+
+        logger.info(f"Retrieved {item_count} listings from Apify")
+        return accommodations
+
+    async def _abort_apify_run(self, run_id: str) -> None:
+        """
+        Abort an Apify run and record the credits it used until then.
+
+        Args:
+            run_id: ID of the run to abort
+        """
+        logger.warning(f"Aborting Apify run {run_id}")
+        try:
+            run = await self.apify_client.abort_run(run_id)
+        except Exception as e:
+            logger.error(f"Failed to abort Apify run {run_id}: {e}")
+            return
+        self._track_apify_credits(run)
+
+    def _track_apify_credits(self, run: Dict[str, Any]) -> None:
+        """Add the compute units of a finished or aborted run to credits_used."""
         if run.get("stats", {}).get("computeUnits"):
             credits = run["stats"]["computeUnits"]
             self.credits_used += credits
             logger.info(f"Apify credits used: {credits:.4f} (total: {self.credits_used:.4f})")
 
-        # Fetch results from dataset
-        dataset_items = []
-        for item in self.apify_client.dataset(run["defaultDatasetId"]).iterate_items():
-            dataset_items.append(item)
-
-        logger.info(f"Retrieved {len(dataset_items)} listings from Apify")
-
-        # Parse and return results
-        return self.parse_apify_results(dataset_items)
-
     def build_apify_input(
         self,
         city: str,
@@ -0,0 +1,239 @@
+"""
+Async client for the Apify REST API.
+
+The ``apify-client`` package's ApifyClient is synchronous: ``actor().call()``
+blocks until the actor run finishes, which can take minutes and stalls every
+other task on the event loop. This module talks to the REST API with httpx
+instead:
+
+- start_actor() starts a run and returns immediately
+- wait_for_run() polls the run with short server-side waits
+  (``waitForFinish``) and yields to the loop between polls
+- abort_run() stops a run that is no longer wanted (timed out or cancelled),
+  so it doesn't keep consuming compute units
+- iterate_dataset_pages() streams the run's dataset page by page, so results
+  can be parsed while later pages are still being fetched
+
+Requests go through a keep-alive client borrowed from HttpClientPool when one
+is given.
+
+Example:
+    >>> apify = ApifyApiClient(token="...", http_pool=pool)
+    >>> run = await apify.start_actor("dtrungtin/airbnb-scraper", actor_input)
+    >>> run = await apify.wait_for_run(run["id"])
+    >>> async for items in apify.iterate_dataset_pages(run["defaultDatasetId"]):
+    ...     listings.extend(parse(items))
+"""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import httpx
+
+from app.exceptions import ScrapingError
+from app.scrapers.http_pool import HttpClientPool
+
+logger = logging.getLogger(__name__)
+
+APIFY_API_URL = "https://api.apify.com"
+
+# Run states after which a run doesn't change anymore
+TERMINAL_RUN_STATUSES = {"SUCCEEDED", "FAILED", "ABORTED", "TIMED-OUT"}
+
+
+class ApifyApiClient:
+    """
+    Minimal async Apify API client for running actors and reading datasets.
+
+    Attributes:
+        base_url: API base URL (APIFY_API_URL, or a local server in tests)
+        timeout: Request timeout in seconds
+        poll_seconds: Server-side wait per run status request (max 60)
+        page_size: Dataset items per page
+    """
+
+    def __init__(
+        self,
+        token: str,
+        base_url: str = APIFY_API_URL,
+        http_pool: Optional[HttpClientPool] = None,
+        timeout: float = 30.0,
+        poll_seconds: int = 30,
+        page_size: int = 100,
+    ):
+        """
+        Initialize the client.
+
+        Args:
+            token: Apify API token
+            base_url: API base URL (default: APIFY_API_URL)
+            http_pool: Shared HTTP client pool to borrow a keep-alive client from
+                (optional; without it each call opens its own client)
+            timeout: Request timeout in seconds (on top of poll waits)
+            poll_seconds: How long the API may hold a status request open
+            page_size: Dataset items per page
+        """
+        self.token = token
+        self.base_url = base_url.rstrip("/")
+        self.http_pool = http_pool
+        self.timeout = timeout
+        self.poll_seconds = poll_seconds
+        self.page_size = page_size
+
+    @asynccontextmanager
+    async def _client(self) -> AsyncIterator[httpx.AsyncClient]:
+        """Borrow the pooled client, or open a one-off client without a pool."""
+        if self.http_pool is not None:
+            yield self.http_pool.httpx_client(httpx.URL(self.base_url).host)
+        else:
+            async with httpx.AsyncClient(timeout=self.timeout) as client:
+                yield client
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Send an API request and return its decoded JSON body.
+
+        Raises:
+            ScrapingError: If the API answers with an error status
+        """
+        url = f"{self.base_url}{path}"
+        headers = {"Authorization": f"Bearer {self.token}"}
+
+        async with self._client() as client:
+            response = await client.request(
+                method, url, headers=headers, timeout=timeout or self.timeout, **kwargs
+            )
+
+        if response.status_code >= 400:
+            raise ScrapingError(
+                scraper_name="Apify",
+                reason=response.text[:200],
+                url=url,
+                http_status=response.status_code,
+            )
+        return response.json()
+
+    async def start_actor(self, actor_id: str, run_input: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Start an actor run without waiting for it.
+
+        Args:
+            actor_id: Actor ID or 'username/actor-name'
+            run_input: Actor input
+
+        Returns:
+            Run object (id, status, defaultDatasetId, ...)
+        """
+        # The API uses '~' instead of '/' in actor names
+        path = f"/v2/acts/{actor_id.replace('/', '~')}/runs"
+        body = await self._request("POST", path, json=run_input)
+        return body["data"]
+
+    async def get_run(self, run_id: str, wait_seconds: int = 0) -> Dict[str, Any]:
+        """
+        Get a run, letting the API wait up to wait_seconds for it to finish.
+
+        Args:
+            run_id: Run ID
+            wait_seconds: Server-side wait (0 returns immediately)
+
+        Returns:
+            Run object
+        """
+        body = await self._request(
+            "GET",
+            f"/v2/actor-runs/{run_id}",
+            params={"waitForFinish": wait_seconds},
+            timeout=self.timeout + wait_seconds,
+        )
+        return body["data"]
+
+    async def abort_run(self, run_id: str) -> Dict[str, Any]:
+        """
+        Abort a run so it stops consuming compute units.
+
+        Args:
+            run_id: Run ID
+
+        Returns:
+            Run object (with the stats of the aborted run)
+        """
+        body = await self._request("POST", f"/v2/actor-runs/{run_id}/abort")
+        return body["data"]
+
+    async def wait_for_run(self, run_id: str, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Poll a run until it finishes.
+
+        Args:
+            run_id: Run ID
+            timeout: Give up after this many seconds (None waits indefinitely)
+
+        Returns:
+            Run object of the succeeded run
+
+        Raises:
+            ScrapingError: If the run fails, is aborted or times out
+            asyncio.TimeoutError: If timeout elapses first
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+
+        while True:
+            wait_seconds = self.poll_seconds
+            if deadline is not None:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    raise asyncio.TimeoutError(f"Apify run {run_id} still running after {timeout}s")
+                wait_seconds = max(0, min(wait_seconds, int(remaining)))
+
+            run = await self.get_run(run_id, wait_seconds=wait_seconds)
+            status = run.get("status")
+
+            if status == "SUCCEEDED":
+                return run
+            if status in TERMINAL_RUN_STATUSES:
+                raise ScrapingError(
+                    scraper_name="Apify",
+                    reason=f"Actor run {run_id} ended with status {status}",
+                )
+
+            logger.debug(f"Apify run {run_id} is {status}, polling again")
+            if wait_seconds == 0:
+                # No server-side wait left; don't spin
+                await asyncio.sleep(1)
+
+    async def iterate_dataset_pages(
+        self, dataset_id: str, limit: Optional[int] = None
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Yield a dataset's items one page at a time.
+
+        Args:
+            dataset_id: Dataset ID
+            limit: Stop after this many items (None reads the whole dataset)
+
+        Yields:
+            Lists of up to page_size items
+        """
+        offset = 0
+        while limit is None or offset < limit:
+            page_size = self.page_size if limit is None else min(self.page_size, limit - offset)
+            items = await self._request(
+                "GET",
+                f"/v2/datasets/{dataset_id}/items",
+                params={"format": "json", "clean": "true", "offset": offset, "limit": page_size},
+            )
+            if items:
+                yield items
+            if len(items) < page_size:
+                return
+            offset += len(items)
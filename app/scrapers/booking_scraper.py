@@ -15,12 +15,13 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 from urllib.parse import quote_plus
 
-from playwright.async_api import Page, TimeoutError as PlaywrightTimeout, async_playwright
+from playwright.async_api import Page, TimeoutError as PlaywrightTimeout
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import AsyncSessionLocal
 from app.models.accommodation import Accommodation
+from app.scrapers.browser_pool import BrowserPool, get_browser_pool
 
 logger = logging.getLogger(__name__)
 
@@ -47,6 +48,7 @@ class BookingClient:
         headless: bool = True,
         screenshots_dir: Optional[Path] = None,
         rate_limit_seconds: float = 5.0,
+        browser_pool: Optional[BrowserPool] = None,
     ):
         """
         Initialize the Booking.com scraper.
@@ -55,8 +57,10 @@ class BookingClient:
             headless: Run browser in headless mode
             screenshots_dir: Directory to save error screenshots
             rate_limit_seconds: Minimum seconds between requests (4-8 recommended)
+            browser_pool: Browser pool to lease contexts from (defaults to the shared pool)
         """
         self.headless = headless
+        self.browser_pool = browser_pool or get_browser_pool(headless=headless)
         self.screenshots_dir = screenshots_dir or Path("screenshots")
         self.screenshots_dir.mkdir(exist_ok=True)
         self.rate_limit_seconds = rate_limit_seconds
@@ -71,29 +75,19 @@ class BookingClient:
         - Randomized user agent
         - Proper viewport settings
 
+        The context is leased from the shared browser pool, so no browser is
+        launched per search. Release it with ``browser_pool.release_context``.
+
         Returns:
-            Tuple of (playwright, browser, context) that should be cleaned up after use
+            Fresh BrowserContext that must be released after use
         """
         logger.info("Creating isolated browser context...")
 
-        # Start playwright
-        playwright = await async_playwright().start()
-
         # Random user agent for this scrape
         user_agent = random.choice(USER_AGENTS)
 
-        # Launch browser with anti-detection args
-        browser = await playwright.chromium.launch(
-            headless=self.headless,
-            args=[
-                "--disable-blink-features=AutomationControlled",
-                "--disable-dev-shm-usage",
-                "--no-sandbox",
-            ],
-        )
-
-        # Create fresh context with randomized settings
-        context = await browser.new_context(
+        # Lease fresh context with randomized settings from a warm browser
+        context = await self.browser_pool.acquire_context(
             user_agent=user_agent,
             viewport={"width": 1920, "height": 1080},
             locale="en-US",
@@ -107,7 +101,7 @@ class BookingClient:
         })
 
         logger.info("Isolated browser context created successfully")
-        return playwright, browser, context
+        return context
 
     async def _random_delay(self, min_seconds: Optional[float] = None) -> None:
         """Add a random delay to simulate human behavior."""
@@ -619,7 +613,7 @@ class BookingClient:
         url = self._build_search_url(city, check_in, check_out, adults, children_ages)
 
         # Create isolated browser context for this search
-        playwright, browser, context = await self._create_isolated_context()
+        context = await self._create_isolated_context()
 
         try:
             # Create new page in isolated context
@@ -668,22 +662,9 @@ class BookingClient:
                 await self._random_delay()
 
         finally:
-            # Always cleanup isolated browser context
+            # Return context to the pool (closes it; the browser stays warm)
             logger.debug("Cleaning up isolated browser context")
-            try:
-                await context.close()
-            except Exception as e:
-                logger.warning(f"Error closing context: {e}")
-
-            try:
-                await browser.close()
-            except Exception as e:
-                logger.warning(f"Error closing browser: {e}")
-
-            try:
-                await playwright.stop()
-            except Exception as e:
-                logger.warning(f"Error stopping playwright: {e}")
+            await self.browser_pool.release_context(context)
 
             logger.debug("Isolated browser context cleaned up")
 
@@ -0,0 +1,354 @@
+"""
+Shared Playwright browser pool for browser-based scrapers.
+
+Launching Chromium for every route dominates scrape time. This module keeps a
+small number of warm Chromium instances per process and hands out a fresh,
+isolated BrowserContext for each scraping operation. Contexts never share
+cookies, storage or cache, so route isolation is preserved while the per-route
+cost drops from a browser launch to a context creation.
+
+Features:
+- N warm browsers per launch configuration (least-loaded browser is used)
+- Health checks: disconnected browsers are dropped and replaced on demand
+- Recycling: a browser is retired after max_uses contexts and closed once idle
+- Clean shutdown via close_browser_pools()
+
+Example:
+    >>> pool = get_browser_pool(headless=True)
+    >>> async with pool.lease(user_agent="...", locale="en-US") as context:
+    ...     page = await context.new_page()
+    ...     await page.goto("https://example.com")
+    >>> await close_browser_pools()  # On process shutdown
+"""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Dict, List, Optional, Sequence, Tuple, TypeVar
+
+from playwright.async_api import Browser, BrowserContext, Playwright, async_playwright
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Default Chromium flags shared by the scrapers
+DEFAULT_LAUNCH_ARGS = (
+    "--disable-blink-features=AutomationControlled",
+    "--disable-dev-shm-usage",
+    "--no-sandbox",
+)
+
+
+@dataclass
+class _PooledBrowser:
+    """Bookkeeping for a single pooled Chromium instance."""
+
+    browser: Browser
+    uses: int = 0
+    active: int = 0
+    retired: bool = False
+
+
+class BrowserPool:
+    """
+    Pool of warm Chromium browsers that leases isolated contexts.
+
+    Browsers are launched lazily up to ``size``. Each lease creates a new
+    BrowserContext on the least-loaded healthy browser; releasing the lease
+    closes the context. After ``max_uses`` leases a browser is retired and
+    closed as soon as its last context is released.
+
+    The pool is bound to the event loop it was first used on. Playwright
+    objects cannot outlive their loop, so using the pool from a new loop
+    (e.g. a second ``asyncio.run``) discards the stale browsers and starts fresh.
+
+    Attributes:
+        size: Maximum number of browsers kept alive
+        max_uses: Contexts served by a browser before it is recycled
+        headless: Launch browsers in headless mode
+        slow_mo: Slow down Playwright operations by this many ms
+        launch_args: Chromium command-line flags
+    """
+
+    def __init__(
+        self,
+        size: Optional[int] = None,
+        max_uses: Optional[int] = None,
+        headless: bool = True,
+        slow_mo: int = 0,
+        launch_args: Optional[Sequence[str]] = None,
+    ):
+        """
+        Initialize the browser pool (no browsers are launched until first use).
+
+        Args:
+            size: Number of browsers to keep (defaults to settings.browser_pool_size)
+            max_uses: Contexts per browser before recycling
+                (defaults to settings.browser_pool_max_uses)
+            headless: Launch browsers in headless mode
+            slow_mo: Slow down operations by specified ms (useful for debugging)
+            launch_args: Chromium flags (defaults to DEFAULT_LAUNCH_ARGS)
+        """
+        self.size = size or settings.browser_pool_size
+        self.max_uses = max_uses or settings.browser_pool_max_uses
+        self.headless = headless
+        self.slow_mo = slow_mo
+        self.launch_args = list(launch_args or DEFAULT_LAUNCH_ARGS)
+
+        self._playwright: Optional[Playwright] = None
+        self._browsers: List[_PooledBrowser] = []
+        self._leases: Dict[BrowserContext, _PooledBrowser] = {}
+        self._lock: Optional[asyncio.Lock] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._launched = 0
+        self._recycled = 0
+
+    def _bind_loop(self) -> None:
+        """Bind to the running loop, discarding state from a previous loop."""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+
+        if self._loop is not None:
+            logger.info("Event loop changed, discarding stale browser pool state")
+
+        self._loop = loop
+        self._lock = asyncio.Lock()
+        self._playwright = None
+        self._browsers = []
+        self._leases = {}
+
+    async def _launch_browser(self) -> _PooledBrowser:
+        """Launch a new Chromium instance and add it to the pool."""
+        if self._playwright is None:
+            self._playwright = await async_playwright().start()
+
+        browser = await self._playwright.chromium.launch(
+            headless=self.headless,
+            slow_mo=self.slow_mo,
+            args=self.launch_args,
+        )
+        pooled = _PooledBrowser(browser=browser)
+        self._browsers.append(pooled)
+        self._launched += 1
+
+        logger.info(f"Launched pooled browser ({len(self._browsers)}/{self.size})")
+        return pooled
+
+    async def _close_browser(self, pooled: _PooledBrowser) -> None:
+        """Close a browser and remove it from the pool."""
+        if pooled in self._browsers:
+            self._browsers.remove(pooled)
+        try:
+            await pooled.browser.close()
+        except Exception as e:
+            logger.warning(f"Error closing pooled browser: {e}")
+
+    def _prune_disconnected(self) -> int:
+        """Drop browsers that have crashed or disconnected."""
+        dead = [p for p in self._browsers if not p.browser.is_connected()]
+        for pooled in dead:
+            self._browsers.remove(pooled)
+            logger.warning("Dropping disconnected browser from pool")
+        return len(dead)
+
+    async def _select_browser(self) -> _PooledBrowser:
+        """Pick the least-loaded healthy browser, launching one if below size."""
+        self._prune_disconnected()
+
+        available = [p for p in self._browsers if not p.retired]
+
+        # Prefer an idle warm browser; otherwise grow the pool up to size
+        if len(available) < self.size and all(p.active > 0 for p in available):
+            return await self._launch_browser()
+
+        return min(available, key=lambda p: (p.active, p.uses))
+
+    async def acquire_context(self, **context_options: Any) -> BrowserContext:
+        """
+        Lease a fresh isolated browser context.
+
+        Args:
+            **context_options: Keyword arguments for ``Browser.new_context``
+                (user_agent, viewport, locale, timezone_id, ...)
+
+        Returns:
+            New BrowserContext; pass it to release_context() when done
+        """
+        self._bind_loop()
+
+        async with self._lock:
+            pooled = await self._select_browser()
+            pooled.uses += 1
+            pooled.active += 1
+            if pooled.uses >= self.max_uses:
+                pooled.retired = True
+
+        try:
+            context = await pooled.browser.new_context(**context_options)
+        except Exception:
+            pooled.active -= 1
+            await self._maybe_recycle(pooled)
+            raise
+
+        self._leases[context] = pooled
+        return context
+
+    async def release_context(self, context: BrowserContext) -> None:
+        """
+        Close a leased context and return its browser slot to the pool.
+
+        Args:
+            context: Context previously returned by acquire_context()
+        """
+        try:
+            await context.close()
+        except Exception as e:
+            logger.warning(f"Error closing context: {e}")
+
+        pooled = self._leases.pop(context, None)
+        if pooled is None:
+            return
+
+        pooled.active -= 1
+        await self._maybe_recycle(pooled)
+
+    async def _maybe_recycle(self, pooled: _PooledBrowser) -> None:
+        """Close a retired browser once it has no active contexts."""
+        if pooled.retired and pooled.active <= 0 and pooled in self._browsers:
+            logger.info(f"Recycling browser after {pooled.uses} uses")
+            self._recycled += 1
+            await self._close_browser(pooled)
+
+    @asynccontextmanager
+    async def lease(self, **context_options: Any) -> AsyncIterator[BrowserContext]:
+        """
+        Async context manager that leases and releases an isolated context.
+
+        Args:
+            **context_options: Keyword arguments for ``Browser.new_context``
+
+        Yields:
+            Fresh BrowserContext
+        """
+        context = await self.acquire_context(**context_options)
+        try:
+            yield context
+        finally:
+            await self.release_context(context)
+
+    async def health_check(self) -> Dict[str, int]:
+        """
+        Drop disconnected browsers and report pool status.
+
+        Returns:
+            Pool statistics after pruning (see get_stats)
+        """
+        if self._loop is asyncio.get_running_loop():
+            async with self._lock:
+                self._prune_disconnected()
+        return self.get_stats()
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get pool statistics.
+
+        Returns:
+            Dictionary with browser and lease counters
+        """
+        return {
+            "browsers": len(self._browsers),
+            "active_contexts": len(self._leases),
+            "launched": self._launched,
+            "recycled": self._recycled,
+        }
+
+    async def close(self) -> None:
+        """Close all browsers and stop Playwright."""
+        if self._loop is not asyncio.get_running_loop():
+            # Objects from another loop can't be awaited here; just forget them
+            self._loop = None
+            self._browsers = []
+            self._leases = {}
+            self._playwright = None
+            return
+
+        for context in list(self._leases):
+            try:
+                await context.close()
+            except Exception as e:
+                logger.warning(f"Error closing context: {e}")
+        self._leases = {}
+
+        for pooled in list(self._browsers):
+            await self._close_browser(pooled)
+
+        if self._playwright is not None:
+            try:
+                await self._playwright.stop()
+            except Exception as e:
+                logger.warning(f"Error stopping playwright: {e}")
+            self._playwright = None
+
+        logger.info("Browser pool closed")
+
+
+# Process-wide pools keyed by launch configuration
+_pools: Dict[Tuple[bool, int, Tuple[str, ...]], BrowserPool] = {}
+
+
+def get_browser_pool(
+    headless: bool = True,
+    slow_mo: int = 0,
+    launch_args: Optional[Sequence[str]] = None,
+) -> BrowserPool:
+    """
+    Get the shared browser pool for a launch configuration.
+
+    Scrapers with identical launch options share the same warm browsers.
+
+    Args:
+        headless: Launch browsers in headless mode
+        slow_mo: Slow down operations by specified ms
+        launch_args: Chromium flags (defaults to DEFAULT_LAUNCH_ARGS)
+
+    Returns:
+        Shared BrowserPool instance
+    """
+    args = tuple(launch_args or DEFAULT_LAUNCH_ARGS)
+    key = (headless, slow_mo, args)
+
+    if key not in _pools:
+        _pools[key] = BrowserPool(headless=headless, slow_mo=slow_mo, launch_args=args)
+
+    return _pools[key]
+
+
+async def close_browser_pools() -> None:
+    """Close every shared browser pool. Call on process/command shutdown."""
+    for pool in list(_pools.values()):
+        await pool.close()
+    _pools.clear()
+
+
+async def run_with_browser_pools(coro: Awaitable[T]) -> T:
+    """
+    Await a coroutine and close the shared browser pools afterwards.
+
+    Use as the top-level coroutine passed to ``asyncio.run`` so warm browsers
+    are shut down before the event loop closes.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    try:
+        return await coro
+    finally:
+        await close_browser_pools()
@@ -0,0 +1,203 @@
+"""
+Shared, lifecycle-managed HTTP clients for API-based scrapers.
+
+Creating an ``aiohttp.ClientSession`` or ``httpx.AsyncClient`` per request
+pays TCP and TLS setup on every call to the same host. This module keeps
+long-lived clients with keep-alive connection pools that scrapers borrow
+instead of creating their own.
+
+Features:
+- One aiohttp session with a global and a per-host connection limit, plus
+  DNS caching (used by KiwiClient)
+- One httpx client per host, capped at the per-host limit, with HTTP/2
+  negotiated when the optional ``h2`` package is installed (used by
+  WizzAirScraper)
+- Keep-alive expiry for idle connections
+- Clean shutdown via close(); the owner (e.g. FlightOrchestrator) decides
+  when that happens
+
+Example:
+    >>> pool = HttpClientPool()
+    >>> kiwi = KiwiClient(http_pool=pool)
+    >>> wizzair = WizzAirScraper(http_pool=pool)
+    >>> ...
+    >>> await pool.close()  # When the owner is done
+"""
+
+import asyncio
+import logging
+from typing import Dict, Optional
+
+import aiohttp
+import httpx
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+class HttpClientPool:
+    """
+    Pool of keep-alive HTTP clients shared by API scrapers.
+
+    Clients are created lazily on first use and are bound to the event loop
+    they were created on. Using the pool from a new loop (e.g. a second
+    ``asyncio.run``) discards the stale clients and starts fresh, like
+    BrowserPool.
+
+    Borrowers must not close the clients they get; the pool owner calls
+    close() once all requests are done.
+
+    Attributes:
+        max_connections: Total connections of the aiohttp session
+        max_per_host: Connections per host (aiohttp limit and httpx client size)
+        keepalive_seconds: Idle time before a pooled connection is closed
+        dns_cache_seconds: TTL of cached DNS lookups (aiohttp)
+        http2: Negotiate HTTP/2 for httpx clients (needs ``h2``)
+    """
+
+    def __init__(
+        self,
+        max_connections: Optional[int] = None,
+        max_per_host: Optional[int] = None,
+        keepalive_seconds: Optional[float] = None,
+        dns_cache_seconds: Optional[int] = None,
+        http2: Optional[bool] = None,
+    ):
+        """
+        Initialize the pool (no connections are opened until first use).
+
+        Args:
+            max_connections: Total connection limit
+                (defaults to settings.http_pool_max_connections)
+            max_per_host: Per-host connection limit
+                (defaults to settings.http_pool_max_per_host)
+            keepalive_seconds: Keep-alive expiry for idle connections
+                (defaults to settings.http_pool_keepalive_seconds)
+            dns_cache_seconds: DNS cache TTL
+                (defaults to settings.http_pool_dns_cache_seconds)
+            http2: Enable HTTP/2 for httpx clients (defaults to settings.http_pool_http2);
+                ignored with a warning if ``h2`` is not installed
+        """
+        self.max_connections = max_connections or settings.http_pool_max_connections
+        self.max_per_host = max_per_host or settings.http_pool_max_per_host
+        self.keepalive_seconds = keepalive_seconds or settings.http_pool_keepalive_seconds
+        self.dns_cache_seconds = dns_cache_seconds or settings.http_pool_dns_cache_seconds
+
+        http2 = settings.http_pool_http2 if http2 is None else http2
+        if http2 and not HTTP2_AVAILABLE:
+            logger.warning("h2 not installed, using HTTP/1.1. Install with: pip install httpx[http2]")
+        self.http2 = http2 and HTTP2_AVAILABLE
+
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._httpx_clients: Dict[str, httpx.AsyncClient] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _bind_loop(self) -> None:
+        """Bind to the running loop, discarding clients from a previous loop."""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+
+        if self._loop is not None:
+            logger.info("Event loop changed, discarding stale HTTP clients")
+
+        self._loop = loop
+        self._session = None
+        self._httpx_clients = {}
+
+    def aiohttp_session(self) -> aiohttp.ClientSession:
+        """
+        Get the shared aiohttp session.
+
+        Returns:
+            Keep-alive ClientSession; pass headers and timeouts per request
+        """
+        self._bind_loop()
+
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections,
+                limit_per_host=self.max_per_host,
+                ttl_dns_cache=self.dns_cache_seconds,
+                keepalive_timeout=self.keepalive_seconds,
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+            logger.info(
+                f"Opened pooled aiohttp session (limit: {self.max_connections}, "
+                f"per host: {self.max_per_host})"
+            )
+
+        return self._session
+
+    def httpx_client(self, host: str) -> httpx.AsyncClient:
+        """
+        Get the shared httpx client for a host.
+
+        Args:
+            host: Host the client talks to (e.g. 'be.wizzair.com'); each host
+                gets its own client so the per-host limit applies
+
+        Returns:
+            Keep-alive AsyncClient; pass headers and timeouts per request
+        """
+        self._bind_loop()
+
+        client = self._httpx_clients.get(host)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                http2=self.http2,
+                limits=httpx.Limits(
+                    max_connections=self.max_per_host,
+                    max_keepalive_connections=self.max_per_host,
+                    keepalive_expiry=self.keepalive_seconds,
+                ),
+            )
+            self._httpx_clients[host] = client
+            logger.info(f"Opened pooled httpx client for {host} (HTTP/2: {self.http2})")
+
+        return client
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get pool statistics.
+
+        Returns:
+            Dictionary with open aiohttp sessions and httpx clients
+        """
+        return {
+            "aiohttp_sessions": int(self._session is not None and not self._session.closed),
+            "httpx_clients": sum(1 for c in self._httpx_clients.values() if not c.is_closed),
+        }
+
+    async def close(self) -> None:
+        """Close all pooled clients and their connections."""
+        if self._loop is not asyncio.get_running_loop():
+            # Clients from another loop can't be awaited here; just forget them
+            self._loop = None
+            self._session = None
+            self._httpx_clients = {}
+            return
+
+        if self._session is not None:
+            try:
+                await self._session.close()
+            except Exception as e:
+                logger.warning(f"Error closing aiohttp session: {e}")
+            self._session = None
+
+        for host, client in list(self._httpx_clients.items()):
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning(f"Error closing httpx client for {host}: {e}")
+        self._httpx_clients = {}
+
+        logger.info("HTTP client pool closed")
@@ -11,8 +11,9 @@ Free tier: 100 requests/month
 
 import asyncio
 import logging
+from contextlib import asynccontextmanager
 from datetime import date, datetime, time, timedelta
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Dict, List, Optional, Union
 from urllib.parse import urlencode
 
 import aiohttp
@@ -24,10 +25,12 @@ from app.database import get_async_session_context
 from app.exceptions import APIKeyMissingError
 from app.models.airport import Airport
 from app.models.flight import Flight
+from app.scrapers.http_pool import HttpClientPool
 from app.utils.rate_limiter import (
+    AsyncRedisRateLimiter,
     RedisRateLimiter,
     RateLimitExceededError,
-    get_kiwi_rate_limiter,
+    get_async_kiwi_rate_limiter,
 )
 from app.utils.retry import api_retry
 
@@ -60,16 +63,20 @@ class KiwiClient:
     def __init__(
         self,
         api_key: Optional[str] = None,
-        rate_limiter: Optional[RedisRateLimiter] = None,
+        rate_limiter: Optional[Union[AsyncRedisRateLimiter, RedisRateLimiter]] = None,
         timeout: int = 30,
+        http_pool: Optional[HttpClientPool] = None,
     ):
         """
         Initialize Kiwi API client.
 
         Args:
             api_key: Kiwi API key (defaults to settings.kiwi_api_key)
-            rate_limiter: Custom rate limiter instance (optional)
+            rate_limiter: Custom rate limiter instance (optional, defaults to the
+                shared async limiter: 100 requests/month, paced per second)
             timeout: Request timeout in seconds (default: 30)
+            http_pool: Shared HTTP client pool to borrow a keep-alive session from
+                (optional; without it each request opens its own session)
         """
         self.api_key = api_key or settings.kiwi_api_key
         if not self.api_key:
@@ -86,10 +93,20 @@ class KiwiClient:
                 )
             )
 
-        self.rate_limiter = rate_limiter or get_kiwi_rate_limiter()
+        self.rate_limiter = rate_limiter or get_async_kiwi_rate_limiter()
         self.timeout = timeout
+        self.http_pool = http_pool
         self.logger = logging.getLogger(f"{__name__}.KiwiClient")
 
+    @asynccontextmanager
+    async def _session(self) -> AsyncIterator[aiohttp.ClientSession]:
+        """Borrow the pooled session, or open a one-off session without a pool."""
+        if self.http_pool is not None:
+            yield self.http_pool.aiohttp_session()
+        else:
+            async with aiohttp.ClientSession() as session:
+                yield session
+
     @api_retry(max_attempts=3, min_wait_seconds=2, max_wait_seconds=10)
     async def _make_request(
         self,
@@ -110,7 +127,11 @@ class KiwiClient:
             aiohttp.ClientError: If network request fails after retries
         """
         # Check rate limit
-        if not self.rate_limiter.is_allowed():
+        is_async_limiter = isinstance(self.rate_limiter, AsyncRedisRateLimiter)
+        if is_async_limiter:
+            # Atomic check-and-reserve; waits for a token instead of raising
+            await self.rate_limiter.acquire(timeout=settings.rate_limit_acquire_timeout)
+        elif not self.rate_limiter.is_allowed():
             remaining = self.rate_limiter.get_remaining()
             raise RateLimitExceededError(
                 f"Monthly rate limit exceeded. {remaining} calls remaining this month."
@@ -119,15 +140,16 @@ class KiwiClient:
         url = f"{self.BASE_URL}{self.SEARCH_ENDPOINT}"
         headers = {"apikey": self.api_key}
 
-        async with aiohttp.ClientSession() as session:
+        async with self._session() as session:
             async with session.get(
                 url,
                 params=params,
                 headers=headers,
                 timeout=aiohttp.ClientTimeout(total=self.timeout),
             ) as response:
-                # Record successful API call
-                self.rate_limiter.record_request()
+                # Record successful API call (the async limiter reserved it already)
+                if not is_async_limiter:
+                    self.rate_limiter.record_request()
 
                 # Log request details
                 query_string = urlencode(params)
@@ -17,18 +17,20 @@ import random
 import re
 from datetime import date, datetime, time, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Union
 
-from playwright.async_api import Browser, BrowserContext, Page, async_playwright
+from playwright.async_api import Browser, BrowserContext, Page
 from playwright_stealth import Stealth
 
 from app.config import settings
 from app.exceptions import ScraperInitializationError
+from app.scrapers.browser_pool import BrowserPool, get_browser_pool
 from app.utils.logging_config import get_logger
 from app.utils.rate_limiter import (
+    AsyncRedisRateLimiter,
     RedisRateLimiter,
     RateLimitExceededError,
-    get_ryanair_rate_limiter,
+    get_async_ryanair_rate_limiter,
 )
 
 logger = get_logger(__name__)
@@ -69,17 +71,35 @@ class RyanairScraper:
         "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.2 Safari/605.1.15",
     ]
 
+    # Chromium flags for the shared browser pool
+    LAUNCH_ARGS = [
+        "--disable-blink-features=AutomationControlled",
+        "--disable-dev-shm-usage",
+        "--disable-web-security",
+        "--disable-features=IsolateOrigins,site-per-process",
+        "--no-sandbox",
+        "--disable-setuid-sandbox",
+        "--disable-infobars",
+        "--window-position=0,0",
+        "--ignore-certificate-errors",
+        "--ignore-certificate-errors-spki-list",
+        "--disable-gpu",
+    ]
+
     def __init__(
         self,
         log_dir: Optional[str] = None,
-        rate_limiter: Optional[RedisRateLimiter] = None,
+        rate_limiter: Optional[Union[AsyncRedisRateLimiter, RedisRateLimiter]] = None,
+        browser_pool: Optional[BrowserPool] = None,
     ):
         """
         Initialize Ryanair scraper with stealth configuration.
 
         Args:
             log_dir: Directory to save error screenshots (defaults to configured log directory)
-            rate_limiter: Custom rate limiter instance (optional)
+            rate_limiter: Custom rate limiter instance (optional, defaults to the
+                shared async limiter: 5 searches/day, paced per second)
+            browser_pool: Browser pool to lease contexts from (defaults to the shared pool)
         """
         if log_dir:
             self.log_dir = Path(log_dir)
@@ -87,7 +107,10 @@ class RyanairScraper:
             self.log_dir = settings.get_log_dir() / "ryanair"
 
         self.log_dir.mkdir(parents=True, exist_ok=True)
-        self.rate_limiter = rate_limiter or get_ryanair_rate_limiter()
+        self.rate_limiter = rate_limiter or get_async_ryanair_rate_limiter()
+        self.browser_pool = browser_pool or get_browser_pool(
+            headless=True, launch_args=self.LAUNCH_ARGS
+        )
 
     async def __aenter__(self):
         """
@@ -126,37 +149,19 @@ class RyanairScraper:
         - Proper viewport settings
         - Stealth mode enabled
 
+        The context is leased from the shared browser pool, so no browser is
+        launched per route. Release it with ``browser_pool.release_context``.
+
         Returns:
-            Tuple of (playwright, browser, context) that should be cleaned up after use
+            Tuple of (context, page); the context must be released after use
         """
         logger.info("Creating isolated browser context with stealth mode...")
 
-        # Start playwright
-        playwright = await async_playwright().start()
-
         # Random user agent for this scrape
         user_agent = random.choice(self.USER_AGENTS)
 
-        # Launch browser with stealth args
-        browser = await playwright.chromium.launch(
-            headless=True,
-            args=[
-                "--disable-blink-features=AutomationControlled",
-                "--disable-dev-shm-usage",
-                "--disable-web-security",
-                "--disable-features=IsolateOrigins,site-per-process",
-                "--no-sandbox",
-                "--disable-setuid-sandbox",
-                "--disable-infobars",
-                "--window-position=0,0",
-                "--ignore-certificate-errors",
-                "--ignore-certificate-errors-spki-list",
-                "--disable-gpu",
-            ],
-        )
-
-        # Create fresh context with realistic settings
-        context = await browser.new_context(
+        # Lease fresh context with realistic settings from a warm browser
+        context = await self.browser_pool.acquire_context(
             viewport={"width": 1920, "height": 1080},
             user_agent=user_agent,
             locale="en-GB",
@@ -210,7 +215,7 @@ class RyanairScraper:
         )
 
         logger.info("Isolated browser context created with stealth mode")
-        return playwright, browser, context, page
+        return context, page
 
     async def _check_rate_limit(self) -> None:
         """
@@ -219,6 +224,12 @@ class RyanairScraper:
         Raises:
             RateLimitExceededError: If daily limit is exceeded
         """
+        if isinstance(self.rate_limiter, AsyncRedisRateLimiter):
+            # Atomic check-and-reserve; waits for a token instead of raising
+            await self.rate_limiter.acquire(timeout=settings.rate_limit_acquire_timeout)
+            logger.info("Rate limit check passed")
+            return
+
         if not self.rate_limiter.is_allowed():
             remaining = self.rate_limiter.get_remaining()
             status = self.rate_limiter.get_status()
@@ -867,7 +878,7 @@ class RyanairScraper:
         await self._check_rate_limit()
 
         # Create isolated browser context for this scrape
-        playwright, browser, context, page = await self._create_isolated_context()
+        context, page = await self._create_isolated_context()
 
         try:
             # Navigate to homepage
@@ -938,20 +949,8 @@ class RyanairScraper:
             except Exception as e:
                 logger.warning(f"Error closing page: {e}")
 
-            try:
-                await context.close()
-            except Exception as e:
-                logger.warning(f"Error closing context: {e}")
-
-            try:
-                await browser.close()
-            except Exception as e:
-                logger.warning(f"Error closing browser: {e}")
-
-            try:
-                await playwright.stop()
-            except Exception as e:
-                logger.warning(f"Error stopping playwright: {e}")
+            # Return context to the pool (closes it; the browser stays warm)
+            await self.browser_pool.release_context(context)
 
             logger.debug("Isolated browser context cleaned up")
 
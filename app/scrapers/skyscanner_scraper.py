@@ -18,7 +18,6 @@ from playwright.async_api import (
     Browser,
     BrowserContext,
     Page,
-    async_playwright,
     TimeoutError as PlaywrightTimeoutError,
 )
 from playwright_stealth.stealth import Stealth
@@ -29,6 +28,7 @@ from app.config import settings
 from app.database import get_async_session_context
 from app.models.airport import Airport
 from app.models.flight import Flight
+from app.scrapers.browser_pool import BrowserPool, get_browser_pool
 from app.utils.rate_limiter import (
     RedisRateLimiter,
     RateLimitExceededError,
@@ -76,6 +76,7 @@ class SkyscannerScraper:
         headless: bool = True,
         slow_mo: int = 0,
         rate_limiter: Optional[RedisRateLimiter] = None,
+        browser_pool: Optional[BrowserPool] = None,
     ):
         """
         Initialize Skyscanner scraper.
@@ -84,11 +85,13 @@ class SkyscannerScraper:
             headless: Run browser in headless mode (default: True)
             slow_mo: Slow down operations by specified ms (useful for debugging)
             rate_limiter: Custom rate limiter instance (optional)
+            browser_pool: Browser pool to lease contexts from (defaults to the shared pool)
         """
         self.headless = headless
         self.slow_mo = slow_mo
         self.stealth = Stealth()  # Initialize stealth mode
         self.rate_limiter = rate_limiter or get_skyscanner_rate_limiter()
+        self.browser_pool = browser_pool or get_browser_pool(headless=headless, slow_mo=slow_mo)
 
         # Create logs directory for screenshots
         self.logs_dir = Path("logs")
@@ -135,31 +138,20 @@ class SkyscannerScraper:
         - Proper viewport settings
         - Stealth mode enabled
 
+        The context is leased from the shared browser pool, so no browser is
+        launched per route. Release it with ``browser_pool.release_context``.
+
         Returns:
-            Tuple of (playwright, browser, context) that should be cleaned up after use
+            Fresh BrowserContext that must be released after use
         """
         logger.info("Creating isolated browser context...")
 
-        # Start playwright
-        playwright = await async_playwright().start()
-
         # Random user agent for this scrape
         user_agent = random.choice(USER_AGENTS)
         logger.debug(f"Using user agent: {user_agent[:50]}...")
 
-        # Launch browser with anti-detection args
-        browser = await playwright.chromium.launch(
-            headless=self.headless,
-            slow_mo=self.slow_mo,
-            args=[
-                '--disable-blink-features=AutomationControlled',
-                '--disable-dev-shm-usage',
-                '--no-sandbox',
-            ]
-        )
-
-        # Create fresh context with randomized settings
-        context = await browser.new_context(
+        # Lease fresh context with randomized settings from a warm browser
+        context = await self.browser_pool.acquire_context(
             user_agent=user_agent,
             viewport={"width": 1920, "height": 1080},
             locale="en-US",
@@ -174,7 +166,7 @@ class SkyscannerScraper:
         logger.debug("Stealth mode applied to isolated browser context")
 
         logger.info("Isolated browser context created successfully")
-        return playwright, browser, context
+        return context
 
     def _check_rate_limit(self):
         """
@@ -344,7 +336,7 @@ class SkyscannerScraper:
         logger.info(f"Scraping route: {origin} → {destination} ({url})")
 
         # Create isolated browser context for this scrape
-        playwright, browser, context = await self._create_isolated_context()
+        context = await self._create_isolated_context()
 
         try:
             # Create new page in isolated context
@@ -391,22 +383,9 @@ class SkyscannerScraper:
                 await page.close()
 
         finally:
-            # Always cleanup browser context and playwright instance
+            # Return context to the pool (closes it; the browser stays warm)
             logger.debug("Cleaning up isolated browser context")
-            try:
-                await context.close()
-            except Exception as e:
-                logger.warning(f"Error closing context: {e}")
-
-            try:
-                await browser.close()
-            except Exception as e:
-                logger.warning(f"Error closing browser: {e}")
-
-            try:
-                await playwright.stop()
-            except Exception as e:
-                logger.warning(f"Error stopping playwright: {e}")
+            await self.browser_pool.release_context(context)
 
             logger.debug("Isolated browser context cleaned up")
 
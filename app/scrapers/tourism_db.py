@@ -4,7 +4,7 @@ Database operations for tourism event scrapers.
 
 import logging
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List, Optional
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -14,6 +14,9 @@ from app.utils.event_deduplication import deduplicate_events, generate_deduplica
 
 logger = logging.getLogger(__name__)
 
+# Hashes per IN query when looking up existing events
+HASH_LOOKUP_CHUNK_SIZE = 1000
+
 
 async def save_events_to_db(
     events: List[Dict[str, Any]],
@@ -25,7 +28,8 @@ async def save_events_to_db(
 
     This function now:
     1. Deduplicates events from multiple sources using hash-based and fuzzy matching
-    2. Checks against existing events using deduplication_hash (not source-specific)
+    2. Checks against existing events using deduplication_hash (not source-specific),
+       loading all of the batch's hashes with one IN query
     3. Stores venue and deduplication_hash for future deduplication
     4. Merges sources and URLs from duplicate events
 
@@ -60,69 +64,40 @@ async def save_events_to_db(
                     venue=event_data.get('venue')
                 )
 
+    # Step 2: Look up existing events for every hash in the batch at once.
+    # This allows cross-source deduplication (same event from different sources)
+    existing_by_hash: Dict[str, Event] = {}
+    if deduplicate:
+        existing_by_hash = await find_events_by_hashes(
+            [event_data.get('deduplication_hash') for event_data in unique_events],
+            session,
+        )
+
     saved_count = 0
     updated_count = 0
     skipped_count = 0
+    new_events: List[Event] = []
 
     for event_data in unique_events:
         try:
-            # Step 2: Check for existing events using deduplication_hash
-            # This allows cross-source deduplication (same event from different sources)
             dedup_hash = event_data.get('deduplication_hash')
-
-            if deduplicate and dedup_hash:
-                stmt = select(Event).where(Event.deduplication_hash == dedup_hash)
-                result = await session.execute(stmt)
-                existing = result.scalar_one_or_none()
-
-                if existing:
-                    # Event already exists - update if new source or better information
-                    should_update = False
-
-                    # Check if this is from a different source
-                    if event_data['source'] != existing.source:
-                        logger.debug(
-                            f"Found event from different source: {event_data['title']} "
-                            f"(existing: {existing.source}, new: {event_data['source']})"
-                        )
-                        should_update = True
-
-                    # Update if new event has more complete information
-                    new_desc_len = len(event_data.get('description', '') or '')
-                    existing_desc_len = len(existing.description or '')
-
-                    if new_desc_len > existing_desc_len:
-                        should_update = True
-
-                    if should_update:
-                        # Update existing event with better information
-                        if event_data.get('description') and new_desc_len > existing_desc_len:
-                            existing.description = event_data['description']
-
-                        if event_data.get('venue') and not existing.venue:
-                            existing.venue = event_data['venue']
-
-                        if event_data.get('url') and not existing.url:
-                            existing.url = event_data['url']
-
-                        if event_data.get('price_range') and existing.price_range == 'varies':
-                            existing.price_range = event_data['price_range']
-
-                        existing.scraped_at = datetime.utcnow()
-                        updated_count += 1
-
-                        logger.debug(
-                            f"Updated event: {event_data['title']} "
-                            f"on {event_data['event_date']} in {event_data['destination_city']}"
-                        )
-                    else:
-                        skipped_count += 1
-                        logger.debug(
-                            f"Skipping duplicate event: {event_data['title']} "
-                            f"on {event_data['event_date']} in {event_data['destination_city']}"
-                        )
-
-                    continue
+            existing = existing_by_hash.get(dedup_hash) if deduplicate and dedup_hash else None
+
+            if existing is not None:
+                # Event already exists - update if new source or better information
+                if _merge_into_existing(existing, event_data):
+                    updated_count += 1
+                    logger.debug(
+                        f"Updated event: {event_data['title']} "
+                        f"on {event_data['event_date']} in {event_data['destination_city']}"
+                    )
+                else:
+                    skipped_count += 1
+                    logger.debug(
+                        f"Skipping duplicate event: {event_data['title']} "
+                        f"on {event_data['event_date']} in {event_data['destination_city']}"
+                    )
+                continue
 
             # Step 3: Create new event object
             event = Event(
@@ -140,13 +115,19 @@ async def save_events_to_db(
                 scraped_at=datetime.utcnow(),
             )
 
-            session.add(event)
+            new_events.append(event)
+            if deduplicate and dedup_hash:
+                # Later events with the same hash update this one
+                existing_by_hash[dedup_hash] = event
             saved_count += 1
 
         except Exception as e:
             logger.error(f"Error saving event to database: {e}", exc_info=True)
             continue
 
+    # Step 4: Write inserts in one batch; updates are flushed with the commit
+    session.add_all(new_events)
+
     # Commit all events
     try:
         await session.commit()
@@ -162,6 +143,86 @@ async def save_events_to_db(
     return saved_count + updated_count
 
 
+async def find_events_by_hashes(
+    hashes: Iterable[Optional[str]],
+    session: AsyncSession,
+) -> Dict[str, Event]:
+    """
+    Get existing events by deduplication hash, with one IN query per chunk.
+
+    Args:
+        hashes: Deduplication hashes (None and repeats are ignored)
+        session: Database session
+
+    Returns:
+        Dictionary mapping hash to the (oldest) event stored with it
+    """
+    unique_hashes = list(dict.fromkeys(h for h in hashes if h))
+    events: Dict[str, Event] = {}
+
+    for start in range(0, len(unique_hashes), HASH_LOOKUP_CHUNK_SIZE):
+        chunk = unique_hashes[start:start + HASH_LOOKUP_CHUNK_SIZE]
+        stmt = (
+            select(Event)
+            .where(Event.deduplication_hash.in_(chunk))
+            .order_by(Event.id.asc())
+        )
+        result = await session.execute(stmt)
+        for event in result.scalars().all():
+            events.setdefault(event.deduplication_hash, event)
+
+    return events
+
+
+def _merge_into_existing(existing: Event, event_data: Dict[str, Any]) -> bool:
+    """
+    Update a stored event with better information from a scraped duplicate.
+
+    Args:
+        existing: Event already in the database
+        event_data: Scraped event with the same deduplication hash
+
+    Returns:
+        True if the event came from a different source or had a longer
+        description (and the stored event was updated)
+    """
+    should_update = False
+
+    # Check if this is from a different source
+    if event_data['source'] != existing.source:
+        logger.debug(
+            f"Found event from different source: {event_data['title']} "
+            f"(existing: {existing.source}, new: {event_data['source']})"
+        )
+        should_update = True
+
+    # Update if new event has more complete information
+    new_desc_len = len(event_data.get('description', '') or '')
+    existing_desc_len = len(existing.description or '')
+
+    if new_desc_len > existing_desc_len:
+        should_update = True
+
+    if not should_update:
+        return False
+
+    # Update existing event with better information
+    if event_data.get('description') and new_desc_len > existing_desc_len:
+        existing.description = event_data['description']
+
+    if event_data.get('venue') and not existing.venue:
+        existing.venue = event_data['venue']
+
+    if event_data.get('url') and not existing.url:
+        existing.url = event_data['url']
+
+    if event_data.get('price_range') and existing.price_range == 'varies':
+        existing.price_range = event_data['price_range']
+
+    existing.scraped_at = datetime.utcnow()
+    return True
+
+
 async def get_events_by_city(
     city: str,
     session: AsyncSession,
@@ -12,8 +12,9 @@ updated API endpoint and request format.
 """
 
 import logging
+from contextlib import asynccontextmanager
 from datetime import date, datetime, time
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 import httpx
 from sqlalchemy import select
@@ -21,6 +22,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.airport import Airport
 from app.models.flight import Flight
+from app.scrapers.http_pool import HttpClientPool
 from app.utils.retry import api_retry
 
 logger = logging.getLogger(__name__)
@@ -55,14 +57,17 @@ class WizzAirScraper:
         "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
     )
 
-    def __init__(self, timeout: int = 30) -> None:
+    def __init__(self, timeout: int = 30, http_pool: Optional[HttpClientPool] = None) -> None:
         """
         Initialize the WizzAir scraper.
 
         Args:
             timeout: HTTP request timeout in seconds (default: 30)
+            http_pool: Shared HTTP client pool to borrow a keep-alive client from
+                (optional; without it each search opens its own client)
         """
         self.timeout = timeout
+        self.http_pool = http_pool
         self.headers = {
             "User-Agent": self.USER_AGENT,
             "Content-Type": "application/json",
@@ -71,6 +76,15 @@ class WizzAirScraper:
             "Referer": "https://wizzair.com/",
         }
 
+    @asynccontextmanager
+    async def _client(self) -> AsyncIterator[httpx.AsyncClient]:
+        """Borrow the pooled client, or open a one-off client without a pool."""
+        if self.http_pool is not None:
+            yield self.http_pool.httpx_client(httpx.URL(self.BASE_URL).host)
+        else:
+            async with httpx.AsyncClient(timeout=self.timeout) as client:
+                yield client
+
     def _build_payload(
         self,
         origin: str,
@@ -169,10 +183,10 @@ class WizzAirScraper:
             f"departure: {departure_date}, return: {return_date}"
         )
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with self._client() as client:
             try:
                 response = await client.post(
-                    self.BASE_URL, headers=self.headers, json=payload
+                    self.BASE_URL, headers=self.headers, json=payload, timeout=self.timeout
                 )
 
                 # Check for rate limiting
@@ -3,5 +3,6 @@ Services package for business logic.
 """
 
 from app.services.price_history_service import PriceHistoryService
+from app.services.route_price_stats import RoutePriceStats, RoutePriceStatsProvider
 
-__all__ = ["PriceHistoryService"]
+__all__ = ["PriceHistoryService", "RoutePriceStats", "RoutePriceStatsProvider"]
@@ -0,0 +1,184 @@
+"""
+Per-route flight price statistics from price history.
+
+RoutePriceStatsProvider aggregates price_history in the database (count,
+average, min, max and quartiles per route) for all routes in a single
+grouped query and keeps the result in memory for a TTL, so building many
+prompts for the same routes costs one query instead of one full history
+scan per package.
+
+Example:
+    >>> provider = RoutePriceStatsProvider(db_session)
+    >>> stats = await provider.get("MUC-LIS")
+    >>> if stats:
+    ...     print(f"Average €{stats.avg_price:.2f} over {stats.count} prices")
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models.price_history import PriceHistory
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RoutePriceStats:
+    """
+    Aggregated historical prices of one route.
+
+    Attributes:
+        route: Route code, e.g. "MUC-LIS"
+        count: Number of historical prices
+        avg_price: Average price in EUR
+        min_price: Lowest price in EUR
+        max_price: Highest price in EUR
+        p25_price: 25th percentile (None where the database cannot compute it)
+        median_price: 50th percentile (None where the database cannot compute it)
+        p75_price: 75th percentile (None where the database cannot compute it)
+    """
+
+    route: str
+    count: int
+    avg_price: float
+    min_price: float
+    max_price: float
+    p25_price: Optional[float] = None
+    median_price: Optional[float] = None
+    p75_price: Optional[float] = None
+
+
+class RoutePriceStatsProvider:
+    """
+    Memoized price statistics for all routes.
+
+    Statistics are loaded for every route at once on first use and reloaded
+    once they are older than the TTL. If a load fails, the previously loaded
+    statistics (if any) stay in use and the load is retried after
+    ERROR_RETRY_SECONDS rather than on every lookup or only after the TTL.
+    """
+
+    # Seconds to wait before retrying a failed load
+    ERROR_RETRY_SECONDS = 30.0
+
+    def __init__(self, db_session: AsyncSession, ttl_seconds: Optional[float] = None):
+        """
+        Initialize the provider (nothing is loaded until the first lookup).
+
+        Args:
+            db_session: Database session for the aggregate query
+            ttl_seconds: Seconds statistics stay fresh
+                (defaults to settings.route_price_stats_ttl)
+        """
+        self.db = db_session
+        self.ttl_seconds = (
+            settings.route_price_stats_ttl if ttl_seconds is None else ttl_seconds
+        )
+        self._stats: Dict[str, RoutePriceStats] = {}
+        self._loaded_at: Optional[float] = None
+        self._retry_at: Optional[float] = None
+        self._lock: Optional[asyncio.Lock] = None
+
+    def _get_lock(self) -> asyncio.Lock:
+        """Create the lock lazily so it binds to the running loop."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    @property
+    def is_fresh(self) -> bool:
+        """Whether statistics were loaded within the TTL."""
+        return (
+            self._loaded_at is not None
+            and time.monotonic() - self._loaded_at < self.ttl_seconds
+        )
+
+    def _needs_refresh(self) -> bool:
+        """Whether statistics are stale and no failed load is backing off."""
+        if self.is_fresh:
+            return False
+        return self._retry_at is None or time.monotonic() >= self._retry_at
+
+    async def get(self, route: str) -> Optional[RoutePriceStats]:
+        """
+        Look up the statistics of a route, loading all routes if stale.
+
+        Args:
+            route: Route code, e.g. "MUC-LIS"
+
+        Returns:
+            RoutePriceStats, or None if the route has no price history
+        """
+        if self._needs_refresh():
+            async with self._get_lock():
+                if self._needs_refresh():
+                    await self.refresh()
+        return self._stats.get(route)
+
+    async def refresh(self) -> int:
+        """
+        Reload statistics for all routes in one grouped query.
+
+        On errors the previous statistics are kept and the next reload is
+        attempted after ERROR_RETRY_SECONDS.
+
+        Returns:
+            Number of routes loaded (0 if the query failed)
+        """
+        columns = [
+            PriceHistory.route,
+            func.count(PriceHistory.id),
+            func.avg(PriceHistory.price),
+            func.min(PriceHistory.price),
+            func.max(PriceHistory.price),
+        ]
+        with_percentiles = self._supports_percentiles()
+        if with_percentiles:
+            columns += [
+                func.percentile_cont(fraction).within_group(PriceHistory.price)
+                for fraction in (0.25, 0.5, 0.75)
+            ]
+
+        try:
+            result = await self.db.execute(select(*columns).group_by(PriceHistory.route))
+            rows = result.all()
+        except Exception as e:
+            self._retry_at = time.monotonic() + self.ERROR_RETRY_SECONDS
+            logger.warning(
+                f"Error loading route price statistics: {e}. Keeping "
+                f"{len(self._stats)} previously loaded routes, retrying in "
+                f"{self.ERROR_RETRY_SECONDS:.0f}s"
+            )
+            return 0
+
+        stats = {}
+        for row in rows:
+            route, count, avg_price, min_price, max_price = row[:5]
+            quartiles = [float(value) for value in row[5:8]] if with_percentiles else []
+            stats[route] = RoutePriceStats(
+                route,
+                int(count),
+                float(avg_price),
+                float(min_price),
+                float(max_price),
+                *quartiles,
+            )
+        self._stats = stats
+        self._loaded_at = time.monotonic()
+        self._retry_at = None
+
+        logger.debug(f"Loaded price statistics for {len(stats)} routes")
+        return len(stats)
+
+    def _supports_percentiles(self) -> bool:
+        """Whether the session's database has percentile_cont (PostgreSQL)."""
+        bind = getattr(self.db, "bind", None)
+        dialect = getattr(bind, "dialect", None)
+        return getattr(dialect, "name", None) == "postgresql"
@@ -157,6 +157,7 @@ def search_accommodations(self):
         from app.database import get_sync_session
         from app.models.airport import Airport
         from app.models.flight import Flight
+        from app.scrapers.browser_pool import run_with_browser_pools
         from app.utils.date_utils import get_school_holiday_periods
 
         # Check for shutdown periodically
@@ -246,7 +247,7 @@ def search_accommodations(self):
 
                 return total_accommodations, accommodations_by_city
 
-            total, accommodations_by_city = asyncio.run(run_search())
+            total, accommodations_by_city = asyncio.run(run_with_browser_pools(run_search()))
 
             logger.info(f"Daily accommodation search task completed successfully. Total: {total} accommodations")
             return {
@@ -438,6 +439,7 @@ def send_deal_notifications(self):
                 db.query(TripPackage)
                 .filter(TripPackage.ai_score >= alert_threshold)
                 .filter(TripPackage.notified == False)
+                .filter(TripPackage.ai_score_provisional == False)
                 .order_by(TripPackage.ai_score.desc())
                 .limit(10)
                 .all()
@@ -0,0 +1,149 @@
+"""
+Concurrency helpers for fan-out over rate-limited APIs.
+
+- AdaptiveConcurrencyLimiter: an async context manager that caps in-flight
+  calls and adapts the cap (additive increase, multiplicative decrease) when
+  the upstream API signals rate limiting
+- get_session_lock: a lock shared by everything that uses one AsyncSession,
+  so concurrent tasks can take turns on it
+
+Example:
+    >>> limiter = AdaptiveConcurrencyLimiter(max_concurrency=8)
+    >>> async with limiter:
+    ...     try:
+    ...         result = await client.analyze(...)
+    ...         limiter.record_success()
+    ...     except RateLimitError:
+    ...         limiter.record_rate_limit()
+"""
+
+import asyncio
+import logging
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+_SESSION_LOCK_KEY = "app.session_lock"
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Concurrency cap that shrinks on rate limits and recovers on success.
+
+    On a rate limit the cap is halved (down to ``min_concurrency``) and new
+    calls pause for ``cooldown_seconds``. After ``limit`` consecutive
+    successes the cap grows by one, up to ``max_concurrency``.
+
+    Attributes:
+        max_concurrency: Upper bound for the cap
+        min_concurrency: Lower bound for the cap
+        cooldown_seconds: Pause before new calls start after a rate limit
+        limit: Current cap
+        in_flight: Calls currently holding a slot
+        rate_limits: Number of rate limits recorded
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        min_concurrency: int = 1,
+        cooldown_seconds: float = 10.0,
+    ):
+        """
+        Initialize the limiter at full concurrency.
+
+        Args:
+            max_concurrency: Maximum concurrent calls
+            min_concurrency: Minimum concurrent calls after backing off
+            cooldown_seconds: Pause after a rate limit
+
+        Raises:
+            ValueError: If the bounds are not 1 <= min_concurrency <= max_concurrency
+        """
+        if not 1 <= min_concurrency <= max_concurrency:
+            raise ValueError(
+                f"Invalid concurrency bounds: min={min_concurrency}, max={max_concurrency}"
+            )
+
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.cooldown_seconds = cooldown_seconds
+        self.limit = max_concurrency
+        self.in_flight = 0
+        self.rate_limits = 0
+
+        self._successes = 0
+        self._resume_at = 0.0
+        self._condition: Optional[asyncio.Condition] = None
+
+    def _get_condition(self) -> asyncio.Condition:
+        """Create the condition lazily so it binds to the running loop."""
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+
+    async def __aenter__(self) -> "AdaptiveConcurrencyLimiter":
+        condition = self._get_condition()
+        async with condition:
+            await condition.wait_for(lambda: self.in_flight < self.limit)
+            self.in_flight += 1
+
+        # Honour a cooldown that started while we were waiting
+        delay = self._resume_at - asyncio.get_running_loop().time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        condition = self._get_condition()
+        async with condition:
+            self.in_flight -= 1
+            condition.notify_all()
+
+    def record_success(self) -> None:
+        """Record a successful call; grow the cap after a full window of successes."""
+        self._successes += 1
+        if self.limit < self.max_concurrency and self._successes >= self.limit:
+            self.limit += 1
+            self._successes = 0
+            logger.debug(f"Concurrency increased to {self.limit}")
+            if self._condition is not None:
+                # Wake a waiter for the new slot (it re-checks under the lock)
+                asyncio.ensure_future(self._notify())
+
+    def record_rate_limit(self) -> None:
+        """Record a rate limit: halve the cap and pause new calls."""
+        self.rate_limits += 1
+        self._successes = 0
+        self.limit = max(self.min_concurrency, self.limit // 2)
+        self._resume_at = asyncio.get_running_loop().time() + self.cooldown_seconds
+        logger.warning(
+            f"Rate limited, concurrency reduced to {self.limit} "
+            f"(pausing {self.cooldown_seconds:.0f}s)"
+        )
+
+    async def _notify(self) -> None:
+        condition = self._get_condition()
+        async with condition:
+            condition.notify_all()
+
+
+def get_session_lock(session: Any) -> asyncio.Lock:
+    """
+    Get the lock guarding a database session.
+
+    AsyncSession does not allow concurrent operations, so tasks that share a
+    session (e.g. concurrent AI scoring and its cost tracking) serialize
+    their database work on this lock. The lock is stored in ``session.info``;
+    objects without an info dict (such as test doubles) get a fresh lock.
+
+    Args:
+        session: AsyncSession (or any object with an ``info`` dict)
+
+    Returns:
+        asyncio.Lock shared by all users of the session
+    """
+    info = getattr(session, "info", None)
+    if not isinstance(info, dict):
+        return asyncio.Lock()
+    return info.setdefault(_SESSION_LOCK_KEY, asyncio.Lock())
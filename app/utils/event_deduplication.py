@@ -3,14 +3,26 @@ Event deduplication utilities for SmartFamilyTravelScout.
 
 This module provides functions for deduplicating events from multiple sources
 (Eventbrite, tourism websites) using hash-based matching and fuzzy string matching.
+
+Fuzzy matching only compares events that share a block (event date and
+normalized city), normalizes every title once, and rules out most pairs with
+upper bounds on the SequenceMatcher ratio (title lengths, shared characters,
+shared bigrams), computed for a whole block with NumPy, before computing the
+exact ratio. The bounds never
+reject a pair that would match, so results are identical to comparing every
+pair; ``apply_fuzzy_deduplication_pairwise`` is that original all-pairs scan,
+kept as the reference for equivalence tests and benchmarks.
 """
 
 import hashlib
 import logging
 import re
+from collections import defaultdict
 from datetime import date
 from difflib import SequenceMatcher
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -323,12 +335,168 @@ def _merge_duplicate_events(events: List[Dict[str, Any]]) -> Dict[str, Any]:
     return best
 
 
-def _apply_fuzzy_deduplication(events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+def _count_matrix(texts: List[str], grams: List[List[str]]) -> np.ndarray:
+    """Rows of per-text gram counts over the block's gram vocabulary."""
+    vocabulary: Dict[str, int] = {}
+    rows, cols = [], []
+    for row, text_grams in enumerate(grams):
+        for gram in text_grams:
+            rows.append(row)
+            cols.append(vocabulary.setdefault(gram, len(vocabulary)))
+
+    counts = np.zeros((len(texts), max(len(vocabulary), 1)), dtype=np.int32)
+    np.add.at(counts, (np.asarray(rows, dtype=np.intp), np.asarray(cols, dtype=np.intp)), 1)
+    return counts
+
+
+def _multiset_overlap(counts: np.ndarray) -> np.ndarray:
+    """Pairwise multiset intersection sizes: sum of min(count_i, count_j) per gram."""
+    # min(a, b) is the number of levels t >= 1 with a >= t and b >= t
+    overlap = np.zeros((counts.shape[0], counts.shape[0]), dtype=np.float64)
+    for level in range(1, int(counts.max(initial=0)) + 1):
+        present = (counts >= level).astype(np.float64)
+        overlap += present @ present.T
+    return overlap
+
+
+def _candidate_pairs(texts: List[str], threshold: float) -> np.ndarray:
+    """
+    Pairs of normalized titles whose SequenceMatcher ratio may reach threshold.
+
+    ratio() is 2*M/T for M matched characters and T = len(a) + len(b), and M
+    is at most the longest common subsequence. Each bound caps M:
+    - Length: M <= min(len(a), len(b))
+    - Characters: M <= shared characters (multiset)
+    - Bigrams: strings within edit distance k share at least
+      max(len) - 1 - 2k bigrams, and k <= T - 2M, so few shared bigrams
+      force a large edit distance and a small M
+
+    The bounds never exceed the true ratio's M, so no matching pair is
+    dropped. All pairs of a block are bounded at once with matrix products.
+
+    Args:
+        texts: Normalized titles of one block
+        threshold: Minimum similarity ratio
+
+    Returns:
+        Boolean matrix; [i, j] is False only if the pair can't match
+    """
+    lengths = np.array([len(text) for text in texts], dtype=np.float64)
+    total = lengths[:, None] + lengths[None, :]
+    nonempty = (lengths[:, None] > 0) & (lengths[None, :] > 0)
+    total = np.where(nonempty, total, 1.0)
+
+    candidates = nonempty & (2.0 * np.minimum(lengths[:, None], lengths[None, :]) / total >= threshold)
+
+    char_overlap = _multiset_overlap(_count_matrix(texts, [list(text) for text in texts]))
+    candidates &= 2.0 * char_overlap / total >= threshold
+
+    bigram_overlap = _multiset_overlap(
+        _count_matrix(texts, [[text[k : k + 2] for k in range(len(text) - 1)] for text in texts])
+    )
+    longest = np.maximum(lengths[:, None], lengths[None, :])
+    min_edits = np.maximum(np.ceil((longest - 1 - bigram_overlap) / 2), 0)
+    candidates &= 2.0 * np.floor((total - min_edits) / 2) / total >= threshold
+
+    return candidates
+
+
+def _fuzzy_block_key(event: Dict[str, Any]) -> Tuple[Hashable, str]:
+    """Events can only be similar within the same (date, normalized city) block."""
+    return event.get('event_date'), normalize_text(event.get('destination_city', ''))
+
+
+def _apply_fuzzy_deduplication(
+    events: List[Dict[str, Any]],
+    fuzzy_threshold: float = FUZZY_MATCH_THRESHOLD,
+) -> List[Dict[str, Any]]:
     """
     Apply fuzzy matching to find and merge similar events that may have slightly different titles.
 
+    Same result as apply_fuzzy_deduplication_pairwise: going through events in
+    order, each event not merged yet absorbs every later unmerged event
+    similar to it (are_events_similar). Only events in the same
+    (date, city) block are compared, and the exact ratio is computed only
+    for pairs that pass the _candidate_pairs bounds.
+
+    Args:
+        events: List of events to deduplicate with fuzzy matching
+        fuzzy_threshold: Minimum title similarity ratio (0-1) for duplicates
+
+    Returns:
+        List of deduplicated events
+    """
+    if len(events) <= 1:
+        return events
+
+    blocks: Dict[Tuple[Hashable, str], List[int]] = defaultdict(list)
+    for index, event in enumerate(events):
+        blocks[_fuzzy_block_key(event)].append(index)
+
+    # Leader index -> indices merged into it (leaders of singletons omitted)
+    groups: Dict[int, List[int]] = {}
+    comparisons = 0
+
+    for indices in blocks.values():
+        if len(indices) == 1:
+            continue
+
+        titles = [normalize_text(events[index].get('title', '')) for index in indices]
+        candidates = _candidate_pairs(titles, fuzzy_threshold)
+        merged = [False] * len(indices)
+
+        for i, leader in enumerate(titles):
+            if merged[i]:
+                continue
+
+            for j in np.flatnonzero(candidates[i, i + 1 :]) + i + 1:
+                if merged[j]:
+                    continue
+
+                comparisons += 1
+                ratio = SequenceMatcher(None, leader, titles[j]).ratio()
+                if ratio >= fuzzy_threshold:
+                    merged[j] = True
+                    groups.setdefault(indices[i], []).append(indices[j])
+
+    absorbed = {index for members in groups.values() for index in members}
+    unique_events = []
+
+    for index, event in enumerate(events):
+        if index in absorbed:
+            continue
+
+        members = groups.get(index)
+        if members:
+            similar_group = [event] + [events[member] for member in members]
+            unique_events.append(_merge_duplicate_events(similar_group))
+            logger.debug(
+                f"Fuzzy matched {len(similar_group)} events: {event.get('title')}"
+            )
+        else:
+            unique_events.append(event)
+
+    logger.debug(
+        f"Fuzzy deduplication: {len(blocks)} blocks, {comparisons} exact comparisons "
+        f"for {len(events)} events"
+    )
+
+    return unique_events
+
+
+def apply_fuzzy_deduplication_pairwise(
+    events: List[Dict[str, Any]],
+    fuzzy_threshold: float = FUZZY_MATCH_THRESHOLD,
+) -> List[Dict[str, Any]]:
+    """
+    Reference all-pairs implementation of fuzzy deduplication.
+
+    Compares every event with every later one via are_events_similar.
+    Kept for equivalence testing and benchmarking.
+
     Args:
         events: List of events to deduplicate with fuzzy matching
+        fuzzy_threshold: Minimum title similarity ratio (0-1) for duplicates
 
     Returns:
         List of deduplicated events
@@ -351,7 +519,7 @@ def _apply_fuzzy_deduplication(events: List[Dict[str, Any]]) -> List[Dict[str, A
                 continue
 
             event2 = events[j]
-            if are_events_similar(event1, event2):
+            if are_events_similar(event1, event2, fuzzy_threshold):
                 similar_group.append(event2)
                 merged_indices.add(j)
 
@@ -15,15 +15,28 @@ Example:
     >>> else:
     >>>     # Process flight and cache it
     >>>     await cache.cache_flight(flight_data)
+
+``FlightGroupIndex`` goes further and keeps one Redis hash per deduplication
+group (route, airline, 2-hour departure and return blocks), so cross-run
+deduplication can tell which stored flight a new one merges with and whether
+it is cheaper:
+
+    >>> index = FlightGroupIndex(redis_client)
+    >>> winners = await index.merge(scraped_flights)  # one round trip per batch
 """
 
 import hashlib
+import json
 import logging
+import math
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 
 from redis.asyncio import Redis
 
+from app.utils.flight_deduplication import FlightColumns, deduplicate_flights
+from app.utils.redis_pool import get_redis, pipeline_exists, pipeline_setex
+
 logger = logging.getLogger(__name__)
 
 
@@ -49,7 +62,7 @@ class FlightDeduplicationCache:
 
     def __init__(
         self,
-        redis_client: Redis,
+        redis_client: Optional[Redis] = None,
         ttl: int = 3600,
         key_prefix: str = "flight:",
     ):
@@ -57,11 +70,12 @@ class FlightDeduplicationCache:
         Initialize the flight deduplication cache.
 
         Args:
-            redis_client: Redis client for caching
+            redis_client: Redis client for caching (defaults to a client on the
+                shared pool)
             ttl: Cache TTL in seconds (default: 3600 = 1 hour)
             key_prefix: Prefix for Redis keys (default: "flight:")
         """
-        self.redis = redis_client
+        self.redis = redis_client if redis_client is not None else get_redis()
         self.ttl = ttl
         self.key_prefix = key_prefix
 
@@ -200,25 +214,21 @@ class FlightDeduplicationCache:
             >>> cached_count = await cache.cache_multiple_flights(unique_flights)
             >>> print(f"Cached {cached_count} flights")
         """
-        cached_count = 0
-
         try:
-            # Use pipeline for batch operations
-            async with self.redis.pipeline() as pipe:
-                timestamp = datetime.now().isoformat()
-
-                for flight in flights:
-                    try:
-                        flight_hash = self._generate_flight_hash(flight)
-                        cache_key = f"{self.key_prefix}{flight_hash}"
-                        pipe.setex(cache_key, self.ttl, timestamp)
-                        cached_count += 1
-                    except Exception as e:
-                        logger.warning(f"Error adding flight to pipeline: {e}")
-                        continue
-
-                # Execute all commands in one go
-                await pipe.execute()
+            timestamp = datetime.now().isoformat()
+            items = {}
+
+            for flight in flights:
+                try:
+                    flight_hash = self._generate_flight_hash(flight)
+                    items[f"{self.key_prefix}{flight_hash}"] = timestamp
+                except Exception as e:
+                    logger.warning(f"Error adding flight to pipeline: {e}")
+                    continue
+
+            # Execute all commands in one go
+            await pipeline_setex(self.redis, items, self.ttl)
+            cached_count = len(items)
 
             logger.info(f"Cached {cached_count} flights in batch operation")
 
@@ -263,20 +273,14 @@ class FlightDeduplicationCache:
                     # Include flights with errors in uncached list (fail open)
                     uncached_flights.append(flight)
 
-            # Batch check existence using mget (more efficient than individual exists() calls)
+            # Batch check existence in one pipelined round trip
             if cache_keys:
-                # Use EXISTS for batch checking
-                # Note: Redis doesn't have a direct batch EXISTS, so we use pipeline
-                async with self.redis.pipeline() as pipe:
-                    for key in cache_keys:
-                        pipe.exists(key)
+                results = await pipeline_exists(self.redis, cache_keys)
 
-                    results = await pipe.execute()
-
-                    # Filter uncached flights
-                    for key, exists in zip(cache_keys, results):
-                        if not exists:
-                            uncached_flights.append(flight_mapping[key])
+                # Filter uncached flights
+                for key, exists in zip(cache_keys, results, strict=True):
+                    if not exists:
+                        uncached_flights.append(flight_mapping[key])
 
             logger.info(
                 f"Filtered {len(flights)} flights: {len(uncached_flights)} uncached, "
@@ -354,3 +358,233 @@ class FlightDeduplicationCache:
                 "ttl": self.ttl,
                 "error": str(e),
             }
+
+
+# Atomically merges a batch of deduplicated flights into their group hashes.
+# ARGV[1] is the TTL, ARGV[i + 1] the JSON-encoded incoming group for KEYS[i].
+# Returns a JSON array with one [status, price, source, count, urls, sources]
+# entry per key; status is 0 (not cheaper), 1 (new group) or 2 (cheaper).
+_MERGE_GROUPS_SCRIPT = """
+local ttl = tonumber(ARGV[1])
+local results = {}
+
+local function add_all(list, items)
+    local seen = {}
+    for _, item in ipairs(list) do seen[item] = true end
+    for _, item in ipairs(items) do
+        if not seen[item] then
+            seen[item] = true
+            table.insert(list, item)
+        end
+    end
+end
+
+for i, key in ipairs(KEYS) do
+    local incoming = cjson.decode(ARGV[i + 1])
+    local price = tonumber(incoming.price) or math.huge
+    local stored = redis.call('HMGET', key, 'price', 'source', 'count', 'urls', 'sources')
+
+    local status, best_price, best_source, count, urls, sources
+    if stored[1] then
+        best_price = tonumber(stored[1]) or math.huge
+        best_source = stored[2]
+        count = tonumber(stored[3]) + incoming.count
+        urls = cjson.decode(stored[4])
+        sources = cjson.decode(stored[5])
+        status = 0
+        if price < best_price then
+            status = 2
+            best_price = price
+            best_source = incoming.source
+        end
+    else
+        status = 1
+        best_price = price
+        best_source = incoming.source
+        count = incoming.count
+        urls = {}
+        sources = {}
+    end
+    add_all(urls, incoming.urls)
+    add_all(sources, incoming.sources)
+
+    redis.call('HSET', key,
+        'price', tostring(best_price),
+        'source', best_source,
+        'count', count,
+        'urls', cjson.encode(urls),
+        'sources', cjson.encode(sources))
+    redis.call('EXPIRE', key, ttl)
+
+    results[i] = {status, tostring(best_price), best_source, count, urls, sources}
+end
+
+return cjson.encode(results)
+"""
+
+
+def _as_list(value: Any) -> List[Any]:
+    """cjson encodes empty tables as objects; normalize them to lists."""
+    return list(value) if isinstance(value, list) else []
+
+
+class FlightGroupIndex:
+    """
+    Redis-backed cross-run index of flight deduplication groups.
+
+    Each group uses the same key as ``deduplicate_flights`` (origin,
+    destination, airline, 2-hour departure block, 2-hour return block) and is
+    stored as a Redis hash with:
+    - ``price``: best price seen so far
+    - ``source``: source of the best price
+    - ``count``: number of flights merged into the group
+    - ``urls`` / ``sources``: merged booking URL and source sets (JSON)
+
+    A batch is deduplicated locally and then merged into Redis with a single
+    Lua script call, which updates every group atomically and returns the
+    stored winner per group.
+
+    Attributes:
+        redis: Redis client instance
+        ttl: Time-to-live for group entries in seconds (refreshed on update)
+        key_prefix: Prefix for all Redis keys (default: "flightgroup:")
+    """
+
+    def __init__(
+        self,
+        redis_client: Redis,
+        ttl: int = 3600,
+        key_prefix: str = "flightgroup:",
+    ):
+        """
+        Initialize the flight group index.
+
+        Args:
+            redis_client: Redis client for the index
+            ttl: Entry TTL in seconds (default: 3600 = 1 hour)
+            key_prefix: Prefix for Redis keys (default: "flightgroup:")
+        """
+        self.redis = redis_client
+        self.ttl = ttl
+        self.key_prefix = key_prefix
+        self._merge_script = redis_client.register_script(_MERGE_GROUPS_SCRIPT)
+        self._groups_seen: set = set()
+        self.received = 0
+        self.emitted = 0
+
+        logger.info(f"Initialized FlightGroupIndex with TTL: {ttl}s")
+
+    def _group_key(self, key: tuple) -> str:
+        """Build the Redis key for a grouping key from FlightColumns.keys()."""
+        origin, destination, airline, departure, ret = key
+        return f"{self.key_prefix}{origin}:{destination}:{airline}:{departure}:{ret}"
+
+    async def update_groups(self, unique_flights: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Merge deduplicated flights into their groups in one round trip.
+
+        Args:
+            unique_flights: Output of ``deduplicate_flights`` (at most one
+                flight per group, with booking_urls/sources/duplicate_count)
+
+        Returns:
+            Stored group record per flight, with keys:
+            - is_new: group did not exist before
+            - is_winner: flight is new or cheaper than the stored best
+            - best_price / best_source: stored winner after the update
+            - booking_urls / sources / duplicate_count: merged across runs
+        """
+        if not unique_flights:
+            return []
+
+        columns = FlightColumns.from_flights(unique_flights)
+        keys = []
+        args = [self.ttl]
+        for flight, key, price in zip(
+            unique_flights, columns.keys(), columns.price.tolist(), strict=True
+        ):
+            keys.append(self._group_key(key))
+            args.append(
+                json.dumps(
+                    {
+                        "price": repr(price) if math.isfinite(price) else "inf",
+                        "source": flight.get("source") or "",
+                        "count": flight.get("duplicate_count", 1),
+                        "urls": flight.get("booking_urls", []),
+                        "sources": flight.get("sources", []),
+                    }
+                )
+            )
+            self._groups_seen.add(key)
+
+        raw = await self._merge_script(keys=keys, args=args)
+
+        records = []
+        for status, price, source, count, urls, sources in json.loads(raw):
+            records.append(
+                {
+                    "is_new": status == 1,
+                    "is_winner": status != 0,
+                    "best_price": float(price),
+                    "best_source": source or None,
+                    "booking_urls": _as_list(urls),
+                    "sources": _as_list(sources),
+                    "duplicate_count": int(count),
+                }
+            )
+        return records
+
+    async def merge(self, flights: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Deduplicate a batch against itself and against all stored groups.
+
+        Returns only flights that start a new group or beat the stored best
+        price, updated with booking URLs, sources and duplicate counts merged
+        across runs. On Redis errors the locally deduplicated batch is
+        returned (fail open).
+
+        Args:
+            flights: Flight dictionaries from any source
+
+        Returns:
+            New or cheaper flights
+        """
+        self.received += len(flights)
+        unique_flights = deduplicate_flights(flights)
+
+        try:
+            records = await self.update_groups(unique_flights)
+        except Exception as e:
+            logger.warning(f"Error merging flight groups, using local deduplication: {e}")
+            self.emitted += len(unique_flights)
+            return unique_flights
+
+        winners = []
+        for flight, record in zip(unique_flights, records, strict=True):
+            if not record["is_winner"]:
+                continue
+            flight["booking_urls"] = record["booking_urls"]
+            flight["sources"] = record["sources"]
+            flight["duplicate_count"] = record["duplicate_count"]
+            winners.append(flight)
+
+        logger.info(
+            f"Merged {len(unique_flights)} flight groups: "
+            f"{len(winners)} new or cheaper, {len(unique_flights) - len(winners)} already known"
+        )
+
+        self.emitted += len(winners)
+        return winners
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get statistics for flights merged through this instance.
+
+        Returns:
+            Dictionary with received, unique (groups touched) and emitted counts
+        """
+        return {
+            "received": self.received,
+            "unique": len(self._groups_seen),
+            "emitted": self.emitted,
+        }
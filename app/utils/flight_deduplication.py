@@ -0,0 +1,477 @@
+"""
+Flight deduplication engine for SmartFamilyTravelScout.
+
+Flights from different sources are duplicates when they share route, airline,
+and fall into the same 2-hour departure (and return) time block. For each group
+the cheapest flight is kept and the booking URLs and sources of all group
+members are merged into it.
+
+The engine works on columnar arrays instead of per-flight Python tuples:
+- Dates become ordinal ints, times become minutes after midnight
+- Route and airline codes are interned to small integer codes
+- Each distinct date/time/code string is parsed exactly once
+- Bucket keys, group ids and the cheapest row per group are computed in one
+  vectorized pandas/NumPy pass
+
+``IncrementalFlightDeduplicator`` applies the same grouping to flights that
+arrive in batches (streaming pipeline). ``deduplicate_flights_iterative`` is
+the original per-flight implementation, kept as the reference for equivalence
+tests and benchmarks.
+
+Example:
+    >>> unique = deduplicate_flights(all_flights)
+    >>> print(f"Reduced {len(all_flights)} flights to {len(unique)}")
+"""
+
+import logging
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import date, datetime, time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from app.utils.date_utils import parse_time
+
+logger = logging.getLogger(__name__)
+
+# Size of the departure/return time blocks used for grouping
+BUCKET_MINUTES = 120
+
+# Time used for grouping when a time is present but unparseable
+DEFAULT_GROUPING_MINUTES = 12 * 60
+
+# Sentinel for "no return leg" / "unparseable date"
+MISSING = -1
+
+
+def _parse_date_ordinal(value: Any) -> int:
+    """Parse a YYYY-MM-DD string (or date) to an ordinal, MISSING if invalid."""
+    if isinstance(value, date):
+        return value.toordinal()
+    if not value or value == "None" or not isinstance(value, str):
+        return MISSING
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").toordinal()
+    except ValueError:
+        return MISSING
+
+
+def _parse_minutes(value: Any) -> int:
+    """Parse a time value to minutes after midnight, noon if unavailable."""
+    parsed = parse_time(value, context="flight deduplication")
+    if parsed is None:
+        return DEFAULT_GROUPING_MINUTES
+    return parsed.hour * 60 + parsed.minute
+
+
+def _upper_code(value: Any) -> str:
+    """Normalize a route/airline code for grouping."""
+    return str(value).upper() if value else ""
+
+
+def _intern(values: Sequence[Any], parse: Callable[[Any], Any], dtype=np.int64) -> np.ndarray:
+    """
+    Map each value through ``parse``, calling it once per distinct value.
+
+    Args:
+        values: Raw column values
+        parse: Function applied to each distinct value
+        dtype: Result dtype
+
+    Returns:
+        Array of parsed values aligned with ``values``
+    """
+    codes, uniques = pd.factorize(np.asarray(values, dtype=object), use_na_sentinel=False)
+    parsed = np.array([parse(u) for u in uniques], dtype=dtype)
+    return parsed[codes] if len(parsed) else np.empty(0, dtype=dtype)
+
+
+def _intern_codes(values: Sequence[Any]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Intern codes case-insensitively to dense integer ids.
+
+    Returns:
+        Tuple of (id per value, upper-case code per id)
+    """
+    codes, uniques = pd.factorize(np.asarray(values, dtype=object), use_na_sentinel=False)
+    normalized, labels = pd.factorize(np.array([_upper_code(u) for u in uniques], dtype=object))
+    if not len(normalized):
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=object)
+    return normalized[codes], np.asarray(labels, dtype=object)
+
+
+@dataclass
+class FlightColumns:
+    """
+    Columnar view of a list of flight dictionaries.
+
+    Attributes:
+        origin: Interned origin airport codes
+        destination: Interned destination airport codes
+        airline: Interned airline codes
+        departure_bucket: Departure ordinal day * 12 + 2-hour block
+        return_bucket: Return bucket, or MISSING for one-way/unparseable
+        price: Price used to pick the cheapest flight (inf if unknown)
+        valid: False for flights without a parseable departure date
+        labels: Upper-case code per interned id, keyed by column name
+    """
+
+    origin: np.ndarray
+    destination: np.ndarray
+    airline: np.ndarray
+    departure_bucket: np.ndarray
+    return_bucket: np.ndarray
+    price: np.ndarray
+    valid: np.ndarray
+    labels: Dict[str, np.ndarray]
+
+    @classmethod
+    def from_flights(cls, flights: Sequence[Dict[str, Any]]) -> "FlightColumns":
+        """
+        Build columns from flight dictionaries.
+
+        Missing departure/return times default to midnight (as in the scraper
+        output contract); present but unparseable times default to noon.
+
+        Args:
+            flights: Flight dictionaries from any source
+
+        Returns:
+            FlightColumns aligned with ``flights``
+        """
+        blocks_per_day = (24 * 60) // BUCKET_MINUTES
+
+        dep_ord = _intern([f.get("departure_date", "") for f in flights], _parse_date_ordinal)
+        dep_min = _intern([f.get("departure_time", "00:00") for f in flights], _parse_minutes)
+        ret_ord = _intern([f.get("return_date", "") for f in flights], _parse_date_ordinal)
+        ret_min = _intern([f.get("return_time", "00:00") for f in flights], _parse_minutes)
+
+        departure_bucket = dep_ord * blocks_per_day + dep_min // BUCKET_MINUTES
+        return_bucket = np.where(
+            ret_ord != MISSING, ret_ord * blocks_per_day + ret_min // BUCKET_MINUTES, MISSING
+        )
+
+        per_person = pd.to_numeric(
+            pd.Series([f.get("price_per_person") for f in flights], dtype=object),
+            errors="coerce",
+        ).to_numpy(dtype=float)
+        total = pd.to_numeric(
+            pd.Series([f.get("total_price", np.inf) for f in flights], dtype=object),
+            errors="coerce",
+        ).to_numpy(dtype=float)
+        total = np.where(np.isnan(total), np.inf, total)
+        # Same rule as `price_per_person or total_price`
+        has_per_person = ~np.isnan(per_person) & (per_person != 0)
+        price = np.where(has_per_person, per_person, total)
+
+        origin, origin_labels = _intern_codes([f.get("origin_airport", "") for f in flights])
+        destination, destination_labels = _intern_codes(
+            [f.get("destination_airport", "") for f in flights]
+        )
+        airline, airline_labels = _intern_codes([f.get("airline", "Unknown") for f in flights])
+
+        return cls(
+            origin=origin,
+            destination=destination,
+            airline=airline,
+            departure_bucket=departure_bucket,
+            return_bucket=return_bucket,
+            price=price,
+            valid=dep_ord != MISSING,
+            labels={
+                "origin": origin_labels,
+                "destination": destination_labels,
+                "airline": airline_labels,
+            },
+        )
+
+    def keys(self) -> List[Optional[Tuple[str, str, str, int, int]]]:
+        """
+        Grouping key per flight, stable across batches.
+
+        Returns:
+            (origin, destination, airline, departure bucket, return bucket)
+            per flight, or None for flights without a valid departure date
+        """
+        return [
+            (origin, destination, airline, departure, ret) if valid else None
+            for origin, destination, airline, departure, ret, valid in zip(
+                self.labels["origin"][self.origin].tolist(),
+                self.labels["destination"][self.destination].tolist(),
+                self.labels["airline"][self.airline].tolist(),
+                self.departure_bucket.tolist(),
+                self.return_bucket.tolist(),
+                self.valid.tolist(),
+                strict=True,
+            )
+        ]
+
+
+def _merge_values_per_group(
+    flights: Sequence[Dict[str, Any]],
+    rows: np.ndarray,
+    group_ids: np.ndarray,
+    field: str,
+) -> Dict[int, List[Any]]:
+    """Collect distinct truthy values of ``field`` per group, in row order."""
+    values = [flights[i].get(field) for i in rows]
+    present = np.fromiter((bool(v) for v in values), dtype=bool, count=len(values))
+    if not present.any():
+        return {}
+
+    frame = pd.DataFrame(
+        {
+            "group": group_ids[present],
+            "value": np.asarray(values, dtype=object)[present],
+        }
+    ).drop_duplicates()
+
+    merged: Dict[int, List[Any]] = {}
+    for group_id, value in zip(frame["group"].tolist(), frame["value"].tolist(), strict=True):
+        merged.setdefault(group_id, []).append(value)
+    return merged
+
+
+def deduplicate_flights(flights: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Deduplicate flights across sources in a single vectorized pass.
+
+    Flights are duplicates when they have the same origin, destination and
+    airline, and their departure (and return) fall in the same 2-hour block.
+    For each group the cheapest flight is kept (first one on ties) and updated
+    in place with:
+    - ``booking_urls``: distinct booking URLs of the group, in input order
+    - ``sources``: distinct sources of the group, in input order
+    - ``duplicate_count``: number of flights merged into it
+
+    Flights without a parseable ``departure_date`` are skipped.
+
+    Args:
+        flights: Flight dictionaries from all sources
+
+    Returns:
+        Unique flights, ordered by first appearance of their group
+    """
+    if not flights:
+        return []
+
+    columns = FlightColumns.from_flights(flights)
+
+    skipped = int((~columns.valid).sum())
+    if skipped:
+        logger.warning(f"Skipping {skipped} flights with missing or invalid departure_date")
+
+    rows = np.flatnonzero(columns.valid)
+    if len(rows) == 0:
+        return []
+
+    # Dense group ids in order of first appearance
+    keys = pd.DataFrame(
+        {
+            "origin": columns.origin[rows],
+            "destination": columns.destination[rows],
+            "airline": columns.airline[rows],
+            "departure": columns.departure_bucket[rows],
+            "return": columns.return_bucket[rows],
+        }
+    )
+    group_ids = keys.groupby(list(keys.columns), sort=False).ngroup().to_numpy()
+
+    # Cheapest row per group: sort by (group, price, input order), take group heads
+    order = np.lexsort((rows, columns.price[rows], group_ids))
+    sorted_groups = group_ids[order]
+    is_head = np.empty(len(order), dtype=bool)
+    is_head[0] = True
+    is_head[1:] = sorted_groups[1:] != sorted_groups[:-1]
+    best_rows = rows[order[is_head]]
+
+    group_sizes = np.bincount(group_ids)
+    booking_urls = _merge_values_per_group(flights, rows, group_ids, "booking_url")
+    sources = _merge_values_per_group(flights, rows, group_ids, "source")
+
+    unique_flights = []
+    for group_id, row in enumerate(best_rows.tolist()):
+        best = flights[row]
+        best["booking_urls"] = booking_urls.get(group_id, [])
+        best["sources"] = sources.get(group_id, [])
+        best["duplicate_count"] = int(group_sizes[group_id])
+        unique_flights.append(best)
+
+    return unique_flights
+
+
+class IncrementalFlightDeduplicator:
+    """
+    Deduplicates flights that arrive in batches, e.g. as each scraper finishes.
+
+    Each batch is deduplicated with ``deduplicate_flights`` and then checked
+    against an index of groups seen in earlier batches. Only a small entry per
+    group is kept (best price, sources, duplicate count), never the flight
+    dictionaries themselves, so callers can write and release emitted flights.
+
+    ``add`` returns flights of new groups and flights that beat the best price
+    seen so far for their group; everything else is counted and dropped.
+
+    Example:
+        >>> dedup = IncrementalFlightDeduplicator()
+        >>> for batch in scraper_results:
+        ...     await save(dedup.add(batch))
+    """
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._index: Dict[Tuple[str, str, str, int, int], List[Any]] = {}
+        self.received = 0
+        self.emitted = 0
+
+    def __len__(self) -> int:
+        """Number of distinct flight groups seen."""
+        return len(self._index)
+
+    def add(self, flights: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Add a batch of flights.
+
+        Args:
+            flights: Flight dictionaries from one or more scrapers
+
+        Returns:
+            Flights that are new or cheaper than before, with ``sources`` and
+            ``duplicate_count`` covering all batches so far
+        """
+        self.received += len(flights)
+        unique = deduplicate_flights(flights)
+        if not unique:
+            return []
+
+        columns = FlightColumns.from_flights(unique)
+        emitted = []
+
+        for flight, key, price in zip(
+            unique, columns.keys(), columns.price.tolist(), strict=True
+        ):
+            entry = self._index.get(key)
+            if entry is None:
+                self._index[key] = [price, flight["duplicate_count"], list(flight["sources"])]
+                emitted.append(flight)
+                continue
+
+            best_price, count, sources = entry
+            entry[1] = count + flight["duplicate_count"]
+            for source in flight["sources"]:
+                if source not in sources:
+                    sources.append(source)
+
+            if price < best_price:
+                entry[0] = price
+                flight["sources"] = list(sources)
+                flight["duplicate_count"] = entry[1]
+                emitted.append(flight)
+
+        self.emitted += len(emitted)
+        return emitted
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get deduplication statistics.
+
+        Returns:
+            Dictionary with received, unique (groups) and emitted counts
+        """
+        return {
+            "received": self.received,
+            "unique": len(self._index),
+            "emitted": self.emitted,
+        }
+
+
+def deduplicate_flights_iterative(flights: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Reference per-flight implementation of ``deduplicate_flights``.
+
+    Parses every flight's dates and times individually and groups on Python
+    tuples. Kept for equivalence testing and benchmarking.
+
+    Args:
+        flights: Flight dictionaries from all sources
+
+    Returns:
+        Unique flights with merged booking URLs and sources
+    """
+    grouped = defaultdict(list)
+
+    for flight in flights:
+        try:
+            dep_date_str = flight.get("departure_date", "")
+            dep_time_str = flight.get("departure_time", "00:00")
+
+            if not dep_date_str:
+                continue
+
+            try:
+                dep_date = datetime.strptime(dep_date_str, "%Y-%m-%d").date()
+            except ValueError:
+                continue
+
+            dep_time = parse_time(dep_time_str)
+            dep_datetime = datetime.combine(dep_date, dep_time or time(12, 0))
+            hour_block = (dep_datetime.hour // 2) * 2
+            rounded_time = dep_datetime.replace(hour=hour_block, minute=0, second=0)
+
+            ret_date_str = flight.get("return_date", "")
+            ret_time_str = flight.get("return_time", "00:00")
+
+            if ret_date_str and ret_date_str != "None":
+                try:
+                    ret_date = datetime.strptime(ret_date_str, "%Y-%m-%d").date()
+                    ret_time = parse_time(ret_time_str)
+                    ret_datetime = datetime.combine(ret_date, ret_time or time(12, 0))
+                    ret_hour_block = (ret_datetime.hour // 2) * 2
+                    rounded_ret_time = ret_datetime.replace(
+                        hour=ret_hour_block, minute=0, second=0
+                    )
+                except ValueError:
+                    rounded_ret_time = None
+            else:
+                rounded_ret_time = None
+
+            key = (
+                flight.get("origin_airport", "").upper(),
+                flight.get("destination_airport", "").upper(),
+                flight.get("airline", "Unknown").upper(),
+                rounded_time,
+                rounded_ret_time,
+            )
+            grouped[key].append(flight)
+
+        except Exception as e:
+            logger.warning(f"Error processing flight for deduplication: {e}")
+            continue
+
+    unique_flights = []
+
+    for flight_group in grouped.values():
+        best = min(
+            flight_group,
+            key=lambda f: f.get("price_per_person") or f.get("total_price", float("inf")),
+        )
+
+        booking_urls = []
+        sources = []
+        for f in flight_group:
+            url = f.get("booking_url")
+            if url and url not in booking_urls:
+                booking_urls.append(url)
+
+            source = f.get("source")
+            if source and source not in sources:
+                sources.append(source)
+
+        best["booking_urls"] = booking_urls
+        best["sources"] = sources
+        best["duplicate_count"] = len(flight_group)
+        unique_flights.append(best)
+
+    return unique_flights
@@ -11,17 +11,25 @@ Features:
 - Thread-safe and process-safe
 - Graceful fallback when Redis is unavailable
 - Support for multiple time window types (hourly, daily, monthly)
+
+``AsyncRedisRateLimiter`` is the asyncio-native variant for async scrapers:
+check-and-reserve is a single atomic Lua call, an optional token bucket
+smooths requests per second, and ``await limiter.acquire()`` waits for
+capacity instead of raising.
 """
 
+import asyncio
 import logging
+import time
 from datetime import datetime, timedelta
 from enum import Enum
 from typing import Optional
 
-import redis
+import redis.asyncio as aioredis
 from redis.exceptions import RedisError
 
 from app.config import settings
+from app.utils.redis_pool import get_redis_registry
 
 logger = logging.getLogger(__name__)
 
@@ -40,67 +48,15 @@ class RateLimitExceededError(Exception):
     pass
 
 
-class RedisRateLimiter:
+class _TimeWindowMixin:
     """
-    Redis-based rate limiter with configurable limits and time windows.
-
-    This class provides a unified rate limiting solution that works across
-    multiple processes and containers by storing rate limit data in Redis.
+    Window key/TTL helpers shared by the sync and async limiters.
 
-    Examples:
-        >>> # Create rate limiter for Kiwi API (100 calls/month)
-        >>> limiter = RedisRateLimiter(
-        ...     scraper_name="kiwi",
-        ...     max_requests=100,
-        ...     time_window=TimeWindow.MONTHLY
-        ... )
-        >>>
-        >>> # Check if request is allowed
-        >>> if limiter.is_allowed():
-        ...     # Make API call
-        ...     limiter.record_request()
-        ... else:
-        ...     print(f"Rate limit exceeded. {limiter.get_remaining()} requests remaining")
+    Both limiters use the same keys, so they count against the same quota.
     """
 
-    def __init__(
-        self,
-        scraper_name: str,
-        max_requests: int,
-        time_window: TimeWindow = TimeWindow.DAILY,
-        redis_url: Optional[str] = None,
-    ):
-        """
-        Initialize rate limiter.
-
-        Args:
-            scraper_name: Unique identifier for the scraper (e.g., "kiwi", "ryanair")
-            max_requests: Maximum number of requests allowed in the time window
-            time_window: Time window type (hourly, daily, monthly)
-            redis_url: Redis connection URL (defaults to settings.redis_url)
-        """
-        self.scraper_name = scraper_name
-        self.max_requests = max_requests
-        self.time_window = time_window
-        self.redis_url = redis_url or str(settings.redis_url)
-
-        # Initialize Redis client
-        try:
-            self.redis_client = redis.from_url(
-                self.redis_url,
-                decode_responses=True,
-                socket_connect_timeout=5,
-                socket_timeout=5,
-            )
-            # Test connection
-            self.redis_client.ping()
-            logger.info(
-                f"RedisRateLimiter initialized for '{scraper_name}': "
-                f"{max_requests} requests per {time_window.value}"
-            )
-        except RedisError as e:
-            logger.error(f"Failed to connect to Redis: {e}")
-            self.redis_client = None
+    scraper_name: str
+    time_window: TimeWindow
 
     def _get_redis_key(self) -> str:
         """
@@ -156,6 +112,63 @@ class RedisRateLimiter:
         # Add a small buffer to ensure the key expires
         return ttl + 60
 
+
+class RedisRateLimiter(_TimeWindowMixin):
+    """
+    Redis-based rate limiter with configurable limits and time windows.
+
+    This class provides a unified rate limiting solution that works across
+    multiple processes and containers by storing rate limit data in Redis.
+
+    Examples:
+        >>> # Create rate limiter for Kiwi API (100 calls/month)
+        >>> limiter = RedisRateLimiter(
+        ...     scraper_name="kiwi",
+        ...     max_requests=100,
+        ...     time_window=TimeWindow.MONTHLY
+        ... )
+        >>>
+        >>> # Check if request is allowed
+        >>> if limiter.is_allowed():
+        ...     # Make API call
+        ...     limiter.record_request()
+        ... else:
+        ...     print(f"Rate limit exceeded. {limiter.get_remaining()} requests remaining")
+    """
+
+    def __init__(
+        self,
+        scraper_name: str,
+        max_requests: int,
+        time_window: TimeWindow = TimeWindow.DAILY,
+        redis_url: Optional[str] = None,
+    ):
+        """
+        Initialize rate limiter.
+
+        Args:
+            scraper_name: Unique identifier for the scraper (e.g., "kiwi", "ryanair")
+            max_requests: Maximum number of requests allowed in the time window
+            time_window: Time window type (hourly, daily, monthly)
+            redis_url: Redis connection URL (defaults to settings.redis_url)
+        """
+        self.scraper_name = scraper_name
+        self.max_requests = max_requests
+        self.time_window = time_window
+        self.redis_url = redis_url or str(settings.redis_url)
+
+        # Borrow a client from the shared pool; connection errors surface
+        # (and fail open) on first use instead of a ping per limiter
+        try:
+            self.redis_client = get_redis_registry().sync_client(self.redis_url)
+            logger.info(
+                f"RedisRateLimiter initialized for '{scraper_name}': "
+                f"{max_requests} requests per {time_window.value}"
+            )
+        except (RedisError, ValueError) as e:
+            logger.error(f"Failed to create Redis client: {e}")
+            self.redis_client = None
+
     def get_current_count(self) -> int:
         """
         Get the current request count for this time window.
@@ -314,6 +327,207 @@ class RedisRateLimiter:
         }
 
 
+# Atomically checks the window quota and token bucket, then reserves permits.
+# KEYS[1]: window counter, KEYS[2]: token bucket hash
+# ARGV: permits, max_requests (-1 = no window quota), window TTL (s),
+#       rate (tokens/s, 0 = no bucket), burst
+# Returns {granted, window count, wait ms}
+_ACQUIRE_SCRIPT = """
+local permits = tonumber(ARGV[1])
+local max_requests = tonumber(ARGV[2])
+local window_ttl = tonumber(ARGV[3])
+local rate = tonumber(ARGV[4])
+local burst = tonumber(ARGV[5])
+
+local used = tonumber(redis.call('GET', KEYS[1]) or '0')
+if max_requests >= 0 and used + permits > max_requests then
+    local ttl = redis.call('PTTL', KEYS[1])
+    if ttl < 0 then
+        ttl = window_ttl * 1000
+    end
+    return {0, used, ttl}
+end
+
+if rate > 0 then
+    local clock = redis.call('TIME')
+    local now = tonumber(clock[1]) * 1000 + math.floor(tonumber(clock[2]) / 1000)
+    local bucket = redis.call('HMGET', KEYS[2], 'tokens', 'ts')
+    local tokens = tonumber(bucket[1]) or burst
+    local last = tonumber(bucket[2]) or now
+    tokens = math.min(burst, tokens + math.max(0, now - last) * rate / 1000)
+    if tokens < permits then
+        return {0, used, math.ceil((permits - tokens) * 1000 / rate)}
+    end
+    redis.call('HSET', KEYS[2], 'tokens', tostring(tokens - permits), 'ts', now)
+    redis.call('PEXPIRE', KEYS[2], math.ceil(burst * 1000 / rate) + 1000)
+end
+
+if max_requests >= 0 then
+    used = redis.call('INCRBY', KEYS[1], permits)
+    if used == permits then
+        redis.call('EXPIRE', KEYS[1], window_ttl)
+    end
+end
+return {1, used, 0}
+"""
+
+
+class AsyncRedisRateLimiter(_TimeWindowMixin):
+    """
+    Asyncio-native Redis rate limiter with an optional token bucket.
+
+    Each reservation is one atomic Lua call that checks both limits and
+    reserves permits only if both allow it, so any number of workers can
+    share a quota without racing:
+    - Window quota: ``max_requests`` per hour/day/month, counted on the same
+      keys as RedisRateLimiter
+    - Token bucket: ``rate_per_second`` refill with up to ``burst`` tokens,
+      for smooth pacing within the window
+
+    The bucket clock is Redis server time, so workers on different hosts
+    agree on the refill. If Redis is unavailable requests are allowed
+    (fail open), like RedisRateLimiter.
+
+    Examples:
+        >>> limiter = AsyncRedisRateLimiter(
+        ...     scraper_name="kiwi",
+        ...     max_requests=100,
+        ...     time_window=TimeWindow.MONTHLY,
+        ...     rate_per_second=1.0,
+        ... )
+        >>> await limiter.acquire()  # Blocks until capacity frees up, even a window reset
+        >>> await limiter.acquire(permits=5, timeout=10)  # Raises if not free within 10s
+    """
+
+    def __init__(
+        self,
+        scraper_name: str,
+        max_requests: Optional[int] = None,
+        time_window: TimeWindow = TimeWindow.DAILY,
+        rate_per_second: Optional[float] = None,
+        burst: Optional[int] = None,
+        redis_client: Optional[aioredis.Redis] = None,
+        redis_url: Optional[str] = None,
+    ):
+        """
+        Initialize the async rate limiter (connects lazily on first use).
+
+        Args:
+            scraper_name: Unique identifier for the scraper (e.g., "kiwi", "ryanair")
+            max_requests: Maximum requests per time window (None = no window quota)
+            time_window: Time window type (hourly, daily, monthly)
+            rate_per_second: Token bucket refill rate (None = no bucket)
+            burst: Token bucket capacity (default: max(1, rate_per_second))
+            redis_client: Async Redis client to use (defaults to a client on
+                the shared pool)
+            redis_url: Redis connection URL if no client is given
+                (defaults to settings.redis_url)
+        """
+        if max_requests is None and not rate_per_second:
+            raise ValueError("Set max_requests, rate_per_second, or both")
+
+        self.scraper_name = scraper_name
+        self.max_requests = max_requests
+        self.time_window = time_window
+        self.rate_per_second = rate_per_second or 0.0
+        self.burst = burst or max(1, int(self.rate_per_second))
+
+        self.redis_client = redis_client or get_redis_registry().client(redis_url)
+        self._acquire_script = self.redis_client.register_script(_ACQUIRE_SCRIPT)
+
+    def _get_bucket_key(self) -> str:
+        """Get Redis key of the token bucket."""
+        return f"rate_limit:{self.scraper_name}:bucket"
+
+    async def try_acquire(self, permits: int = 1) -> float:
+        """
+        Reserve permits if both limits allow it, in one round trip.
+
+        Args:
+            permits: Number of requests to reserve at once
+
+        Returns:
+            0.0 if reserved, otherwise seconds until capacity may be available
+        """
+        if self.rate_per_second and permits > self.burst:
+            raise ValueError(f"Cannot reserve {permits} permits with burst {self.burst}")
+
+        try:
+            granted, used, wait_ms = await self._acquire_script(
+                keys=[self._get_redis_key(), self._get_bucket_key()],
+                args=[
+                    permits,
+                    -1 if self.max_requests is None else self.max_requests,
+                    self._get_ttl(),
+                    self.rate_per_second,
+                    self.burst,
+                ],
+            )
+        except RedisError as e:
+            logger.error(f"Error acquiring rate limit, allowing request: {e}")
+            return 0.0
+
+        if granted:
+            logger.debug(f"Rate limit reserved {permits} for '{self.scraper_name}' ({used} used)")
+            return 0.0
+        return wait_ms / 1000
+
+    async def acquire(self, permits: int = 1, timeout: Optional[float] = None) -> None:
+        """
+        Wait until permits are reserved.
+
+        Without a timeout this never raises: when the window quota is used up it
+        sleeps until the hourly/daily/monthly window resets.
+
+        Args:
+            permits: Number of requests to reserve at once
+            timeout: Max seconds to wait (None = no limit, 0 = don't wait)
+
+        Raises:
+            RateLimitExceededError: If a timeout is given and capacity won't be
+                available within it
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            wait = await self.try_acquire(permits)
+            if wait <= 0:
+                return
+
+            if deadline is not None and time.monotonic() + wait > deadline:
+                raise RateLimitExceededError(
+                    f"Rate limit exceeded for '{self.scraper_name}': "
+                    f"capacity available in {wait:.1f}s"
+                )
+
+            await asyncio.sleep(wait)
+
+    async def get_remaining(self) -> Optional[int]:
+        """
+        Get the number of remaining requests in this time window.
+
+        Returns:
+            Requests remaining, or None without a window quota
+        """
+        if self.max_requests is None:
+            return None
+
+        try:
+            count = await self.redis_client.get(self._get_redis_key())
+        except RedisError as e:
+            logger.error(f"Error getting count from Redis: {e}")
+            return self.max_requests
+        return max(0, self.max_requests - int(count or 0))
+
+    async def reset(self) -> None:
+        """Reset the window counter and token bucket."""
+        try:
+            await self.redis_client.delete(self._get_redis_key(), self._get_bucket_key())
+            logger.info(f"Rate limit reset for '{self.scraper_name}'")
+        except RedisError as e:
+            logger.error(f"Error resetting rate limit: {e}")
+
+
 # Convenience factory functions for common scrapers
 def get_kiwi_rate_limiter() -> RedisRateLimiter:
     """
@@ -349,3 +563,33 @@ def get_skyscanner_rate_limiter() -> RedisRateLimiter:
     return RedisRateLimiter(
         scraper_name="skyscanner", max_requests=10, time_window=TimeWindow.HOURLY
     )
+
+
+def get_async_kiwi_rate_limiter() -> AsyncRedisRateLimiter:
+    """
+    Get async rate limiter for Kiwi API (100 requests/month, paced per second).
+
+    Returns:
+        Configured AsyncRedisRateLimiter instance
+    """
+    return AsyncRedisRateLimiter(
+        scraper_name="kiwi",
+        max_requests=100,
+        time_window=TimeWindow.MONTHLY,
+        rate_per_second=settings.scraper_rate_per_second_kiwi,
+    )
+
+
+def get_async_ryanair_rate_limiter() -> AsyncRedisRateLimiter:
+    """
+    Get async rate limiter for Ryanair scraper (5 requests/day, paced per second).
+
+    Returns:
+        Configured AsyncRedisRateLimiter instance
+    """
+    return AsyncRedisRateLimiter(
+        scraper_name="ryanair",
+        max_requests=5,
+        time_window=TimeWindow.DAILY,
+        rate_per_second=settings.scraper_rate_per_second_ryanair,
+    )
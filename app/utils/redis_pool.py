@@ -0,0 +1,320 @@
+"""
+Application-wide Redis connection pools.
+
+Opening a Redis connection per component (and pinging it before use) adds a
+round trip to cached lookups and churns connections. RedisPoolRegistry keeps
+one pool per Redis URL that every component borrows clients from:
+
+- Async clients (``client()``) share a ``redis.asyncio`` pool bound to the
+  running event loop; a new loop (e.g. a second ``asyncio.run``) starts fresh
+  pools, like HttpClientPool
+- Sync clients (``sync_client()``) share a thread-safe ``redis`` pool, used by
+  RedisRateLimiter
+- A background heartbeat pings Redis every few seconds and keeps ``healthy``
+  up to date, so callers check a flag instead of pinging per call
+
+pipeline_exists() and pipeline_setex() batch many keys into one round trip.
+
+Example:
+    >>> redis_client = get_redis()
+    >>> if get_redis_registry().healthy:
+    ...     cached = await redis_client.get("claude:response:...")
+    >>> await close_redis_registry()  # On shutdown
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import redis
+import redis.asyncio as aioredis
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class RedisPoolRegistry:
+    """
+    Shared Redis connection pools with heartbeat health tracking.
+
+    Borrowers must not close the clients they get; the registry owner calls
+    close() once all work is done. Until the first heartbeat has run, Redis
+    is assumed healthy and failures are left to the individual operations.
+
+    Attributes:
+        redis_url: Default Redis URL (settings.redis_url)
+        max_connections: Connections per pool
+        heartbeat_seconds: Interval between heartbeat pings (0 = no heartbeat)
+        healthy: Result of the latest heartbeat (or check())
+        last_check: time.monotonic() of the latest heartbeat, if any
+    """
+
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        max_connections: Optional[int] = None,
+        heartbeat_seconds: Optional[float] = None,
+    ):
+        """
+        Initialize the registry (no connections are opened until first use).
+
+        Args:
+            redis_url: Default Redis URL (defaults to settings.redis_url)
+            max_connections: Connections per pool
+                (defaults to settings.redis_max_connections)
+            heartbeat_seconds: Heartbeat interval
+                (defaults to settings.redis_heartbeat_seconds)
+        """
+        self.redis_url = redis_url or str(settings.redis_url)
+        self.max_connections = max_connections or settings.redis_max_connections
+        self.heartbeat_seconds = (
+            settings.redis_heartbeat_seconds if heartbeat_seconds is None else heartbeat_seconds
+        )
+        self.healthy = True
+        self.last_check: Optional[float] = None
+
+        self._pools: Dict[Tuple[str, bool], aioredis.ConnectionPool] = {}
+        self._sync_pools: Dict[str, redis.ConnectionPool] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._heartbeat: Optional[asyncio.Task] = None
+
+    def _bind_loop(self) -> Optional[asyncio.AbstractEventLoop]:
+        """
+        Bind to the running loop, discarding pools from a previous loop.
+
+        Pools created outside a loop (e.g. in a constructor) are kept and
+        bound to the first loop that uses the registry.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+
+        if self._loop is loop:
+            return loop
+
+        if self._loop is not None:
+            logger.info("Event loop changed, discarding stale Redis pools")
+            self._pools = {}
+            self._heartbeat = None
+
+        self._loop = loop
+        return loop
+
+    def _pool(self, redis_url: Optional[str], decode_responses: bool) -> aioredis.ConnectionPool:
+        """Get or create the async pool for a URL and response decoding."""
+        key = (redis_url or self.redis_url, decode_responses)
+        pool = self._pools.get(key)
+        if pool is None:
+            pool = aioredis.ConnectionPool.from_url(
+                key[0],
+                max_connections=self.max_connections,
+                decode_responses=decode_responses,
+                socket_connect_timeout=5,
+                socket_timeout=5,
+            )
+            self._pools[key] = pool
+            logger.info(
+                f"Opened Redis connection pool (max connections: {self.max_connections}, "
+                f"decode responses: {decode_responses})"
+            )
+        return pool
+
+    def client(
+        self, redis_url: Optional[str] = None, decode_responses: bool = False
+    ) -> aioredis.Redis:
+        """
+        Get an async client on the shared pool.
+
+        Clients are cheap views of the pool; call this freely instead of
+        keeping your own connection.
+
+        Args:
+            redis_url: Redis URL (defaults to the registry's URL)
+            decode_responses: Return str instead of bytes
+
+        Returns:
+            Async Redis client; don't close it
+        """
+        loop = self._bind_loop()
+        pool = self._pool(redis_url, decode_responses)
+        if loop is not None:
+            self._start_heartbeat()
+        return aioredis.Redis(connection_pool=pool)
+
+    def sync_client(self, redis_url: Optional[str] = None) -> redis.Redis:
+        """
+        Get a sync client (decoding responses) on a shared, thread-safe pool.
+
+        Args:
+            redis_url: Redis URL (defaults to the registry's URL)
+
+        Returns:
+            Sync Redis client; don't close it
+        """
+        url = redis_url or self.redis_url
+        pool = self._sync_pools.get(url)
+        if pool is None:
+            pool = redis.ConnectionPool.from_url(
+                url,
+                max_connections=self.max_connections,
+                decode_responses=True,
+                socket_connect_timeout=5,
+                socket_timeout=5,
+            )
+            self._sync_pools[url] = pool
+        return redis.Redis(connection_pool=pool)
+
+    async def check(self) -> bool:
+        """
+        Ping Redis now and update ``healthy``.
+
+        Returns:
+            True if Redis answered
+        """
+        self._bind_loop()
+        client = aioredis.Redis(connection_pool=self._pool(None, False))
+        try:
+            await client.ping()
+            healthy = True
+        except Exception as e:
+            if self.healthy:
+                logger.warning(f"Redis heartbeat failed: {e}. Marking Redis unavailable.")
+            healthy = False
+        else:
+            if not self.healthy:
+                logger.info("Redis heartbeat recovered")
+
+        self.healthy = healthy
+        self.last_check = time.monotonic()
+        return healthy
+
+    def _start_heartbeat(self) -> None:
+        """Start the heartbeat task on the running loop if it isn't running."""
+        if self.heartbeat_seconds <= 0:
+            return
+        if self._heartbeat is not None and not self._heartbeat.done():
+            return
+        self._heartbeat = asyncio.create_task(self._run_heartbeat())
+
+    async def _run_heartbeat(self) -> None:
+        """Ping Redis every heartbeat_seconds until cancelled."""
+        while True:
+            await self.check()
+            await asyncio.sleep(self.heartbeat_seconds)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get registry statistics.
+
+        Returns:
+            Dictionary with pool counts, health and heartbeat state
+        """
+        return {
+            "async_pools": len(self._pools),
+            "sync_pools": len(self._sync_pools),
+            "healthy": self.healthy,
+            "heartbeat_running": self._heartbeat is not None and not self._heartbeat.done(),
+        }
+
+    async def close(self) -> None:
+        """Stop the heartbeat and disconnect all pools."""
+        if self._heartbeat is not None:
+            self._heartbeat.cancel()
+            self._heartbeat = None
+
+        if self._loop is asyncio.get_running_loop():
+            for pool in self._pools.values():
+                try:
+                    await pool.disconnect()
+                except Exception as e:
+                    logger.warning(f"Error closing Redis pool: {e}")
+        # Pools from another loop can't be awaited here; just forget them
+        self._pools = {}
+        self._loop = None
+
+        for pool in self._sync_pools.values():
+            try:
+                pool.disconnect()
+            except Exception as e:
+                logger.warning(f"Error closing Redis pool: {e}")
+        self._sync_pools = {}
+
+        logger.info("Redis connection pools closed")
+
+
+async def pipeline_exists(client: aioredis.Redis, keys: Iterable[str]) -> List[bool]:
+    """
+    Check which keys exist, in one round trip.
+
+    Args:
+        client: Async Redis client
+        keys: Keys to check
+
+    Returns:
+        One bool per key, in order
+    """
+    keys = list(keys)
+    if not keys:
+        return []
+    async with client.pipeline(transaction=False) as pipe:
+        for key in keys:
+            pipe.exists(key)
+        results = await pipe.execute()
+    return [bool(exists) for exists in results]
+
+
+async def pipeline_setex(client: aioredis.Redis, items: Dict[str, Any], ttl: int) -> None:
+    """
+    Set many keys with the same TTL, in one round trip.
+
+    Args:
+        client: Async Redis client
+        items: Mapping of key to value
+        ttl: Expiry in seconds
+    """
+    if not items:
+        return
+    async with client.pipeline(transaction=False) as pipe:
+        for key, value in items.items():
+            pipe.setex(key, ttl, value)
+        await pipe.execute()
+
+
+_registry: Optional[RedisPoolRegistry] = None
+
+
+def get_redis_registry() -> RedisPoolRegistry:
+    """
+    Get the process-wide RedisPoolRegistry, creating it on first use.
+
+    Returns:
+        Shared registry for settings.redis_url
+    """
+    global _registry
+    if _registry is None:
+        _registry = RedisPoolRegistry()
+    return _registry
+
+
+def get_redis(decode_responses: bool = False) -> aioredis.Redis:
+    """
+    Get an async client on the process-wide pool.
+
+    Args:
+        decode_responses: Return str instead of bytes
+
+    Returns:
+        Async Redis client; don't close it
+    """
+    return get_redis_registry().client(decode_responses=decode_responses)
+
+
+async def close_redis_registry() -> None:
+    """Close and drop the process-wide registry (call on shutdown)."""
+    global _registry
+    if _registry is not None:
+        registry, _registry = _registry, None
+        await registry.close()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Event fuzzy deduplication benchmark.
+
+Compares the blocked fuzzy deduplication engine against the reference
+all-pairs scan on synthetic scraped events. The all-pairs scan is quadratic,
+so it only runs up to --reference-max events; larger sizes time the blocked
+engine alone.
+
+Usage:
+    poetry run python benchmarks/bench_event_deduplication.py
+    poetry run python benchmarks/bench_event_deduplication.py --sizes 5000 100000
+"""
+
+import argparse
+import copy
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.utils.event_deduplication import (  # noqa: E402
+    _apply_fuzzy_deduplication,
+    apply_fuzzy_deduplication_pairwise,
+)
+from benchmarks.synthetic import AIRPORTS, DESTINATIONS, generate_events  # noqa: E402
+
+
+def time_call(func, events: List[Dict]) -> Dict:
+    """Run one fuzzy deduplication implementation on a private copy and time it."""
+    data = copy.deepcopy(events)
+    started = time.perf_counter()
+    result = func(data)
+    elapsed = time.perf_counter() - started
+    return {"seconds": round(elapsed, 4), "unique": len(result), "result": result}
+
+
+def main() -> None:
+    """Run the benchmark and print one JSON line per size."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[5_000, 100_000])
+    parser.add_argument("--reference-max", type=int, default=5_000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    cities = [AIRPORTS[code][0] for code in DESTINATIONS]
+
+    for size in args.sizes:
+        events = generate_events(size, cities, seed=args.seed)
+        blocked = time_call(_apply_fuzzy_deduplication, events)
+        row = {
+            "benchmark": "event_deduplication",
+            "events": size,
+            "blocked": {k: v for k, v in blocked.items() if k != "result"},
+        }
+
+        if size <= args.reference_max:
+            pairwise = time_call(apply_fuzzy_deduplication_pairwise, events)
+            row["pairwise"] = {k: v for k, v in pairwise.items() if k != "result"}
+            row["speedup"] = round(pairwise["seconds"] / max(blocked["seconds"], 1e-9), 2)
+            row["equivalent"] = pairwise["result"] == blocked["result"]
+
+        print(json.dumps(row), flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Flight deduplication benchmark.
+
+Compares the vectorized deduplication engine against the reference
+per-flight implementation on synthetic scrape results.
+
+Usage:
+    poetry run python benchmarks/bench_flight_deduplication.py
+    poetry run python benchmarks/bench_flight_deduplication.py --sizes 10000 100000
+"""
+
+import argparse
+import copy
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.utils.flight_deduplication import (  # noqa: E402
+    deduplicate_flights,
+    deduplicate_flights_iterative,
+)
+from benchmarks.synthetic import generate_flights  # noqa: E402
+
+
+def time_call(func, flights: List[Dict]) -> Dict:
+    """Run one deduplication implementation on a private copy and time it."""
+    data = copy.deepcopy(flights)
+    started = time.perf_counter()
+    result = func(data)
+    elapsed = time.perf_counter() - started
+    return {"seconds": round(elapsed, 4), "unique": len(result)}
+
+
+def main() -> None:
+    """Run the benchmark and print one JSON line per size."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000]
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        flights = generate_flights(size, seed=args.seed)
+        iterative = time_call(deduplicate_flights_iterative, flights)
+        vectorized = time_call(deduplicate_flights, flights)
+
+        print(
+            json.dumps(
+                {
+                    "benchmark": "flight_deduplication",
+                    "flights": size,
+                    "iterative": iterative,
+                    "vectorized": vectorized,
+                    "speedup": round(iterative["seconds"] / max(vectorized["seconds"], 1e-9), 2),
+                    "equivalent": iterative["unique"] == vectorized["unique"],
+                }
+            ),
+            flush=True,
+        )
+
+
+if __name__ == "__main__":
+    main()
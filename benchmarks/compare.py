@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Compare two pipeline benchmark result files.
+
+Prints the per-stage time ratio (candidate / baseline) and optionally fails
+when any stage got slower than a threshold, for use in CI.
+
+Usage:
+    poetry run python benchmarks/compare.py results/base.json results/head.json
+    poetry run python benchmarks/compare.py base.json head.json --fail-above 1.2
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+def load_stages(path: Path) -> Dict[str, Dict]:
+    """Load a results file and index its stages by name."""
+    document = json.loads(path.read_text())
+    return {record["stage"]: record for record in document["stages"]}
+
+
+def compare(baseline: Dict[str, Dict], candidate: Dict[str, Dict]) -> List[Dict]:
+    """
+    Compare stages present in both result sets.
+
+    Args:
+        baseline: Stages of the baseline run
+        candidate: Stages of the candidate run
+
+    Returns:
+        One row per common stage with both timings and the ratio
+    """
+    rows = []
+    for stage, base in baseline.items():
+        head = candidate.get(stage)
+        if head is None:
+            continue
+        ratio: Optional[float] = None
+        if base["seconds"]:
+            ratio = round(head["seconds"] / base["seconds"], 3)
+        rows.append(
+            {
+                "stage": stage,
+                "baseline_seconds": base["seconds"],
+                "candidate_seconds": head["seconds"],
+                "ratio": ratio,
+            }
+        )
+    return rows
+
+
+def main() -> None:
+    """Print the comparison and exit non-zero on regressions above the threshold."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("baseline", type=Path)
+    parser.add_argument("candidate", type=Path)
+    parser.add_argument(
+        "--fail-above",
+        type=float,
+        help="Exit with status 1 if any stage ratio exceeds this value (e.g. 1.2)",
+    )
+    parser.add_argument("--json", action="store_true", help="Print rows as JSON")
+    args = parser.parse_args()
+
+    rows = compare(load_stages(args.baseline), load_stages(args.candidate))
+
+    if args.json:
+        print(json.dumps(rows, indent=2))
+    else:
+        print(f"{'stage':<22}{'baseline s':>12}{'candidate s':>13}{'ratio':>8}")
+        for row in rows:
+            ratio = "n/a" if row["ratio"] is None else f"{row['ratio']:.3f}"
+            print(
+                f"{row['stage']:<22}{row['baseline_seconds']:>12.4f}"
+                f"{row['candidate_seconds']:>13.4f}{ratio:>8}"
+            )
+
+    if args.fail_above is not None:
+        regressions = [r for r in rows if r["ratio"] is not None and r["ratio"] > args.fail_above]
+        if regressions:
+            names = ", ".join(r["stage"] for r in regressions)
+            print(f"Regression above {args.fail_above}x: {names}", file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
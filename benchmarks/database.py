@@ -0,0 +1,141 @@
+"""
+Database setup for benchmarks.
+
+Benchmarks run against a local PostgreSQL (same schema and code paths as
+production) or, when none is available, an in-memory SQLite stand-in. The
+stand-in needs a few schema adaptations that are applied only for SQLite:
+
+- ARRAY and JSONB columns are stored as JSON
+- ``NOW()`` server defaults become ``CURRENT_TIMESTAMP``
+- The global ``SET timezone`` connect listener from app.database is removed
+
+Creating a PostgreSQL engine drops all tables first, so it is refused unless
+the database is named like the configured app database plus a disposable
+suffix (e.g. ``travelscout_bench``) or dropping is explicitly allowed.
+"""
+
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator, Callable
+
+from sqlalchemy import ARRAY, event, make_url, pool, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.schema import DefaultClause
+
+import app.models  # noqa: F401  (register all tables)
+from app import database
+from app.config import settings
+from app.models.base import Base
+
+SQLITE_MEMORY_URL = "sqlite+aiosqlite:///:memory:"
+
+# Suffixes that mark a copy of the app database as safe to drop
+DISPOSABLE_DATABASE_SUFFIXES = ("_bench", "_benchmark", "_test")
+
+
+@compiles(ARRAY, "sqlite")
+@compiles(JSONB, "sqlite")
+def _compile_json_for_sqlite(type_, compiler, **kw) -> str:
+    """Store PostgreSQL ARRAY/JSONB columns as JSON on SQLite."""
+    return "JSON"
+
+
+def _adapt_schema_for_sqlite() -> None:
+    """Apply the SQLite-only adaptations described in the module docstring."""
+    if event.contains(pool.Pool, "connect", database.set_postgres_pragmas):
+        event.remove(pool.Pool, "connect", database.set_postgres_pragmas)
+
+    for table in Base.metadata.tables.values():
+        for column in table.columns:
+            default = column.server_default
+            if default is not None and getattr(default, "arg", None) == "NOW()":
+                column.server_default = DefaultClause(text("CURRENT_TIMESTAMP"))
+
+
+def check_disposable_database(url: str, allow_drop: bool = False) -> None:
+    """
+    Refuse database URLs whose tables must not be dropped.
+
+    SQLite is always allowed. PostgreSQL databases must be named like the
+    configured app database plus one of DISPOSABLE_DATABASE_SUFFIXES, so a
+    copy-pasted DATABASE_URL can't wipe real data.
+
+    Args:
+        url: Async database URL
+        allow_drop: Skip the check (the caller knows all tables are dropped)
+
+    Raises:
+        ValueError: If the database isn't recognisably disposable
+    """
+    if allow_drop or url.startswith("sqlite"):
+        return
+
+    name = make_url(url).database or ""
+    app_name = make_url(str(settings.database_url)).database or ""
+    allowed = [f"{app_name}{suffix}" for suffix in DISPOSABLE_DATABASE_SUFFIXES]
+    if name not in allowed:
+        raise ValueError(
+            f"Refusing to drop all tables in database '{name}'. Benchmarks only run "
+            f"against {', '.join(allowed)}, unless dropping is explicitly allowed "
+            f"(--i-know-this-drops-tables)."
+        )
+
+
+async def create_benchmark_engine(
+    url: str = SQLITE_MEMORY_URL, allow_drop: bool = False
+) -> AsyncEngine:
+    """
+    Create an engine with a freshly created schema.
+
+    Args:
+        url: Async database URL (existing tables are dropped)
+        allow_drop: Allow any PostgreSQL database, not only disposable ones
+
+    Returns:
+        AsyncEngine with all tables created
+
+    Raises:
+        ValueError: If url names a database that isn't recognisably disposable
+    """
+    check_disposable_database(url, allow_drop)
+
+    if url.startswith("sqlite"):
+        _adapt_schema_for_sqlite()
+        # One shared connection, otherwise every connection sees its own in-memory DB
+        engine = create_async_engine(url, poolclass=pool.StaticPool)
+    else:
+        engine = create_async_engine(url, pool_size=10, max_overflow=10)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+    return engine
+
+
+def session_context_factory(engine: AsyncEngine) -> Callable:
+    """
+    Build a drop-in replacement for app.database.get_async_session_context.
+
+    Args:
+        engine: Benchmark engine
+
+    Returns:
+        Async context manager factory yielding committed-on-exit sessions
+    """
+    session_maker = async_sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False, autoflush=False
+    )
+
+    @asynccontextmanager
+    async def get_session_context() -> AsyncGenerator[AsyncSession, None]:
+        async with session_maker() as session:
+            try:
+                yield session
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+
+    return get_session_context
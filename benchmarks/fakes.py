@@ -0,0 +1,98 @@
+"""
+Fake scrapers for benchmarks.
+
+Stand-ins for the flight scrapers with the same call signatures as the real
+ones, returning synthetic flights after an optional simulated latency. No
+network requests or browsers are involved.
+"""
+
+import asyncio
+import random
+from datetime import date
+from typing import Dict, List, Optional
+
+from app.orchestration.flight_orchestrator import FlightOrchestrator
+from benchmarks.synthetic import generate_route_flights
+
+
+class FakeApiScraper:
+    """Fake for API clients called via search_flights (KiwiClient, WizzAirScraper)."""
+
+    def __init__(self, source: str, flights_per_call: int, latency: float = 0.0, seed: int = 42):
+        """
+        Args:
+            source: Scraper name stamped on the generated flights
+            flights_per_call: Flights returned per search
+            latency: Simulated request latency in seconds
+            seed: Random seed
+        """
+        self.source = source
+        self.flights_per_call = flights_per_call
+        self.latency = latency
+        self.rng = random.Random(f"{source}-{seed}")
+        self.calls = 0
+
+    async def search_flights(
+        self,
+        origin: str,
+        destination: str,
+        departure_date: date,
+        return_date: Optional[date] = None,
+        **kwargs,
+    ) -> List[Dict]:
+        """Return synthetic flights for the route."""
+        self.calls += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return generate_route_flights(
+            self.rng,
+            origin,
+            destination,
+            departure_date,
+            return_date,
+            self.flights_per_call,
+            self.source,
+        )
+
+
+class FakeBrowserScraper(FakeApiScraper):
+    """Fake for browser scrapers used as async context managers (Skyscanner, Ryanair)."""
+
+    async def __aenter__(self) -> "FakeBrowserScraper":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        return None
+
+    async def scrape_route(
+        self,
+        origin: str,
+        destination: str,
+        departure_date: date,
+        return_date: Optional[date] = None,
+    ) -> List[Dict]:
+        """Return synthetic flights for the route."""
+        return await self.search_flights(origin, destination, departure_date, return_date)
+
+
+def build_fake_orchestrator(
+    flights_per_call: int, latency: float = 0.0, seed: int = 42
+) -> FlightOrchestrator:
+    """
+    Create a FlightOrchestrator whose four scrapers are fakes.
+
+    Args:
+        flights_per_call: Flights each fake returns per route and date range
+        latency: Simulated latency per scraper call in seconds
+        seed: Random seed
+
+    Returns:
+        FlightOrchestrator without Redis cache
+    """
+    orchestrator = FlightOrchestrator(enabled_scrapers=[])
+    orchestrator.enabled_scrapers = ["kiwi", "skyscanner", "ryanair", "wizzair"]
+    orchestrator.kiwi = FakeApiScraper("kiwi", flights_per_call, latency, seed)
+    orchestrator.wizzair = FakeApiScraper("wizzair", flights_per_call, latency, seed)
+    orchestrator.skyscanner = FakeBrowserScraper("skyscanner", flights_per_call, latency, seed)
+    orchestrator.ryanair = FakeBrowserScraper("ryanair", flights_per_call, latency, seed)
+    return orchestrator
@@ -0,0 +1,252 @@
+"""
+Synthetic data for benchmarks.
+
+Generators are deterministic for a given seed so results are comparable
+across commits. Values follow the scraper output contracts (flights, events)
+and the ORM models (airports, accommodations).
+"""
+
+import random
+from datetime import date, timedelta
+from typing import Dict, List, Tuple
+
+ORIGINS = ["MUC", "FMM", "NUE", "SZG"]
+DESTINATIONS = ["LIS", "BCN", "PRG", "BUD", "OPO", "NAP", "ATH", "DBV", "SPU", "VLC"]
+AIRLINES = ["Ryanair", "Wizz Air", "Lufthansa", "TAP", "Vueling", "Eurowings"]
+SOURCES = ["kiwi", "skyscanner", "ryanair", "wizzair"]
+
+# IATA code -> (city, distance from home km, driving time min)
+AIRPORTS: Dict[str, Tuple[str, int, int]] = {
+    "MUC": ("Munich", 40, 35),
+    "FMM": ("Memmingen", 110, 70),
+    "NUE": ("Nuremberg", 170, 100),
+    "SZG": ("Salzburg", 150, 90),
+    "LIS": ("Lisbon", 0, 0),
+    "BCN": ("Barcelona", 0, 0),
+    "PRG": ("Prague", 0, 0),
+    "BUD": ("Budapest", 0, 0),
+    "OPO": ("Porto", 0, 0),
+    "NAP": ("Naples", 0, 0),
+    "ATH": ("Athens", 0, 0),
+    "DBV": ("Dubrovnik", 0, 0),
+    "SPU": ("Split", 0, 0),
+    "VLC": ("Valencia", 0, 0),
+}
+
+EVENT_TOPICS = [
+    "Jazz Night", "Kids Science Fair", "Food Market", "Open Air Cinema",
+    "Puppet Theatre", "Wine Tasting", "Street Art Tour", "Family Fun Run",
+    "Flamenco Show", "Aquarium Sleepover", "Craft Beer Festival", "Zoo Discovery Day",
+]
+EVENT_CATEGORIES = ["family", "parent_escape", "cultural", "outdoor"]
+
+START_DATE = date(2025, 12, 1)
+
+
+def city_of(iata_code: str) -> str:
+    """City name for a benchmark airport code."""
+    return AIRPORTS[iata_code][0]
+
+
+def _time(rng: random.Random) -> str:
+    """Random HH:MM departure/return time."""
+    return f"{rng.randrange(5, 23):02d}:{rng.choice([0, 15, 30, 45]):02d}"
+
+
+def generate_flights(n: int, seed: int = 42) -> List[Dict]:
+    """
+    Generate synthetic multi-source scrape results.
+
+    Roughly a third of the flights are cross-source duplicates.
+
+    Args:
+        n: Number of flights
+        seed: Random seed
+
+    Returns:
+        List of flight dictionaries in scraper output format
+    """
+    rng = random.Random(seed)
+    flights = []
+
+    for i in range(n):
+        if flights and rng.random() < 0.33:
+            flight = dict(rng.choice(flights))
+            flight["source"] = rng.choice(SOURCES)
+            flight["price_per_person"] = round(flight["price_per_person"] * rng.uniform(0.9, 1.1), 2)
+            flight["booking_url"] = f"https://{flight['source']}.example.com/{i}"
+            flights.append(flight)
+            continue
+
+        departure = START_DATE + timedelta(days=rng.randrange(180))
+        price = round(rng.uniform(40, 400), 2)
+        flights.append(
+            {
+                "origin_airport": rng.choice(ORIGINS),
+                "destination_airport": rng.choice(DESTINATIONS),
+                "airline": rng.choice(AIRLINES),
+                "departure_date": departure.isoformat(),
+                "departure_time": _time(rng),
+                "return_date": (departure + timedelta(days=rng.randrange(3, 15))).isoformat(),
+                "return_time": _time(rng),
+                "price_per_person": price,
+                "total_price": price * 4,
+                "booking_url": f"https://example.com/{i}",
+                "source": rng.choice(SOURCES),
+            }
+        )
+
+    return flights
+
+
+def generate_route_flights(
+    rng: random.Random,
+    origin: str,
+    destination: str,
+    departure_date: date,
+    return_date: date,
+    count: int,
+    source: str,
+) -> List[Dict]:
+    """
+    Generate one scraper call's worth of flights for a route and date range.
+
+    Args:
+        rng: Random generator (shared across calls for reproducibility)
+        origin: Origin IATA code
+        destination: Destination IATA code
+        departure_date: Outbound date
+        return_date: Return date
+        count: Number of flights
+        source: Scraper name
+
+    Returns:
+        List of flight dictionaries in scraper output format
+    """
+    flights = []
+    for i in range(count):
+        price = round(rng.uniform(40, 400), 2)
+        flights.append(
+            {
+                "origin_airport": origin,
+                "destination_airport": destination,
+                "origin_city": city_of(origin),
+                "destination_city": city_of(destination),
+                "airline": rng.choice(AIRLINES),
+                "departure_date": departure_date.isoformat(),
+                "departure_time": _time(rng),
+                "return_date": return_date.isoformat(),
+                "return_time": _time(rng),
+                "price_per_person": price,
+                "total_price": price * 4,
+                "direct_flight": rng.random() < 0.6,
+                "booking_class": "Economy",
+                "booking_url": f"https://{source}.example.com/{origin}{destination}/{i}",
+                "source": source,
+            }
+        )
+    return flights
+
+
+def generate_date_ranges(count: int, nights: int = 7) -> List[Tuple[date, date]]:
+    """
+    Generate weekly (departure, return) date ranges.
+
+    Args:
+        count: Number of ranges
+        nights: Trip length in nights
+
+    Returns:
+        List of (departure_date, return_date) tuples
+    """
+    return [
+        (START_DATE + timedelta(weeks=i), START_DATE + timedelta(weeks=i, days=nights))
+        for i in range(count)
+    ]
+
+
+def generate_accommodations(cities: List[str], per_city: int, seed: int = 42) -> List[Dict]:
+    """
+    Generate accommodation rows (Accommodation model columns).
+
+    Args:
+        cities: Destination city names
+        per_city: Accommodations per city
+        seed: Random seed
+
+    Returns:
+        List of column dictionaries
+    """
+    rng = random.Random(seed)
+    accommodations = []
+
+    for city in cities:
+        for i in range(per_city):
+            accommodations.append(
+                {
+                    "destination_city": city,
+                    "name": f"{city} Stay {i}",
+                    "type": rng.choice(["hotel", "airbnb", "apartment"]),
+                    "bedrooms": rng.randint(1, 4),
+                    "price_per_night": round(rng.uniform(50, 300), 2),
+                    "family_friendly": rng.random() < 0.5,
+                    "has_kitchen": rng.random() < 0.5,
+                    "has_kids_club": rng.random() < 0.1,
+                    "rating": round(rng.uniform(5.0, 10.0), 1),
+                    "review_count": rng.randint(0, 2000),
+                    "source": rng.choice(["booking", "airbnb"]),
+                    "url": f"https://example.com/{city}/{i}",
+                }
+            )
+
+    return accommodations
+
+
+def generate_events(n: int, cities: List[str], seed: int = 42) -> List[Dict]:
+    """
+    Generate scraped events, about a quarter of them near-duplicates.
+
+    Duplicates share city and date and differ in title punctuation, casing
+    or a small prefix, like the same event listed by two sources.
+
+    Args:
+        n: Number of events
+        cities: Destination city names
+        seed: Random seed
+
+    Returns:
+        List of event dictionaries in scraper output format
+    """
+    rng = random.Random(seed)
+    events = []
+
+    for i in range(n):
+        if events and rng.random() < 0.25:
+            event = dict(rng.choice(events))
+            event["title"] = rng.choice(
+                [event["title"].upper(), event["title"] + "!", "The " + event["title"]]
+            )
+            event["source"] = rng.choice(["eventbrite", "tourism_board"])
+            event["url"] = f"https://events.example.com/dup/{i}"
+            events.append(event)
+            continue
+
+        city = rng.choice(cities)
+        event_date = START_DATE + timedelta(days=rng.randrange(180))
+        multi_day = rng.random() < 0.2
+        events.append(
+            {
+                "destination_city": city,
+                "title": f"{city} {rng.choice(EVENT_TOPICS)} {i}",
+                "venue": f"{city} Venue {rng.randrange(20)}",
+                "event_date": event_date,
+                "end_date": event_date + timedelta(days=rng.randint(1, 5)) if multi_day else None,
+                "category": rng.choice(EVENT_CATEGORIES),
+                "description": "Synthetic benchmark event",
+                "price_range": rng.choice(["free", "<€20", "€20-50", "€50+"]),
+                "source": rng.choice(["eventbrite", "tourism_board"]),
+                "url": f"https://events.example.com/{i}",
+            }
+        )
+
+    return events
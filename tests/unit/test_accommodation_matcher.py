@@ -361,6 +361,98 @@ class TestMatchFlightsToAccommodations:
         assert len(pairs) == 0
 
 
+class TestFindAffordablePairs:
+    """Tests for the vectorized find_affordable_pairs method."""
+
+    @pytest.fixture
+    def matcher(self):
+        """Create AccommodationMatcher instance."""
+        return AccommodationMatcher()
+
+    @staticmethod
+    def make_flight(true_cost, nights):
+        flight = Mock(spec=Flight)
+        flight.true_cost = true_cost
+        flight.departure_date = date(2025, 12, 20)
+        flight.return_date = date.fromordinal(date(2025, 12, 20).toordinal() + nights)
+        return flight
+
+    @staticmethod
+    def make_accommodation(price_per_night):
+        accommodation = Mock(spec=Accommodation)
+        accommodation.price_per_night = price_per_night
+        return accommodation
+
+    def test_matches_nested_loop(self, matcher):
+        """Test that the broadcast keeps exactly the pairs the per-pair loop keeps."""
+        import random
+
+        rng = random.Random(7)
+        flights = [
+            self.make_flight(round(rng.uniform(100, 1500), 2), rng.randint(1, 14))
+            for _ in range(60)
+        ]
+        accommodations = [
+            self.make_accommodation(round(rng.uniform(40, 300), 2)) for _ in range(25)
+        ]
+
+        expected = []
+        for i, flight in enumerate(flights):
+            nights = (flight.return_date - flight.departure_date).days
+            if not (3 <= nights <= 10):
+                continue
+            for j, accommodation in enumerate(accommodations):
+                if matcher.calculate_trip_cost(flight, accommodation, nights)["total"] <= 2000.0:
+                    expected.append((i, j))
+
+        flight_idx, accom_idx = matcher.find_affordable_pairs(
+            flights, accommodations, max_budget=2000.0, min_nights=3, max_nights=10
+        )
+
+        assert expected
+        assert list(zip(flight_idx.tolist(), accom_idx.tolist(), strict=True)) == expected
+
+    def test_budget_boundary_is_inclusive(self, matcher):
+        """Test that a package costing exactly the budget is kept."""
+        # 500 + 7 × 100 + 7 × 150 = 2250
+        flights = [self.make_flight(500.0, 7)]
+        accommodations = [self.make_accommodation(100.0), self.make_accommodation(100.01)]
+
+        flight_idx, accom_idx = matcher.find_affordable_pairs(
+            flights, accommodations, max_budget=2250.0, min_nights=3, max_nights=10
+        )
+
+        assert accom_idx.tolist() == [0]
+
+    def test_top_k_keeps_cheapest(self, matcher):
+        """Test that top_k keeps the K cheapest pairs, cheapest first."""
+        flights = [self.make_flight(900.0, 5), self.make_flight(300.0, 5)]
+        accommodations = [self.make_accommodation(120.0), self.make_accommodation(60.0)]
+
+        flight_idx, accom_idx = matcher.find_affordable_pairs(
+            flights, accommodations, max_budget=5000.0, min_nights=3, max_nights=10, top_k=3
+        )
+
+        pairs = list(zip(flight_idx.tolist(), accom_idx.tolist(), strict=True))
+        assert pairs == [(1, 1), (1, 0), (0, 1)]
+
+    def test_no_flights_in_night_range(self, matcher):
+        """Test that flights outside the night range produce no pairs."""
+        flights = [self.make_flight(300.0, 1), self.make_flight(300.0, 20)]
+
+        flight_idx, accom_idx = matcher.find_affordable_pairs(
+            flights, [self.make_accommodation(50.0)], max_budget=5000.0, min_nights=3, max_nights=10
+        )
+
+        assert len(flight_idx) == 0 and len(accom_idx) == 0
+
+    def test_empty_inputs(self, matcher):
+        """Test that empty flight or accommodation lists produce no pairs."""
+        flight_idx, _ = matcher.find_affordable_pairs([], [], 2000.0, 3, 10)
+
+        assert len(flight_idx) == 0
+
+
 class TestIsDuringHoliday:
     """Tests for _is_during_holiday helper method."""
 
@@ -0,0 +1,122 @@
+"""
+Unit tests for AccommodationOrchestrator multi-city searches.
+"""
+
+import asyncio
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.orchestration.accommodation_orchestrator import AccommodationOrchestrator
+
+WINDOWS = [(date(2025, 12, 20), date(2025, 12, 27)), (date(2026, 4, 1), date(2026, 4, 8))]
+
+
+class FakeScraper:
+    """Accommodation scraper that records how many searches overlap."""
+
+    def __init__(self, delay=0.02):
+        self.delay = delay
+        self.calls = []
+        self.running = 0
+        self.peak = 0
+
+    async def search(self, city, check_in, check_out, **kwargs):
+        self.calls.append((city, check_in, check_out))
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        await asyncio.sleep(self.delay)
+        self.running -= 1
+        return [{"name": f"{city} Family Apartment {check_in}", "price_per_night": 100.0}]
+
+    def filter_family_friendly(self, accommodations, **kwargs):
+        return accommodations
+
+    def filter_family_suitable(self, accommodations):
+        return accommodations
+
+
+@pytest.fixture
+def orchestrator():
+    """Create an orchestrator backed by fake scrapers."""
+    with patch("app.orchestration.accommodation_orchestrator.BookingClient"), patch(
+        "app.orchestration.accommodation_orchestrator.AirbnbClient"
+    ):
+        orchestrator = AccommodationOrchestrator()
+    orchestrator.booking = FakeScraper()
+    orchestrator.airbnb = FakeScraper()
+    orchestrator._print_stats_table = MagicMock()
+    return orchestrator
+
+
+@pytest.fixture
+def limits():
+    """Patch accommodation concurrency settings."""
+    with patch("app.orchestration.accommodation_orchestrator.settings") as mock_settings:
+        mock_settings.get_accommodation_concurrency_limits.return_value = {
+            "booking": 2,
+            "airbnb": 3,
+        }
+        mock_settings.scraper_max_concurrency = 10
+        mock_settings.max_accommodation_price_per_night = 200
+        yield mock_settings
+
+
+class TestSearchCities:
+    """Test suite for AccommodationOrchestrator.search_cities."""
+
+    @pytest.mark.asyncio
+    async def test_searches_every_city_and_window(self, orchestrator, limits):
+        """Test that each source searches every city in every date range."""
+        cities = ["Lisbon", "Barcelona", "Prague"]
+
+        accommodations = await orchestrator.search_cities(cities, WINDOWS)
+
+        expected = {(city, ci, co) for city in cities for ci, co in WINDOWS}
+        assert set(orchestrator.booking.calls) == expected
+        assert set(orchestrator.airbnb.calls) == expected
+        assert {acc["destination_city"] for acc in accommodations} == set(cities)
+
+    @pytest.mark.asyncio
+    async def test_cities_searched_concurrently_within_limits(self, orchestrator, limits):
+        """Test that searches overlap but never exceed the per-source limits."""
+        cities = [f"City {i}" for i in range(6)]
+
+        await orchestrator.search_cities(cities, WINDOWS[:1])
+
+        assert orchestrator.booking.peak == 2
+        assert orchestrator.airbnb.peak == 3
+
+    @pytest.mark.asyncio
+    async def test_earlier_windows_start_first(self, orchestrator, limits):
+        """Test that the first holiday window is searched before later ones."""
+        limits.get_accommodation_concurrency_limits.return_value = {"booking": 1, "airbnb": 1}
+
+        await orchestrator.search_cities(["Lisbon", "Prague"], WINDOWS)
+
+        check_ins = [call[1] for call in orchestrator.booking.calls]
+        assert check_ins == [WINDOWS[0][0], WINDOWS[0][0], WINDOWS[1][0], WINDOWS[1][0]]
+
+    @pytest.mark.asyncio
+    async def test_stats_grouped_by_source(self, orchestrator, limits):
+        """Test that searches and results are counted per scraper source."""
+
+        async def no_results(*args, **kwargs):
+            return []
+
+        orchestrator.airbnb.search = no_results
+
+        await orchestrator.search_cities(["Lisbon", "Prague"], WINDOWS)
+
+        stats, _ = orchestrator._print_stats_table.call_args.args
+        assert stats == {
+            "Booking.com": {"success": 4, "failed": 0, "accommodations": 4},
+            "Airbnb": {"success": 4, "failed": 0, "accommodations": 0},
+        }
+
+    @pytest.mark.asyncio
+    async def test_no_cities(self, orchestrator, limits):
+        """Test that nothing is searched without cities."""
+        assert await orchestrator.search_cities([], WINDOWS) == []
+        assert orchestrator.booking.calls == []
@@ -208,19 +208,20 @@ class TestAirbnbClient:
     async def test_search_with_apify(self, client, sample_apify_results):
         """Test searching with Apify integration."""
         # Mock Apify client methods
-        mock_actor = MagicMock()
         mock_run = {
+            "id": "test_run_id",
             "defaultDatasetId": "test_dataset_id",
             "stats": {"computeUnits": 0.05},
         }
-        mock_actor.call.return_value = mock_run
 
-        mock_dataset = MagicMock()
-        mock_dataset.iterate_items.return_value = iter(sample_apify_results)
+        async def pages(dataset_id, limit=None):
+            yield sample_apify_results[:2]
+            yield sample_apify_results[2:]
 
         client.apify_client = MagicMock()
-        client.apify_client.actor.return_value = mock_actor
-        client.apify_client.dataset.return_value = mock_dataset
+        client.apify_client.start_actor = AsyncMock(return_value={"id": "test_run_id"})
+        client.apify_client.wait_for_run = AsyncMock(return_value=mock_run)
+        client.apify_client.iterate_dataset_pages = pages
 
         # Perform search
         results = await client.search(
@@ -239,8 +240,11 @@ class TestAirbnbClient:
         # Verify credits were tracked
         assert client.credits_used == 0.05
 
-        # Verify actor was called
-        mock_actor.call.assert_called_once()
+        # Verify actor was started and awaited
+        client.apify_client.start_actor.assert_awaited_once()
+        client.apify_client.wait_for_run.assert_awaited_once_with(
+            "test_run_id", timeout=AirbnbClient.APIFY_RUN_TIMEOUT
+        )
 
     @pytest.mark.asyncio
     async def test_search_fallback_to_playwright(self, client):
@@ -391,7 +395,7 @@ class TestAirbnbClient:
         """Test that Apify errors trigger Playwright fallback."""
         # Mock Apify to raise an error
         client.apify_client = MagicMock()
-        client.apify_client.actor.side_effect = Exception("Apify error")
+        client.apify_client.start_actor = AsyncMock(side_effect=Exception("Apify error"))
 
         # Mock Playwright
         with patch.object(
@@ -19,11 +19,11 @@ def mock_db_connection():
 @pytest.fixture
 def mock_redis():
     """Mock Redis connection."""
-    with patch('app.api.main.aioredis') as mock:
-        redis_mock = AsyncMock()
-        redis_mock.ping = AsyncMock()
-        mock.from_url = AsyncMock(return_value=redis_mock)
-        yield mock
+    redis_mock = AsyncMock()
+    redis_mock.ping = AsyncMock()
+    with patch('app.api.main.get_redis', return_value=redis_mock) as mock:
+        with patch('app.api.main.close_redis_registry', new_callable=AsyncMock):
+            yield mock
 
 
 @pytest.fixture
@@ -217,7 +217,8 @@ class TestLifespan:
         """Test successful startup."""
         from app.api.main import lifespan, app
 
-        with patch('app.api.main.aioredis.from_url') as mock_redis:
+        with patch('app.api.main.get_redis') as mock_redis, \
+                patch('app.api.main.close_redis_registry', new_callable=AsyncMock) as mock_close:
             mock_redis_client = AsyncMock()
             mock_redis_client.ping = AsyncMock()
             mock_redis.return_value = mock_redis_client
@@ -226,17 +227,17 @@ class TestLifespan:
                 with patch('app.api.main.close_db_connections', new_callable=AsyncMock):
                     async with lifespan(app):
                         # During lifespan, connections should be established
-                        pass
+                        mock_redis_client.ping.assert_called_once()
 
-                    # After lifespan, connections should be closed
-                    mock_redis_client.close.assert_called_once()
+                    # After lifespan, the shared pools should be closed
+                    mock_close.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_lifespan_redis_connection_fails(self):
         """Test startup when Redis connection fails."""
         from app.api.main import lifespan, app
 
-        with patch('app.api.main.aioredis.from_url') as mock_redis:
+        with patch('app.api.main.get_redis') as mock_redis:
             mock_redis.side_effect = Exception("Redis connection failed")
 
             with patch('app.api.main.check_db_connection', return_value=True):
@@ -250,7 +251,8 @@ class TestLifespan:
         """Test startup when database check fails."""
         from app.api.main import lifespan, app
 
-        with patch('app.api.main.aioredis.from_url') as mock_redis:
+        with patch('app.api.main.get_redis') as mock_redis, \
+                patch('app.api.main.close_redis_registry', new_callable=AsyncMock):
             mock_redis_client = AsyncMock()
             mock_redis_client.ping = AsyncMock()
             mock_redis.return_value = mock_redis_client
@@ -268,9 +270,10 @@ class TestLifespan:
 
         mock_redis_client = AsyncMock()
         mock_redis_client.ping = AsyncMock()
-        mock_redis_client.close = AsyncMock()
+        mock_close_redis = AsyncMock()
 
-        with patch('app.api.main.aioredis.from_url', return_value=mock_redis_client):
+        with patch('app.api.main.get_redis', return_value=mock_redis_client), \
+                patch('app.api.main.close_redis_registry', mock_close_redis):
             with patch('app.api.main.check_db_connection', return_value=True):
                 mock_close_db = AsyncMock()
                 with patch('app.api.main.close_db_connections', mock_close_db):
@@ -278,7 +281,7 @@ class TestLifespan:
                         pass
 
                     # Verify shutdown was called
-                    mock_redis_client.close.assert_called_once()
+                    mock_close_redis.assert_called_once()
                     mock_close_db.assert_called_once()
 
 
@@ -6,12 +6,16 @@ import pytest
 from unittest.mock import AsyncMock, Mock, patch
 from datetime import datetime, date
 from fastapi.testclient import TestClient
+from sqlalchemy.dialects import postgresql
+
+from app.api.main import app  # imports the v1 package before its route modules
+from app.api.routes.v1.deals import get_deal, get_deals
+from app.models import TripPackage
 
 
 @pytest.fixture
 def test_client():
     """Create a test client for the FastAPI app."""
-    from app.api.main import app
     return TestClient(app)
 
 
@@ -176,3 +180,60 @@ class TestAPIDocumentation:
         response = test_client.get("/redoc")
         assert response.status_code == 200
         assert "text/html" in response.headers.get("content-type", "")
+
+
+class TestDealsEndpoint:
+    """Tests for the v1 deals listing."""
+
+    @staticmethod
+    def make_deal(deal_id, ai_score, provisional):
+        """Create a stored TripPackage."""
+        return TripPackage(
+            id=deal_id,
+            package_type="family",
+            destination_city="Lisbon",
+            departure_date=date(2025, 12, 20),
+            return_date=date(2025, 12, 27),
+            num_nights=7,
+            total_price=1800.0,
+            ai_score=ai_score,
+            ai_score_provisional=provisional,
+            created_at=datetime(2025, 11, 1),
+        )
+
+    @pytest.mark.asyncio
+    async def test_provisional_scores_not_listed_as_ai_deals(self):
+        """Test that min_score filtering leaves out local pre-score estimates."""
+        db = AsyncMock()
+        result = Mock()
+        result.all.return_value = []
+        result.scalars.return_value.all.return_value = [self.make_deal(1, 75, False)]
+        db.execute = AsyncMock(return_value=result)
+
+        with patch("app.api.routes.v1.deals.AsyncSessionLocal") as mock_session:
+            mock_session.return_value.__aenter__.return_value = db
+            response = await get_deals(
+                min_score=70, destination=None, min_price=None, max_price=None,
+                package_type=None, limit=20, offset=0,
+            )
+
+        for call in db.execute.await_args_list:
+            sql = str(call.args[0].compile(dialect=postgresql.dialect()))
+            assert "trip_packages.ai_score_provisional IS false" in sql
+        assert response.deals[0].ai_score_provisional is False
+
+    @pytest.mark.asyncio
+    async def test_provisional_flag_exposed(self):
+        """Test that responses mark local estimates so clients can tell them apart."""
+        deal = self.make_deal(2, 95, True)
+        db = AsyncMock()
+        result = Mock()
+        result.scalar_one_or_none.return_value = deal
+        db.execute = AsyncMock(return_value=result)
+
+        with patch("app.api.routes.v1.deals.AsyncSessionLocal") as mock_session:
+            mock_session.return_value.__aenter__.return_value = db
+            response = await get_deal(2)
+
+        assert response.ai_score_provisional is True
+        assert deal.is_high_score is False
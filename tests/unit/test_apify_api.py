@@ -0,0 +1,361 @@
+"""
+Unit tests for the async Apify API client and AirbnbClient's Apify path.
+
+Requests go over real HTTP to a local fake Apify server running in a thread.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import AsyncMock, patch
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from app.exceptions import ScrapingError
+from app.scrapers.airbnb_scraper import AirbnbClient
+from app.scrapers.apify_api import ApifyApiClient
+
+TOKEN = "test_token"
+
+
+def make_listing(city, index):
+    """Create a raw Apify Airbnb listing."""
+    return {
+        "name": f"{city} Family Apartment {index}",
+        "url": f"https://www.airbnb.com/rooms/{index}",
+        "price": {"rate": f"€{80 + index}"},
+        "bedrooms": 2,
+        "amenities": ["Kitchen", "Wifi"],
+        "rating": 4.7,
+        "reviewsCount": 30,
+        "location": {"city": city},
+        "images": [],
+    }
+
+
+class FakeApifyServer:
+    """
+    Local stand-in for the Apify API.
+
+    Runs stay RUNNING for ``polls_until_done`` status requests (each held
+    open for ``poll_delay`` seconds), then end with ``final_status``. A run's
+    dataset holds ``items_per_run`` listings for the run's locationQuery.
+    """
+
+    def __init__(self, polls_until_done=2, poll_delay=0.05, items_per_run=5,
+                 final_status="SUCCEEDED"):
+        self.polls_until_done = polls_until_done
+        self.poll_delay = poll_delay
+        self.items_per_run = items_per_run
+        self.final_status = final_status
+        self.runs = {}
+        self.requests = []
+        self.events = []  # (event, run id, time)
+        self.lock = threading.Lock()
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _send(self, status, body):
+                payload = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def _authorized(self):
+                if self.headers.get("Authorization") != f"Bearer {TOKEN}":
+                    self._send(401, {"error": {"message": "Unauthorized"}})
+                    return False
+                return True
+
+            def do_POST(self):
+                url = urlparse(self.path)
+                server.requests.append(("POST", url.path))
+                if not self._authorized():
+                    return
+                parts = url.path.strip("/").split("/")
+
+                if parts[1] == "actor-runs" and parts[3] == "abort":
+                    run_id = parts[2]
+                    with server.lock:
+                        server.runs[run_id]["aborted"] = True
+                        server.events.append(("aborted", run_id, time.monotonic()))
+                    self._send(200, {"data": server.run_object(run_id)})
+                    return
+
+                length = int(self.headers.get("Content-Length", 0))
+                run_input = json.loads(self.rfile.read(length))
+                with server.lock:
+                    run_id = f"run{len(server.runs) + 1}"
+                    server.runs[run_id] = {
+                        "input": run_input,
+                        "actor": url.path.split("/")[3],
+                        "polls": 0,
+                    }
+                    server.events.append(("started", run_id, time.monotonic()))
+                self._send(201, {"data": server.run_object(run_id)})
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                query = parse_qs(url.query)
+                server.requests.append(("GET", url.path))
+                if not self._authorized():
+                    return
+                parts = url.path.strip("/").split("/")
+
+                if parts[1] == "actor-runs":
+                    run_id = parts[2]
+                    if int(query.get("waitForFinish", ["0"])[0]) > 0:
+                        time.sleep(server.poll_delay)
+                    with server.lock:
+                        server.runs[run_id]["polls"] += 1
+                        run = server.run_object(run_id)
+                        if run["status"] != "RUNNING":
+                            server.events.append(("finished", run_id, time.monotonic()))
+                    self._send(200, {"data": run})
+
+                elif parts[1] == "datasets":
+                    run_id = parts[2].replace("dataset-", "")
+                    city = server.runs[run_id]["input"]["locationQuery"]
+                    items = [make_listing(city, i) for i in range(server.items_per_run)]
+                    offset = int(query["offset"][0])
+                    limit = int(query["limit"][0])
+                    self._send(200, items[offset:offset + limit])
+
+                else:
+                    self._send(404, {"error": {"message": "Not found"}})
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address
+        return f"http://{host}:{port}"
+
+    def run_object(self, run_id):
+        run = self.runs[run_id]
+        if run.get("aborted"):
+            return {
+                "id": run_id,
+                "status": "ABORTED",
+                "defaultDatasetId": f"dataset-{run_id}",
+                "stats": {"computeUnits": 0.02},
+            }
+        done = run["polls"] >= self.polls_until_done
+        return {
+            "id": run_id,
+            "status": self.final_status if done else "RUNNING",
+            "defaultDatasetId": f"dataset-{run_id}",
+            "stats": {"computeUnits": 0.01} if done else {},
+        }
+
+    def dataset_requests(self):
+        return [path for method, path in self.requests if "/datasets/" in path]
+
+    def abort_requests(self):
+        return [path for method, path in self.requests if path.endswith("/abort")]
+
+
+@pytest.fixture
+def fake_apify():
+    """Start a fake Apify server for one test."""
+    server = FakeApifyServer()
+    server.thread.start()
+    yield server
+    server.httpd.shutdown()
+    server.httpd.server_close()
+
+
+def make_airbnb_client(server):
+    """Create an AirbnbClient talking to the fake server."""
+    client = AirbnbClient(apify_api_key=TOKEN, apify_base_url=server.url)
+    client.apify_client.poll_seconds = 1
+    client.apify_client.page_size = 2
+    return client
+
+
+class TestApifyApiClient:
+    """Test suite for ApifyApiClient."""
+
+    @pytest.mark.asyncio
+    async def test_start_wait_and_page_through_dataset(self, fake_apify):
+        """Test a full run: start, poll until done, read the dataset in pages."""
+        apify = ApifyApiClient(token=TOKEN, base_url=fake_apify.url, poll_seconds=1, page_size=2)
+
+        run = await apify.start_actor("dtrungtin/airbnb-scraper", {"locationQuery": "Lisbon"})
+        assert run["status"] == "RUNNING"
+        run = await apify.wait_for_run(run["id"])
+        pages = [page async for page in apify.iterate_dataset_pages(run["defaultDatasetId"])]
+
+        assert run["status"] == "SUCCEEDED"
+        assert fake_apify.runs[run["id"]]["actor"] == "dtrungtin~airbnb-scraper"
+        assert [len(page) for page in pages] == [2, 2, 1]
+
+    @pytest.mark.asyncio
+    async def test_dataset_limit(self, fake_apify):
+        """Test that reading stops once the item limit is reached."""
+        apify = ApifyApiClient(token=TOKEN, base_url=fake_apify.url, page_size=2)
+        run = await apify.start_actor("actor", {"locationQuery": "Lisbon"})
+
+        pages = [page async for page in apify.iterate_dataset_pages(
+            run["defaultDatasetId"], limit=3
+        )]
+
+        assert [len(page) for page in pages] == [2, 1]
+        assert len(fake_apify.dataset_requests()) == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_run_raises(self, fake_apify):
+        """Test that a failed actor run raises ScrapingError."""
+        fake_apify.final_status = "FAILED"
+        apify = ApifyApiClient(token=TOKEN, base_url=fake_apify.url, poll_seconds=1)
+        run = await apify.start_actor("actor", {"locationQuery": "Lisbon"})
+
+        with pytest.raises(ScrapingError):
+            await apify.wait_for_run(run["id"])
+
+    @pytest.mark.asyncio
+    async def test_wait_timeout(self, fake_apify):
+        """Test that waiting gives up after the timeout."""
+        fake_apify.polls_until_done = 1000
+        apify = ApifyApiClient(token=TOKEN, base_url=fake_apify.url, poll_seconds=1)
+        run = await apify.start_actor("actor", {"locationQuery": "Lisbon"})
+
+        with pytest.raises(asyncio.TimeoutError):
+            await apify.wait_for_run(run["id"], timeout=0.3)
+
+    @pytest.mark.asyncio
+    async def test_http_error_raises(self, fake_apify):
+        """Test that API errors surface as ScrapingError with the status code."""
+        apify = ApifyApiClient(token="wrong_token", base_url=fake_apify.url)
+
+        with pytest.raises(ScrapingError) as exc_info:
+            await apify.start_actor("actor", {})
+
+        assert "401" in str(exc_info.value.details)
+
+
+class TestAirbnbApifySearch:
+    """Test AirbnbClient searches against the fake Apify server."""
+
+    @pytest.mark.asyncio
+    async def test_search_parses_all_pages(self, fake_apify):
+        """Test that listings from every dataset page are parsed."""
+        client = make_airbnb_client(fake_apify)
+
+        results = await client.search(
+            city="Lisbon",
+            check_in=date(2025, 12, 20),
+            check_out=date(2025, 12, 27),
+            max_listings=20,
+        )
+
+        assert len(results) == 5
+        assert results[0]["name"] == "Lisbon Family Apartment 0"
+        assert results[0]["price_per_night"] == 80.0
+        assert client.get_credits_used() == pytest.approx(0.01)
+
+    @pytest.mark.asyncio
+    async def test_search_does_not_block_event_loop(self, fake_apify):
+        """Test that other tasks keep running while the actor run is polled."""
+        fake_apify.polls_until_done = 4
+        fake_apify.poll_delay = 0.1
+        client = make_airbnb_client(fake_apify)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticker_task = asyncio.create_task(ticker())
+        try:
+            await client.search(
+                city="Lisbon", check_in=date(2025, 12, 20), check_out=date(2025, 12, 27)
+            )
+        finally:
+            ticker_task.cancel()
+
+        # The search took about 0.4s; a blocked loop would not have ticked
+        assert ticks >= 10
+
+    @pytest.mark.asyncio
+    async def test_cities_searched_concurrently(self, fake_apify):
+        """Test that runs for several cities are in flight at the same time."""
+        fake_apify.polls_until_done = 3
+        fake_apify.poll_delay = 0.1
+        client = make_airbnb_client(fake_apify)
+        cities = ["Lisbon", "Barcelona", "Prague"]
+
+        results = await asyncio.gather(*(
+            client.search(city=city, check_in=date(2025, 12, 20), check_out=date(2025, 12, 27))
+            for city in cities
+        ))
+
+        assert [result[0]["destination_city"] for result in results] == cities
+        started = [t for event, _, t in fake_apify.events if event == "started"]
+        finished = [t for event, _, t in fake_apify.events if event == "finished"]
+        assert len(started) == 3
+        assert max(started) < min(finished)
+
+    @pytest.mark.asyncio
+    async def test_timed_out_run_is_aborted(self, fake_apify):
+        """Test that a run is aborted (and its credits counted) when waiting times out."""
+        fake_apify.polls_until_done = 1000
+        client = make_airbnb_client(fake_apify)
+        client.APIFY_RUN_TIMEOUT = 0.3
+
+        with patch.object(
+            client, "_scrape_airbnb_direct", new_callable=AsyncMock
+        ) as mock_scrape:
+            mock_scrape.return_value = []
+            await client.search(
+                city="Lisbon", check_in=date(2025, 12, 20), check_out=date(2025, 12, 27)
+            )
+
+        # Falls back to Playwright only after stopping the actor
+        mock_scrape.assert_awaited_once()
+        assert fake_apify.abort_requests() == ["/v2/actor-runs/run1/abort"]
+        assert client.get_credits_used() == pytest.approx(0.02)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_search_aborts_run(self, fake_apify):
+        """Test that cancelling a search (e.g. by the scheduler) aborts its run."""
+        fake_apify.polls_until_done = 1000
+        client = make_airbnb_client(fake_apify)
+
+        task = asyncio.create_task(client.search(
+            city="Lisbon", check_in=date(2025, 12, 20), check_out=date(2025, 12, 27)
+        ))
+        while not fake_apify.runs:
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.1)
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert fake_apify.abort_requests() == ["/v2/actor-runs/run1/abort"]
+        assert fake_apify.runs["run1"]["aborted"] is True
+
+    @pytest.mark.asyncio
+    async def test_finished_run_is_not_aborted(self, fake_apify):
+        """Test that successful searches don't send abort requests."""
+        client = make_airbnb_client(fake_apify)
+
+        await client.search(
+            city="Lisbon", check_in=date(2025, 12, 20), check_out=date(2025, 12, 27)
+        )
+
+        assert fake_apify.abort_requests() == []
@@ -0,0 +1,179 @@
+"""
+Unit tests for the shared Playwright browser pool.
+
+Playwright is mocked so no real browser is launched.
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.scrapers import browser_pool as browser_pool_module
+from app.scrapers.browser_pool import BrowserPool, close_browser_pools, get_browser_pool
+
+
+def make_browser():
+    """Create a mock Chromium browser that hands out mock contexts."""
+    browser = MagicMock()
+    browser.is_connected.return_value = True
+    browser.close = AsyncMock()
+
+    async def new_context(**kwargs):
+        context = MagicMock()
+        context.options = kwargs
+        context.close = AsyncMock()
+        return context
+
+    browser.new_context = AsyncMock(side_effect=new_context)
+    return browser
+
+
+@pytest.fixture
+def mock_playwright():
+    """Patch async_playwright so each launch returns a fresh mock browser."""
+    playwright = MagicMock()
+    playwright.chromium.launch = AsyncMock(side_effect=lambda **kwargs: make_browser())
+    playwright.stop = AsyncMock()
+
+    with patch("app.scrapers.browser_pool.async_playwright") as mock_async_playwright:
+        mock_async_playwright.return_value.start = AsyncMock(return_value=playwright)
+        yield playwright
+
+
+class TestBrowserPool:
+    """Test suite for BrowserPool."""
+
+    @pytest.mark.asyncio
+    async def test_sequential_leases_reuse_warm_browser(self, mock_playwright):
+        """Test that sequential leases reuse one browser instead of relaunching."""
+        pool = BrowserPool(size=2, max_uses=100)
+
+        for _ in range(5):
+            async with pool.lease(locale="en-US") as context:
+                assert context.options == {"locale": "en-US"}
+
+        assert mock_playwright.chromium.launch.await_count == 1
+        assert pool.get_stats()["browsers"] == 1
+        assert pool.get_stats()["active_contexts"] == 0
+
+    @pytest.mark.asyncio
+    async def test_concurrent_leases_grow_to_size(self, mock_playwright):
+        """Test that concurrent leases launch up to size browsers, then share."""
+        pool = BrowserPool(size=2, max_uses=100)
+
+        contexts = [await pool.acquire_context() for _ in range(4)]
+
+        assert mock_playwright.chromium.launch.await_count == 2
+        assert pool.get_stats()["active_contexts"] == 4
+
+        for context in contexts:
+            await pool.release_context(context)
+
+        assert pool.get_stats()["active_contexts"] == 0
+
+    @pytest.mark.asyncio
+    async def test_each_lease_gets_fresh_context(self, mock_playwright):
+        """Test route isolation: every lease creates and closes its own context."""
+        pool = BrowserPool(size=1, max_uses=100)
+
+        async with pool.lease() as first:
+            pass
+        async with pool.lease() as second:
+            pass
+
+        assert first is not second
+        first.close.assert_awaited_once()
+        second.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_browser_recycled_after_max_uses(self, mock_playwright):
+        """Test that a browser is closed and replaced after max_uses contexts."""
+        pool = BrowserPool(size=1, max_uses=2)
+
+        async with pool.lease():
+            pass
+        first_browser = pool._browsers[0].browser
+        async with pool.lease():
+            pass
+
+        # Second use reached max_uses, so the browser was closed once idle
+        first_browser.close.assert_awaited_once()
+        assert pool.get_stats()["recycled"] == 1
+
+        async with pool.lease():
+            pass
+
+        assert mock_playwright.chromium.launch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_retired_browser_waits_for_active_contexts(self, mock_playwright):
+        """Test that recycling doesn't close a browser with live contexts."""
+        pool = BrowserPool(size=1, max_uses=1)
+
+        context = await pool.acquire_context()
+        browser = pool._browsers[0].browser
+
+        browser.close.assert_not_awaited()
+        await pool.release_context(context)
+        browser.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_disconnected_browser_replaced(self, mock_playwright):
+        """Test that a crashed browser is dropped and a new one launched."""
+        pool = BrowserPool(size=1, max_uses=100)
+
+        async with pool.lease():
+            pass
+        pool._browsers[0].browser.is_connected.return_value = False
+
+        stats = await pool.health_check()
+        assert stats["browsers"] == 0
+
+        async with pool.lease():
+            pass
+
+        assert mock_playwright.chromium.launch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_close_shuts_down_everything(self, mock_playwright):
+        """Test that close() closes browsers, open contexts and Playwright."""
+        pool = BrowserPool(size=2, max_uses=100)
+
+        context = await pool.acquire_context()
+        browser = pool._browsers[0].browser
+
+        await pool.close()
+
+        context.close.assert_awaited()
+        browser.close.assert_awaited_once()
+        mock_playwright.stop.assert_awaited_once()
+        assert pool.get_stats()["browsers"] == 0
+
+    @pytest.mark.asyncio
+    async def test_launch_options_passed_to_chromium(self, mock_playwright):
+        """Test that headless/slow_mo/args are used when launching."""
+        pool = BrowserPool(size=1, headless=False, slow_mo=50, launch_args=["--foo"])
+
+        async with pool.lease():
+            pass
+
+        mock_playwright.chromium.launch.assert_awaited_once_with(
+            headless=False, slow_mo=50, args=["--foo"]
+        )
+
+
+class TestSharedPools:
+    """Test the process-wide pool registry."""
+
+    @pytest.mark.asyncio
+    async def test_same_config_shares_pool(self, mock_playwright):
+        """Test that identical launch configs share one pool."""
+        await close_browser_pools()
+
+        assert get_browser_pool(headless=True) is get_browser_pool(headless=True)
+        assert get_browser_pool(headless=True) is not get_browser_pool(
+            headless=True, launch_args=["--other"]
+        )
+
+        await close_browser_pools()
+        assert browser_pool_module._pools == {}
@@ -11,6 +11,7 @@ from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 from app.ai.claude_client import ClaudeClient, ClaudeAPIError
+from app.ai.cost_buffer import ApiCostBuffer
 
 
 class TestClaudeClient:
@@ -27,6 +28,13 @@ class TestClaudeClient:
         redis.ping = AsyncMock(return_value=True)
         return redis
 
+    @pytest.fixture(autouse=True)
+    def redis_registry(self):
+        """Shared Redis pool registry whose heartbeat reports Redis healthy."""
+        registry = Mock(healthy=True)
+        with patch("app.ai.claude_client.get_redis_registry", return_value=registry):
+            yield registry
+
     @pytest.fixture
     def mock_db_session(self):
         """Create a mock database session."""
@@ -37,13 +45,19 @@ class TestClaudeClient:
         return session
 
     @pytest.fixture
-    def claude_client(self, mock_redis, mock_db_session):
+    def cost_buffer(self):
+        """Create a cost buffer that only flushes when asked to."""
+        return ApiCostBuffer(session_factory=MagicMock(), flush_interval=3600)
+
+    @pytest.fixture
+    def claude_client(self, mock_redis, mock_db_session, cost_buffer):
         """Create ClaudeClient instance with mocked dependencies."""
         with patch("app.ai.claude_client.AsyncAnthropic"):
             return ClaudeClient(
                 api_key="test-api-key",
                 redis_client=mock_redis,
                 db_session=mock_db_session,
+                cost_buffer=cost_buffer,
             )
 
     @pytest.fixture
@@ -151,8 +165,8 @@ class TestClaudeClient:
 
         assert "Failed to parse JSON response" in str(exc_info.value)
 
-    async def test_track_cost(self, claude_client, mock_db_session):
-        """Test cost calculation and database logging."""
+    async def test_track_cost(self, claude_client, mock_db_session, cost_buffer):
+        """Test cost calculation and buffered database logging."""
         input_tokens = 1000
         output_tokens = 500
 
@@ -167,51 +181,47 @@ class TestClaudeClient:
         expected_cost = (1000 / 1_000_000) * 3.0 + (500 / 1_000_000) * 15.0
         assert cost == pytest.approx(expected_cost)
 
-        # Verify database logging
-        mock_db_session.add.assert_called_once()
-        mock_db_session.commit.assert_called_once()
-
-        # Verify the ApiCost object
-        api_cost = mock_db_session.add.call_args[0][0]
-        assert api_cost.service == "claude"
-        assert api_cost.model == claude_client.model
-        assert api_cost.input_tokens == input_tokens
-        assert api_cost.output_tokens == output_tokens
-        assert api_cost.cost_usd == pytest.approx(expected_cost)
-        assert api_cost.operation == "test_operation"
-        assert api_cost.prompt_hash == "abc123"
-        assert api_cost.cache_hit is False
-
-    async def test_track_cache_hit(self, claude_client, mock_db_session):
+        # Verify the record is buffered, not committed on the caller's session
+        mock_db_session.add.assert_not_called()
+        mock_db_session.commit.assert_not_called()
+        assert len(cost_buffer.pending) == 1
+
+        # Verify the ApiCost record
+        api_cost = cost_buffer.pending[0]
+        assert api_cost["service"] == "claude"
+        assert api_cost["model"] == claude_client.model
+        assert api_cost["input_tokens"] == input_tokens
+        assert api_cost["output_tokens"] == output_tokens
+        assert api_cost["cost_usd"] == pytest.approx(expected_cost)
+        assert api_cost["operation"] == "test_operation"
+        assert api_cost["prompt_hash"] == "abc123"
+        assert api_cost["cache_hit"] is False
+
+    async def test_track_cache_hit(self, claude_client, cost_buffer):
         """Test tracking a cache hit."""
         await claude_client._track_cache_hit(
             prompt_hash="test_hash", operation="test_op"
         )
 
-        # Verify database logging
-        mock_db_session.add.assert_called_once()
-        mock_db_session.commit.assert_called_once()
-
-        # Verify the ApiCost object for cache hit
-        api_cost = mock_db_session.add.call_args[0][0]
-        assert api_cost.cache_hit is True
-        assert api_cost.input_tokens == 0
-        assert api_cost.output_tokens == 0
-        assert api_cost.cost_usd == 0.0
+        # Verify the ApiCost record for cache hit
+        assert len(cost_buffer.pending) == 1
+        api_cost = cost_buffer.pending[0]
+        assert api_cost["cache_hit"] is True
+        assert api_cost["input_tokens"] == 0
+        assert api_cost["output_tokens"] == 0
+        assert api_cost["cost_usd"] == 0.0
 
-    async def test_track_error(self, claude_client, mock_db_session):
+    async def test_track_error(self, claude_client, cost_buffer):
         """Test tracking an API error."""
         error_message = "API connection failed"
 
         await claude_client._track_error(error_message, operation="test_op")
 
-        # Verify database logging
-        mock_db_session.add.assert_called_once()
-
-        # Verify the ApiCost object for error
-        api_cost = mock_db_session.add.call_args[0][0]
-        assert api_cost.error == error_message
-        assert api_cost.cost_usd == 0.0
+        # Verify the ApiCost record for error
+        assert len(cost_buffer.pending) == 1
+        api_cost = cost_buffer.pending[0]
+        assert api_cost["error"] == error_message
+        assert api_cost["cost_usd"] == 0.0
 
     async def test_analyze_success(self, claude_client, mock_api_response, mock_redis):
         """Test successful analyze call."""
@@ -320,6 +330,62 @@ class TestClaudeClient:
 
         assert "Claude API call failed" in str(exc_info.value)
 
+    @staticmethod
+    def fake_stream(chunks):
+        """Create a stand-in for client.messages.stream() yielding text chunks."""
+
+        async def text_stream():
+            for chunk in chunks:
+                yield chunk
+
+        stream = MagicMock()
+        stream.text_stream = text_stream()
+        stream.get_final_message = AsyncMock(
+            return_value=Mock(
+                content=[Mock(type="text", text="".join(chunks))],
+                usage=Mock(input_tokens=100, output_tokens=50),
+            )
+        )
+        manager = MagicMock()
+        manager.__aenter__ = AsyncMock(return_value=stream)
+        manager.__aexit__ = AsyncMock(return_value=False)
+        return manager
+
+    async def test_analyze_stream(self, claude_client, mock_redis, cost_buffer):
+        """Test streaming delivers text deltas and returns the parsed response."""
+        chunks = ['{"score": ', '85, "rating"', ': "excellent"}']
+        claude_client.client.messages.stream = Mock(return_value=self.fake_stream(chunks))
+        received = []
+
+        async def on_text(text):
+            received.append(text)
+
+        result = await claude_client.analyze_stream(
+            prompt="Score: {deal}", data={"deal": "Lisbon"}, on_text=on_text
+        )
+
+        assert received == chunks
+        assert result["score"] == 85
+        assert result["_tokens"]["total"] == 150
+        assert result["_cost"] > 0
+        assert cost_buffer.pending[0]["output_tokens"] == 50
+        params = claude_client.client.messages.stream.call_args.kwargs
+        assert params["messages"][0]["content"] == "Score: Lisbon"
+        mock_redis.setex.assert_called_once()
+
+    async def test_analyze_stream_cache_hit(self, claude_client, mock_redis):
+        """Test cached responses are returned without streaming."""
+        mock_redis.get.return_value = json.dumps({"score": 70, "_cost": 0.01})
+        claude_client.client.messages.stream = Mock()
+        on_text = AsyncMock()
+
+        result = await claude_client.analyze_stream(prompt="Test", on_text=on_text)
+
+        assert result["score"] == 70
+        assert result["_cache_hit"] is True
+        claude_client.client.messages.stream.assert_not_called()
+        on_text.assert_not_called()
+
     async def test_clear_cache(self, claude_client, mock_redis):
         """Test clearing cached responses."""
         # Mock scan_iter to return some keys
@@ -376,36 +442,109 @@ class TestClaudeClient:
         assert "Paris" in formatted_prompt
         assert "4" in formatted_prompt
 
+    async def test_analyze_sends_static_sections_as_cached_system_prompt(
+        self, claude_client, mock_api_response
+    ):
+        """Test that static template sections go to a cached system prompt."""
+        claude_client._call_api_with_retry = AsyncMock(return_value=mock_api_response)
+
+        await claude_client.analyze(
+            prompt="You score deals.\n\nDEAL:\n{deal}\n\nReturn JSON: {{\"score\": <0-100>}}",
+            data={"deal": "Lisbon €400"},
+        )
+
+        call = claude_client._call_api_with_retry.call_args
+        assert call.args[0] == "DEAL:\nLisbon €400"
+        assert call.kwargs["system"] == [
+            {
+                "type": "text",
+                "text": 'You score deals.\n\nReturn JSON: {"score": <0-100>}',
+                "cache_control": {"type": "ephemeral"},
+            }
+        ]
+
+    async def test_analyze_prompt_caching_disabled(self, claude_client, mock_api_response):
+        """Test that the whole prompt is the user message when caching is off."""
+        claude_client.prompt_caching = False
+        claude_client._call_api_with_retry = AsyncMock(return_value=mock_api_response)
+
+        await claude_client.analyze(
+            prompt="You score deals.\n\nDEAL:\n{deal}", data={"deal": "Lisbon €400"}
+        )
+
+        call = claude_client._call_api_with_retry.call_args
+        assert call.args[0] == "You score deals.\n\nDEAL:\nLisbon €400"
+        assert call.kwargs["system"] is None
+
+    async def test_analyze_records_cache_tokens(
+        self, claude_client, mock_api_response, cost_buffer
+    ):
+        """Test that prompt cache reads and writes are priced and recorded."""
+        claude_client._pricing_loaded = True
+        claude_client.input_cost_per_million = 3.0
+        claude_client.output_cost_per_million = 15.0
+        mock_api_response.usage = Mock(
+            input_tokens=100,
+            output_tokens=50,
+            cache_read_input_tokens=2000,
+            cache_creation_input_tokens=0,
+        )
+        claude_client._call_api_with_retry = AsyncMock(return_value=mock_api_response)
+
+        result = await claude_client.analyze(
+            prompt="Static instructions.\n\n{deal}", data={"deal": "Lisbon"}
+        )
+
+        assert result["_tokens"]["cache_read"] == 2000
+        assert result["_tokens"]["total"] == 2150
+        # 100 input + 2000 cached at 10% = 300 input-equivalent tokens
+        assert result["_cost"] == pytest.approx((300 * 3.0 + 50 * 15.0) / 1_000_000)
+
+        api_cost = cost_buffer.pending[-1]
+        assert api_cost["input_tokens"] == 100
+        assert api_cost["cache_read_tokens"] == 2000
+        assert api_cost["cache_write_tokens"] == 0
+
+    async def test_track_cost_cache_write_premium(self, claude_client):
+        """Test that prompt cache writes cost 25% more than regular input."""
+        claude_client._pricing_loaded = True
+        claude_client.input_cost_per_million = 3.0
+        claude_client.output_cost_per_million = 15.0
+
+        cost = await claude_client.track_cost(
+            input_tokens=0, output_tokens=0, cache_write_tokens=1_000_000
+        )
+
+        assert cost == pytest.approx(3.75)
+
     def test_initialization_with_cache_enabled(self, claude_client):
         """Test that cache is enabled after successful initialization."""
         assert claude_client._cache_enabled is True
 
     async def test_check_redis_health_success(self, claude_client, mock_redis):
-        """Test Redis health check with successful connection."""
-        mock_redis.ping.return_value = True
-
+        """Test Redis health check reads the heartbeat instead of pinging."""
         result = await claude_client._check_redis_health()
 
         assert result is True
         assert claude_client._cache_enabled is True
-        mock_redis.ping.assert_called_once()
+        mock_redis.ping.assert_not_called()
 
-    async def test_check_redis_health_failure(self, claude_client, mock_redis):
-        """Test Redis health check with failed connection."""
-        # Simulate Redis connection failure
-        mock_redis.ping.side_effect = Exception("Connection refused")
+    async def test_check_redis_health_failure(self, claude_client, redis_registry):
+        """Test Redis health check when the heartbeat reports Redis down."""
+        redis_registry.healthy = False
 
-        result = await claude_client._check_redis_health()
+        assert await claude_client._check_redis_health() is False
 
-        assert result is False
-        assert claude_client._cache_enabled is False
+        # Caching resumes once the heartbeat recovers
+        redis_registry.healthy = True
+        assert await claude_client._check_redis_health() is True
 
     async def test_get_cached_response_redis_unavailable(
-        self, claude_client, mock_redis
+        self, claude_client, mock_redis, redis_registry
     ):
         """Test cache retrieval when Redis is unavailable."""
         # Simulate Redis being down
-        mock_redis.ping.side_effect = Exception("Connection refused")
+        redis_registry.healthy = False
 
         result = await claude_client._get_cached_response("test_key")
 
@@ -413,10 +552,10 @@ class TestClaudeClient:
         # Redis get should not be called if health check fails
         mock_redis.get.assert_not_called()
 
-    async def test_cache_response_redis_unavailable(self, claude_client, mock_redis):
+    async def test_cache_response_redis_unavailable(self, claude_client, mock_redis, redis_registry):
         """Test cache storage when Redis is unavailable."""
         # Simulate Redis being down
-        mock_redis.ping.side_effect = Exception("Connection refused")
+        redis_registry.healthy = False
         response = {"score": 85, "rating": "good"}
 
         await claude_client._cache_response("test_key", response)
@@ -424,10 +563,10 @@ class TestClaudeClient:
         # Redis setex should not be called if health check fails
         mock_redis.setex.assert_not_called()
 
-    async def test_clear_cache_redis_unavailable(self, claude_client, mock_redis):
+    async def test_clear_cache_redis_unavailable(self, claude_client, mock_redis, redis_registry):
         """Test clear_cache when Redis is unavailable."""
         # Simulate Redis being down
-        mock_redis.ping.side_effect = Exception("Connection refused")
+        redis_registry.healthy = False
 
         deleted = await claude_client.clear_cache()
 
@@ -435,10 +574,10 @@ class TestClaudeClient:
         # scan_iter should not be called if health check fails
         mock_redis.scan_iter.assert_not_called()
 
-    async def test_get_cache_stats_redis_unavailable(self, claude_client, mock_redis):
+    async def test_get_cache_stats_redis_unavailable(self, claude_client, mock_redis, redis_registry):
         """Test get_cache_stats when Redis is unavailable."""
         # Simulate Redis being down
-        mock_redis.ping.side_effect = Exception("Connection refused")
+        redis_registry.healthy = False
 
         stats = await claude_client.get_cache_stats()
 
@@ -449,9 +588,6 @@ class TestClaudeClient:
 
     async def test_get_cache_stats_redis_available(self, claude_client, mock_redis):
         """Test get_cache_stats when Redis is available."""
-        # Mock successful ping
-        mock_redis.ping.return_value = True
-
         # Mock scan_iter to return some keys
         async def async_gen():
             for _ in range(3):
@@ -466,11 +602,11 @@ class TestClaudeClient:
         assert stats["cache_enabled"] is True
 
     async def test_analyze_continues_without_cache(
-        self, claude_client, mock_redis, mock_api_response
+        self, claude_client, mock_redis, redis_registry, mock_api_response
     ):
         """Test that analyze continues to work even when Redis is down."""
         # Simulate Redis being down
-        mock_redis.ping.side_effect = Exception("Connection refused")
+        redis_registry.healthy = False
 
         # Mock the API call
         claude_client._call_api_with_retry = AsyncMock(return_value=mock_api_response)
@@ -568,3 +704,286 @@ class TestClaudeClient:
         assert cost == 60.0
         assert claude_client.input_cost_per_million == 10.0
         assert claude_client.output_cost_per_million == 50.0
+
+
+class FakeBatchServer:
+    """
+    Minimal local stand-in for the Anthropic Message Batches endpoints.
+
+    Answers each request with a JSON object whose text is produced by
+    ``reply(prompt)``; prompts containing "FAIL" come back as errored results.
+    Batches report "in_progress" for ``polls_until_ended`` status checks.
+    """
+
+    def __init__(self, reply, polls_until_ended: int = 1):
+        from aiohttp import web
+
+        self.reply = reply
+        self.polls_until_ended = polls_until_ended
+        self.batches = {}
+        self.created = []
+        self.cancelled = []
+        self.retrieve_error_status = None
+
+        self.app = web.Application()
+        self.app.router.add_post("/v1/messages/batches", self.create)
+        self.app.router.add_get("/v1/messages/batches/{batch_id}", self.retrieve)
+        self.app.router.add_post("/v1/messages/batches/{batch_id}/cancel", self.cancel)
+        self.app.router.add_get("/v1/messages/batches/{batch_id}/results", self.results)
+
+    def _batch(self, batch_id: str, status: str):
+        requests = self.batches[batch_id]["requests"]
+        failed = sum(1 for r in requests if "FAIL" in r["params"]["messages"][0]["content"])
+        ended = status == "ended"
+        return {
+            "id": batch_id,
+            "type": "message_batch",
+            "processing_status": status,
+            "request_counts": {
+                "processing": 0 if ended else len(requests),
+                "succeeded": len(requests) - failed if ended else 0,
+                "errored": failed if ended else 0,
+                "canceled": 0,
+                "expired": 0,
+            },
+            "created_at": "2025-01-01T00:00:00Z",
+            "expires_at": "2025-01-02T00:00:00Z",
+            "ended_at": "2025-01-01T00:05:00Z" if ended else None,
+            "cancel_initiated_at": None,
+            "archived_at": None,
+            "results_url": f"/v1/messages/batches/{batch_id}/results" if ended else None,
+        }
+
+    async def create(self, request):
+        from aiohttp import web
+
+        body = await request.json()
+        batch_id = f"msgbatch_{len(self.batches) + 1:04d}"
+        self.batches[batch_id] = {"requests": body["requests"], "polls": 0}
+        self.created.append(body["requests"])
+        return web.json_response(self._batch(batch_id, "in_progress"))
+
+    async def retrieve(self, request):
+        from aiohttp import web
+
+        if self.retrieve_error_status is not None:
+            return web.json_response(
+                {"type": "error", "error": {"type": "api_error", "message": "Overloaded"}},
+                status=self.retrieve_error_status,
+            )
+
+        batch_id = request.match_info["batch_id"]
+        batch = self.batches[batch_id]
+        batch["polls"] += 1
+        status = "ended" if batch["polls"] >= self.polls_until_ended else "in_progress"
+        return web.json_response(self._batch(batch_id, status))
+
+    async def cancel(self, request):
+        from aiohttp import web
+
+        batch_id = request.match_info["batch_id"]
+        self.cancelled.append(batch_id)
+        return web.json_response(self._batch(batch_id, "canceling"))
+
+    async def results(self, request):
+        from aiohttp import web
+
+        lines = []
+        for entry in self.batches[request.match_info["batch_id"]]["requests"]:
+            prompt = entry["params"]["messages"][0]["content"]
+            if "FAIL" in prompt:
+                result = {
+                    "type": "errored",
+                    "error": {
+                        "type": "error",
+                        "error": {"type": "invalid_request_error", "message": "bad prompt"},
+                    },
+                }
+            else:
+                result = {
+                    "type": "succeeded",
+                    "message": {
+                        "id": f"msg_{entry['custom_id']}",
+                        "type": "message",
+                        "role": "assistant",
+                        "model": entry["params"]["model"],
+                        "content": [{"type": "text", "text": self.reply(prompt)}],
+                        "stop_reason": "end_turn",
+                        "stop_sequence": None,
+                        "usage": {"input_tokens": 100, "output_tokens": 50},
+                    },
+                }
+            lines.append(json.dumps({"custom_id": entry["custom_id"], "result": result}))
+        return web.Response(text="\n".join(lines) + "\n", content_type="application/x-jsonl")
+
+
+class TestAnalyzeBatch:
+    """Tests for ClaudeClient.analyze_batch against a local fake batch endpoint."""
+
+    @pytest.fixture
+    def cache(self):
+        return {}
+
+    @pytest.fixture
+    def mock_redis(self, cache):
+        """Dict-backed Redis double so cached responses round-trip."""
+        redis = AsyncMock()
+        redis.get = AsyncMock(side_effect=lambda key: cache.get(key))
+        redis.setex = AsyncMock(side_effect=lambda key, ttl, value: cache.__setitem__(key, value))
+        redis.ping = AsyncMock(return_value=True)
+        return redis
+
+    @pytest.fixture
+    def mock_db_session(self):
+        session = AsyncMock()
+        session.add = MagicMock()
+        return session
+
+    @pytest.fixture
+    def fake_server(self):
+        return FakeBatchServer(
+            reply=lambda prompt: json.dumps({"echo": prompt}), polls_until_ended=2
+        )
+
+    @pytest.fixture
+    async def batch_client(self, fake_server, mock_redis, mock_db_session):
+        from aiohttp.test_utils import TestServer
+        from anthropic import AsyncAnthropic
+
+        server = TestServer(fake_server.app)
+        await server.start_server()
+
+        client = ClaudeClient(
+            api_key="test-api-key", redis_client=mock_redis, db_session=None
+        )
+        client.client = AsyncAnthropic(
+            api_key="test-api-key", base_url=str(server.make_url("")), max_retries=0
+        )
+        client.db_session = mock_db_session
+        client.cost_buffer = ApiCostBuffer(session_factory=MagicMock(), flush_interval=3600)
+        client._pricing_loaded = True
+        client.input_cost_per_million = 3.0
+        client.output_cost_per_million = 15.0
+
+        yield client
+
+        await client.client.close()
+        await server.close()
+
+    async def test_results_fan_out_in_request_order(self, batch_client, fake_server):
+        from app.ai.claude_client import AnalyzeRequest
+
+        requests = [
+            AnalyzeRequest(prompt="Score {name}", data={"name": name}, operation="event_scoring")
+            for name in ["a", "b", "c"]
+        ]
+
+        results = await batch_client.analyze_batch(requests, poll_interval=0.01)
+
+        assert [r["echo"] for r in results] == ["Score a", "Score b", "Score c"]
+        assert len(fake_server.created) == 1
+        assert len(fake_server.created[0]) == 3
+        assert results[0]["_tokens"] == {
+            "input": 100,
+            "output": 50,
+            "cache_read": 0,
+            "cache_write": 0,
+            "total": 150,
+        }
+
+    async def test_batch_discount_and_cost_tracking(
+        self, batch_client, fake_server, mock_db_session
+    ):
+        from app.ai.claude_client import AnalyzeRequest
+
+        results = await batch_client.analyze_batch(
+            [AnalyzeRequest(prompt="one", operation="event_scoring")], poll_interval=0.01
+        )
+
+        # Standard price for 100 in / 50 out is $0.00105; batches cost half
+        assert results[0]["_cost"] == pytest.approx(0.000525)
+
+        api_cost = batch_client.cost_buffer.pending[-1]
+        assert api_cost["operation"] == "event_scoring"
+        assert api_cost["cost_usd"] == pytest.approx(0.000525)
+        assert json.loads(api_cost["extra_metadata"]) == {"batch_id": "msgbatch_0001"}
+
+    async def test_reuses_response_cache(self, batch_client, fake_server, mock_db_session):
+        from app.ai.claude_client import AnalyzeRequest
+
+        await batch_client.analyze_batch([AnalyzeRequest(prompt="cached")], poll_interval=0.01)
+        results = await batch_client.analyze_batch(
+            [AnalyzeRequest(prompt="cached"), AnalyzeRequest(prompt="fresh")],
+            poll_interval=0.01,
+        )
+
+        assert results[0]["echo"] == "cached"
+        assert results[0]["_cache_hit"] is True
+        assert results[1]["echo"] == "fresh"
+        # Only the uncached prompt went into the second batch
+        assert [r["params"]["messages"][0]["content"] for r in fake_server.created[1]] == [
+            "fresh"
+        ]
+
+    async def test_duplicate_prompts_sent_once(self, batch_client, fake_server):
+        from app.ai.claude_client import AnalyzeRequest
+
+        results = await batch_client.analyze_batch(
+            [AnalyzeRequest(prompt="same"), AnalyzeRequest(prompt="same")],
+            use_cache=False,
+            poll_interval=0.01,
+        )
+
+        assert len(fake_server.created[0]) == 1
+        assert results[0] == results[1]
+        assert results[0] is not results[1]
+
+    async def test_failed_items_return_errors(self, batch_client):
+        from app.ai.claude_client import AnalyzeRequest
+
+        results = await batch_client.analyze_batch(
+            [
+                AnalyzeRequest(prompt="ok"),
+                AnalyzeRequest(prompt="FAIL please"),
+                AnalyzeRequest(prompt="Missing {key}", data={"other": 1}),
+            ],
+            poll_interval=0.01,
+        )
+
+        assert results[0]["echo"] == "ok"
+        assert isinstance(results[1], ClaudeAPIError)
+        assert "bad prompt" in str(results[1])
+        assert isinstance(results[2], ClaudeAPIError)
+
+    async def test_splits_into_max_sized_batches(self, batch_client, fake_server):
+        from app.ai.claude_client import AnalyzeRequest
+
+        with patch("app.ai.claude_client.settings.claude_batch_max_requests", 2):
+            results = await batch_client.analyze_batch(
+                [AnalyzeRequest(prompt=f"p{i}") for i in range(5)], poll_interval=0.01
+            )
+
+        assert [len(batch) for batch in fake_server.created] == [2, 2, 1]
+        assert [r["echo"] for r in results] == [f"p{i}" for i in range(5)]
+
+    async def test_timeout_cancels_batch(self, batch_client, fake_server):
+        from app.ai.claude_client import AnalyzeRequest
+
+        fake_server.polls_until_ended = 1000
+
+        with pytest.raises(ClaudeAPIError, match="did not finish"):
+            await batch_client.analyze_batch(
+                [AnalyzeRequest(prompt="slow")], poll_interval=0.01, timeout=0.05
+            )
+
+        assert fake_server.cancelled == ["msgbatch_0001"]
+
+    async def test_polling_error_cancels_batch(self, batch_client, fake_server):
+        from app.ai.claude_client import AnalyzeRequest
+
+        fake_server.retrieve_error_status = 529
+
+        with pytest.raises(ClaudeAPIError, match="message batch failed"):
+            await batch_client.analyze_batch([AnalyzeRequest(prompt="slow")], poll_interval=0.01)
+
+        assert fake_server.cancelled == ["msgbatch_0001"]
@@ -0,0 +1,83 @@
+"""
+Unit tests for the adaptive concurrency limiter and session locks.
+"""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.utils.concurrency import AdaptiveConcurrencyLimiter, get_session_lock
+
+
+class TestAdaptiveConcurrencyLimiter:
+    """Test suite for AdaptiveConcurrencyLimiter."""
+
+    @pytest.mark.asyncio
+    async def test_caps_in_flight_calls(self):
+        """Test that no more than the limit run at once."""
+        limiter = AdaptiveConcurrencyLimiter(max_concurrency=3)
+        active = 0
+        peak = 0
+
+        async def call():
+            nonlocal active, peak
+            async with limiter:
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+
+        await asyncio.gather(*(call() for _ in range(10)))
+
+        assert peak == 3
+        assert limiter.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_halves_and_successes_recover(self):
+        """Test multiplicative decrease and additive increase of the cap."""
+        limiter = AdaptiveConcurrencyLimiter(max_concurrency=8, cooldown_seconds=0)
+
+        limiter.record_rate_limit()
+        limiter.record_rate_limit()
+        assert limiter.limit == 2
+        assert limiter.rate_limits == 2
+
+        for _ in range(2):
+            limiter.record_success()
+        assert limiter.limit == 3
+
+        for _ in range(100):
+            limiter.record_success()
+        assert limiter.limit == 8
+
+    @pytest.mark.asyncio
+    async def test_never_below_minimum(self):
+        """Test that backing off stops at min_concurrency."""
+        limiter = AdaptiveConcurrencyLimiter(max_concurrency=4, min_concurrency=2, cooldown_seconds=0)
+
+        for _ in range(5):
+            limiter.record_rate_limit()
+
+        assert limiter.limit == 2
+
+    def test_invalid_bounds(self):
+        """Test that inconsistent bounds are rejected."""
+        with pytest.raises(ValueError):
+            AdaptiveConcurrencyLimiter(max_concurrency=2, min_concurrency=3)
+
+
+class TestGetSessionLock:
+    """Test suite for get_session_lock."""
+
+    def test_same_lock_per_session(self):
+        """Test that one session always yields the same lock."""
+        session = MagicMock(info={})
+        other = MagicMock(info={})
+
+        assert get_session_lock(session) is get_session_lock(session)
+        assert get_session_lock(session) is not get_session_lock(other)
+
+    def test_session_without_info_dict(self):
+        """Test that objects without an info dict get a usable lock."""
+        assert isinstance(get_session_lock(object()), asyncio.Lock)
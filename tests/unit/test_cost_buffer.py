@@ -0,0 +1,147 @@
+"""
+Unit tests for ApiCostBuffer.
+
+Flushes go to a session double that keeps committed rows in a list.
+"""
+
+import asyncio
+
+import pytest
+
+from app.ai.cost_buffer import ApiCostBuffer
+
+
+def make_row(cost=0.01, **overrides):
+    """Create ApiCost column values as ClaudeClient records them."""
+    row = {
+        "service": "claude",
+        "model": "claude-test",
+        "input_tokens": 100,
+        "output_tokens": 50,
+        "cache_read_tokens": 0,
+        "cache_write_tokens": 0,
+        "cost_usd": cost,
+        "operation": "deal_scoring",
+        "prompt_hash": None,
+        "cache_hit": False,
+        "error": None,
+        "extra_metadata": None,
+    }
+    row.update(overrides)
+    return row
+
+
+class FakeSession:
+    """Async session double: executed rows become visible on commit."""
+
+    def __init__(self, table):
+        self.table = table
+        self.staged = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def execute(self, statement, rows):
+        assert statement.table.name == "api_costs"
+        self.staged.extend(rows)
+
+    async def commit(self):
+        self.table.extend(self.staged)
+        self.staged = []
+
+
+@pytest.fixture
+def table():
+    """Committed api_costs rows."""
+    return []
+
+
+@pytest.fixture
+def session_factory(table):
+    return lambda: FakeSession(table)
+
+
+class TestApiCostBuffer:
+    """Tests for buffering and bulk flushing."""
+
+    async def test_record_does_not_write(self, session_factory, table):
+        buffer = ApiCostBuffer(session_factory, max_batch_size=10, flush_interval=3600)
+
+        buffer.record(make_row())
+
+        assert buffer.pending == [make_row()]
+        assert table == []
+
+    async def test_flushes_when_batch_is_full(self, session_factory, table):
+        buffer = ApiCostBuffer(session_factory, max_batch_size=3, flush_interval=3600)
+
+        for _ in range(3):
+            buffer.record(make_row())
+        await asyncio.sleep(0.05)
+
+        assert buffer.pending == []
+        assert buffer.written == 3
+        assert len(table) == 3
+
+    async def test_flushes_after_interval(self, session_factory, table):
+        buffer = ApiCostBuffer(session_factory, max_batch_size=100, flush_interval=0.01)
+
+        buffer.record(make_row())
+        buffer.record(make_row(cache_hit=True, cost_usd=0.0))
+        await asyncio.sleep(0.1)
+
+        assert buffer.written == 2
+        assert len(table) == 2
+
+    async def test_close_writes_remaining_rows(self, session_factory, table):
+        buffer = ApiCostBuffer(session_factory, max_batch_size=100, flush_interval=3600)
+        for cost in (0.01, 0.02, 0.03):
+            buffer.record(make_row(cost=cost))
+
+        await buffer.close()
+
+        assert len(table) == 3
+        assert sum(row["cost_usd"] for row in table) == pytest.approx(0.06)
+        assert buffer.written_cost_usd == pytest.approx(buffer.recorded_cost_usd)
+
+    async def test_failed_flush_keeps_rows_for_retry(self, session_factory, table):
+        calls = 0
+
+        def flaky_factory():
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise ConnectionError("database unavailable")
+            return session_factory()
+
+        buffer = ApiCostBuffer(flaky_factory, max_batch_size=100, flush_interval=3600)
+        buffer.record(make_row(cost=0.01))
+        buffer.record(make_row(cost=0.02))
+
+        assert await buffer.flush() == 0
+        assert buffer.failed_flushes == 1
+        assert len(buffer.pending) == 2
+
+        buffer.record(make_row(cost=0.04))
+        await buffer.close()
+
+        assert [row["cost_usd"] for row in table] == [0.01, 0.02, 0.04]
+        assert buffer.recorded == buffer.written == 3
+
+    async def test_concurrent_recording_is_exact(self, session_factory, table):
+        buffer = ApiCostBuffer(session_factory, max_batch_size=7, flush_interval=0.005)
+
+        async def worker(index):
+            for _ in range(20):
+                buffer.record(make_row(cost=0.001 * (index + 1)))
+                await asyncio.sleep(0)
+
+        await asyncio.gather(*(worker(i) for i in range(5)))
+        await buffer.close()
+
+        assert len(table) == 100
+        expected = sum(0.001 * (i + 1) * 20 for i in range(5))
+        assert sum(row["cost_usd"] for row in table) == pytest.approx(expected)
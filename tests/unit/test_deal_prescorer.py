@@ -0,0 +1,186 @@
+"""
+Unit tests for DealPreScorer.
+
+Uses a session double that answers each query by the entity it selects, so
+the bulk loaders run unchanged.
+"""
+
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.ai.deal_prescorer import DealPreScorer
+from app.models.accommodation import Accommodation
+from app.models.event import Event
+from app.models.price_history import PriceHistory
+from app.models.school_holiday import SchoolHoliday
+from app.models.trip_package import TripPackage
+
+
+def make_package(package_id=1, flight_price=150.0, **overrides):
+    """Create a trip package for pre-scoring tests."""
+    fields = dict(
+        id=package_id,
+        package_type="family",
+        destination_city="Lisbon",
+        departure_date=date(2025, 7, 7),
+        return_date=date(2025, 7, 14),
+        num_nights=7,
+        total_price=1000.0,
+        flights_json={
+            "origin_airport": "MUC",
+            "destination_airport": "LIS",
+            "price_per_person": flight_price,
+        },
+        events_json=[],
+    )
+    fields.update(overrides)
+    return TripPackage(**fields)
+
+
+def make_session(prices=(), holidays=(), accommodations=(), events=()):
+    """Create a session double returning the given rows per queried entity."""
+    rows = {
+        PriceHistory: [("MUC-LIS", price) for price in prices],
+        SchoolHoliday: list(holidays),
+        Accommodation: list(accommodations),
+        Event: list(events),
+    }
+
+    async def execute(statement):
+        entity = statement.column_descriptions[0]["entity"]
+        result = MagicMock()
+        result.all.return_value = rows[entity]
+        result.scalars.return_value.all.return_value = rows[entity]
+        return result
+
+    session = AsyncMock()
+    session.execute = AsyncMock(side_effect=execute)
+    return session
+
+
+class TestComponents:
+    """Tests for the individual score components."""
+
+    async def test_cheaper_than_history_scores_higher(self):
+        session = make_session(prices=[100, 150, 200, 250])
+        prescorer = DealPreScorer(session)
+
+        cheap, typical, expensive = await prescorer.score_packages(
+            [
+                make_package(1, flight_price=90),
+                make_package(2, flight_price=175),
+                make_package(3, flight_price=300),
+            ]
+        )
+
+        assert cheap["price"] == 100.0
+        assert typical["price"] == 50.0
+        assert expensive["price"] == 0.0
+        assert cheap["score"] > typical["score"] > expensive["score"]
+
+    async def test_missing_data_is_neutral(self):
+        prescorer = DealPreScorer(make_session())
+
+        (estimate,) = await prescorer.score_packages([make_package(events_json=None)])
+
+        assert estimate["accommodation"] == DealPreScorer.NEUTRAL_SCORE
+        assert estimate["price"] == DealPreScorer.NEUTRAL_SCORE
+        assert estimate["events"] == DealPreScorer.NEUTRAL_SCORE
+        # Family trip entirely outside school holidays
+        assert estimate["holiday"] == 0.0
+
+    async def test_holiday_fit_for_family_trips_only(self):
+        session = make_session(holidays=[(date(2025, 7, 10), date(2025, 9, 1))])
+        prescorer = DealPreScorer(session)
+
+        family, escape = await prescorer.score_packages(
+            [make_package(1), make_package(2, package_type="parent_escape")]
+        )
+
+        # 5 of 8 trip days (Jul 10-14) fall in the holidays
+        assert family["holiday"] == 62.5
+        assert escape["holiday"] == DealPreScorer.NEUTRAL_SCORE
+
+    async def test_accommodation_and_events_use_existing_scorers(self):
+        accommodation = Accommodation(
+            id=7,
+            destination_city="Lisbon",
+            name="Family Apartment",
+            type="apartment",
+            bedrooms=2,
+            price_per_night=80.0,
+            family_friendly=True,
+            has_kitchen=True,
+            has_kids_club=False,
+            rating=9.0,
+            review_count=150,
+            source="booking.com",
+        )
+        event = Event(
+            id=11,
+            title="Puppet show",
+            event_date=date(2025, 7, 9),
+            destination_city="Lisbon",
+            category="family",
+            ai_relevance_score=9.0,
+            price_range="free",
+            source="tourism",
+        )
+        session = make_session(accommodations=[accommodation], events=[event])
+        scorer = MagicMock()
+        scorer.score_accommodation.return_value = {"overall_score": 88.0}
+        prescorer = DealPreScorer(session, accommodation_scorer=scorer)
+
+        (estimate,) = await prescorer.score_packages(
+            [make_package(accommodation_id=7, events_json=[11])]
+        )
+
+        scorer.score_accommodation.assert_called_once_with(accommodation)
+        assert estimate["accommodation"] == 88.0
+        # 90 (AI relevance) + 20 (free), capped at 100
+        assert estimate["events"] == 100.0
+
+
+class TestScorePackages:
+    """Tests for the combined score."""
+
+    async def test_loads_reference_data_once_per_batch(self):
+        session = make_session(prices=[100, 200])
+        prescorer = DealPreScorer(session)
+        packages = [make_package(i, accommodation_id=i, events_json=[i]) for i in range(50)]
+
+        estimates = await prescorer.score_packages(packages)
+
+        assert len(estimates) == 50
+        # price history, holidays, accommodations, events
+        assert session.execute.await_count == 4
+
+    async def test_score_is_weighted_component_sum(self):
+        prescorer = DealPreScorer(make_session(prices=[100, 200]))
+
+        (estimate,) = await prescorer.score_packages([make_package(flight_price=150)])
+
+        expected = (
+            estimate["accommodation"] * DealPreScorer.WEIGHT_ACCOMMODATION
+            + estimate["price"] * DealPreScorer.WEIGHT_PRICE
+            + estimate["holiday"] * DealPreScorer.WEIGHT_HOLIDAY
+            + estimate["events"] * DealPreScorer.WEIGHT_EVENTS
+        )
+        assert estimate["score"] == pytest.approx(expected, abs=0.01)
+
+    async def test_query_errors_fall_back_to_neutral(self):
+        session = AsyncMock()
+        session.execute = AsyncMock(side_effect=RuntimeError("db down"))
+        prescorer = DealPreScorer(session)
+
+        (estimate,) = await prescorer.score_packages([make_package(accommodation_id=1)])
+
+        assert estimate["price"] == DealPreScorer.NEUTRAL_SCORE
+        assert estimate["accommodation"] == DealPreScorer.NEUTRAL_SCORE
+
+    async def test_empty_batch(self):
+        session = make_session()
+        assert await DealPreScorer(session).score_packages([]) == []
+        session.execute.assert_not_awaited()
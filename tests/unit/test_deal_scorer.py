@@ -5,11 +5,17 @@ Tests the AI-powered deal scoring system with mocked Claude API responses
 to ensure correct filtering, scoring, and data handling.
 """
 
+import asyncio
+
+import httpx
 import pytest
+from anthropic import RateLimitError
 from datetime import date, datetime
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
+from app.ai.claude_client import ClaudeAPIError
 from app.ai.deal_scorer import DealScorer, create_deal_scorer
+from app.config import settings
 from app.models.trip_package import TripPackage
 from app.models.accommodation import Accommodation
 
@@ -342,3 +348,278 @@ class TestDealScorer:
                 assert isinstance(scorer, DealScorer)
                 assert scorer.price_threshold == 250.0
                 assert scorer.analyze_all is True
+
+
+class TestScoreBatch:
+    """Test suite for concurrent, budget-aware batch scoring."""
+
+    @pytest.fixture
+    def mock_db_session(self):
+        """Create a mock database session with an empty price history."""
+        session = AsyncMock()
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = []
+        session.execute = AsyncMock(return_value=result)
+        return session
+
+    @staticmethod
+    def make_package(package_id, total_price, flight_price=150.0):
+        """Create a trip package without an accommodation."""
+        return TripPackage(
+            id=package_id,
+            package_type="family",
+            destination_city="Lisbon",
+            departure_date=date(2025, 6, 15),
+            return_date=date(2025, 6, 22),
+            num_nights=7,
+            total_price=total_price,
+            flights_json={
+                "origin_airport": "MUC",
+                "destination_airport": "LIS",
+                "price_per_person": flight_price,
+            },
+            events_json=[],
+        )
+
+    @staticmethod
+    def make_scorer(claude_client, db_session):
+        return DealScorer(claude_client=claude_client, db_session=db_session)
+
+    @staticmethod
+    def response(score=80, cost=0.01, **extra):
+        return {"score": score, "reasoning": "ok", "_cost": cost, **extra}
+
+    async def test_concurrent_cheapest_first_with_group_commits(self, mock_db_session):
+        """Test bounded concurrency, cheapest-first ordering and grouped commits."""
+        started = []
+        active = 0
+        peak = 0
+
+        async def analyze(prompt, data, **kwargs):
+            nonlocal active, peak
+            started.append(data["total_cost"])
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return self.response()
+
+        client = AsyncMock()
+        client.analyze = AsyncMock(side_effect=analyze)
+        scorer = self.make_scorer(client, mock_db_session)
+        packages = [self.make_package(i, price) for i, price in enumerate([1500, 900, 1200, 700, 1100])]
+
+        report = await scorer.score_batch(
+            packages, max_concurrency=2, budget_usd=10.0, commit_batch_size=2
+        )
+
+        assert report.scored == 5
+        assert peak == 2
+        assert started[:2] == [700.0, 900.0]
+        assert all(p.ai_score == 80 for p in packages)
+        # 2 + 2 + final 1
+        assert mock_db_session.commit.await_count == 3
+
+    async def test_stops_at_budget(self, mock_db_session):
+        """Test that no new calls start once the spend reaches the budget."""
+        client = AsyncMock()
+        client.analyze = AsyncMock(return_value=self.response(cost=0.4))
+        scorer = self.make_scorer(client, mock_db_session)
+        packages = [self.make_package(i, 1000 + i) for i in range(5)]
+
+        report = await scorer.score_batch(packages, max_concurrency=1, budget_usd=1.0)
+
+        assert report.scored == 3
+        assert report.not_scored == 2
+        assert report.budget_exhausted is True
+        assert report.spent_usd == pytest.approx(1.2)
+
+    async def test_cache_hits_are_free(self, mock_db_session):
+        """Test that cached responses do not count against the budget."""
+        client = AsyncMock()
+        client.analyze = AsyncMock(return_value=self.response(cost=0.5, _cache_hit=True))
+        scorer = self.make_scorer(client, mock_db_session)
+
+        report = await scorer.score_batch(
+            [self.make_package(i, 1000) for i in range(4)], budget_usd=0.1
+        )
+
+        assert report.scored == 4
+        assert report.spent_usd == 0.0
+
+    async def test_rate_limit_reduces_concurrency_and_retries(self, mock_db_session):
+        """Test that a rate-limited package is retried after backing off."""
+        rate_limit = RateLimitError(
+            "rate limited",
+            response=httpx.Response(429, request=httpx.Request("POST", "https://api.anthropic.com")),
+            body=None,
+        )
+        api_error = ClaudeAPIError("Claude API call failed")
+        api_error.__cause__ = rate_limit
+
+        client = AsyncMock()
+        client.analyze = AsyncMock(side_effect=[api_error, self.response(), self.response()])
+        scorer = self.make_scorer(client, mock_db_session)
+
+        with patch.object(settings, "ai_scoring_rate_limit_cooldown", 0.0):
+            report = await scorer.score_batch(
+                [self.make_package(1, 1000), self.make_package(2, 1100)],
+                max_concurrency=1,
+                budget_usd=10.0,
+            )
+
+        assert report.scored == 2
+        assert report.failed == 0
+        assert report.rate_limits == 1
+        assert client.analyze.await_count == 3
+
+    async def test_threshold_and_failures_counted(self, mock_db_session):
+        """Test that over-threshold packages are skipped and errors don't stop the batch."""
+        client = AsyncMock()
+        client.analyze = AsyncMock(side_effect=[ClaudeAPIError("bad json"), self.response()])
+        scorer = self.make_scorer(client, mock_db_session)
+        outcomes = []
+
+        report = await scorer.score_batch(
+            [
+                self.make_package(1, 1000),
+                self.make_package(2, 1100),
+                self.make_package(3, 900, flight_price=450.0),
+            ],
+            max_concurrency=1,
+            budget_usd=10.0,
+            on_result=lambda package, status, response: outcomes.append((package.id, status)),
+        )
+
+        assert (report.scored, report.skipped, report.failed) == (1, 1, 1)
+        assert outcomes == [(3, "skipped"), (1, "failed"), (2, "scored")]
+
+    async def test_near_duplicate_reuses_signature_cache(self, mock_db_session):
+        """Test that near-duplicate packages are scored once and reported in cache stats."""
+        from app.ai.deal_signature_cache import DealSignatureCache
+
+        store = {}
+        redis = AsyncMock()
+        redis.get = AsyncMock(side_effect=lambda key: store.get(key))
+        redis.setex = AsyncMock(side_effect=lambda key, ttl, value: store.__setitem__(key, value))
+
+        client = AsyncMock()
+        client.analyze = AsyncMock(return_value=self.response(score=77, cost=0.02))
+        client.get_cache_stats = AsyncMock(return_value={"cached_responses": 1})
+        scorer = DealScorer(
+            claude_client=client,
+            db_session=mock_db_session,
+            signature_cache=DealSignatureCache(redis),
+        )
+
+        # Same trip, €3 apart: the second one reuses the first one's score
+        first = await scorer.score_batch([self.make_package(1, 1000.0)], budget_usd=10.0)
+        second = await scorer.score_batch([self.make_package(2, 1003.0)], budget_usd=10.0)
+
+        client.analyze.assert_called_once()
+        assert second.results[0]["package"].ai_score == 77
+        assert second.results[0]["_signature_hit"] is True
+        assert first.spent_usd == 0.02
+        assert second.spent_usd == 0.0
+
+        stats = await scorer.get_cache_stats()
+        assert stats["signature_hits"] == 1
+        assert stats["signature_misses"] == 1
+        assert stats["signature_hit_rate"] == 0.5
+        assert stats["api_calls"] == 1
+        assert stats["overall_hit_rate"] == 0.5
+        assert stats["exact_cache"] == {"cached_responses": 1}
+
+
+    async def test_prescore_sends_only_top_slice_to_claude(self, mock_db_session):
+        """Test that large batches are pre-scored and only the best slice hits Claude."""
+        local_scores = {0: 40.0, 1: 90.0, 2: 60.0, 3: 75.0, 4: 20.0}
+
+        prescorer = AsyncMock()
+        prescorer.score_packages = AsyncMock(
+            side_effect=lambda packages: [
+                {
+                    "score": local_scores[p.id],
+                    "accommodation": 50.0,
+                    "price": 50.0,
+                    "holiday": 50.0,
+                    "events": 50.0,
+                }
+                for p in packages
+            ]
+        )
+        client = AsyncMock()
+        client.analyze = AsyncMock(return_value=self.response(score=85))
+        scorer = DealScorer(
+            claude_client=client, db_session=mock_db_session, prescorer=prescorer
+        )
+        packages = [self.make_package(i, 1000.0 + i) for i in range(5)]
+        statuses = []
+
+        with patch.multiple(
+            settings,
+            ai_prescore_claude_fraction=0.4,
+            ai_prescore_min_claude=1,
+            ai_prescore_max_claude=10,
+        ):
+            report = await scorer.score_batch(
+                packages,
+                budget_usd=10.0,
+                on_result=lambda package, status, response: statuses.append(status),
+            )
+
+        prescorer.score_packages.assert_awaited_once()
+        assert client.analyze.await_count == 2
+        assert {r["package"].id for r in report.results} == {1, 3}
+        assert all(not r["package"].ai_score_provisional for r in report.results)
+
+        assert report.estimated == 3
+        assert statuses.count("estimated") == 3
+        assert packages[4].ai_score == 20.0
+        assert packages[4].ai_score_provisional is True
+        assert packages[4].ai_reasoning.startswith("Local estimate")
+        mock_db_session.commit.assert_awaited()
+
+    async def test_small_batch_skips_prescoring(self, mock_db_session):
+        """Test that batches within the Claude slice are not pre-scored."""
+        prescorer = AsyncMock()
+        client = AsyncMock()
+        client.analyze = AsyncMock(return_value=self.response())
+        scorer = DealScorer(
+            claude_client=client, db_session=mock_db_session, prescorer=prescorer
+        )
+
+        with patch.object(settings, "ai_prescore_min_claude", 20):
+            report = await scorer.score_batch(
+                [self.make_package(i, 1000.0) for i in range(3)], budget_usd=10.0
+            )
+
+        prescorer.score_packages.assert_not_called()
+        assert report.scored == 3
+        assert report.estimated == 0
+
+
+class TestPriceContext:
+    """Test suite for the route price context in prompts."""
+
+    async def test_route_stats_loaded_once_for_many_packages(self):
+        """Test that price context comes from one memoized aggregate query."""
+        session = AsyncMock()
+        session.bind = MagicMock()
+        session.bind.dialect.name = "postgresql"
+        result = MagicMock()
+        result.all.return_value = [("MUC-LIS", 40, 200.0, 120.0, 310.0, 170.0, 195.0, 230.0)]
+        session.execute = AsyncMock(return_value=result)
+        scorer = DealScorer(claude_client=AsyncMock(), db_session=session)
+
+        contexts = [
+            await scorer._get_price_context(
+                TestScoreBatch.make_package(i, 1000.0, flight_price=150.0 + i)
+            )
+            for i in range(5)
+        ]
+
+        session.execute.assert_awaited_once()
+        assert "Average price for MUC-LIS: €200.00" in contexts[0]
+        assert "Typical range: €170.00-€230.00 (median €195.00)" in contexts[0]
+        assert "25.0% below average (based on 40 historical records)" in contexts[0]
@@ -0,0 +1,146 @@
+"""
+Unit tests for DealSignatureCache.
+
+Uses a dict-backed Redis double so stored entries round-trip.
+"""
+
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.ai.deal_signature_cache import DealSignatureCache
+from app.models.trip_package import TripPackage
+
+
+def make_package(package_id=1, total_price=1000.0, departure=date(2025, 7, 7), **overrides):
+    """Create a trip package for signature tests."""
+    fields = dict(
+        id=package_id,
+        package_type="family",
+        destination_city="Lisbon",
+        departure_date=departure,
+        return_date=date(2025, 7, 14),
+        num_nights=7,
+        total_price=total_price,
+        flights_json={"origin_airport": "MUC", "destination_airport": "LIS"},
+        events_json=[
+            {"name": "Zoo day", "category": "family"},
+            {"name": "Street festival", "category": "cultural"},
+        ],
+    )
+    fields.update(overrides)
+    return TripPackage(**fields)
+
+
+@pytest.fixture
+def store():
+    return {}
+
+
+@pytest.fixture
+def redis(store):
+    client = AsyncMock()
+    client.get = AsyncMock(side_effect=lambda key: store.get(key))
+    client.setex = AsyncMock(side_effect=lambda key, ttl, value: store.__setitem__(key, value))
+    return client
+
+
+@pytest.fixture
+def cache(redis):
+    return DealSignatureCache(redis, ttl=3600, namespace="test-model")
+
+
+class TestSignature:
+    """Tests for signature normalization."""
+
+    def test_near_duplicates_share_signature(self, cache):
+        package = make_package()
+        near_duplicate = make_package(
+            package_id=2,
+            total_price=1003.0,
+            departure=date(2025, 7, 8),
+            events_json=[
+                {"name": "Street festival", "category": "Cultural"},
+                {"name": "Aquarium", "category": "family"},
+            ],
+        )
+
+        assert cache.signature(package) == cache.signature(near_duplicate)
+
+    @pytest.mark.parametrize(
+        "overrides",
+        [
+            {"destination_city": "Porto"},
+            {"total_price": 1200.0},
+            {"departure": date(2025, 8, 4)},
+            {"num_nights": 5},
+            {"package_type": "parent_escape"},
+            {"events_json": []},
+            {"flights_json": {"origin_airport": "VIE"}},
+        ],
+    )
+    def test_material_differences_change_signature(self, cache, overrides):
+        assert cache.signature(make_package()) != cache.signature(make_package(**overrides))
+
+    def test_namespace_changes_signature(self, redis):
+        package = make_package()
+        a = DealSignatureCache(redis, namespace="model-a")
+        b = DealSignatureCache(redis, namespace="model-b")
+
+        assert a.signature(package) != b.signature(package)
+
+    def test_rating_band(self, cache):
+        def with_rating(rating):
+            package = make_package()
+            package.accommodation = MagicMock(rating=rating)
+            return package
+
+        assert cache.signature(with_rating(8.2)) == cache.signature(with_rating(8.9))
+        assert cache.signature(with_rating(8.9)) != cache.signature(with_rating(9.1))
+
+    def test_incomplete_package_has_no_signature(self, cache):
+        assert cache.signature(make_package(total_price=None)) is None
+
+
+class TestGetSet:
+    """Tests for storing and reusing scores."""
+
+    async def test_round_trip_and_counters(self, cache, redis):
+        signature = cache.signature(make_package())
+
+        assert await cache.get(signature) is None
+        await cache.set(
+            signature,
+            {"score": 82, "reasoning": "Great value", "recommendation": "book_now", "_cost": 0.01},
+        )
+        cached = await cache.get(signature)
+
+        assert cached["score"] == 82
+        assert cached["reasoning"] == "Great value"
+        assert cached["_signature_hit"] is True
+        assert "_cost" not in cached
+        assert (cache.hits, cache.misses, cache.stores) == (1, 1, 1)
+        assert redis.setex.call_args[0][1] == 3600
+
+    async def test_responses_without_score_not_stored(self, cache, redis):
+        await cache.set(cache.signature(make_package()), {"score": None})
+
+        redis.setex.assert_not_called()
+
+    async def test_unreadable_entry_is_a_miss(self, cache, store):
+        signature = cache.signature(make_package())
+        store[f"{DealSignatureCache.KEY_PREFIX}{signature}"] = "{not json"
+
+        assert await cache.get(signature) is None
+        assert cache.misses == 1
+
+    async def test_redis_errors_disable_cache(self, cache, redis):
+        redis.get.side_effect = ConnectionError("down")
+        signature = cache.signature(make_package())
+
+        assert await cache.get(signature) is None
+        assert cache.enabled is False
+
+        await cache.set(signature, {"score": 50})
+        redis.setex.assert_not_called()
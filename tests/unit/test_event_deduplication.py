@@ -2,17 +2,25 @@
 Unit tests for event deduplication utilities.
 """
 
-import pytest
+import copy
+import random
 from datetime import date
+from difflib import SequenceMatcher
+
+import pytest
 
 from app.utils.event_deduplication import (
+    FUZZY_MATCH_THRESHOLD,
     normalize_text,
     extract_venue_from_text,
     generate_deduplication_hash,
     fuzzy_match_titles,
     are_events_similar,
     deduplicate_events,
+    _apply_fuzzy_deduplication,
+    _candidate_pairs,
     _merge_duplicate_events,
+    apply_fuzzy_deduplication_pairwise,
 )
 
 
@@ -452,3 +460,73 @@ class TestDeduplicateEvents:
         assert len(unique) == 1
         # Venue should be extracted
         assert unique[0].get('venue') is not None
+
+
+class TestBlockedFuzzyDeduplication:
+    """Test the blocked fuzzy engine against the all-pairs reference."""
+
+    WORDS = ["jazz", "night", "kids", "science", "fair", "food", "market", "open",
+             "air", "cinema", "the", "festival", "lisbon", "tour", "puppet"]
+
+    def make_events(self, rng, n):
+        """Random events with overlapping titles, a few dates and city spellings."""
+        events = []
+        for i in range(n):
+            title = " ".join(rng.choice(self.WORDS) for _ in range(rng.randint(1, 4)))
+            title += rng.choice(["", "!", "s", " 2", " (Family)"])
+            events.append({
+                'title': title if rng.random() < 0.8 else title.upper(),
+                'event_date': date(2025, 7, rng.randint(1, 3)),
+                'destination_city': rng.choice(["Lisbon", "lisbon!", "Porto"]),
+                'source': rng.choice(["eventbrite", "tourism_lisbon"]),
+                'url': f"https://example.com/{i}",
+                'description': "x" * rng.randint(0, 5),
+            })
+        return events
+
+    @pytest.mark.parametrize("threshold", [FUZZY_MATCH_THRESHOLD, 0.6, 0.95])
+    def test_equivalent_to_pairwise(self, threshold):
+        """Test identical output, including order and merged groups."""
+        rng = random.Random(7)
+
+        for _ in range(50):
+            events = self.make_events(rng, rng.randint(0, 40))
+            blocked = _apply_fuzzy_deduplication(copy.deepcopy(events), threshold)
+            pairwise = apply_fuzzy_deduplication_pairwise(copy.deepcopy(events), threshold)
+
+            assert blocked == pairwise
+
+    def test_bounds_never_reject_a_match(self):
+        """Test that the candidate filter only drops pairs below the threshold."""
+        rng = random.Random(11)
+
+        for _ in range(5000):
+            a = "".join(rng.choice("abcde ") for _ in range(rng.randint(1, 25)))
+            b = list(a)
+            for _ in range(rng.randint(0, 6)):
+                position = rng.randrange(len(b) + 1)
+                if rng.random() < 0.5:
+                    b.insert(position, rng.choice("abcde "))
+                elif b:
+                    b.pop(min(position, len(b) - 1))
+            title_a, title_b = normalize_text(a), normalize_text("".join(b))
+            if not title_a or not title_b:
+                continue
+
+            ratio = SequenceMatcher(None, title_a, title_b).ratio()
+            if ratio >= FUZZY_MATCH_THRESHOLD:
+                assert _candidate_pairs([title_a, title_b], FUZZY_MATCH_THRESHOLD)[0, 1]
+
+    def test_only_same_date_and_city_compared(self):
+        """Test that identical titles in different blocks stay separate."""
+        events = [
+            {'title': 'Jazz Night', 'event_date': date(2025, 7, 1), 'destination_city': 'Lisbon'},
+            {'title': 'Jazz Night', 'event_date': date(2025, 7, 2), 'destination_city': 'Lisbon'},
+            {'title': 'Jazz Night!', 'event_date': date(2025, 7, 1), 'destination_city': 'Porto'},
+            {'title': 'Jazz Night!', 'event_date': date(2025, 7, 1), 'destination_city': 'LISBON'},
+        ]
+
+        unique = _apply_fuzzy_deduplication(events)
+
+        assert len(unique) == 3
+        assert unique[0]['duplicate_count'] == 2
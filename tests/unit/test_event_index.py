@@ -0,0 +1,98 @@
+"""
+Unit tests for EventIntervalIndex.
+"""
+
+from datetime import date, timedelta
+from unittest.mock import Mock
+
+from app.models.event import Event
+from app.orchestration.event_index import EventIntervalIndex
+
+
+def make_event(event_id, start, end=None, city="Lisbon"):
+    """Create an event mock with the fields the index reads."""
+    return Mock(
+        spec=Event,
+        id=event_id,
+        destination_city=city,
+        event_date=start,
+        end_date=end,
+    )
+
+
+def brute_force(events, city, start, end):
+    """Reference overlap check."""
+    return {
+        e.id
+        for e in events
+        if e.destination_city == city
+        and e.event_date <= end
+        and (e.end_date or e.event_date) >= start
+    }
+
+
+class TestEventIntervalIndex:
+    """Test suite for EventIntervalIndex."""
+
+    def test_single_and_multi_day_overlap(self):
+        """Test inclusive overlap for one-day and multi-day events."""
+        events = [
+            make_event(1, date(2025, 12, 19)),
+            make_event(2, date(2025, 12, 20)),
+            make_event(3, date(2025, 12, 27)),
+            make_event(4, date(2025, 12, 28)),
+            make_event(5, date(2025, 12, 15), date(2025, 12, 20)),
+            make_event(6, date(2025, 12, 15), date(2025, 12, 19)),
+        ]
+        index = EventIntervalIndex(events)
+
+        result = index.overlapping("Lisbon", date(2025, 12, 20), date(2025, 12, 27))
+
+        assert sorted(e.id for e in result) == [2, 3, 5]
+        assert len(index) == 6
+
+    def test_cities_are_separate(self):
+        """Test that events only match their own city."""
+        events = [
+            make_event(1, date(2025, 12, 22)),
+            make_event(2, date(2025, 12, 22), city="Porto"),
+        ]
+        index = EventIntervalIndex(events)
+
+        assert [e.id for e in index.overlapping("Porto", date(2025, 12, 20), date(2025, 12, 27))] == [2]
+        assert index.overlapping("Madrid", date(2025, 12, 20), date(2025, 12, 27)) == []
+
+    def test_long_events_do_not_widen_window(self):
+        """Test that season-long events are found without being indexed."""
+        events = [
+            make_event(1, date(2025, 6, 1), date(2026, 3, 1)),
+            make_event(2, date(2025, 12, 22)),
+        ]
+        index = EventIntervalIndex(events, long_event_days=14)
+        city = index._cities["Lisbon"]
+
+        assert city.max_span == 0
+        result = index.overlapping("Lisbon", date(2025, 12, 20), date(2025, 12, 27))
+        assert [e.id for e in result] == [2, 1]
+
+    def test_matches_brute_force(self):
+        """Test the index against a linear scan over many ranges."""
+        base = date(2025, 1, 1)
+        events = [
+            make_event(
+                i,
+                base + timedelta(days=(i * 7) % 300),
+                None if i % 3 else base + timedelta(days=(i * 7) % 300 + i % 20),
+                city="Lisbon" if i % 2 else "Porto",
+            )
+            for i in range(200)
+        ]
+        index = EventIntervalIndex(events)
+
+        for offset in range(0, 320, 11):
+            start = base + timedelta(days=offset)
+            end = start + timedelta(days=offset % 9)
+            for city in ("Lisbon", "Porto"):
+                found = [e.id for e in index.overlapping(city, start, end)]
+                assert len(found) == len(set(found))
+                assert set(found) == brute_force(events, city, start, end)
@@ -528,5 +528,60 @@ class TestEventMatcher:
 
         # Each package should be processed
         assert len(packages) == 2
-        # Database should be queried for each package
-        assert mock_db_session.execute.call_count == 2
+        # Events for all packages are loaded with a single query
+        assert mock_db_session.execute.call_count == 1
+        # Only the Lisbon package has events in its city
+        assert packages[0].events_json
+        assert packages[1].events_json == []
+
+    @pytest.mark.asyncio
+    async def test_match_events_to_packages_same_as_per_package_filters(
+        self, event_matcher, mock_db_session, sample_events
+    ):
+        """Test that indexed matching agrees with the per-package filter chain."""
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = sample_events
+        mock_db_session.execute = AsyncMock(return_value=mock_result)
+
+        packages = [
+            Mock(
+                spec=TripPackage,
+                id=i,
+                destination_city="Lisbon",
+                departure_date=departure,
+                return_date=return_date,
+                package_type=package_type,
+                events_json=None,
+            )
+            for i, (departure, return_date, package_type) in enumerate(
+                [
+                    (date(2025, 12, 20), date(2025, 12, 27), "family"),
+                    (date(2025, 12, 23), date(2025, 12, 24), "parent_escape"),
+                    (date(2025, 12, 27), date(2025, 12, 30), "family"),
+                    (date(2026, 1, 5), date(2026, 1, 9), "family"),
+                ]
+            )
+        ]
+
+        await event_matcher.match_events_to_packages(packages)
+
+        for package in packages:
+            overlapping = [
+                e
+                for e in sample_events
+                if e.event_date <= package.return_date
+                and (e.end_date or e.event_date) >= package.departure_date
+            ]
+            if package.package_type == "family":
+                expected = event_matcher.categorize_for_package_type(
+                    event_matcher.filter_by_age_appropriateness(overlapping), "family"
+                )
+            else:
+                expected = event_matcher.categorize_for_package_type(
+                    overlapping, "parent_escape"
+                )
+            expected = event_matcher.rank_events_by_relevance(expected, package)
+            assert package.events_json == [e.id for e in expected]
+
+        assert packages[2].events_json == [5]
+        assert packages[3].events_json == []
@@ -5,12 +5,13 @@ Tests the AI-powered event relevance scoring with mocked Claude API
 to avoid actual API calls during testing.
 """
 
+import json
 import pytest
 from datetime import date
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 from app.ai.event_scorer import EventScorer, score_events_for_destination
-from app.ai.claude_client import ClaudeClient
+from app.ai.claude_client import ClaudeAPIError, ClaudeClient
 from app.models.event import Event
 from app.models.user_preference import UserPreference
 
@@ -297,6 +298,174 @@ class TestEventScorer:
         assert results["failed_events"] == 1
         assert results["average_score"] == 7.5  # (8.0 + 7.0) / 2
 
+    async def test_score_events_batch_with_batch_api(
+        self,
+        event_scorer,
+        mock_claude_client,
+        mock_db_session,
+        mock_scoring_response,
+        sample_user_preferences,
+    ):
+        """Test batch scoring through the Message Batches API."""
+        events = [
+            Event(
+                id=i,
+                destination_city="Porto",
+                title=f"Event {i}",
+                event_date=date(2025, 12, 15),
+                category="family",
+                description=f"Description {i}",
+            )
+            for i in range(1, 4)
+        ]
+
+        mock_claude_client.analyze_batch.return_value = [
+            {**mock_scoring_response, "relevance_score": 8.0, "_cost": 0.002},
+            ClaudeAPIError("Batch request failed (expired)"),
+            {**mock_scoring_response, "relevance_score": 6.0, "_cost": 0.002},
+        ]
+
+        results = await event_scorer.score_events_batch(
+            events=events,
+            user_preferences=sample_user_preferences,
+            use_batch_api=True,
+        )
+
+        # One batch submission instead of per-event calls
+        mock_claude_client.analyze.assert_not_called()
+        requests = mock_claude_client.analyze_batch.call_args[0][0]
+        assert [r.data["title"] for r in requests] == ["Event 1", "Event 2", "Event 3"]
+        assert all(r.operation == "event_scoring" for r in requests)
+
+        assert results["scored_events"] == 2
+        assert results["failed_events"] == 1
+        assert results["total_cost"] == 0.004
+        assert [e.ai_relevance_score for e in events] == [8.0, None, 6.0]
+        mock_db_session.commit.assert_called_once()
+
+    @pytest.fixture
+    def packed_events(self):
+        """Events for packed scoring tests."""
+        return [
+            Event(
+                id=i,
+                destination_city="Lisbon",
+                title=f"Event {i}",
+                event_date=date(2025, 12, 15),
+                category="family",
+                description=f"Description {i}",
+            )
+            for i in range(1, 5)
+        ]
+
+    async def test_score_events_packed(
+        self, event_scorer, mock_claude_client, mock_db_session, packed_events
+    ):
+        """Test packed scoring maps results back by event id."""
+        mock_claude_client.analyze.side_effect = [
+            {
+                "results": [
+                    # Out of order, one id echoed as a string
+                    {"event_id": 2, "relevance_score": 6.0, "recommendation": "consider"},
+                    {"event_id": "1", "relevance_score": 9.0, "recommendation": "book"},
+                ],
+                "_cost": 0.004,
+            },
+            {
+                "results": [
+                    {"event_id": 3, "relevance_score": 3.0},
+                    {"event_id": 4, "relevance_score": 7.0},
+                ],
+                "_cost": 0.004,
+            },
+        ]
+
+        outcomes = await event_scorer.score_events_packed(
+            packed_events, user_interests=["museums"], pack_size=2
+        )
+
+        assert mock_claude_client.analyze.call_count == 2
+        data = mock_claude_client.analyze.call_args_list[0].kwargs["data"]
+        sent = json.loads(data["events_json"])
+        assert [item["event_id"] for item in sent] == [1, 2]
+        assert data["user_interests"] == "museums"
+
+        assert [event.id for event, _ in outcomes] == [1, 2, 3, 4]
+        assert [result["relevance_score"] for _, result in outcomes] == [9.0, 6.0, 3.0, 7.0]
+        assert outcomes[0][1]["recommendation"] == "book"
+        assert outcomes[0][1]["_cost"] == pytest.approx(0.002)
+        assert [e.ai_relevance_score for e in packed_events] == [9.0, 6.0, 3.0, 7.0]
+        assert mock_db_session.commit.call_count == 2
+
+    async def test_score_events_packed_malformed_falls_back(
+        self, event_scorer, mock_claude_client, mock_scoring_response, packed_events
+    ):
+        """Test malformed packed responses fall back to single-event scoring."""
+        mock_claude_client.analyze.side_effect = [
+            ClaudeAPIError("Failed to parse JSON response"),
+            {**mock_scoring_response, "relevance_score": 5.0},
+            {**mock_scoring_response, "relevance_score": 4.0},
+        ]
+
+        outcomes = await event_scorer.score_events_packed(packed_events[:2], pack_size=2)
+
+        assert mock_claude_client.analyze.call_count == 3
+        assert [result["relevance_score"] for _, result in outcomes] == [5.0, 4.0]
+
+    async def test_score_events_packed_partial_response(
+        self, event_scorer, mock_claude_client, mock_scoring_response, packed_events
+    ):
+        """Test events missing or invalid in the packed response are re-scored alone."""
+        mock_claude_client.analyze.side_effect = [
+            {
+                "results": [
+                    {"event_id": 1, "relevance_score": 8.0},
+                    {"event_id": 2, "relevance_score": 42},  # out of range
+                    {"event_id": 3, "relevance_score": 6.0},
+                    {"event_id": 3, "relevance_score": 2.0},  # conflicting duplicate
+                    {"event_id": 99, "relevance_score": 5.0},  # unknown id
+                ],
+                "_cost": 0.004,
+            },
+            {**mock_scoring_response, "relevance_score": 7.0},
+            {**mock_scoring_response, "relevance_score": 6.5},
+            ClaudeAPIError("API error"),
+        ]
+
+        outcomes = await event_scorer.score_events_packed(packed_events, pack_size=4)
+
+        assert mock_claude_client.analyze.call_count == 4
+        assert outcomes[0][1]["relevance_score"] == 8.0
+        assert outcomes[1][1]["relevance_score"] == 7.0
+        assert outcomes[2][1]["relevance_score"] == 6.5
+        assert isinstance(outcomes[3][1], ClaudeAPIError)
+
+    async def test_score_events_batch_packed(
+        self,
+        event_scorer,
+        mock_claude_client,
+        sample_user_preferences,
+        packed_events,
+    ):
+        """Test score_events_batch summarizes packed results."""
+        mock_claude_client.analyze.return_value = {
+            "results": [
+                {"event_id": event.id, "relevance_score": 8.0} for event in packed_events
+            ],
+            "_cost": 0.006,
+        }
+
+        results = await event_scorer.score_events_batch(
+            events=packed_events,
+            user_preferences=sample_user_preferences,
+            pack_size=10,
+        )
+
+        mock_claude_client.analyze.assert_called_once()
+        assert results["scored_events"] == 4
+        assert results["high_relevance_count"] == 4
+        assert results["total_cost"] == 0.006
+
     async def test_get_top_events(self, event_scorer, mock_db_session):
         """Test retrieving top-scored events for a destination."""
         # Mock database query result
@@ -0,0 +1,164 @@
+"""
+Unit tests for FlightBulkWriter.
+
+Covers staging row preparation and the set-based statement flow.
+The SQL itself targets PostgreSQL and is exercised by integration tests.
+"""
+
+from datetime import date, time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.orchestration.flight_bulk_writer import FlightBulkWriter, prepare_staging_rows
+
+AIRPORT_IDS = {"MUC": 1, "LIS": 2}
+
+
+def make_flight(**overrides):
+    """Create a flight dictionary with sensible defaults."""
+    flight = {
+        "origin_airport": "MUC",
+        "destination_airport": "LIS",
+        "airline": "TAP",
+        "departure_date": "2025-12-20",
+        "departure_time": "10:30",
+        "return_date": "2025-12-27",
+        "return_time": "18:00",
+        "price_per_person": 100.0,
+        "total_price": 400.0,
+        "source": "kiwi",
+        "booking_url": "https://example.com",
+    }
+    flight.update(overrides)
+    return flight
+
+
+class FakeResult:
+    """Minimal stand-in for a SQLAlchemy result."""
+
+    def __init__(self, rows):
+        self._rows = rows
+
+    def all(self):
+        return self._rows
+
+
+def make_db(action_counts):
+    """Create a mock session that answers airport and action count queries."""
+    db = MagicMock()
+    db.run_sync = AsyncMock()
+
+    async def execute(stmt, params=None):
+        sql = str(stmt)
+        if "GROUP BY" in sql:
+            return FakeResult(list(action_counts.items()))
+        if sql.startswith("SELECT airports"):
+            return FakeResult(list(AIRPORT_IDS.items()))
+        return FakeResult([])
+
+    db.execute = AsyncMock(side_effect=execute)
+    return db
+
+
+class TestPrepareStagingRows:
+    """Test conversion of flight dictionaries to staging rows."""
+
+    def test_basic_row(self):
+        """Test that a complete flight is converted with parsed values."""
+        rows, skipped = prepare_staging_rows([make_flight()], AIRPORT_IDS)
+
+        assert skipped == 0
+        row = rows[0]
+        assert row["origin_airport_id"] == 1
+        assert row["destination_airport_id"] == 2
+        assert row["route"] == "MUC-LIS"
+        assert row["departure_date"] == date(2025, 12, 20)
+        assert row["departure_time"] == time(10, 30)
+        assert row["time_lower"] == time(8, 30)
+        assert row["time_upper"] == time(12, 30)
+        assert row["return_date"] == date(2025, 12, 27)
+        assert row["has_booking_url"] is True
+
+    def test_skips_unknown_airport_and_bad_date(self):
+        """Test that unusable flights are counted as skipped."""
+        flights = [
+            make_flight(origin_airport="XXX"),
+            make_flight(departure_date="20/12/2025"),
+            make_flight(departure_date=None),
+            make_flight(),
+        ]
+
+        rows, skipped = prepare_staging_rows(flights, AIRPORT_IDS)
+
+        assert skipped == 3
+        assert [row["idx"] for row in rows] == [3]
+
+    def test_price_fallbacks(self):
+        """Test the price_per_person/total_price fallbacks."""
+        flights = [
+            make_flight(price_per_person=None, total_price=480.0),
+            make_flight(total_price=None, price_per_person=90.0),
+        ]
+
+        rows, _ = prepare_staging_rows(flights, AIRPORT_IDS)
+
+        assert rows[0]["price_per_person"] == 120.0
+        assert rows[1]["total_price"] == 360.0
+
+    def test_missing_time_has_no_window(self):
+        """Test that flights without departure time match the whole day."""
+        rows, _ = prepare_staging_rows([make_flight(departure_time=None)], AIRPORT_IDS)
+
+        assert rows[0]["departure_time"] is None
+        assert rows[0]["time_lower"] is None
+        assert rows[0]["time_upper"] is None
+
+    def test_one_way_and_missing_url(self):
+        """Test one-way flights and flights without a booking_url key."""
+        flight = make_flight(return_date="None")
+        del flight["booking_url"]
+
+        rows, _ = prepare_staging_rows([flight], AIRPORT_IDS)
+
+        assert rows[0]["return_date"] is None
+        assert rows[0]["has_booking_url"] is False
+
+
+class TestFlightBulkWriter:
+    """Test the bulk write statement flow."""
+
+    @pytest.mark.asyncio
+    async def test_statement_count_independent_of_batch_size(self):
+        """Test that a batch costs a fixed number of statements."""
+        small_db = make_db({"insert": 2})
+        large_db = make_db({"insert": 1500, "update": 300, "skip": 200})
+
+        await FlightBulkWriter(small_db).write([make_flight() for _ in range(2)])
+        await FlightBulkWriter(large_db).write([make_flight() for _ in range(2000)])
+
+        assert small_db.execute.await_count == large_db.execute.await_count
+        # Staging rows are sent as one executemany
+        staged = [c for c in large_db.execute.await_args_list if len(c.args) > 1]
+        assert len(staged) == 1
+        assert len(staged[0].args[1]) == 2000
+
+    @pytest.mark.asyncio
+    async def test_stats_from_actions(self):
+        """Test that stats combine SQL outcomes with rows skipped in Python."""
+        db = make_db({"insert": 2, "update": 1, "skip": 1})
+        flights = [make_flight() for _ in range(4)] + [make_flight(departure_date="")]
+
+        stats = await FlightBulkWriter(db).write(flights)
+
+        assert stats == {"inserted": 2, "updated": 1, "skipped": 2}
+
+    @pytest.mark.asyncio
+    async def test_empty_batch(self):
+        """Test that an empty batch issues no statements."""
+        db = make_db({})
+
+        stats = await FlightBulkWriter(db).write([])
+
+        assert stats == {"inserted": 0, "updated": 0, "skipped": 0}
+        db.execute.assert_not_awaited()
@@ -0,0 +1,131 @@
+"""
+Unit tests for the Redis flight group index.
+
+The Lua merge script itself runs inside Redis; these tests cover the
+arguments sent to it and how its results are applied.
+"""
+
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from redis.exceptions import RedisError
+
+from app.utils.flight_cache import FlightGroupIndex
+
+
+def make_flight(**overrides):
+    """Create a flight dictionary with sensible defaults."""
+    flight = {
+        "origin_airport": "MUC",
+        "destination_airport": "LIS",
+        "airline": "TAP",
+        "departure_date": "2025-12-20",
+        "departure_time": "10:30",
+        "return_date": "2025-12-27",
+        "return_time": "18:00",
+        "price_per_person": 100.0,
+        "total_price": 400.0,
+        "booking_url": "https://example.com/a",
+        "source": "kiwi",
+    }
+    flight.update(overrides)
+    return flight
+
+
+def make_index(script_results=None, side_effect=None):
+    """Create an index whose registered script returns canned results."""
+    redis_client = MagicMock()
+    script = AsyncMock(return_value=json.dumps(script_results or []), side_effect=side_effect)
+    redis_client.register_script.return_value = script
+    return FlightGroupIndex(redis_client, ttl=600), script
+
+
+class TestFlightGroupIndex:
+    """Test suite for FlightGroupIndex."""
+
+    @pytest.mark.asyncio
+    async def test_one_script_call_per_batch(self):
+        """Test that a batch is merged with one call keyed by grouping bucket."""
+        index, script = make_index(
+            [
+                [1, "90.0", "kiwi", 2, ["https://a"], ["kiwi"]],
+                [1, "120.0", "kiwi", 1, ["https://b"], ["kiwi"]],
+            ]
+        )
+        flights = [
+            make_flight(price_per_person=90.0, booking_url="https://a"),
+            make_flight(price_per_person=95.0, booking_url="https://a", departure_time="11:00"),
+            make_flight(destination_airport="bcn", price_per_person=120.0, booking_url="https://b"),
+        ]
+
+        await index.merge(flights)
+
+        script.assert_awaited_once()
+        keys = script.await_args.kwargs["keys"]
+        args = script.await_args.kwargs["args"]
+        assert len(keys) == 2
+        assert keys[1].startswith("flightgroup:MUC:BCN:TAP:")
+        assert args[0] == 600
+        first = json.loads(args[1])
+        assert first["price"] == "90.0"
+        assert first["count"] == 2
+        assert first["urls"] == ["https://a"]
+
+    @pytest.mark.asyncio
+    async def test_returns_winners_with_merged_history(self):
+        """Test that only new/cheaper groups are returned, with stored history."""
+        index, _ = make_index(
+            [
+                [2, "80.0", "skyscanner", 5, ["https://old", "https://a"], ["kiwi", "skyscanner"]],
+                [0, "50.0", "ryanair", 3, ["https://c"], ["ryanair"]],
+            ]
+        )
+        cheaper = make_flight(price_per_person=80.0, source="skyscanner")
+        pricier = make_flight(destination_airport="BCN", price_per_person=70.0)
+
+        winners = await index.merge([cheaper, pricier])
+
+        assert winners == [cheaper]
+        assert cheaper["booking_urls"] == ["https://old", "https://a"]
+        assert cheaper["sources"] == ["kiwi", "skyscanner"]
+        assert cheaper["duplicate_count"] == 5
+        assert index.get_stats() == {"received": 2, "unique": 2, "emitted": 1}
+
+    @pytest.mark.asyncio
+    async def test_update_groups_records(self):
+        """Test the per-group records, including empty sets encoded as objects."""
+        index, _ = make_index([[1, "inf", "", 1, {}, {}]])
+
+        records = await index.update_groups([make_flight(price_per_person=None, total_price=None)])
+
+        assert records == [
+            {
+                "is_new": True,
+                "is_winner": True,
+                "best_price": float("inf"),
+                "best_source": None,
+                "booking_urls": [],
+                "sources": [],
+                "duplicate_count": 1,
+            }
+        ]
+
+    @pytest.mark.asyncio
+    async def test_fails_open_on_redis_error(self):
+        """Test that Redis errors fall back to the locally deduplicated batch."""
+        index, _ = make_index(side_effect=RedisError("connection lost"))
+        flights = [make_flight(price_per_person=120.0), make_flight(price_per_person=90.0)]
+
+        winners = await index.merge(flights)
+
+        assert winners == [flights[1]]
+        assert winners[0]["duplicate_count"] == 2
+
+    @pytest.mark.asyncio
+    async def test_empty_batch_skips_redis(self):
+        """Test that an empty batch does not call Redis."""
+        index, script = make_index()
+
+        assert await index.merge([]) == []
+        script.assert_not_awaited()
@@ -0,0 +1,223 @@
+"""
+Unit tests for the vectorized flight deduplication engine.
+
+Checks grouping semantics and equivalence with the reference
+per-flight implementation.
+"""
+
+import copy
+import random
+
+import pytest
+
+from app.utils.flight_deduplication import (
+    IncrementalFlightDeduplicator,
+    deduplicate_flights,
+    deduplicate_flights_iterative,
+)
+
+
+def make_flight(**overrides):
+    """Create a flight dictionary with sensible defaults."""
+    flight = {
+        "origin_airport": "MUC",
+        "destination_airport": "LIS",
+        "airline": "TAP",
+        "departure_date": "2025-12-20",
+        "departure_time": "10:30",
+        "return_date": "2025-12-27",
+        "return_time": "18:00",
+        "price_per_person": 100.0,
+        "total_price": 400.0,
+        "booking_url": "https://example.com/a",
+        "source": "kiwi",
+    }
+    flight.update(overrides)
+    return flight
+
+
+def random_flights(n, seed=0):
+    """Generate flights with many collisions and messy values."""
+    rng = random.Random(seed)
+    times = ["06:00", "07:59", "08:00", "10:15", "9:30 AM", "11:45 PM", "bad", None, ""]
+    dates = ["2025-12-20", "2025-12-21", "2025-12-22", "2025-13-01", "", None]
+    flights = []
+    for i in range(n):
+        flight = {
+            "origin_airport": rng.choice(["MUC", "muc", "VIE"]),
+            "destination_airport": rng.choice(["LIS", "BCN"]),
+            "airline": rng.choice(["TAP", "tap", "Vueling"]),
+            "departure_date": rng.choice(dates),
+            "departure_time": rng.choice(times),
+            "return_date": rng.choice(dates + ["None"]),
+            "return_time": rng.choice(times),
+            "price_per_person": rng.choice([None, 0, 50.0, 75.5, 100.0]),
+            "total_price": rng.choice([200.0, 300.0, 400.0]),
+            "booking_url": rng.choice([f"https://x/{i % 7}", None]),
+            "source": rng.choice(["kiwi", "skyscanner", "ryanair", None]),
+        }
+        # Missing keys exercise the midnight/inf defaults
+        for key in ("departure_time", "return_time", "total_price", "airline"):
+            if rng.random() < 0.1:
+                del flight[key]
+        flights.append(flight)
+    return flights
+
+
+def summarize(flights):
+    """Comparable view of deduplication output."""
+    return [
+        (
+            f["_id"],
+            f["booking_urls"],
+            f["sources"],
+            f["duplicate_count"],
+        )
+        for f in flights
+    ]
+
+
+class TestDeduplicateFlights:
+    """Test suite for deduplicate_flights."""
+
+    def test_empty(self):
+        """Test that no flights gives no results."""
+        assert deduplicate_flights([]) == []
+
+    def test_keeps_cheapest_and_merges(self):
+        """Test that duplicates collapse to the cheapest with merged URLs."""
+        flights = [
+            make_flight(price_per_person=120.0, booking_url="https://a", source="kiwi"),
+            make_flight(
+                departure_time="11:10",
+                price_per_person=90.0,
+                booking_url="https://b",
+                source="skyscanner",
+            ),
+            make_flight(price_per_person=95.0, booking_url="https://a", source="kiwi"),
+        ]
+
+        result = deduplicate_flights(flights)
+
+        assert len(result) == 1
+        assert result[0] is flights[1]
+        assert result[0]["booking_urls"] == ["https://a", "https://b"]
+        assert result[0]["sources"] == ["kiwi", "skyscanner"]
+        assert result[0]["duplicate_count"] == 3
+
+    def test_two_hour_buckets(self):
+        """Test that flights in different 2-hour blocks are kept apart."""
+        flights = [
+            make_flight(departure_time="09:59"),
+            make_flight(departure_time="10:00"),
+        ]
+
+        assert len(deduplicate_flights(flights)) == 2
+
+    def test_codes_case_insensitive(self):
+        """Test that airport and airline codes are compared case-insensitively."""
+        flights = [
+            make_flight(origin_airport="muc", airline="tap"),
+            make_flight(origin_airport="MUC", airline="TAP"),
+        ]
+
+        assert len(deduplicate_flights(flights)) == 1
+
+    def test_one_way_separate_from_round_trip(self):
+        """Test that one-way flights don't merge with round trips."""
+        flights = [
+            make_flight(),
+            make_flight(return_date=None),
+            make_flight(return_date="None"),
+        ]
+
+        result = deduplicate_flights(flights)
+
+        assert [f["duplicate_count"] for f in result] == [1, 2]
+
+    def test_skips_missing_departure_date(self):
+        """Test that flights without a valid departure date are skipped."""
+        flights = [
+            make_flight(departure_date=""),
+            make_flight(departure_date="20-12-2025"),
+            make_flight(),
+        ]
+
+        result = deduplicate_flights(flights)
+
+        assert len(result) == 1
+        assert result[0] is flights[2]
+
+    def test_ties_keep_first(self):
+        """Test that the first flight wins when prices are equal."""
+        flights = [make_flight(source="a"), make_flight(source="b")]
+
+        assert deduplicate_flights(flights)[0] is flights[0]
+
+    def test_total_price_fallback(self):
+        """Test that total_price is used when price_per_person is missing."""
+        flights = [
+            make_flight(price_per_person=None, total_price=300.0),
+            make_flight(price_per_person=None, total_price=250.0),
+        ]
+
+        assert deduplicate_flights(flights)[0] is flights[1]
+
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_equivalent_to_iterative(self, seed):
+        """Test that output matches the reference implementation."""
+        flights = random_flights(2000, seed=seed)
+        for i, flight in enumerate(flights):
+            flight["_id"] = i
+
+        expected = deduplicate_flights_iterative(copy.deepcopy(flights))
+        actual = deduplicate_flights(copy.deepcopy(flights))
+
+        assert summarize(actual) == summarize(expected)
+
+
+class TestIncrementalFlightDeduplicator:
+    """Test suite for IncrementalFlightDeduplicator."""
+
+    def test_new_groups_emitted(self):
+        """Test that flights of unseen groups are emitted."""
+        dedup = IncrementalFlightDeduplicator()
+
+        first = dedup.add([make_flight()])
+        second = dedup.add([make_flight(destination_airport="BCN")])
+
+        assert len(first) == 1
+        assert len(second) == 1
+        assert len(dedup) == 2
+
+    def test_more_expensive_duplicate_dropped(self):
+        """Test that a later, pricier duplicate is counted but not emitted."""
+        dedup = IncrementalFlightDeduplicator()
+        dedup.add([make_flight(price_per_person=90.0, source="kiwi")])
+
+        emitted = dedup.add([make_flight(price_per_person=120.0, source="skyscanner")])
+
+        assert emitted == []
+        assert dedup.get_stats() == {"received": 2, "unique": 1, "emitted": 1}
+
+    def test_cheaper_duplicate_emitted_with_merged_sources(self):
+        """Test that a cheaper duplicate is emitted with history from earlier batches."""
+        dedup = IncrementalFlightDeduplicator()
+        dedup.add([make_flight(price_per_person=120.0, source="kiwi")])
+
+        emitted = dedup.add([make_flight(price_per_person=90.0, source="skyscanner")])
+
+        assert len(emitted) == 1
+        assert emitted[0]["price_per_person"] == 90.0
+        assert emitted[0]["sources"] == ["kiwi", "skyscanner"]
+        assert emitted[0]["duplicate_count"] == 2
+
+    def test_matches_one_shot_groups(self):
+        """Test that batching yields the same groups as one-shot deduplication."""
+        flights = random_flights(1000, seed=7)
+        dedup = IncrementalFlightDeduplicator()
+
+        for start in range(0, len(flights), 97):
+            dedup.add(copy.deepcopy(flights[start : start + 97]))
+
+        assert len(dedup) == len(deduplicate_flights(copy.deepcopy(flights)))
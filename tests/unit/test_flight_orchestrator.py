@@ -5,6 +5,8 @@ Tests the orchestration, deduplication, and database saving logic
 with mocked scrapers to avoid actual web scraping.
 """
 
+import asyncio
+
 import pytest
 from datetime import date, datetime, time
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -284,6 +286,17 @@ class TestFlightOrchestrator:
         assert len(unique) == 1
         assert unique[0]["destination_airport"] == "BCN"
 
+    @pytest.mark.asyncio
+    async def test_deduplicate_uses_redis_group_index(self, orchestrator, sample_flights):
+        """Test that with Redis configured, cross-run groups decide the winners."""
+        orchestrator.cache = MagicMock()
+        orchestrator.cache.merge = AsyncMock(return_value=sample_flights[:1])
+
+        unique = await orchestrator.deduplicate(sample_flights)
+
+        orchestrator.cache.merge.assert_awaited_once_with(sample_flights)
+        assert unique == sample_flights[:1]
+
     @pytest.mark.asyncio
     async def test_scrape_source_kiwi(self, orchestrator):
         """Test scraping from Kiwi source."""
@@ -668,6 +681,10 @@ class TestFlightOrchestrator:
         with patch("app.orchestration.flight_orchestrator.settings") as mock_settings:
             mock_settings.scraper_failure_threshold = 0.4
             mock_settings.get_available_scrapers.return_value = ["kiwi", "skyscanner", "ryanair", "wizzair"]
+            mock_settings.scraper_max_concurrency = 10
+            mock_settings.get_scraper_concurrency_limits.return_value = {
+                "kiwi": 8, "skyscanner": 2, "ryanair": 2, "wizzair": 4,
+            }
 
             # Should raise exception (50% > 40% threshold)
             with pytest.raises(ScraperFailureThresholdExceeded) as exc_info:
@@ -682,6 +699,134 @@ class TestFlightOrchestrator:
             assert exception.threshold == 0.4
 
 
+class TestFlightOrchestratorStreaming:
+    """Test the streaming scrape -> dedup -> DB pipeline."""
+
+    @pytest.fixture
+    def orchestrator(self):
+        """Create FlightOrchestrator with only the Kiwi scraper enabled."""
+        with patch("app.orchestration.flight_orchestrator.settings") as mock_settings, \
+             patch("app.orchestration.flight_orchestrator.KiwiClient"):
+            mock_settings.get_available_scrapers.return_value = ["kiwi"]
+            mock_settings.cache_ttl_flights = 3600
+            orchestrator = FlightOrchestrator(redis_client=None)
+
+        return orchestrator
+
+    @staticmethod
+    def make_flight(destination, price, source="kiwi"):
+        return {
+            "origin_airport": "MUC",
+            "destination_airport": destination,
+            "airline": "TAP",
+            "departure_date": "2025-12-20",
+            "departure_time": "10:00",
+            "return_date": "2025-12-27",
+            "return_time": "18:00",
+            "price_per_person": price,
+            "total_price": price * 4,
+            "source": source,
+            "booking_url": f"https://example.com/{destination}/{price}",
+        }
+
+    @staticmethod
+    def fake_saver(saved):
+        async def save(flights, create_job=True):
+            saved.append(list(flights))
+            return {"total": len(flights), "inserted": len(flights), "updated": 0, "skipped": 0}
+
+        return save
+
+    @pytest.mark.asyncio
+    async def test_streams_unique_flights_to_database(self, orchestrator):
+        """Test that duplicates across scraper results are saved once."""
+        results = {
+            "LIS": [self.make_flight("LIS", 100.0)],
+            "BCN": [self.make_flight("BCN", 80.0)],
+            "OPO": [self.make_flight("LIS", 120.0, source="skyscanner")],
+        }
+
+        async def scrape_source(scraper, name, origin, destination, dates):
+            return [dict(f) for f in results[destination]]
+
+        saved = []
+        orchestrator.scrape_source = scrape_source
+        orchestrator.save_to_database = self.fake_saver(saved)
+
+        stats = await orchestrator.stream_to_database(
+            origins=["MUC"],
+            destinations=["LIS", "BCN", "OPO"],
+            date_ranges=[(date(2025, 12, 20), date(2025, 12, 27))],
+            batch_size=100,
+            flush_interval=10,
+        )
+
+        written = [f for batch in saved for f in batch]
+        assert sorted(f["destination_airport"] for f in written) == ["BCN", "LIS"]
+        assert stats["scraped"] == 3
+        assert stats["unique"] == 2
+        assert stats["inserted"] == 2
+
+    @pytest.mark.asyncio
+    async def test_first_results_saved_before_scraping_ends(self, orchestrator):
+        """Test that fast scrapers' flights are written while slow ones still run."""
+        release_slow = asyncio.Event()
+        saved = []
+
+        async def scrape_source(scraper, name, origin, destination, dates):
+            if destination == "SLOW":
+                await release_slow.wait()
+            return [self.make_flight(destination, 100.0)]
+
+        async def save(flights, create_job=True):
+            saved.append(list(flights))
+            release_slow.set()
+            return {"total": len(flights), "inserted": len(flights), "updated": 0, "skipped": 0}
+
+        orchestrator.scrape_source = scrape_source
+        orchestrator.save_to_database = save
+
+        with patch("app.orchestration.flight_orchestrator.settings") as mock_settings:
+            mock_settings.scraper_failure_threshold = 0.5
+            mock_settings.scraper_max_concurrency = 10
+            mock_settings.get_scraper_concurrency_limits.return_value = {"kiwi": 8}
+
+            await asyncio.wait_for(
+                orchestrator.stream_to_database(
+                    origins=["MUC"],
+                    destinations=["FAST", "SLOW"],
+                    date_ranges=[(date(2025, 12, 20), date(2025, 12, 27))],
+                    queue_size=4,
+                    batch_size=100,
+                    flush_interval=0.01,
+                ),
+                timeout=5,
+            )
+
+        # The slow scraper only returns after the fast one's flight was saved
+        assert [f["destination_airport"] for f in saved[0]] == ["FAST"]
+        assert len(saved) == 2
+
+    @pytest.mark.asyncio
+    async def test_writer_failure_stops_pipeline(self, orchestrator):
+        """Test that a database error cancels scraping and is raised."""
+
+        async def scrape_source(scraper, name, origin, destination, dates):
+            return [self.make_flight(destination, 100.0)]
+
+        orchestrator.scrape_source = scrape_source
+        orchestrator.save_to_database = AsyncMock(side_effect=RuntimeError("db down"))
+
+        with pytest.raises(RuntimeError, match="db down"):
+            await orchestrator.stream_to_database(
+                origins=["MUC"],
+                destinations=[f"D{i:02d}" for i in range(20)],
+                date_ranges=[(date(2025, 12, 20), date(2025, 12, 27))],
+                queue_size=1,
+                batch_size=1,
+            )
+
+
 class TestFlightOrchestratorDatabase:
     """Test database operations of FlightOrchestrator."""
 
@@ -0,0 +1,94 @@
+"""
+Unit tests for the shared HTTP client pool.
+
+No network requests are made; clients are only created and closed.
+"""
+
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.scrapers import http_pool as http_pool_module
+from app.scrapers.http_pool import HttpClientPool
+from app.scrapers.wizzair_scraper import WizzAirScraper
+
+
+@pytest.fixture
+def pool():
+    """Create a pool with explicit limits."""
+    return HttpClientPool(
+        max_connections=20,
+        max_per_host=4,
+        keepalive_seconds=15,
+        dns_cache_seconds=120,
+        http2=False,
+    )
+
+
+class TestHttpClientPool:
+    """Test suite for HttpClientPool."""
+
+    @pytest.mark.asyncio
+    async def test_aiohttp_session_reused_with_limits(self, pool):
+        """Test that one keep-alive session with connector limits is shared."""
+        session = pool.aiohttp_session()
+
+        assert pool.aiohttp_session() is session
+        assert session.connector.limit == 20
+        assert session.connector.limit_per_host == 4
+
+        await pool.close()
+        assert session.closed
+
+    @pytest.mark.asyncio
+    async def test_httpx_client_per_host(self, pool):
+        """Test that each host gets one reusable client."""
+        wizzair = pool.httpx_client("be.wizzair.com")
+        eventbrite = pool.httpx_client("www.eventbriteapi.com")
+
+        assert pool.httpx_client("be.wizzair.com") is wizzair
+        assert eventbrite is not wizzair
+        assert pool.get_stats() == {"aiohttp_sessions": 0, "httpx_clients": 2}
+
+        await pool.close()
+        assert wizzair.is_closed and eventbrite.is_closed
+        assert pool.get_stats() == {"aiohttp_sessions": 0, "httpx_clients": 0}
+
+    @pytest.mark.asyncio
+    async def test_reopens_after_close(self, pool):
+        """Test that using the pool after close opens fresh clients."""
+        session = pool.aiohttp_session()
+        await pool.close()
+
+        assert pool.aiohttp_session() is not session
+        await pool.close()
+
+    def test_http2_requires_h2(self):
+        """Test that HTTP/2 is disabled when h2 is not installed."""
+        with patch.object(http_pool_module, "HTTP2_AVAILABLE", False):
+            assert HttpClientPool(http2=True).http2 is False
+
+
+class TestScraperBorrowsPooledClient:
+    """Test that API scrapers use the pool instead of their own clients."""
+
+    @pytest.mark.asyncio
+    async def test_wizzair_uses_pooled_client(self):
+        """Test that WizzAir searches reuse the pooled client and leave it open."""
+        response = MagicMock(status_code=200)
+        response.json.return_value = {"outboundFlights": [], "returnFlights": []}
+
+        client = MagicMock()
+        client.post = AsyncMock(return_value=response)
+        pool = MagicMock()
+        pool.httpx_client.return_value = client
+
+        scraper = WizzAirScraper(timeout=12, http_pool=pool)
+        for _ in range(2):
+            await scraper.search_flights("MUC", "CHI", date(2025, 12, 20))
+
+        pool.httpx_client.assert_called_with("be.wizzair.com")
+        assert client.post.call_count == 2
+        assert client.post.call_args.kwargs["timeout"] == 12
+        client.aclose.assert_not_called()
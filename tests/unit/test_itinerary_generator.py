@@ -5,6 +5,9 @@ Tests the itinerary generation functionality with mocked Claude API
 to avoid actual API calls and ensure predictable testing.
 """
 
+import asyncio
+import json
+
 import pytest
 from datetime import date, timedelta
 from unittest.mock import AsyncMock, MagicMock, Mock
@@ -197,6 +200,23 @@ class TestItineraryGenerator:
 
         assert "below threshold" in str(exc_info.value).lower()
 
+    async def test_generate_itinerary_provisional_score(
+        self, generator, sample_trip_package, mock_claude_client
+    ):
+        """Test that a high local pre-score estimate doesn't trigger a Claude call."""
+        sample_trip_package.ai_score = 92.0
+        sample_trip_package.ai_score_provisional = True
+
+        with pytest.raises(ItineraryGenerationError) as exc_info:
+            await generator.generate_itinerary(
+                trip_package=sample_trip_package,
+                force=False,
+            )
+
+        assert "provisional" in str(exc_info.value).lower()
+        mock_claude_client.analyze.assert_not_called()
+        mock_claude_client.analyze_stream.assert_not_called()
+
     async def test_generate_itinerary_force_low_score(
         self,
         generator,
@@ -382,3 +402,147 @@ class TestItineraryGenerator:
 
         assert "Failed to save" in str(exc_info.value)
         mock_db_session.rollback.assert_called_once()
+
+    @staticmethod
+    def copy_trip(trip, trip_id, **overrides):
+        """Create another trip package with the same details."""
+        fields = dict(
+            id=trip_id,
+            package_type=trip.package_type,
+            flights_json=trip.flights_json,
+            events_json=trip.events_json,
+            destination_city=trip.destination_city,
+            departure_date=trip.departure_date,
+            return_date=trip.return_date,
+            num_nights=trip.num_nights,
+            total_price=trip.total_price,
+            ai_score=trip.ai_score,
+        )
+        fields.update(overrides)
+        return TripPackage(**fields)
+
+    @staticmethod
+    def stream_response(mock_claude_client, response, chunk_size=40):
+        """Make analyze_stream feed the response JSON in chunks to on_text."""
+        text = json.dumps({k: v for k, v in response.items() if not k.startswith("_")})
+
+        async def analyze_stream(on_text=None, **kwargs):
+            for start in range(0, len(text), chunk_size):
+                await on_text(text[start : start + chunk_size])
+            return response
+
+        mock_claude_client.analyze_stream = AsyncMock(side_effect=analyze_stream)
+
+    async def test_generate_itinerary_streaming_saves_days_as_they_arrive(
+        self,
+        generator,
+        sample_trip_package,
+        sample_itinerary_response,
+        mock_claude_client,
+        mock_db_session,
+    ):
+        """Test streaming commits each finished section, then the final itinerary."""
+        self.stream_response(mock_claude_client, sample_itinerary_response)
+        saved = []
+        mock_db_session.commit.side_effect = lambda: saved.append(
+            sample_trip_package.itinerary_json
+        )
+        sections = []
+
+        result = await generator.generate_itinerary_streaming(
+            trip_package=sample_trip_package,
+            on_section=lambda trip, key, value: sections.append(key),
+        )
+
+        assert sections == ["day_1", "day_2", "day_3", "tips", "packing_essentials"]
+        # One commit per section plus the final save
+        assert len(saved) == 6
+        assert list(saved[0]) == ["day_1", "_status"]
+        assert saved[0]["_status"] == "generating"
+        assert saved[2]["day_3"] == sample_itinerary_response["day_3"]
+        assert "_status" not in saved[-1]
+        assert result == saved[-1]
+        assert sample_trip_package.itinerary_json == result
+
+    async def test_generate_itinerary_streaming_failure_restores_previous(
+        self,
+        generator,
+        sample_trip_package,
+        sample_itinerary_response,
+        mock_claude_client,
+    ):
+        """Test a failed stream does not leave a partial itinerary behind."""
+        incomplete = {"day_1": sample_itinerary_response["day_1"], "_cost": 0.01}
+        self.stream_response(mock_claude_client, incomplete)
+
+        with pytest.raises(ItineraryGenerationError):
+            await generator.generate_itinerary_streaming(trip_package=sample_trip_package)
+
+        assert sample_trip_package.itinerary_json is None
+
+    async def test_partial_itinerary_is_regenerated(
+        self,
+        generator,
+        sample_trip_package,
+        sample_itinerary_response,
+        mock_claude_client,
+    ):
+        """Test an itinerary left mid-stream is not returned as cached."""
+        sample_trip_package.itinerary_json = {"day_1": {}, "_status": "generating"}
+        mock_claude_client.analyze.return_value = sample_itinerary_response
+
+        result = await generator.generate_itinerary(trip_package=sample_trip_package)
+
+        mock_claude_client.analyze.assert_called_once()
+        assert "day_3" in result
+        assert ItineraryGenerator.is_partial({"_status": "generating"})
+        assert not ItineraryGenerator.is_partial(result)
+
+    async def test_generate_batch_runs_concurrently(
+        self,
+        generator,
+        sample_trip_package,
+        sample_itinerary_response,
+        mock_claude_client,
+    ):
+        """Test batch generation overlaps trips up to max_concurrency."""
+        in_flight = 0
+        peak = 0
+
+        async def analyze(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return dict(sample_itinerary_response)
+
+        mock_claude_client.analyze = AsyncMock(side_effect=analyze)
+        trips = [self.copy_trip(sample_trip_package, trip_id) for trip_id in range(1, 9)]
+
+        results = await generator.generate_batch(trips, save_to_db=False, max_concurrency=3)
+
+        assert list(results) == list(range(1, 9))
+        assert peak == 3
+
+    async def test_generate_batch_skips_failed_trips(
+        self,
+        generator,
+        sample_trip_package,
+        sample_itinerary_response,
+        mock_claude_client,
+    ):
+        """Test one failing trip does not stop the rest of the batch."""
+        low_score = self.copy_trip(sample_trip_package, 2, ai_score=10.0)
+        mock_claude_client.analyze.return_value = sample_itinerary_response
+
+        results = await generator.generate_batch(
+            [low_score, sample_trip_package], save_to_db=False
+        )
+
+        assert list(results) == [sample_trip_package.id]
+
+        with pytest.raises(ItineraryGenerationError):
+            await generator.generate_batch(
+                [low_score, sample_trip_package], save_to_db=False, skip_errors=False
+            )
@@ -0,0 +1,54 @@
+"""
+Unit tests for JsonMemberStream.
+"""
+
+import json
+
+import pytest
+
+from app.ai.json_stream import JsonMemberStream
+
+
+def feed_in_chunks(text, size):
+    """Feed text in fixed-size chunks and collect the completed members."""
+    parser = JsonMemberStream()
+    members = []
+    for start in range(0, len(text), size):
+        members += parser.feed(text[start : start + size])
+    return parser, members
+
+
+class TestJsonMemberStream:
+    """Tests for incremental member parsing."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 17, 10_000])
+    def test_members_match_full_parse(self, chunk_size):
+        document = {
+            "day_1": {"morning": 'Zoo {not a brace} "quoted" \\ path', "spots": [1, {"x": "]"}]},
+            "day_2": {"morning": "Beach, then ice cream"},
+            "tips": ["Bring a stroller", "Book ahead}"],
+            "budget": 120.5,
+            "stroller_friendly": True,
+            "notes": None,
+        }
+        text = f"```json\n{json.dumps(document, indent=2)}\n```"
+
+        parser, members = feed_in_chunks(text, chunk_size)
+
+        assert members == list(document.items())
+        assert parser.done
+
+    def test_member_is_returned_as_soon_as_it_completes(self):
+        parser = JsonMemberStream()
+
+        assert parser.feed('{"day_1": {"morning": "Zoo"') == []
+        assert parser.feed('}, "day_2": {"mor') == [("day_1", {"morning": "Zoo"})]
+        assert parser.feed('ning": "Park"}}') == [("day_2", {"morning": "Park"})]
+
+    def test_text_after_object_is_ignored(self):
+        parser = JsonMemberStream()
+
+        members = parser.feed('{"a": 1} trailing {"b": 2}')
+
+        assert members == [("a", 1)]
+        assert parser.feed('{"c": 3}') == []
@@ -4,11 +4,19 @@ Unit tests for PromptLoader.
 Tests the prompt template loading and management functionality.
 """
 
+import string
+
 import pytest
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
-from app.ai.prompt_loader import PromptLoader, get_prompt_loader, load_prompt
+from app.ai.prompt_loader import (
+    PROMPTS_DIR,
+    PromptLoader,
+    get_prompt_loader,
+    load_prompt,
+    split_prompt_template,
+)
 
 
 class TestPromptLoader:
@@ -284,3 +292,43 @@ Provide a detailed analysis.
 
         assert len(prompts) == 1
         assert prompts == ["valid"]
+
+
+class TestSplitPromptTemplate:
+    """Tests for split_prompt_template."""
+
+    def test_splits_static_and_variable_sections(self):
+        template = (
+            "You are an expert.\n\n"
+            "DETAILS:\n{title}\n\n"
+            "CRITERIA:\n- be fair\n\n"
+            "INTERESTS:\n{interests}\n\n"
+            'Return JSON:\n{{"score": <0-10>}}'
+        )
+
+        static, variable = split_prompt_template(template)
+
+        assert static == (
+            'You are an expert.\n\nCRITERIA:\n- be fair\n\nReturn JSON:\n{{"score": <0-10>}}'
+        )
+        assert variable == "DETAILS:\n{title}\n\nINTERESTS:\n{interests}"
+
+    def test_template_without_placeholders(self):
+        static, variable = split_prompt_template("Hello, world!")
+
+        assert static == "Hello, world!"
+        assert variable == ""
+
+    @pytest.mark.parametrize("prompt_path", sorted(PROMPTS_DIR.glob("*.txt")), ids=lambda p: p.stem)
+    def test_shipped_templates_format(self, prompt_path):
+        """Every shipped template must survive str.format, whole and split."""
+        template = prompt_path.read_text(encoding="utf-8")
+        fields = {f for _, f, _, _ in string.Formatter().parse(template) if f}
+        data = {field: "X" for field in fields}
+
+        template.format(**data)
+        static, variable = split_prompt_template(template)
+        assert static and variable
+        static.format()
+        variable.format(**data)
+
@@ -4,12 +4,13 @@ Unit tests for Redis-based rate limiter.
 
 import time
 from datetime import datetime
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from redis.exceptions import RedisError
 
 from app.utils.rate_limiter import (
+    AsyncRedisRateLimiter,
     RedisRateLimiter,
     RateLimitExceededError,
     TimeWindow,
@@ -25,10 +26,10 @@ class TestRedisRateLimiter:
     @pytest.fixture
     def mock_redis(self):
         """Mock Redis client."""
-        with patch("app.utils.rate_limiter.redis.from_url") as mock_from_url:
+        with patch("app.utils.rate_limiter.get_redis_registry") as mock_registry:
             mock_client = Mock()
             mock_client.ping.return_value = True
-            mock_from_url.return_value = mock_client
+            mock_registry.return_value.sync_client.return_value = mock_client
             yield mock_client
 
     def test_init_with_default_settings(self, mock_redis):
@@ -42,12 +43,14 @@ class TestRedisRateLimiter:
         assert limiter.scraper_name == "test"
         assert limiter.max_requests == 100
         assert limiter.time_window == TimeWindow.DAILY
-        mock_redis.ping.assert_called_once()
+        assert limiter.redis_client is mock_redis
+        # The shared pool connects lazily; no ping per limiter
+        mock_redis.ping.assert_not_called()
 
     def test_init_with_redis_connection_error(self):
-        """Test initialization when Redis connection fails."""
-        with patch("app.utils.rate_limiter.redis.from_url") as mock_from_url:
-            mock_from_url.side_effect = RedisError("Connection failed")
+        """Test initialization when the Redis client can't be created."""
+        with patch("app.utils.rate_limiter.get_redis_registry") as mock_registry:
+            mock_registry.return_value.sync_client.side_effect = RedisError("Connection failed")
 
             limiter = RedisRateLimiter(
                 scraper_name="test",
@@ -261,8 +264,8 @@ class TestRedisRateLimiter:
 
     def test_is_allowed_redis_unavailable(self):
         """Test is_allowed returns True when Redis is unavailable (fail open)."""
-        with patch("app.utils.rate_limiter.redis.from_url") as mock_from_url:
-            mock_from_url.side_effect = RedisError("Connection failed")
+        with patch("app.utils.rate_limiter.get_redis_registry") as mock_registry:
+            mock_registry.return_value.sync_client.side_effect = RedisError("Connection failed")
 
             limiter = RedisRateLimiter(
                 scraper_name="test",
@@ -326,12 +329,12 @@ class TestRedisRateLimiter:
 
     def test_record_request_redis_error(self):
         """Test recording request when Redis errors."""
-        with patch("app.utils.rate_limiter.redis.from_url") as mock_from_url:
+        with patch("app.utils.rate_limiter.get_redis_registry") as mock_registry:
             mock_client = Mock()
             mock_client.ping.return_value = True
             mock_client.get.return_value = "50"
             mock_client.incr.side_effect = RedisError("Redis error")
-            mock_from_url.return_value = mock_client
+            mock_registry.return_value.sync_client.return_value = mock_client
 
             limiter = RedisRateLimiter(
                 scraper_name="test",
@@ -388,8 +391,8 @@ class TestRedisRateLimiter:
 
     def test_reset_redis_unavailable(self):
         """Test resetting when Redis is unavailable."""
-        with patch("app.utils.rate_limiter.redis.from_url") as mock_from_url:
-            mock_from_url.side_effect = RedisError("Connection failed")
+        with patch("app.utils.rate_limiter.get_redis_registry") as mock_registry:
+            mock_registry.return_value.sync_client.side_effect = RedisError("Connection failed")
 
             limiter = RedisRateLimiter(
                 scraper_name="test",
@@ -437,16 +440,95 @@ class TestRedisRateLimiter:
         assert status["remaining"] == 0
 
 
+class TestAsyncRedisRateLimiter:
+    """Tests for AsyncRedisRateLimiter class."""
+
+    @staticmethod
+    def make_limiter(script_results=None, side_effect=None, **kwargs):
+        """Create a limiter whose Lua script returns canned results."""
+        redis_client = Mock()
+        script = AsyncMock(side_effect=side_effect or script_results)
+        redis_client.register_script.return_value = script
+        options = {"max_requests": 100, "time_window": TimeWindow.MONTHLY}
+        options.update(kwargs)
+        limiter = AsyncRedisRateLimiter("kiwi", redis_client=redis_client, **options)
+        return limiter, script
+
+    @pytest.mark.asyncio
+    async def test_acquire_single_atomic_call(self):
+        """Test that check-and-reserve is one script call with both limits."""
+        limiter, script = self.make_limiter([[1, 1, 0]], rate_per_second=2.0)
+
+        await limiter.acquire()
+
+        script.assert_awaited_once()
+        keys = script.await_args.kwargs["keys"]
+        args = script.await_args.kwargs["args"]
+        assert keys == [limiter._get_redis_key(), "rate_limit:kiwi:bucket"]
+        assert args[:2] == [1, 100]
+        assert args[3:] == [2.0, 2]
+
+    def test_shares_window_key_with_sync_limiter(self):
+        """Test that sync and async limiters count against the same quota."""
+        limiter, _ = self.make_limiter()
+        with patch("app.utils.rate_limiter.get_redis_registry"):
+            sync_limiter = RedisRateLimiter("kiwi", 100, TimeWindow.MONTHLY)
+
+        assert limiter._get_redis_key() == sync_limiter._get_redis_key()
+
+    @pytest.mark.asyncio
+    async def test_acquire_waits_for_capacity(self):
+        """Test that acquire sleeps for the returned wait instead of raising."""
+        limiter, script = self.make_limiter([[0, 5, 250], [1, 6, 0]], rate_per_second=4.0)
+
+        with patch("app.utils.rate_limiter.asyncio.sleep", new=AsyncMock()) as mock_sleep:
+            await limiter.acquire(timeout=5)
+
+        mock_sleep.assert_awaited_once_with(0.25)
+        assert script.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_acquire_raises_past_timeout(self):
+        """Test that acquire raises when capacity won't arrive within timeout."""
+        limiter, _ = self.make_limiter([[0, 100, 3_600_000]])
+
+        with pytest.raises(RateLimitExceededError):
+            await limiter.acquire(timeout=10)
+
+    @pytest.mark.asyncio
+    async def test_batch_reservation(self):
+        """Test reserving several permits in one call."""
+        limiter, script = self.make_limiter([[1, 5, 0]], rate_per_second=10.0, burst=10)
+
+        assert await limiter.try_acquire(permits=5) == 0.0
+        assert script.await_args.kwargs["args"][0] == 5
+
+        with pytest.raises(ValueError):
+            await limiter.try_acquire(permits=11)
+
+    @pytest.mark.asyncio
+    async def test_fails_open_on_redis_error(self):
+        """Test that Redis errors allow the request."""
+        limiter, _ = self.make_limiter(side_effect=RedisError("Connection lost"))
+
+        assert await limiter.try_acquire() == 0.0
+
+    def test_requires_a_limit(self):
+        """Test that a limiter without window quota or rate is rejected."""
+        with pytest.raises(ValueError):
+            AsyncRedisRateLimiter("kiwi", redis_client=Mock())
+
+
 class TestFactoryFunctions:
     """Tests for factory functions."""
 
     @pytest.fixture
     def mock_redis(self):
         """Mock Redis client."""
-        with patch("app.utils.rate_limiter.redis.from_url") as mock_from_url:
+        with patch("app.utils.rate_limiter.get_redis_registry") as mock_registry:
             mock_client = Mock()
             mock_client.ping.return_value = True
-            mock_from_url.return_value = mock_client
+            mock_registry.return_value.sync_client.return_value = mock_client
             yield mock_client
 
     def test_get_kiwi_rate_limiter(self, mock_redis):
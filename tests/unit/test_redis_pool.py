@@ -0,0 +1,134 @@
+"""
+Unit tests for the shared Redis pool registry.
+
+No Redis server is needed: pools connect lazily and pings are patched.
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.utils.redis_pool import RedisPoolRegistry, pipeline_exists, pipeline_setex
+
+
+@pytest.fixture
+def registry():
+    """Create a registry without a heartbeat."""
+    return RedisPoolRegistry(
+        redis_url="redis://localhost:6379/0", max_connections=8, heartbeat_seconds=0
+    )
+
+
+def make_pipeline_client(results):
+    """Create a client whose pipeline records commands and returns results."""
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=results)
+    context = MagicMock()
+    context.__aenter__ = AsyncMock(return_value=pipe)
+    context.__aexit__ = AsyncMock(return_value=False)
+    client = MagicMock()
+    client.pipeline.return_value = context
+    return client, pipe
+
+
+class TestRedisPoolRegistry:
+    """Test suite for RedisPoolRegistry."""
+
+    @pytest.mark.asyncio
+    async def test_clients_share_one_pool(self, registry):
+        """Test that clients borrow connections from the same pool."""
+        first = registry.client()
+        second = registry.client()
+
+        assert first.connection_pool is second.connection_pool
+        assert first.connection_pool.max_connections == 8
+        assert registry.client(decode_responses=True).connection_pool is not first.connection_pool
+        assert registry.get_stats()["async_pools"] == 2
+
+        await registry.close()
+        assert registry.get_stats()["async_pools"] == 0
+
+    def test_sync_clients_share_one_pool(self, registry):
+        """Test that sync clients share a decoding pool per URL."""
+        first = registry.sync_client()
+        second = registry.sync_client()
+
+        assert first.connection_pool is second.connection_pool
+        assert first.connection_pool.connection_kwargs["decode_responses"] is True
+        assert registry.get_stats()["sync_pools"] == 1
+
+    def test_client_outside_event_loop(self, registry):
+        """Test that clients can be created before a loop is running."""
+        client = registry.client()
+
+        assert registry.get_stats()["async_pools"] == 1
+        assert registry.get_stats()["heartbeat_running"] is False
+        assert client.connection_pool is registry.client().connection_pool
+
+    @pytest.mark.asyncio
+    async def test_check_tracks_health(self, registry):
+        """Test that check() marks Redis down and back up."""
+        with patch(
+            "redis.asyncio.Redis.ping",
+            AsyncMock(side_effect=RedisConnectionError("Connection refused")),
+        ):
+            assert await registry.check() is False
+        assert registry.healthy is False
+
+        with patch("redis.asyncio.Redis.ping", AsyncMock(return_value=True)):
+            assert await registry.check() is True
+        assert registry.healthy is True
+        assert registry.last_check is not None
+
+    @pytest.mark.asyncio
+    async def test_heartbeat_starts_with_first_client(self):
+        """Test that the heartbeat runs in the background and stops on close."""
+        registry = RedisPoolRegistry(redis_url="redis://localhost:6379/0", heartbeat_seconds=60)
+
+        with patch("redis.asyncio.Redis.ping", AsyncMock(return_value=True)) as ping:
+            registry.client()
+            registry.client()
+            assert registry.get_stats()["heartbeat_running"] is True
+
+            await registry.close()
+
+        assert ping.await_count <= 1
+        assert registry.get_stats()["heartbeat_running"] is False
+
+
+class TestPipelineHelpers:
+    """Test suite for the pipelining helpers."""
+
+    @pytest.mark.asyncio
+    async def test_pipeline_exists(self):
+        """Test that existence checks go out in one non-transactional pipeline."""
+        client, pipe = make_pipeline_client([1, 0, 1])
+
+        result = await pipeline_exists(client, ["a", "b", "c"])
+
+        assert result == [True, False, True]
+        client.pipeline.assert_called_once_with(transaction=False)
+        assert pipe.exists.call_count == 3
+        pipe.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_pipeline_setex(self):
+        """Test that values are written with one pipeline."""
+        client, pipe = make_pipeline_client([True, True])
+
+        await pipeline_setex(client, {"a": "1", "b": "2"}, ttl=60)
+
+        pipe.setex.assert_any_call("a", 60, "1")
+        pipe.setex.assert_any_call("b", 60, "2")
+        pipe.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_empty_input_skips_redis(self):
+        """Test that empty batches don't open a pipeline."""
+        client, _ = make_pipeline_client([])
+
+        assert await pipeline_exists(client, []) == []
+        await pipeline_setex(client, {}, ttl=60)
+
+        client.pipeline.assert_not_called()
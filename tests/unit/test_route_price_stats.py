@@ -0,0 +1,120 @@
+"""
+Unit tests for RoutePriceStatsProvider.
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from sqlalchemy.dialects import postgresql
+
+from app.services.route_price_stats import RoutePriceStats, RoutePriceStatsProvider
+
+
+def make_session(rows, dialect="postgresql"):
+    """Create a session double returning aggregate rows."""
+    session = AsyncMock()
+    session.bind = MagicMock()
+    session.bind.dialect.name = dialect
+    result = MagicMock()
+    result.all.return_value = rows
+    session.execute = AsyncMock(return_value=result)
+    return session
+
+
+class TestRoutePriceStatsProvider:
+    """Tests for loading and memoizing route statistics."""
+
+    async def test_loads_all_routes_in_one_query(self):
+        session = make_session(
+            [
+                ("MUC-LIS", 4, 175.0, 100.0, 250.0, 137.5, 175.0, 212.5),
+                ("MUC-BCN", 2, 90.0, 80.0, 100.0, 85.0, 90.0, 95.0),
+            ]
+        )
+        provider = RoutePriceStatsProvider(session, ttl_seconds=60)
+
+        lisbon = await provider.get("MUC-LIS")
+        barcelona = await provider.get("MUC-BCN")
+        missing = await provider.get("MUC-OPO")
+
+        session.execute.assert_awaited_once()
+        assert lisbon == RoutePriceStats("MUC-LIS", 4, 175.0, 100.0, 250.0, 137.5, 175.0, 212.5)
+        assert barcelona.median_price == 90.0
+        assert missing is None
+
+    async def test_percentiles_are_computed_in_sql_on_postgresql(self):
+        session = make_session([])
+        await RoutePriceStatsProvider(session).refresh()
+
+        statement = session.execute.call_args[0][0]
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+        assert "percentile_cont" in sql
+        assert "GROUP BY price_history.route" in sql
+
+    async def test_other_databases_skip_percentiles(self):
+        session = make_session([("MUC-LIS", 2, 150.0, 100.0, 200.0)], dialect="sqlite")
+        provider = RoutePriceStatsProvider(session)
+
+        stats = await provider.get("MUC-LIS")
+
+        sql = str(session.execute.call_args[0][0])
+        assert "percentile_cont" not in sql
+        assert stats.avg_price == 150.0
+        assert stats.median_price is None
+
+    async def test_reloads_after_ttl(self):
+        session = make_session([("MUC-LIS", 1, 100.0, 100.0, 100.0, 100.0, 100.0, 100.0)])
+        provider = RoutePriceStatsProvider(session, ttl_seconds=60)
+
+        now = [0.0]
+
+        with patch("app.services.route_price_stats.time.monotonic", lambda: now[0]):
+            await provider.get("MUC-LIS")  # loads at t=0
+            now[0] = 30.0
+            await provider.get("MUC-LIS")  # fresh
+            now[0] = 90.0
+            await provider.get("MUC-LIS")  # stale, reloads
+
+        assert session.execute.await_count == 2
+
+    async def test_query_error_returns_none(self):
+        session = make_session([])
+        session.execute = AsyncMock(side_effect=RuntimeError("db down"))
+        provider = RoutePriceStatsProvider(session, ttl_seconds=60)
+
+        assert await provider.get("MUC-LIS") is None
+        assert await provider.get("MUC-BCN") is None
+        # The failed load is not retried for every lookup
+        session.execute.assert_awaited_once()
+
+    async def test_query_error_retried_after_backoff(self):
+        session = make_session([("MUC-LIS", 1, 100.0, 100.0, 100.0, 100.0, 100.0, 100.0)])
+        result = session.execute.return_value
+        session.execute = AsyncMock(side_effect=[RuntimeError("db down"), result])
+        provider = RoutePriceStatsProvider(session, ttl_seconds=3600)
+
+        now = [0.0]
+
+        with patch("app.services.route_price_stats.time.monotonic", lambda: now[0]):
+            assert await provider.get("MUC-LIS") is None  # fails at t=0
+            now[0] = 10.0
+            assert await provider.get("MUC-LIS") is None  # backing off
+            now[0] = provider.ERROR_RETRY_SECONDS + 1
+            stats = await provider.get("MUC-LIS")  # retried long before the TTL
+
+        assert session.execute.await_count == 2
+        assert stats.avg_price == 100.0
+
+    async def test_query_error_keeps_previous_stats(self):
+        session = make_session([("MUC-LIS", 1, 100.0, 100.0, 100.0, 100.0, 100.0, 100.0)])
+        provider = RoutePriceStatsProvider(session, ttl_seconds=60)
+
+        now = [0.0]
+
+        with patch("app.services.route_price_stats.time.monotonic", lambda: now[0]):
+            await provider.get("MUC-LIS")
+            session.execute = AsyncMock(side_effect=RuntimeError("db down"))
+            now[0] = 90.0
+            stats = await provider.get("MUC-LIS")  # stale, reload fails
+
+        session.execute.assert_awaited_once()
+        assert stats.avg_price == 100.0
@@ -0,0 +1,189 @@
+"""
+Unit tests for ScrapeScheduler.
+
+Tests per-source and global concurrency limits, priority ordering,
+and exception capture.
+"""
+
+import asyncio
+
+import pytest
+
+from app.orchestration.scrape_scheduler import ScrapeScheduler
+
+
+class ConcurrencyProbe:
+    """Records how many jobs run at once, overall and per source."""
+
+    def __init__(self):
+        self.active = {}
+        self.peak = {}
+        self.total_active = 0
+        self.total_peak = 0
+        self.started = []
+
+    def job(self, source, name, delay=0.01, result=None, error=None):
+        async def run():
+            self.started.append(name)
+            self.active[source] = self.active.get(source, 0) + 1
+            self.peak[source] = max(self.peak.get(source, 0), self.active[source])
+            self.total_active += 1
+            self.total_peak = max(self.total_peak, self.total_active)
+            try:
+                await asyncio.sleep(delay)
+                if error:
+                    raise error
+                return result if result is not None else name
+            finally:
+                self.active[source] -= 1
+                self.total_active -= 1
+
+        return run
+
+
+class TestScrapeScheduler:
+    """Test suite for ScrapeScheduler."""
+
+    @pytest.mark.asyncio
+    async def test_respects_per_source_limits(self):
+        """Test that no source exceeds its own concurrency limit."""
+        probe = ConcurrencyProbe()
+        scheduler = ScrapeScheduler(
+            source_limits={"skyscanner": 2, "kiwi": 5}, max_concurrency=20
+        )
+
+        for i in range(10):
+            scheduler.submit("skyscanner", probe.job("skyscanner", f"sky-{i}"))
+            scheduler.submit("kiwi", probe.job("kiwi", f"kiwi-{i}"))
+
+        results = await scheduler.run()
+
+        assert len(results) == 20
+        assert probe.peak["skyscanner"] == 2
+        assert probe.peak["kiwi"] == 5
+
+    @pytest.mark.asyncio
+    async def test_respects_global_cap(self):
+        """Test that the global cap bounds jobs across all sources."""
+        probe = ConcurrencyProbe()
+        scheduler = ScrapeScheduler(
+            source_limits={"a": 10, "b": 10}, max_concurrency=3
+        )
+
+        for i in range(6):
+            scheduler.submit("a", probe.job("a", f"a-{i}"))
+            scheduler.submit("b", probe.job("b", f"b-{i}"))
+
+        await scheduler.run()
+
+        assert probe.total_peak == 3
+
+    @pytest.mark.asyncio
+    async def test_unknown_source_uses_default_limit(self):
+        """Test that sources without explicit limits use the default limit."""
+        probe = ConcurrencyProbe()
+        scheduler = ScrapeScheduler(max_concurrency=10, default_source_limit=2)
+
+        for i in range(5):
+            scheduler.submit("other", probe.job("other", f"o-{i}"))
+
+        await scheduler.run()
+
+        assert probe.peak["other"] == 2
+
+    @pytest.mark.asyncio
+    async def test_priority_ordering(self):
+        """Test that lower priority values start first."""
+        probe = ConcurrencyProbe()
+        scheduler = ScrapeScheduler(source_limits={"kiwi": 1}, max_concurrency=1)
+
+        scheduler.submit("kiwi", probe.job("kiwi", "late"), priority=2)
+        scheduler.submit("kiwi", probe.job("kiwi", "early"), priority=0)
+        scheduler.submit("kiwi", probe.job("kiwi", "middle"), priority=1)
+        scheduler.submit("kiwi", probe.job("kiwi", "early-2"), priority=0)
+
+        await scheduler.run()
+
+        assert probe.started == ["early", "early-2", "middle", "late"]
+
+    @pytest.mark.asyncio
+    async def test_saturated_source_does_not_block_others(self):
+        """Test that a full source does not hold back jobs from other sources."""
+        probe = ConcurrencyProbe()
+        scheduler = ScrapeScheduler(
+            source_limits={"skyscanner": 1, "kiwi": 2}, max_concurrency=3
+        )
+
+        scheduler.submit("skyscanner", probe.job("skyscanner", "sky-0", delay=0.05), priority=0)
+        scheduler.submit("skyscanner", probe.job("skyscanner", "sky-1", delay=0.05), priority=0)
+        scheduler.submit("kiwi", probe.job("kiwi", "kiwi-0"), priority=5)
+
+        await scheduler.run()
+
+        # kiwi starts before the second skyscanner job despite lower priority
+        assert probe.started.index("kiwi-0") < probe.started.index("sky-1")
+
+    @pytest.mark.asyncio
+    async def test_results_in_submission_order_with_exceptions(self):
+        """Test that results keep submission order and failures are returned."""
+        probe = ConcurrencyProbe()
+        scheduler = ScrapeScheduler(max_concurrency=4)
+
+        scheduler.submit("kiwi", probe.job("kiwi", "a", delay=0.03, result=[1]))
+        scheduler.submit("kiwi", probe.job("kiwi", "b", error=ValueError("boom")))
+        scheduler.submit("kiwi", probe.job("kiwi", "c", delay=0.0, result=[2, 3]))
+
+        results = await scheduler.run()
+
+        assert results[0] == [1]
+        assert isinstance(results[1], ValueError)
+        assert results[2] == [2, 3]
+
+    @pytest.mark.asyncio
+    async def test_on_complete_called_for_each_job(self):
+        """Test that the completion callback fires once per job."""
+        probe = ConcurrencyProbe()
+        scheduler = ScrapeScheduler(max_concurrency=2)
+        completed = []
+
+        scheduler.submit("kiwi", probe.job("kiwi", "a"), label="Kiwi: MUC→LIS")
+        scheduler.submit("kiwi", probe.job("kiwi", "b", error=RuntimeError("x")), label="Kiwi: MUC→BCN")
+
+        await scheduler.run(on_complete=lambda job, result: completed.append((job.label, result)))
+
+        assert len(completed) == 2
+        labels = {label for label, _ in completed}
+        assert labels == {"Kiwi: MUC→LIS", "Kiwi: MUC→BCN"}
+
+    @pytest.mark.asyncio
+    async def test_jobs_created_lazily(self):
+        """Test that factories are not invoked until a slot is free."""
+        calls = []
+        scheduler = ScrapeScheduler(max_concurrency=1)
+
+        def factory(name):
+            def make():
+                calls.append(name)
+                return asyncio.sleep(0, result=name)
+
+            return make
+
+        scheduler.submit("kiwi", factory("a"))
+        scheduler.submit("kiwi", factory("b"))
+
+        assert calls == []
+        results = await scheduler.run()
+        assert results == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_empty_scheduler(self):
+        """Test running with no jobs."""
+        scheduler = ScrapeScheduler()
+        assert await scheduler.run() == []
+
+    def test_invalid_limits(self):
+        """Test that limits below 1 are rejected."""
+        with pytest.raises(ValueError):
+            ScrapeScheduler(max_concurrency=0)
+        with pytest.raises(ValueError):
+            ScrapeScheduler(source_limits={"kiwi": 0})
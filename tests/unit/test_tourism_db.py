@@ -0,0 +1,157 @@
+"""
+Unit tests for tourism event persistence (save_events_to_db).
+"""
+
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.models.event import Event
+from app.scrapers import tourism_db
+from app.scrapers.tourism_db import find_events_by_hashes, save_events_to_db
+from app.utils.event_deduplication import generate_deduplication_hash
+
+
+def make_event_data(title, source="tourism_lisbon", description=None, event_date=None):
+    """Create a scraped event dictionary."""
+    return {
+        'destination_city': 'Lisbon',
+        'title': title,
+        'event_date': event_date or date(2025, 12, 20),
+        'category': 'cultural',
+        'description': description,
+        'source': source,
+        'url': f"https://example.com/{source}/{title.replace(' ', '-').lower()}",
+    }
+
+
+def make_stored_event(event_data, event_id=1, **overrides):
+    """Create a stored Event matching a scraped event."""
+    event = Event(
+        id=event_id,
+        destination_city=event_data['destination_city'],
+        title=event_data['title'],
+        event_date=event_data['event_date'],
+        category=event_data['category'],
+        description=event_data.get('description'),
+        price_range='varies',
+        source=event_data['source'],
+        url=None,
+        deduplication_hash=generate_deduplication_hash(
+            title=event_data['title'],
+            event_date=event_data['event_date'],
+            destination_city=event_data['destination_city'],
+            venue=event_data.get('venue'),
+        ),
+    )
+    for key, value in overrides.items():
+        setattr(event, key, value)
+    return event
+
+
+def make_session(stored_events):
+    """Create a session whose queries return the stored events."""
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = stored_events
+    session = AsyncMock()
+    session.execute = AsyncMock(return_value=result)
+    session.add = MagicMock()
+    session.add_all = MagicMock()
+    return session
+
+
+class TestSaveEventsToDb:
+    """Test suite for save_events_to_db."""
+
+    @pytest.mark.asyncio
+    async def test_existing_events_loaded_with_one_query(self):
+        """Test that the batch's hashes are looked up together, not per event."""
+        events = [
+            make_event_data("Concert", event_date=date(2025, 12, day)) for day in range(1, 21)
+        ]
+        session = make_session([])
+
+        saved = await save_events_to_db(events, session)
+
+        assert saved == 20
+        assert session.execute.await_count == 1
+        session.add_all.assert_called_once()
+        assert len(session.add_all.call_args.args[0]) == 20
+        session.add.assert_not_called()
+        session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_existing_event_updated_from_other_source(self):
+        """Test that a stored event takes a longer description and missing URL."""
+        new = make_event_data(
+            "Fado Night", source="eventbrite", description="An evening of traditional fado"
+        )
+        stored = make_stored_event(make_event_data("Fado Night"))
+        session = make_session([stored])
+
+        saved = await save_events_to_db([new, make_event_data("Jazz Night")], session)
+
+        assert saved == 2
+        assert stored.description == "An evening of traditional fado"
+        assert stored.url == new['url']
+        inserted = session.add_all.call_args.args[0]
+        assert [event.title for event in inserted] == ["Jazz Night"]
+
+    @pytest.mark.asyncio
+    async def test_unchanged_duplicate_skipped(self):
+        """Test that a duplicate from the same source without new details is skipped."""
+        event_data = make_event_data("Fado Night", description="Fado")
+        stored = make_stored_event(event_data)
+        session = make_session([stored])
+
+        saved = await save_events_to_db([event_data], session)
+
+        assert saved == 0
+        assert session.add_all.call_args.args[0] == []
+
+    @pytest.mark.asyncio
+    async def test_no_lookup_without_deduplication(self):
+        """Test that deduplicate=False inserts everything without querying."""
+        events = [make_event_data("Fado Night"), make_event_data("Fado Night")]
+        session = make_session([])
+
+        saved = await save_events_to_db(events, session, deduplicate=False)
+
+        assert saved == 2
+        session.execute.assert_not_awaited()
+        assert all(event.deduplication_hash for event in session.add_all.call_args.args[0])
+
+
+class TestFindEventsByHashes:
+    """Test suite for find_events_by_hashes."""
+
+    @pytest.mark.asyncio
+    async def test_hashes_chunked(self, monkeypatch):
+        """Test that large batches are split into several IN queries."""
+        monkeypatch.setattr(tourism_db, "HASH_LOOKUP_CHUNK_SIZE", 2)
+        session = make_session([])
+
+        await find_events_by_hashes(["a", "b", "c", "a", None, "d", "e"], session)
+
+        assert session.execute.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_first_event_per_hash_kept(self):
+        """Test that the oldest event wins when a hash is stored twice."""
+        event_data = make_event_data("Fado Night")
+        first = make_stored_event(event_data, event_id=1)
+        second = make_stored_event(event_data, event_id=2)
+        session = make_session([first, second])
+
+        events = await find_events_by_hashes([first.deduplication_hash], session)
+
+        assert events == {first.deduplication_hash: first}
+
+    @pytest.mark.asyncio
+    async def test_empty_hashes_skip_query(self):
+        """Test that no query runs without hashes."""
+        session = make_session([])
+
+        assert await find_events_by_hashes([None, ""], session) == {}
+        session.execute.assert_not_awaited()